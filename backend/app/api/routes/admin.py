@@ -0,0 +1,47 @@
+"""
+Admin API routes for the Social Media Post Manager.
+
+Every endpoint requires the X-Admin-Key header to match ADMIN_API_KEY.
+"""
+import logging
+from typing import Dict, Any
+from fastapi import APIRouter, HTTPException, Depends
+
+from app.core.dependencies import require_admin_key
+from app.langgraph.utils.topic_config_registry import get_topic_config_registry
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter(dependencies=[Depends(require_admin_key)])
+
+
+@router.post("/topic-configs/reload")
+async def reload_topic_configs() -> Dict[str, Any]:
+    """
+    Force a reload of the in-memory topic config registry.
+    
+    Use after editing topic_configs outside the application, e.g. with
+    SQL that does not bump updated_at and so is missed by version polling.
+    
+    Returns:
+        Number of loaded topics and registry statistics
+    """
+    registry = get_topic_config_registry()
+    
+    try:
+        count = await registry.reload()
+    except Exception as e:
+        logger.error(f"Topic config reload failed: {str(e)}")
+        raise HTTPException(
+            status_code=503,
+            detail={
+                "error": "Topic config reload failed",
+                "message": str(e)
+            }
+        )
+    
+    return {
+        "success": True,
+        "topics": count,
+        "registry": registry.get_stats()
+    }
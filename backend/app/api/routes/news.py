@@ -4,13 +4,13 @@ News API routes for the Social Media Post Manager.
 This module provides REST endpoints for news processing
 using the LangGraph workflow system.
 """
-from typing import Dict, Any
+from typing import AsyncIterator, Dict, Any, Tuple
 from fastapi import APIRouter, HTTPException, Depends
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, StreamingResponse
 from pydantic import BaseModel, Field
 from datetime import datetime
 
-from app.langgraph.workflows.news_workflow import execute_news_workflow
+from app.langgraph.workflows.news_workflow import execute_news_workflow, get_news_workflow
 from app.langgraph.utils.error_handlers import (
     ValidationError,
     QuotaExceededError,
@@ -20,6 +20,7 @@ from app.langgraph.utils.error_handlers import (
     DatabaseError,
     NewsProcessingError
 )
+from app.api.sse import format_sse_event, SSE_HEADERS
 from app.core.dependencies import get_db
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -64,10 +65,11 @@ async def fetch_news(
     This endpoint executes the complete news processing pipeline:
     1. Validates input parameters
     2. Checks user quotas and prevents duplicates
-    3. Fetches news from Serper API
-    4. Filters articles by relevance and source priority
-    5. Generates AI summaries using selected LLM
-    6. Caches results for future use
+    3. Serves repeat (topic, date, topN) requests from the news cache
+    4. Fetches news from Serper API
+    5. Filters articles by relevance and source priority
+    6. Generates AI summaries using selected LLM
+    7. Caches results for future use
     
     Args:
         request: News request parameters
@@ -100,93 +102,158 @@ async def fetch_news(
             cacheHit=results["cache_hit"]
         )
         
-    except ValidationError as e:
+    except Exception as e:
+        status_code, detail = _map_news_error(e)
+        raise HTTPException(status_code=status_code, detail=detail)
+
+
+@router.post("/fetch/stream")
+async def fetch_news_stream(request: NewsRequest) -> StreamingResponse:
+    """
+    Fetch and process news articles, streaming progress as Server-Sent Events.
+    
+    Runs the same workflow as /fetch and emits:
+    - step: each processing step as it completes
+    - article: each summarized article as soon as its summary is ready,
+      once per index; articles left with their snippet are sent when
+      summarization ends, as a later provider may still summarize them
+    - complete: the final result in the /fetch response shape
+    - error: {"status": ..., **detail} if the workflow fails
+    
+    Args:
+        request: News request parameters
+        
+    Returns:
+        text/event-stream response
+    """
+    return StreamingResponse(
+        _news_events(request),
+        media_type="text/event-stream",
+        headers=SSE_HEADERS
+    )
+
+
+async def _news_events(request: NewsRequest) -> AsyncIterator[str]:
+    """
+    Run the streaming news workflow and encode it as SSE messages.
+    
+    Errors after the response has started are sent as an error event,
+    since the HTTP status can no longer change.
+    
+    Args:
+        request: News request parameters
+        
+    Yields:
+        Encoded step, article, complete or error events
+    """
+    workflow = get_news_workflow()
+    
+    try:
+        async for event in workflow.execute_stream(
+            topic=request.topic,
+            date=request.date,
+            top_n=request.topN,
+            llm_model=request.llmModel,
+            session_id=request.sessionId
+        ):
+            if event["type"] == "step":
+                yield format_sse_event("step", event["step"])
+            
+            elif event["type"] == "article":
+                yield format_sse_event("article", {
+                    "index": event["index"],
+                    "article": event["article"]
+                })
+            
+            elif event["type"] == "complete":
+                results = event["result"]
+                yield format_sse_event("complete", NewsResponse(
+                    articles=results["articles"],
+                    totalFound=results["total_found"],
+                    processingTime=results["processing_time"],
+                    quotaRemaining=results["quota_remaining"],
+                    workflowId=results["workflow_id"],
+                    llmProviderUsed=results["llm_provider_used"],
+                    cacheHit=results["cache_hit"]
+                ).model_dump())
+    
+    except Exception as e:
+        status_code, detail = _map_news_error(e)
+        yield format_sse_event("error", {"status": status_code, **detail})
+
+
+def _map_news_error(e: Exception) -> Tuple[int, Dict[str, Any]]:
+    """
+    Map a news workflow error to an HTTP status code and error detail.
+    
+    Args:
+        e: Exception raised by the workflow
+        
+    Returns:
+        (status_code, detail) tuple
+    """
+    if isinstance(e, ValidationError):
         # Input validation errors (400 Bad Request)
-        raise HTTPException(
-            status_code=400,
-            detail={
-                "error": "ValidationError",
-                "message": e.message,
-                "details": e.context
-            }
-        )
+        return 400, {
+            "error": "ValidationError",
+            "message": e.message,
+            "details": e.context
+        }
     
-    except QuotaExceededError as e:
+    if isinstance(e, QuotaExceededError):
         # Quota exceeded errors (429 Too Many Requests)
-        raise HTTPException(
-            status_code=429,
-            detail={
-                "error": "QuotaExceeded",
-                "message": e.message,
-                "details": e.context
-            }
-        )
+        return 429, {
+            "error": "QuotaExceeded",
+            "message": e.message,
+            "details": e.context
+        }
     
-    except DuplicateRequestError as e:
+    if isinstance(e, DuplicateRequestError):
         # Duplicate request errors (409 Conflict)
-        raise HTTPException(
-            status_code=409,
-            detail={
-                "error": "DuplicateRequest",
-                "message": e.message,
-                "details": e.context
-            }
-        )
+        return 409, {
+            "error": "DuplicateRequest",
+            "message": e.message,
+            "details": e.context
+        }
     
-    except SerperAPIError as e:
+    if isinstance(e, SerperAPIError):
         # External API errors (502 Bad Gateway)
-        raise HTTPException(
-            status_code=502,
-            detail={
-                "error": "ExternalAPIError",
-                "message": f"News service temporarily unavailable: {e.message}",
-                "details": {"provider": "Serper", "context": e.context}
-            }
-        )
+        return 502, {
+            "error": "ExternalAPIError",
+            "message": f"News service temporarily unavailable: {e.message}",
+            "details": {"provider": "Serper", "context": e.context}
+        }
     
-    except LLMProviderError as e:
+    if isinstance(e, LLMProviderError):
         # LLM provider errors (502 Bad Gateway)
-        raise HTTPException(
-            status_code=502,
-            detail={
-                "error": "LLMProviderError",
-                "message": f"AI service temporarily unavailable: {e.message}",
-                "details": e.context
-            }
-        )
+        return 502, {
+            "error": "LLMProviderError",
+            "message": f"AI service temporarily unavailable: {e.message}",
+            "details": e.context
+        }
     
-    except DatabaseError as e:
+    if isinstance(e, DatabaseError):
         # Database errors (500 Internal Server Error)
-        raise HTTPException(
-            status_code=500,
-            detail={
-                "error": "DatabaseError",
-                "message": "Internal database error occurred",
-                "details": {"operation": e.context.get("operation", "unknown")}
-            }
-        )
+        return 500, {
+            "error": "DatabaseError",
+            "message": "Internal database error occurred",
+            "details": {"operation": e.context.get("operation", "unknown")}
+        }
     
-    except NewsProcessingError as e:
+    if isinstance(e, NewsProcessingError):
         # General processing errors (500 Internal Server Error)
-        raise HTTPException(
-            status_code=500,
-            detail={
-                "error": "ProcessingError",
-                "message": e.message,
-                "details": e.context
-            }
-        )
+        return 500, {
+            "error": "ProcessingError",
+            "message": e.message,
+            "details": e.context
+        }
     
-    except Exception as e:
-        # Unexpected errors (500 Internal Server Error)
-        raise HTTPException(
-            status_code=500,
-            detail={
-                "error": "UnexpectedError",
-                "message": "An unexpected error occurred",
-                "details": {"error_type": type(e).__name__}
-            }
-        )
+    # Unexpected errors (500 Internal Server Error)
+    return 500, {
+        "error": "UnexpectedError",
+        "message": "An unexpected error occurred",
+        "details": {"error_type": type(e).__name__}
+    }
 
 
 @router.get("/health")
@@ -4,16 +4,17 @@ Post generation API routes for the Social Media Post Manager.
 This module provides REST endpoints for generating and managing
 LinkedIn and X posts from news articles.
 """
-from typing import Dict, Any, List, Optional
+import logging
+from typing import AsyncIterator, Dict, Any, List, Optional, Tuple
 from fastapi import APIRouter, HTTPException, Depends, Query
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, StreamingResponse
 from pydantic import BaseModel, Field
 from datetime import datetime
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, and_
 import uuid
 
-from app.langgraph.workflows.post_workflow import execute_post_workflow
+from app.langgraph.workflows.post_workflow import execute_post_workflow, stream_linkedin_post
 from app.langgraph.workflows.stateless_post_workflow import get_stateless_post_workflow
 from app.langgraph.utils.error_handlers import (
     ValidationError,
@@ -21,11 +22,13 @@ from app.langgraph.utils.error_handlers import (
     DatabaseError,
     NewsProcessingError
 )
+from app.api.sse import format_sse_event, SSE_HEADERS
 from app.core.dependencies import get_db
 from app.models.generated_post import GeneratedPost, PostType
 from app.models.session import Session
 
 router = APIRouter()
+logger = logging.getLogger(__name__)
 
 
 class PostGenerationRequest(BaseModel):
@@ -93,18 +96,7 @@ async def generate_posts(
     """
     try:
         # Validate session exists
-        session_uuid = uuid.UUID(request.sessionId)
-        result = await db.execute(
-            select(Session).where(Session.id == session_uuid)
-        )
-        session = result.scalar_one_or_none()
-        
-        if not session:
-            raise ValidationError(
-                field="sessionId",
-                value=request.sessionId,
-                reason="Session ID does not exist in database"
-            )
+        await _validate_session_exists(db, request.sessionId)
         
         # Execute stateless post generation workflow (NEW APPROACH)
         stateless_workflow = get_stateless_post_workflow()
@@ -124,49 +116,9 @@ async def generate_posts(
             posts=results["posts"]
         )
         
-    except ValidationError as e:
-        # Input validation errors (400 Bad Request)
-        raise HTTPException(
-            status_code=400,
-            detail={
-                "error": "ValidationError",
-                "message": e.message,
-                "details": e.context
-            }
-        )
-    
-    except LLMProviderError as e:
-        # LLM provider errors (502 Bad Gateway)
-        raise HTTPException(
-            status_code=502,
-            detail={
-                "error": "LLMProviderError",
-                "message": f"AI service temporarily unavailable: {e.message}",
-                "details": e.context
-            }
-        )
-    
-    except DatabaseError as e:
-        # Database errors (500 Internal Server Error)
-        raise HTTPException(
-            status_code=500,
-            detail={
-                "error": "DatabaseError",
-                "message": "Internal database error occurred",
-                "details": {"operation": e.context.get("operation", "unknown")}
-            }
-        )
-    
-    except NewsProcessingError as e:
-        # General processing errors (500 Internal Server Error)
-        raise HTTPException(
-            status_code=500,
-            detail={
-                "error": "ProcessingError",
-                "message": e.message,
-                "details": e.context
-            }
-        )
+    except (ValidationError, LLMProviderError, DatabaseError, NewsProcessingError) as e:
+        status_code, detail = _map_post_error(e)
+        raise HTTPException(status_code=status_code, detail=detail)
     
     except Exception as e:
         # Log the unexpected error with full details
@@ -204,6 +156,159 @@ async def generate_posts(
         )
 
 
+@router.post("/generate/linkedin/stream")
+async def generate_linkedin_post_stream(
+    request: PostGenerationRequest,
+    db: AsyncSession = Depends(get_db)
+) -> StreamingResponse:
+    """
+    Generate a LinkedIn post, streaming tokens as Server-Sent Events.
+    
+    Emits:
+    - token: {"content": ...} for each chunk as the LLM streams it
+    - complete: the saved post in the /generate response shape
+    - error: {"status": ..., **detail} if generation or saving fails
+    
+    Args:
+        request: Post generation request parameters
+        db: Database session dependency
+        
+    Returns:
+        text/event-stream response
+        
+    Raises:
+        HTTPException: 400 if the session ID is malformed or does not exist
+    """
+    try:
+        await _validate_session_exists(db, request.sessionId)
+    except ValidationError as e:
+        status_code, detail = _map_post_error(e)
+        raise HTTPException(status_code=status_code, detail=detail)
+    
+    return StreamingResponse(
+        _linkedin_post_events(request),
+        media_type="text/event-stream",
+        headers=SSE_HEADERS
+    )
+
+
+async def _linkedin_post_events(request: PostGenerationRequest) -> AsyncIterator[str]:
+    """
+    Run streaming LinkedIn post generation and encode it as SSE messages.
+    
+    Errors after the response has started are sent as an error event,
+    since the HTTP status can no longer change.
+    
+    Args:
+        request: Post generation request parameters
+        
+    Yields:
+        Encoded token, complete or error events
+    """
+    try:
+        async for event in stream_linkedin_post(
+            articles=request.articles,
+            topic=request.topic,
+            llm_model=request.llmModel,
+            session_id=request.sessionId,
+            news_workflow_id=request.newsWorkflowId
+        ):
+            if event["type"] == "token":
+                yield format_sse_event("token", {"content": event["content"]})
+            
+            elif event["type"] == "complete":
+                results = event["result"]
+                yield format_sse_event("complete", PostGenerationResponse(
+                    workflowId=results["workflow_id"],
+                    processingTime=results["processing_time"],
+                    llmModelUsed=results["llm_model_used"],
+                    posts=results["posts"]
+                ).model_dump())
+    
+    except (ValidationError, LLMProviderError, DatabaseError, NewsProcessingError) as e:
+        status_code, detail = _map_post_error(e)
+        yield format_sse_event("error", {"status": status_code, **detail})
+    
+    except Exception as e:
+        logger.error(f"Unexpected error in streaming LinkedIn post generation: {str(e)}", exc_info=True)
+        yield format_sse_event("error", {
+            "status": 500,
+            "error": "UnexpectedError",
+            "message": f"An unexpected error occurred during post generation: {str(e)}",
+            "details": {"error_type": type(e).__name__}
+        })
+
+
+async def _validate_session_exists(db: AsyncSession, session_id: str) -> None:
+    """
+    Ensure the session exists.
+    
+    Raises:
+        ValidationError: When the session ID is malformed or not in the database
+    """
+    try:
+        session_uuid = uuid.UUID(session_id)
+    except ValueError:
+        raise ValidationError(
+            field="sessionId",
+            value=session_id,
+            reason="Session ID is not a valid UUID"
+        )
+    
+    result = await db.execute(
+        select(Session).where(Session.id == session_uuid)
+    )
+    
+    if not result.scalar_one_or_none():
+        raise ValidationError(
+            field="sessionId",
+            value=session_id,
+            reason="Session ID does not exist in database"
+        )
+
+
+def _map_post_error(e: NewsProcessingError) -> Tuple[int, Dict[str, Any]]:
+    """
+    Map a post workflow error to an HTTP status code and error detail.
+    
+    Args:
+        e: Error raised by the workflow
+        
+    Returns:
+        (status_code, detail) tuple
+    """
+    if isinstance(e, ValidationError):
+        # Input validation errors (400 Bad Request)
+        return 400, {
+            "error": "ValidationError",
+            "message": e.message,
+            "details": e.context
+        }
+    
+    if isinstance(e, LLMProviderError):
+        # LLM provider errors (502 Bad Gateway)
+        return 502, {
+            "error": "LLMProviderError",
+            "message": f"AI service temporarily unavailable: {e.message}",
+            "details": e.context
+        }
+    
+    if isinstance(e, DatabaseError):
+        # Database errors (500 Internal Server Error)
+        return 500, {
+            "error": "DatabaseError",
+            "message": "Internal database error occurred",
+            "details": {"operation": e.context.get("operation", "unknown")}
+        }
+    
+    # General processing errors (500 Internal Server Error)
+    return 500, {
+        "error": "ProcessingError",
+        "message": e.message,
+        "details": e.context
+    }
+
+
 @router.put("/{post_id}", response_model=PostResponse)
 async def update_post(
     post_id: int,
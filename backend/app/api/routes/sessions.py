@@ -16,6 +16,7 @@ from app.core.dependencies import get_db
 from app.models.session import Session
 from app.models.user_request import UserRequest
 from app.core.config import settings
+from app.core.quota import get_quota_usage
 
 router = APIRouter()
 
@@ -183,27 +184,8 @@ async def get_session_quota(
                 }
             )
         
-        # Calculate quota usage
-        today = datetime.utcnow().date()
-        month_start = today.replace(day=1)
-        
-        # Get daily usage
-        daily_result = await db.execute(
-            select(func.count(UserRequest.id)).where(
-                UserRequest.session_id == session_id,
-                func.date(UserRequest.created_at) == today
-            )
-        )
-        daily_used = daily_result.scalar() or 0
-        
-        # Get monthly usage
-        monthly_result = await db.execute(
-            select(func.count(UserRequest.id)).where(
-                UserRequest.session_id == session_id,
-                func.date(UserRequest.created_at) >= month_start
-            )
-        )
-        monthly_used = monthly_result.scalar() or 0
+        # Calculate quota usage (daily and monthly in a single query)
+        daily_used, monthly_used = await get_quota_usage(db, session_id)
         
         # Calculate remaining quota
         remaining = max(0, settings.DAILY_QUOTA_LIMIT - daily_used)
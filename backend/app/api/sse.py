@@ -0,0 +1,25 @@
+"""
+Server-Sent Events helpers for streaming API routes.
+"""
+import json
+from typing import Any
+
+# Headers that keep proxies from buffering or caching the event stream
+SSE_HEADERS = {
+    "Cache-Control": "no-cache",
+    "X-Accel-Buffering": "no"
+}
+
+
+def format_sse_event(event: str, data: Any) -> str:
+    """
+    Format one Server-Sent Event.
+    
+    Args:
+        event: Event name
+        data: JSON-serializable event payload
+    
+    Returns:
+        Encoded SSE message
+    """
+    return f"event: {event}\ndata: {json.dumps(data, default=str)}\n\n"
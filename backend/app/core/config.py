@@ -1,7 +1,7 @@
 """
 Application configuration settings
 """
-from typing import List
+from typing import Dict, List
 from pydantic_settings import BaseSettings
 from pydantic import validator
 
@@ -36,6 +36,9 @@ class Settings(BaseSettings):
     GOOGLE_API_KEY: str = ""
     TINYURL_API_KEY: str = ""
     
+    # Admin endpoints (X-Admin-Key header); disabled when empty
+    ADMIN_API_KEY: str = ""
+    
     # Langfuse Configuration (LLM Observability)
     LANGFUSE_PUBLIC_KEY: str = ""
     LANGFUSE_SECRET_KEY: str = ""
@@ -44,20 +47,112 @@ class Settings(BaseSettings):
     # Quota Limits
     DAILY_QUOTA_LIMIT: int = 10
     MONTHLY_QUOTA_LIMIT: int = 300
+    # "database" checks quota in Postgres on every request; "memory" keeps
+    # per-session counters in process and writes requests behind in batches
+    QUOTA_BACKEND: str = "database"
+    QUOTA_FLUSH_INTERVAL: float = 1.0  # seconds
+    QUOTA_FLUSH_BATCH_SIZE: int = 100
+    QUOTA_WRITE_MAX_RETRIES: int = 60  # batch retries while the database is unreachable
     
     # LLM Configuration
     DEFAULT_LLM_MODEL: str = "claude-3-5-sonnet"
     LLM_MAX_TOKENS: int = 4000
     LLM_TEMPERATURE: float = 0.7
     
+    # Summarization strategy: "sequential", "concurrent" or "batch"
+    SUMMARY_STRATEGY: str = "concurrent"
+    # Max in-flight summary calls per provider (overrides keyed by provider name)
+    LLM_DEFAULT_CONCURRENCY: int = 4
+    LLM_PROVIDER_CONCURRENCY: Dict[str, int] = {}
+    # Per-article summaries reused across sessions (in-process LRU over article_summary_cache)
+    SUMMARY_CACHE_ENABLED: bool = True
+    SUMMARY_CACHE_MAX_ENTRIES: int = 5000
+    # Provider routing: per-model rolling health window and circuit breaker
+    LLM_ROUTER_WINDOW_SECONDS: float = 120.0
+    LLM_ROUTER_MIN_REQUESTS: int = 5  # calls in the window before the error rate can trip
+    LLM_ROUTER_ERROR_THRESHOLD: float = 0.5
+    LLM_ROUTER_CONSECUTIVE_FAILURES: int = 3
+    LLM_ROUTER_OPEN_SECONDS: float = 30.0
+    # Requested model keeps priority unless its score is this many times the best one
+    LLM_ROUTER_PREFERENCE_SLACK: float = 2.0
+    # Hedging: duplicate a call on the next provider once it exceeds this latency quantile
+    LLM_HEDGING_ENABLED: bool = False
+    LLM_HEDGING_QUANTILE: float = 0.95
+    LLM_HEDGING_MIN_SAMPLES: int = 20  # successful calls in the window before hedging a model
+    # Hedges earned per primary call, up to the burst (overrides keyed by node name)
+    LLM_HEDGING_BUDGET_RATIO: float = 0.05
+    LLM_HEDGING_BUDGET_BURST: float = 5.0
+    LLM_HEDGING_BUDGETS: Dict[str, float] = {}
+    
     # News Configuration
     MAX_NEWS_ARTICLES: int = 12
     DEFAULT_NEWS_ARTICLES: int = 5
     NEWS_CACHE_TTL: int = 3600  # 1 hour
+    NEWS_CACHE_ENABLED: bool = True
+    # Write news_cache rows from a background queue instead of before the response
+    NEWS_CACHE_WRITE_BEHIND: bool = True
+    # Share one pipeline run between identical concurrent requests across sessions
+    NEWS_COALESCE_ENABLED: bool = True
+    NEWS_COALESCE_TIMEOUT: float = 120.0  # max seconds a follower waits for the leader
+    
+    # Write-behind queues (news_cache rows and in-memory quota request records)
+    WRITE_BEHIND_MAX_SIZE: int = 1000  # queued items before producers wait
+    WRITE_BEHIND_BATCH_SIZE: int = 100
+    WRITE_BEHIND_FLUSH_INTERVAL: float = 1.0  # seconds to collect a batch
+    WRITE_BEHIND_MAX_RETRIES: int = 3  # news_cache batches are dropped after this
+    WRITE_BEHIND_SHUTDOWN_TIMEOUT: float = 10.0  # seconds to drain on shutdown
+    
+    # Serper HTTP client (shared keep-alive connection pool)
+    SERPER_TIMEOUT: float = 30.0
+    SERPER_POOL_MAX_CONNECTIONS: int = 20
+    SERPER_POOL_MAX_KEEPALIVE: int = 10
+    SERPER_KEEPALIVE_EXPIRY: float = 30.0
+    SERPER_HTTP2: bool = False
+    
+    # Serper response cache (in-process LRU in front of serper_response_cache)
+    SERPER_CACHE_ENABLED: bool = True
+    SERPER_CACHE_TTL: int = 900  # seconds a response is served as fresh
+    SERPER_CACHE_STALE_TTL: int = 3600  # further seconds served stale while refreshing
+    SERPER_CACHE_MAX_ENTRIES: int = 500
+    
+    # Serper fan-out: extra keyword and site: queries per request, merged and de-duplicated
+    SERPER_FANOUT_ENABLED: bool = False
+    SERPER_FANOUT_MAX_QUERIES: int = 5  # including the base topic query
+    SERPER_FANOUT_CONCURRENCY: int = 5
+    SERPER_FANOUT_DEADLINE: float = 8.0  # seconds to wait for extra queries
+    
+    # Upstream rate limits shared by all workflows ("serper" and LLM model names)
+    RATE_LIMIT_ENABLED: bool = True
+    RATE_LIMIT_BACKEND: str = "memory"  # "memory" (per worker) or "redis" (REDIS_URL, shared)
+    RATE_LIMITS: Dict[str, Dict[str, float]] = {}  # e.g. {"serper": {"rps": 5}, "gpt-4-turbo": {"rps": 2, "tpm": 30000}}
+    RATE_LIMIT_DEFAULT_RPS: float = 10.0  # 0 = unlimited
+    RATE_LIMIT_DEFAULT_TPM: float = 0.0  # LLM tokens per minute, 0 = unlimited
+    RATE_LIMIT_BURST_SECONDS: float = 1.0  # requests bucket holds this many seconds of rps
+    RATE_LIMIT_MAX_WAIT: float = 30.0  # seconds a call may queue before failing
+    RATE_LIMIT_DEFAULT_BACKOFF: float = 1.0  # pause after a 429 without Retry-After
+    
+    # Topic config registry: seconds between topic_configs version checks (0 disables polling)
+    TOPIC_CONFIG_POLL_INTERVAL: float = 60.0
+    
+    # URL shortening (in-process LRU in front of the short_urls table)
+    URL_SHORTENER_CACHE_SIZE: int = 5000
+    
+    # External workflow state (stateless post workflow)
+    # "memory" (single worker), "redis" (shared across workers) or "sqlite"
+    STATE_BACKEND: str = "memory"
+    REDIS_URL: str = "redis://localhost:6379/0"
+    STATE_SQLITE_PATH: str = ":memory:"
+    STATE_TTL_SECONDS: int = 7200  # 2 hours
+    STATE_SWEEP_INTERVAL: float = 300.0  # seconds between expiry sweeps
+    STATE_MAX_ENTRIES: int = 1000  # in-memory backend LRU cap
     
     # Logging
     LOG_LEVEL: str = "INFO"
     LOG_FORMAT: str = "json"
+    # Format and write log records on a background thread instead of the event loop
+    LOG_ASYNC: bool = True
+    # Share of INFO records kept per step/event name (warnings and errors are always kept)
+    LOG_SAMPLE_RATES: Dict[str, float] = {"summary_progress": 0.1, "api_call": 0.25, "retry_attempt": 0.5}
     
     @validator("CORS_ORIGINS", pre=True)
     def assemble_cors_origins(cls, v):
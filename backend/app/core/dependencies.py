@@ -1,10 +1,12 @@
 """
 Core dependencies for the application
 """
-from fastapi import HTTPException, status
-from typing import AsyncGenerator
+import hmac
+from fastapi import HTTPException, Header, status
+from typing import AsyncGenerator, Optional
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.config import settings
 from app.core.database import AsyncSessionLocal
 from app.core.db_status import get_database_status
 
@@ -53,3 +55,28 @@ def check_database_connection():
             }
         )
     return True
+
+
+async def require_admin_key(x_admin_key: Optional[str] = Header(default=None)) -> None:
+    """
+    Admin endpoint guard comparing the X-Admin-Key header with ADMIN_API_KEY.
+    
+    Admin endpoints are disabled while ADMIN_API_KEY is empty.
+    """
+    if not settings.ADMIN_API_KEY:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail={
+                "error": "Admin API disabled",
+                "message": "Set ADMIN_API_KEY to enable admin endpoints."
+            }
+        )
+    
+    if x_admin_key is None or not hmac.compare_digest(x_admin_key, settings.ADMIN_API_KEY):
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail={
+                "error": "Invalid admin key",
+                "message": "A valid X-Admin-Key header is required."
+            }
+        )
@@ -0,0 +1,98 @@
+"""
+Shared HTTP clients for external APIs
+"""
+import logging
+from typing import Any, Dict, Optional
+
+import httpx
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+# Global app-scoped Serper client, created and closed in the application lifespan
+serper_client: Optional[httpx.AsyncClient] = None
+
+
+def create_serper_client() -> httpx.AsyncClient:
+    """Create a pooled keep-alive HTTP client for the Serper API"""
+    http2 = settings.SERPER_HTTP2
+    if http2:
+        try:
+            import h2  # noqa: F401
+        except ImportError:
+            logger.warning("SERPER_HTTP2 is enabled but the 'h2' package is not installed, using HTTP/1.1")
+            http2 = False
+    
+    limits = httpx.Limits(
+        max_connections=settings.SERPER_POOL_MAX_CONNECTIONS,
+        max_keepalive_connections=settings.SERPER_POOL_MAX_KEEPALIVE,
+        keepalive_expiry=settings.SERPER_KEEPALIVE_EXPIRY
+    )
+    
+    return httpx.AsyncClient(
+        timeout=settings.SERPER_TIMEOUT,
+        limits=limits,
+        http2=http2
+    )
+
+
+def set_serper_client(client: Optional[httpx.AsyncClient]):
+    """Set the app-scoped Serper client"""
+    global serper_client
+    serper_client = client
+
+
+def get_serper_client() -> Optional[httpx.AsyncClient]:
+    """Get the app-scoped Serper client, if the application has created one"""
+    return serper_client
+
+
+def get_client_pool_stats(client: Optional[httpx.AsyncClient]) -> Dict[str, Any]:
+    """
+    Get connection pool statistics for an httpx client.
+    
+    httpx does not expose pool stats publicly, so they are read from the
+    private httpcore pool. If its layout changes (e.g. after an upgrade),
+    the counts are reported as None instead of failing the health check.
+    """
+    if client is None:
+        return {"status": "not_initialized"}
+    
+    if client.is_closed:
+        return {"status": "closed"}
+    
+    stats = {
+        "status": "open",
+        "connections": None,
+        "in_use": None,
+        "idle": None,
+        "max_connections": settings.SERPER_POOL_MAX_CONNECTIONS,
+        "max_keepalive_connections": settings.SERPER_POOL_MAX_KEEPALIVE
+    }
+    
+    try:
+        pool = getattr(getattr(client, "_transport", None), "_pool", None)
+        connections = getattr(pool, "connections", None)
+        if connections is None:
+            return stats
+        
+        connections = list(connections)
+        idle = sum(1 for connection in connections if _connection_state(connection, "is_idle"))
+        closed = sum(1 for connection in connections if _connection_state(connection, "is_closed"))
+    except Exception as e:
+        logger.warning(f"Could not read HTTP connection pool stats: {e}")
+        return stats
+    
+    stats.update({
+        "connections": len(connections),
+        "in_use": len(connections) - idle - closed,
+        "idle": idle
+    })
+    return stats
+
+
+def _connection_state(connection: Any, method_name: str) -> bool:
+    """Call an httpcore connection state method, treating a missing one as False"""
+    method = getattr(connection, method_name, None)
+    return bool(method()) if callable(method) else False
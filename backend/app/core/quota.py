@@ -0,0 +1,60 @@
+"""
+Quota usage accounting shared by the quota check node and session routes
+"""
+from datetime import datetime, timedelta
+from typing import Optional, Tuple
+from sqlalchemy import select, func
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.user_request import UserRequest
+
+
+def get_quota_windows(now: Optional[datetime] = None) -> Tuple[datetime, datetime, datetime, datetime]:
+    """
+    Get the half-open UTC day and month windows containing now.
+    
+    Returns:
+        (day_start, next_day_start, month_start, next_month_start)
+    """
+    now = now or datetime.utcnow()
+    
+    day_start = now.replace(hour=0, minute=0, second=0, microsecond=0)
+    next_day_start = day_start + timedelta(days=1)
+    
+    month_start = day_start.replace(day=1)
+    if month_start.month == 12:
+        next_month_start = month_start.replace(year=month_start.year + 1, month=1)
+    else:
+        next_month_start = month_start.replace(month=month_start.month + 1)
+    
+    return day_start, next_day_start, month_start, next_month_start
+
+
+async def get_quota_usage(db: AsyncSession, session_id: str) -> Tuple[int, int]:
+    """
+    Count a session's requests for the current UTC day and month in one query.
+    
+    Filters on plain created_at ranges (no date() casts) so the
+    (session_id, created_at) index can serve the scan.
+    
+    Returns:
+        (daily_used, monthly_used)
+    """
+    day_start, next_day_start, month_start, next_month_start = get_quota_windows()
+    
+    result = await db.execute(
+        select(
+            func.count(UserRequest.id).filter(
+                UserRequest.created_at >= day_start,
+                UserRequest.created_at < next_day_start
+            ),
+            func.count(UserRequest.id)
+        ).where(
+            UserRequest.session_id == session_id,
+            UserRequest.created_at >= month_start,
+            UserRequest.created_at < next_month_start
+        )
+    )
+    daily_used, monthly_used = result.one()
+    
+    return daily_used or 0, monthly_used or 0
@@ -3,6 +3,8 @@ LangGraph nodes for news processing and post generation workflows
 """
 from .validate_input_node import ValidateInputNode
 from .check_quota_node import CheckQuotaNode
+from .check_cache_node import CheckCacheNode
+from .coalesce_request_node import CoalesceRequestNode
 from .fetch_news_node import FetchNewsNode
 from .filter_articles_node import FilterArticlesNode
 from .summarize_content_node import SummarizeContentNode
@@ -15,6 +17,8 @@ __all__ = [
     # News processing nodes
     "ValidateInputNode",
     "CheckQuotaNode",
+    "CheckCacheNode",
+    "CoalesceRequestNode",
     "FetchNewsNode",
     "FilterArticlesNode",
     "SummarizeContentNode",
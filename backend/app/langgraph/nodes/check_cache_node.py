@@ -0,0 +1,188 @@
+"""
+Read-through cache node for news processing workflow.
+
+This node follows LangGraph best practices:
+- Single responsibility: Serve repeat requests from the news cache
+- Cache failures degrade to a normal fetch instead of failing the workflow
+- Immutable state updates
+- Comprehensive logging
+"""
+import time
+from datetime import datetime, timedelta
+from typing import List, Optional
+from sqlalchemy import select, func
+
+from app.langgraph.state.news_state import NewsState, NewsArticle, mark_step_completed
+from app.langgraph.utils.logging_config import StructuredLogger
+from app.core.config import settings
+from app.core.database import AsyncSessionLocal
+from app.models.news_cache import NewsCache
+
+
+class CheckCacheNode:
+    """
+    Serves (topic, date, top_n) requests from the news_cache table.
+    
+    Responsibilities:
+    - Look up articles cached for the same topic and date within NEWS_CACHE_TTL
+    - Return cached summaries when enough articles are available
+    - Flag cache hits so the workflow can skip fetching and summarization
+    
+    A cache miss (or any cache lookup failure) leaves the state
+    untouched apart from the processing step, so the workflow
+    continues with a fresh Serper fetch.
+    """
+    
+    def __init__(self):
+        """Initialize cache checking node with structured logger."""
+        self.logger = StructuredLogger("check_cache")
+        self.node_name = "check_cache"
+    
+    async def __call__(self, state: NewsState) -> NewsState:
+        """
+        Execute the read-through cache lookup.
+        
+        Args:
+            state: Current workflow state
+        
+        Returns:
+            Updated state, with summarized articles populated on a cache hit
+        """
+        start_time = time.time()
+        
+        # Log node entry
+        self.logger.log_node_entry(
+            session_id=state["session_id"],
+            workflow_id=state["workflow_id"],
+            step="check_cache",
+            extra_data={
+                "topic": state["topic"],
+                "date": state["date"],
+                "top_n": state["top_n"]
+            }
+        )
+        
+        new_state = state.copy()
+        new_state["current_step"] = "Checking news cache"
+        
+        if not settings.NEWS_CACHE_ENABLED:
+            new_state["cache_hit"] = False
+            return mark_step_completed(new_state, "check_cache", "News cache disabled")
+        
+        try:
+            cached_articles = await self._load_cached_articles(
+                topic=state["topic"],
+                date=state["date"],
+                top_n=state["top_n"]
+            )
+        except Exception as e:
+            # Cache is an optimization only - fall through to a fresh fetch
+            self.logger.log_processing_step(
+                session_id=state["session_id"],
+                workflow_id=state["workflow_id"],
+                step="cache_lookup_failed",
+                message=f"News cache lookup failed, fetching fresh articles: {str(e)}",
+                extra_data={"error": str(e)}
+            )
+            cached_articles = None
+        
+        if cached_articles:
+            new_state["summarized_articles"] = cached_articles
+            new_state["total_found"] = len(cached_articles)
+            new_state["cache_hit"] = True
+            message = f"Served {len(cached_articles)} articles from cache"
+        else:
+            new_state["cache_hit"] = False
+            message = "Cache miss, fetching fresh articles"
+        
+        self.logger.log_processing_step(
+            session_id=state["session_id"],
+            workflow_id=state["workflow_id"],
+            step="cache_hit" if new_state["cache_hit"] else "cache_miss",
+            message=message,
+            extra_data={"cache_hit": new_state["cache_hit"]}
+        )
+        
+        completed_state = mark_step_completed(new_state, "check_cache", message)
+        
+        # Log successful completion
+        duration = time.time() - start_time
+        self.logger.log_node_exit(
+            session_id=state["session_id"],
+            workflow_id=state["workflow_id"],
+            step="check_cache",
+            success=True,
+            duration=duration,
+            extra_data={"cache_hit": new_state["cache_hit"]}
+        )
+        
+        return completed_state
+    
+    async def _load_cached_articles(
+        self,
+        topic: str,
+        date: str,
+        top_n: int
+    ) -> Optional[List[NewsArticle]]:
+        """
+        Load cached articles for the topic and date within the cache TTL.
+        
+        Args:
+            topic: News topic
+            date: Date in YYYY-MM-DD format
+            top_n: Number of articles requested
+        
+        Returns:
+            List of cached articles, or None when fewer than top_n are cached
+        """
+        cutoff = datetime.utcnow() - timedelta(seconds=settings.NEWS_CACHE_TTL)
+        rows = await self._query_cached_rows(topic, date, cutoff, top_n)
+        
+        if len(rows) < top_n:
+            return None
+        
+        return [
+            NewsArticle(
+                title=row.title,
+                url=row.url,
+                source=row.source,
+                summary=row.summary,
+                published_at=row.published_at,
+                relevance_score=row.relevance_score,
+                content_hash=row.content_hash
+            )
+            for row in rows
+        ]
+    
+    async def _query_cached_rows(
+        self,
+        topic: str,
+        date: str,
+        cutoff: datetime,
+        top_n: int
+    ) -> List[NewsCache]:
+        """
+        Query news_cache rows for the topic and date created since cutoff.
+        
+        Args:
+            topic: News topic, matched case-insensitively
+            date: Date in YYYY-MM-DD format
+            cutoff: Oldest created_at still within the TTL
+            top_n: Maximum number of rows
+        
+        Returns:
+            Rows in ranked order
+        """
+        async with AsyncSessionLocal() as db_session:
+            # Rank as the filter node does: by relevance, then insertion order
+            result = await db_session.execute(
+                select(NewsCache)
+                .where(
+                    func.lower(NewsCache.topic) == topic.lower().strip(),
+                    NewsCache.date_fetched == date,
+                    NewsCache.created_at >= cutoff
+                )
+                .order_by(NewsCache.relevance_score.desc().nullslast(), NewsCache.id)
+                .limit(top_n)
+            )
+            return result.scalars().all()
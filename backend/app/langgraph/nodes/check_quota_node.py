@@ -10,7 +10,7 @@ This node follows LangGraph best practices:
 import time
 from datetime import datetime, timedelta
 from typing import Optional
-from sqlalchemy import select, func
+from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.langgraph.state.news_state import NewsState, QuotaInfo, mark_step_completed, mark_step_error
@@ -23,6 +23,8 @@ from app.langgraph.utils.error_handlers import (
 )
 from app.core.config import settings
 from app.core.database import AsyncSessionLocal
+from app.core.quota import get_quota_usage
+from app.langgraph.utils.quota_backend import InMemoryQuotaBackend, get_quota_backend
 from app.models.user_request import UserRequest
 from app.models.session import Session
 
@@ -80,44 +82,15 @@ class CheckQuotaNode:
             new_state = state.copy()
             new_state["current_step"] = "Checking quota and duplicate requests"
             
-            async with AsyncSessionLocal() as db_session:
-                # Ensure session exists
-                await self._ensure_session_exists(db_session, state["session_id"])
-                
-                # Generate request hash for duplicate detection
-                request_hash = self._generate_request_hash(state["topic"], state["date"], state["session_id"])
-                
-                # Check for duplicate requests
-                await self._check_duplicate_request(
-                    db_session, 
-                    state["session_id"], 
-                    request_hash,
-                    state["workflow_id"]
-                )
-                
-                # Get current quota usage
-                quota_info = await self._get_quota_info(db_session, state["session_id"])
-                
-                # Check quota limits
-                self._validate_quota_limits(quota_info, state["workflow_id"])
-                
-                # Record this request
-                await self._record_request(
-                    db_session,
-                    state["session_id"],
-                    state["topic"],
-                    state["date"],
-                    request_hash
-                )
-                
-                # Update quota info after recording request
-                quota_info["daily_used"] += 1
-                quota_info["monthly_used"] += 1
-                quota_info["remaining"] = quota_info["daily_limit"] - quota_info["daily_used"]
-                quota_info["quota_available"] = quota_info["remaining"] > 0
-                
-                # Commit the transaction
-                await db_session.commit()
+            # Generate request hash for duplicate detection
+            request_hash = self._generate_request_hash(state["topic"], state["date"], state["session_id"])
+            
+            quota_backend = get_quota_backend()
+            if quota_backend is not None:
+                # In-memory counters with write-behind persistence
+                quota_info = await self._check_quota_in_memory(quota_backend, state, request_hash)
+            else:
+                quota_info = await self._check_quota_in_database(state, request_hash)
             
             # Update state with quota information
             new_state["quota_info"] = quota_info
@@ -193,6 +166,92 @@ class CheckQuotaNode:
             
             raise custom_error
     
+    async def _check_quota_in_database(self, state: NewsState, request_hash: str) -> QuotaInfo:
+        """
+        Check duplicates and quota, and record the request directly in the database.
+        
+        Args:
+            state: Current workflow state
+            request_hash: Request hash for duplicate detection
+            
+        Returns:
+            Quota information including this request
+        """
+        async with AsyncSessionLocal() as db_session:
+            # Ensure session exists
+            await self._ensure_session_exists(db_session, state["session_id"])
+            
+            # Check for duplicate requests
+            await self._check_duplicate_request(
+                db_session, 
+                state["session_id"], 
+                request_hash,
+                state["workflow_id"]
+            )
+            
+            # Get current quota usage
+            quota_info = await self._get_quota_info(db_session, state["session_id"])
+            
+            # Check quota limits
+            self._validate_quota_limits(quota_info, state["workflow_id"])
+            
+            # Record this request
+            await self._record_request(
+                db_session,
+                state["session_id"],
+                state["topic"],
+                state["date"],
+                request_hash
+            )
+            
+            # Update quota info after recording request
+            quota_info["daily_used"] += 1
+            quota_info["monthly_used"] += 1
+            quota_info["remaining"] = quota_info["daily_limit"] - quota_info["daily_used"]
+            quota_info["quota_available"] = quota_info["remaining"] > 0
+            
+            # Commit the transaction
+            await db_session.commit()
+        
+        return quota_info
+    
+    async def _check_quota_in_memory(
+        self,
+        quota_backend: InMemoryQuotaBackend,
+        state: NewsState,
+        request_hash: str
+    ) -> QuotaInfo:
+        """
+        Check duplicates and quota against in-memory counters.
+        
+        The request is recorded in memory and written to the
+        database asynchronously by the quota backend.
+        
+        Args:
+            quota_backend: In-memory quota backend
+            state: Current workflow state
+            request_hash: Request hash for duplicate detection
+            
+        Returns:
+            Quota information including this request
+        """
+        daily_used, monthly_used = await quota_backend.reserve(
+            session_id=state["session_id"],
+            topic=state["topic"],
+            date=state["date"],
+            request_hash=request_hash
+        )
+        
+        remaining = settings.DAILY_QUOTA_LIMIT - daily_used
+        return QuotaInfo(
+            daily_used=daily_used,
+            daily_limit=settings.DAILY_QUOTA_LIMIT,
+            monthly_used=monthly_used,
+            monthly_limit=settings.MONTHLY_QUOTA_LIMIT,
+            remaining=remaining,
+            quota_available=remaining > 0
+        )
+    
     async def _ensure_session_exists(self, db_session: AsyncSession, session_id: str) -> None:
         """
         Ensure session exists in database, create if not found.
@@ -322,26 +381,8 @@ class CheckQuotaNode:
             DatabaseError: When quota query fails
         """
         try:
-            today = datetime.utcnow().date()
-            month_start = today.replace(day=1)
-            
-            # Get daily usage
-            daily_result = await db_session.execute(
-                select(func.count(UserRequest.id)).where(
-                    UserRequest.session_id == session_id,
-                    func.date(UserRequest.created_at) == today
-                )
-            )
-            daily_used = daily_result.scalar() or 0
-            
-            # Get monthly usage
-            monthly_result = await db_session.execute(
-                select(func.count(UserRequest.id)).where(
-                    UserRequest.session_id == session_id,
-                    func.date(UserRequest.created_at) >= month_start
-                )
-            )
-            monthly_used = monthly_result.scalar() or 0
+            # Daily and monthly usage in a single aggregate query
+            daily_used, monthly_used = await get_quota_usage(db_session, session_id)
             
             return QuotaInfo(
                 daily_used=daily_used,
@@ -0,0 +1,117 @@
+"""
+Request coalescing node for news processing workflow.
+
+This node follows LangGraph best practices:
+- Single responsibility: Share one pipeline run between identical concurrent requests
+- Leader failures degrade to a normal fetch instead of failing followers
+- Immutable state updates
+- Comprehensive logging
+"""
+import time
+
+from app.langgraph.state.news_state import NewsState, mark_step_completed
+from app.langgraph.utils.logging_config import StructuredLogger
+from app.langgraph.utils.request_coalescer import get_request_coalescer, make_coalesce_key
+from app.core.config import settings
+
+
+class CoalesceRequestNode:
+    """
+    Coalesces concurrent cache misses for the same (topic, date, top_n, llm_model).
+    
+    Responsibilities:
+    - Make the first workflow for a key the leader, which runs the pipeline
+    - Make concurrent workflows followers, which await the leader's articles
+    - Flag coalesced results so the workflow skips fetching and summarization
+    
+    The leader publishes its articles from SaveResultsNode, after they
+    are cached. A follower whose leader fails or times out continues
+    with its own fresh fetch.
+    """
+    
+    def __init__(self):
+        """Initialize request coalescing node with structured logger."""
+        self.logger = StructuredLogger("coalesce_request")
+        self.node_name = "coalesce_request"
+    
+    async def __call__(self, state: NewsState) -> NewsState:
+        """
+        Join or lead the in-flight pipeline for this request.
+        
+        Args:
+            state: Current workflow state after a cache miss
+        
+        Returns:
+            Updated state, with summarized articles populated for followers
+        """
+        start_time = time.time()
+        
+        self.logger.log_node_entry(
+            session_id=state["session_id"],
+            workflow_id=state["workflow_id"],
+            step="coalesce_request",
+            extra_data={
+                "topic": state["topic"],
+                "date": state["date"],
+                "top_n": state["top_n"],
+                "llm_model": state["llm_model"]
+            }
+        )
+        
+        new_state = state.copy()
+        new_state["current_step"] = "Checking for identical in-flight requests"
+        new_state["coalesced"] = False
+        
+        if not settings.NEWS_COALESCE_ENABLED:
+            return mark_step_completed(new_state, "coalesce_request", "Request coalescing disabled")
+        
+        coalescer = get_request_coalescer()
+        key = make_coalesce_key(state["topic"], state["date"], state["top_n"], state["llm_model"])
+        is_leader, future = coalescer.acquire(key, state["workflow_id"])
+        
+        if is_leader:
+            step = "coalesce_leader"
+            message = "No identical request in flight, fetching fresh articles"
+        else:
+            self.logger.log_processing_step(
+                session_id=state["session_id"],
+                workflow_id=state["workflow_id"],
+                step="coalesce_wait",
+                message="Waiting for identical in-flight request",
+                extra_data={"coalesce_key": key}
+            )
+            
+            result = await coalescer.wait(future, settings.NEWS_COALESCE_TIMEOUT)
+            
+            if result:
+                new_state["summarized_articles"] = result["articles"]
+                new_state["total_found"] = result["total_found"]
+                new_state["current_llm_provider"] = result["llm_provider"]
+                new_state["coalesced"] = True
+                step = "coalesce_follower"
+                message = f"Shared {len(result['articles'])} articles from identical in-flight request"
+            else:
+                step = "coalesce_fallback"
+                message = "Identical in-flight request failed or timed out, fetching fresh articles"
+        
+        self.logger.log_processing_step(
+            session_id=state["session_id"],
+            workflow_id=state["workflow_id"],
+            step=step,
+            message=message,
+            extra_data={"coalesce_key": key, "coalesced": new_state["coalesced"]}
+        )
+        
+        completed_state = mark_step_completed(new_state, "coalesce_request", message)
+        
+        duration = time.time() - start_time
+        self.logger.log_node_exit(
+            session_id=state["session_id"],
+            workflow_id=state["workflow_id"],
+            step="coalesce_request",
+            success=True,
+            duration=duration,
+            extra_data={"coalesced": new_state["coalesced"]}
+        )
+        
+        return completed_state
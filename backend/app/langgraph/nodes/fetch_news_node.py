@@ -9,18 +9,23 @@ This node follows LangGraph best practices:
 """
 import time
 import asyncio
-from typing import List, Dict, Any, Optional
+from contextlib import asynccontextmanager
+from typing import List, Dict, Any, Optional, AsyncIterator, Tuple
 import httpx
 from datetime import datetime
 
 from app.langgraph.state.news_state import NewsState, mark_step_completed, mark_step_error
 from app.langgraph.utils.logging_config import StructuredLogger
+from app.langgraph.utils.serper_cache import get_serper_cache
+from app.langgraph.utils.topic_config_registry import get_topic_config
+from app.langgraph.utils.rate_limiter import SERPER_UPSTREAM, get_rate_limiter, is_rate_limit_error, parse_retry_after
 from app.langgraph.utils.error_handlers import (
     SerperAPIError,
     RetryableError,
     handle_node_error
 )
 from app.core.config import settings
+from app.core.http_client import get_serper_client
 
 
 class FetchNewsNode:
@@ -38,12 +43,21 @@ class FetchNewsNode:
     proper error handling and retry mechanisms.
     """
     
-    def __init__(self):
-        """Initialize news fetching node with structured logger."""
+    def __init__(self, http_client: Optional[httpx.AsyncClient] = None):
+        """
+        Initialize news fetching node with structured logger.
+        
+        Args:
+            http_client: Shared pooled client for Serper calls. Falls back to
+                the app-scoped client, then to a one-off client per call.
+        """
         self.logger = StructuredLogger("fetch_news")
         self.node_name = "fetch_news"
         self.base_url = "https://google.serper.dev/news"
-        self.timeout = 30.0
+        self.timeout = settings.SERPER_TIMEOUT
+        self.http_client = http_client
+        self.language = "en"
+        self.country = "us"
         self.max_retries = 3
         self.retry_delay = 1.0
     
@@ -89,13 +103,22 @@ class FetchNewsNode:
                 message=f"Built search query: {search_query}"
             )
             
-            # Fetch articles with retry mechanism
-            raw_articles = await self._fetch_with_retry(
-                query=search_query,
-                num_results=state["top_n"],
-                session_id=state["session_id"],
-                workflow_id=state["workflow_id"]
-            )
+            # Fetch articles through the response cache
+            if settings.SERPER_FANOUT_ENABLED:
+                raw_articles = await self._fetch_fanout(
+                    topic=state["topic"],
+                    date=state["date"],
+                    num_results=state["top_n"],
+                    session_id=state["session_id"],
+                    workflow_id=state["workflow_id"]
+                )
+            else:
+                raw_articles = await self._fetch_articles(
+                    query=search_query,
+                    num_results=state["top_n"],
+                    session_id=state["session_id"],
+                    workflow_id=state["workflow_id"]
+                )
             
             # Update state with fetched articles
             new_state["raw_articles"] = raw_articles
@@ -192,6 +215,210 @@ class FetchNewsNode:
         
         return query
     
+    def _build_fanout_queries(
+        self,
+        topic: str,
+        date: str,
+        topic_config: Optional[Dict[str, Any]]
+    ) -> List[str]:
+        """
+        Build the queries for a fan-out fetch.
+        
+        The base topic query comes first, followed by alternating keyword
+        and trusted-source site: variants from the topic configuration,
+        up to SERPER_FANOUT_MAX_QUERIES queries in total.
+        
+        Args:
+            topic: News topic to search for
+            date: Date in YYYY-MM-DD format
+            topic_config: Topic configuration, or None for the base query only
+            
+        Returns:
+            De-duplicated list of search queries
+        """
+        base_query = self._build_search_query(topic, date)
+        if not topic_config:
+            return [base_query]
+        
+        keyword_queries = [
+            self._build_search_query(keyword, date)
+            for keyword in topic_config.get("keywords") or []
+        ]
+        site_queries = [
+            f"{topic.strip()} site:{source} after:{date}"
+            for source in topic_config.get("trustedSources") or []
+        ]
+        
+        queries = [base_query]
+        seen = {base_query.lower()}
+        for i in range(max(len(keyword_queries), len(site_queries))):
+            for candidates in (keyword_queries, site_queries):
+                if i < len(candidates) and candidates[i].lower() not in seen:
+                    seen.add(candidates[i].lower())
+                    queries.append(candidates[i])
+        
+        return queries[:max(settings.SERPER_FANOUT_MAX_QUERIES, 1)]
+    
+    async def _fetch_fanout(
+        self,
+        topic: str,
+        date: str,
+        num_results: int,
+        session_id: str,
+        workflow_id: str
+    ) -> List[Dict[str, Any]]:
+        """
+        Fetch news with several concurrent queries and merge the results.
+        
+        Queries run under SERPER_FANOUT_CONCURRENCY and results are merged
+        and de-duplicated by URL as each query completes. Extra queries
+        still running at SERPER_FANOUT_DEADLINE are cancelled, but the base
+        query is always awaited. The fetch only fails when the base query
+        fails and no other query returned articles.
+        
+        Args:
+            topic: News topic to search for
+            date: Date in YYYY-MM-DD format
+            num_results: Number of results to fetch per query
+            session_id: Session identifier for logging
+            workflow_id: Workflow identifier for logging
+            
+        Returns:
+            Merged list of raw article dictionaries, base query results first
+            
+        Raises:
+            SerperAPIError: When the base query fails and no other query returned articles
+        """
+        try:
+            topic_config = await get_topic_config(topic)
+        except Exception as e:
+            # Fan-out is best effort; fall back to the base query alone
+            self.logger.log_processing_step(
+                session_id=session_id,
+                workflow_id=workflow_id,
+                step="fanout_config_failed",
+                message=f"Topic config unavailable, fetching base query only: {str(e)}",
+                extra_data={"error": str(e)}
+            )
+            topic_config = None
+        
+        queries = self._build_fanout_queries(topic, date, topic_config)
+        semaphore = asyncio.Semaphore(max(settings.SERPER_FANOUT_CONCURRENCY, 1))
+        
+        async def run_query(index: int, query: str) -> Tuple[int, List[Dict[str, Any]]]:
+            async with semaphore:
+                articles = await self._fetch_articles(
+                    query=query,
+                    num_results=num_results,
+                    session_id=session_id,
+                    workflow_id=workflow_id
+                )
+            return index, articles
+        
+        tasks = [asyncio.create_task(run_query(i, query)) for i, query in enumerate(queries)]
+        base_task = tasks[0]
+        
+        # URL -> (query index, position, article); lower query index wins on duplicates
+        merged: Dict[str, Tuple[int, int, Dict[str, Any]]] = {}
+        failed_queries = 0
+        deadline = time.monotonic() + settings.SERPER_FANOUT_DEADLINE
+        pending = set(tasks)
+        
+        try:
+            while pending:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    if base_task not in pending:
+                        break
+                    # Past the deadline, only the base query is still worth waiting for
+                    remaining = None
+                
+                done, pending = await asyncio.wait(
+                    pending,
+                    timeout=remaining,
+                    return_when=asyncio.FIRST_COMPLETED
+                )
+                
+                for task in done:
+                    if task.exception() is not None:
+                        failed_queries += 1
+                        continue
+                    
+                    index, articles = task.result()
+                    for position, article in enumerate(articles):
+                        url = article.get("url", "")
+                        existing = merged.get(url)
+                        if existing is None or index < existing[0]:
+                            merged[url] = (index, position, article)
+        finally:
+            for task in pending:
+                task.cancel()
+        
+        if base_task.exception() is not None and not merged:
+            raise base_task.exception()
+        
+        self.logger.log_processing_step(
+            session_id=session_id,
+            workflow_id=workflow_id,
+            step="fanout_merged",
+            message=f"Merged {len(merged)} unique articles from {len(queries)} queries",
+            extra_data={
+                "queries": queries,
+                "failed_queries": failed_queries,
+                "timed_out_queries": len(pending),
+                "unique_articles": len(merged)
+            }
+        )
+        
+        return [article for _, _, article in sorted(merged.values(), key=lambda item: item[:2])]
+    
+    async def _fetch_articles(
+        self,
+        query: str,
+        num_results: int,
+        session_id: str,
+        workflow_id: str
+    ) -> List[Dict[str, Any]]:
+        """
+        Fetch news through the Serper response cache.
+        
+        Repeated queries are answered from the cache (stale entries are
+        served while refreshing in the background); misses fall through
+        to the API with retries.
+        
+        Args:
+            query: Search query string
+            num_results: Number of results to fetch
+            session_id: Session identifier for logging
+            workflow_id: Workflow identifier for logging
+            
+        Returns:
+            List of raw article dictionaries
+            
+        Raises:
+            SerperAPIError: When all retry attempts fail
+        """
+        num_results = min(num_results, 20)  # Serper max is typically 20
+        
+        async def fetch(num: int) -> List[Dict[str, Any]]:
+            return await self._fetch_with_retry(
+                query=query,
+                num_results=num,
+                session_id=session_id,
+                workflow_id=workflow_id
+            )
+        
+        if not settings.SERPER_CACHE_ENABLED:
+            return await fetch(num_results)
+        
+        return await get_serper_cache().get_or_fetch(
+            query=query,
+            num_results=num_results,
+            hl=self.language,
+            gl=self.country,
+            fetch=fetch
+        )
+    
     async def _fetch_with_retry(
         self,
         query: str,
@@ -229,8 +456,8 @@ class FetchNewsNode:
                 last_error = e
                 
                 if attempt < self.max_retries:
-                    # Calculate delay with exponential backoff
-                    delay = self.retry_delay * (2 ** attempt)
+                    # Calculate delay with exponential backoff; the rate limiter paces 429 retries
+                    delay = 0 if is_rate_limit_error(e) else self.retry_delay * (2 ** attempt)
                     
                     self.logger.log_processing_step(
                         session_id=session_id,
@@ -290,8 +517,8 @@ class FetchNewsNode:
         payload = {
             "q": query,
             "num": min(num_results, 20),  # Serper max is typically 20
-            "hl": "en",
-            "gl": "us"
+            "hl": self.language,
+            "gl": self.country
         }
         
         headers = {
@@ -299,10 +526,14 @@ class FetchNewsNode:
             "Content-Type": "application/json"
         }
         
+        # Wait for a slot shared with every other workflow calling Serper
+        limiter = get_rate_limiter(SERPER_UPSTREAM)
+        await limiter.acquire()
+        
         api_start_time = time.time()
         
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
+            async with self._get_http_client() as client:
                 # Log API call
                 self.logger.log_api_call(
                     session_id=session_id,
@@ -333,6 +564,9 @@ class FetchNewsNode:
                 )
                 
                 # Check response status
+                if response.status_code == 429:
+                    await limiter.record_throttled(parse_retry_after(response.headers.get("Retry-After")))
+                
                 if response.status_code != 200:
                     error_body = response.text
                     raise SerperAPIError(
@@ -353,9 +587,29 @@ class FetchNewsNode:
             raise SerperAPIError(f"API call timed out after {self.timeout}s")
         except httpx.RequestError as e:
             raise SerperAPIError(f"Request error: {str(e)}")
+        except SerperAPIError:
+            # Keep the status code for retry decisions
+            raise
         except Exception as e:
             raise SerperAPIError(f"Unexpected error during API call: {str(e)}")
     
+    @asynccontextmanager
+    async def _get_http_client(self) -> AsyncIterator[httpx.AsyncClient]:
+        """
+        Get an HTTP client for a Serper call.
+        
+        Yields the shared pooled client when one is open, so connections
+        are kept alive across requests. Otherwise yields a one-off client
+        that is closed after the call.
+        """
+        client = self.http_client or get_serper_client()
+        if client is not None and not client.is_closed:
+            yield client
+            return
+        
+        async with httpx.AsyncClient(timeout=self.timeout) as client:
+            yield client
+    
     def _parse_serper_response(self, response_data: Dict[str, Any]) -> List[Dict[str, Any]]:
         """
         Parse Serper API response and extract articles.
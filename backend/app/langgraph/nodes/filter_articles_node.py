@@ -11,7 +11,6 @@ import time
 import hashlib
 from typing import List, Dict, Any, Optional
 from urllib.parse import urlparse
-from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.langgraph.state.news_state import NewsState, NewsArticle, mark_step_completed, mark_step_error
@@ -19,12 +18,11 @@ from app.langgraph.utils.logging_config import StructuredLogger
 from app.langgraph.utils.error_handlers import (
     ContentFilteringError,
     TopicConfigError,
-    DatabaseError,
     handle_node_error
 )
+from app.langgraph.utils.topic_config_registry import get_topic_config
+from app.langgraph.utils.keyword_matcher import get_keyword_matcher
 from app.core.config import settings
-from app.core.database import AsyncSessionLocal
-from app.models.topic_config import TopicConfig
 
 
 class FilterArticlesNode:
@@ -236,7 +234,7 @@ class FilterArticlesNode:
         workflow_id: str
     ) -> Optional[Dict[str, Any]]:
         """
-        Load topic configuration from database or use defaults.
+        Load topic configuration from the registry or use defaults.
         
         Args:
             topic: Topic name to load configuration for
@@ -246,58 +244,26 @@ class FilterArticlesNode:
         Returns:
             Topic configuration dictionary or None
         """
-        try:
-            async with AsyncSessionLocal() as db_session:
-                # Try to find exact match first
-                result = await db_session.execute(
-                    select(TopicConfig).where(TopicConfig.topic_name == topic.lower())
-                )
-                topic_config = result.scalar_one_or_none()
-                
-                if topic_config:
-                    return {
-                        "topicName": topic_config.topic_name,
-                        "keywords": topic_config.keywords,
-                        "trustedSources": topic_config.trusted_sources,
-                        "priorityWeight": topic_config.priority_weight
-                    }
-                
-                # Try partial matches for common topics
-                common_topics = ["ai", "finance", "healthcare", "technology", "business"]
-                for common_topic in common_topics:
-                    if common_topic in topic.lower():
-                        result = await db_session.execute(
-                            select(TopicConfig).where(TopicConfig.topic_name == common_topic)
-                        )
-                        topic_config = result.scalar_one_or_none()
-                        
-                        if topic_config:
-                            self.logger.log_processing_step(
-                                session_id=session_id,
-                                workflow_id=workflow_id,
-                                step="topic_config_fallback",
-                                message=f"Using {common_topic} config for topic '{topic}'"
-                            )
-                            
-                            return {
-                                "topicName": topic_config.topic_name,
-                                "keywords": topic_config.keywords,
-                                "trustedSources": topic_config.trusted_sources,
-                                "priorityWeight": topic_config.priority_weight
-                            }
-                
-                # No configuration found, use generic approach
-                self.logger.log_processing_step(
-                    session_id=session_id,
-                    workflow_id=workflow_id,
-                    step="no_topic_config",
-                    message=f"No specific configuration found for topic '{topic}', using generic filtering"
-                )
-                
-                return None
-                
-        except Exception as e:
-            raise DatabaseError("topic_config_load", str(e))
+        topic_config = await get_topic_config(topic)
+        
+        if topic_config is None:
+            # No configuration found, use generic approach
+            self.logger.log_processing_step(
+                session_id=session_id,
+                workflow_id=workflow_id,
+                step="no_topic_config",
+                message=f"No specific configuration found for topic '{topic}', using generic filtering"
+            )
+        
+        elif topic_config["topicName"] != topic.lower():
+            self.logger.log_processing_step(
+                session_id=session_id,
+                workflow_id=workflow_id,
+                step="topic_config_fallback",
+                message=f"Using {topic_config['topicName']} config for topic '{topic}'"
+            )
+        
+        return topic_config
     
     def _filter_by_quality(
         self,
@@ -438,29 +404,17 @@ class FilterArticlesNode:
                 article["relevance_score"] = 0.5
             return articles
         
-        # Calculate scores based on keyword matches
+        # Each field is scanned once for all keywords (word-boundary, case-insensitive)
+        matcher = get_keyword_matcher(keywords)
+        total_keywords = len(keywords)
+        
         for article in articles:
-            title = article.get("title", "").lower()
-            snippet = article.get("snippet", "").lower()
-            source = article.get("source", "").lower()
-            
-            score = 0.0
-            total_keywords = len(keywords)
-            
-            for keyword in keywords:
-                keyword_lower = keyword.lower()
-                
-                # Title matches are weighted more heavily
-                if keyword_lower in title:
-                    score += 0.4
-                
-                # Snippet matches
-                if keyword_lower in snippet:
-                    score += 0.2
-                
-                # Source matches
-                if keyword_lower in source:
-                    score += 0.1
+            # Title matches are weighted more heavily, then snippet, then source
+            score = (
+                0.4 * len(matcher.match(article.get("title", ""))) +
+                0.2 * len(matcher.match(article.get("snippet", ""))) +
+                0.1 * len(matcher.match(article.get("source", "")))
+            )
             
             # Normalize score
             article["relevance_score"] = min(score / total_keywords, 1.0)
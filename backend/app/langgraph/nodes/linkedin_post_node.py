@@ -5,10 +5,8 @@ This node generates professional LinkedIn posts from news articles,
 dynamically adjusting content based on the number of articles.
 """
 import asyncio
-from typing import Dict, Any, List
-from langchain_anthropic import ChatAnthropic
-from langchain_openai import ChatOpenAI
-from langchain_google_genai import ChatGoogleGenerativeAI
+import time
+from typing import Dict, Any, List, AsyncIterator
 from langchain_core.messages import SystemMessage, HumanMessage
 
 from app.langgraph.state.post_state import (
@@ -21,9 +19,12 @@ from app.langgraph.state.post_state import (
 )
 from datetime import datetime
 from app.langgraph.utils.logging_config import StructuredLogger
-from app.langgraph.utils.error_handlers import LLMProviderError
+from app.langgraph.utils.error_handlers import LLMProviderError, RateLimitExceededError
+from app.langgraph.utils.llm_client_pool import get_llm_client_pool
+from app.langgraph.utils.provider_router import get_provider_router
+from app.langgraph.utils.hedging import get_hedge_budget
+from app.langgraph.utils.rate_limiter import get_rate_limiter, estimate_tokens
 from app.langgraph.utils.state_helpers import get_post_workflow_fields, StateAccessError, StateAccessHelper
-from app.core.config import settings
 
 
 class LinkedInPostNode:
@@ -39,50 +40,33 @@ class LinkedInPostNode:
     
     MAX_CHAR_LIMIT = 3000
     
+    # Maximum output tokens per model
+    LLM_MAX_TOKENS = {
+        "claude-3-5-sonnet": 8192,
+        "claude-3-5-haiku": 8192,
+        "gpt-4-turbo": 4096,
+        "gemini-pro": 4096
+    }
+    LLM_TEMPERATURE = 0.7
+    
     def __init__(self):
         """Initialize LinkedIn post node with logger."""
         self.logger = StructuredLogger("linkedin_post_node")
         self.llm_providers = self._initialize_llm_providers()
     
     def _initialize_llm_providers(self) -> Dict[str, Any]:
-        """Initialize available LLM providers."""
-        providers = {}
-        
-        # Initialize Anthropic Claude (latest version)
-        if settings.ANTHROPIC_API_KEY:
-            providers["claude-3-5-sonnet"] = ChatAnthropic(
-                model="claude-3-5-sonnet-20241022",
-                api_key=settings.ANTHROPIC_API_KEY,
-                max_tokens=8192,
-                temperature=0.7
-            )
-            # Add Claude 3.5 Haiku for faster responses
-            providers["claude-3-5-haiku"] = ChatAnthropic(
-                model="claude-3-5-haiku-20241022",
-                api_key=settings.ANTHROPIC_API_KEY,
-                max_tokens=8192,
-                temperature=0.7
-            )
+        """Get shared clients for all LLM providers with a configured API key."""
+        pool = get_llm_client_pool()
         
-        # Initialize OpenAI GPT
-        if settings.OPENAI_API_KEY:
-            providers["gpt-4-turbo"] = ChatOpenAI(
-                model="gpt-4-turbo-preview",
-                api_key=settings.OPENAI_API_KEY,
-                max_tokens=4096,
-                temperature=0.7
-            )
-        
-        # Initialize Google Gemini
-        if settings.GOOGLE_API_KEY:
-            providers["gemini-pro"] = ChatGoogleGenerativeAI(
-                model="gemini-pro",
-                google_api_key=settings.GOOGLE_API_KEY,
-                max_output_tokens=4096,
-                temperature=0.7
+        return {
+            model_name: pool.get_client(
+                model_name,
+                max_tokens=self.LLM_MAX_TOKENS[model_name],
+                temperature=self.LLM_TEMPERATURE
             )
-        
-        return providers
+            for model_name in pool.configured_models()
+            if model_name in self.LLM_MAX_TOKENS
+        }
     
     def _calculate_content_distribution(self, article_count: int) -> Dict[str, int]:
         """
@@ -193,6 +177,226 @@ Generate the LinkedIn post now:"""
         
         return prompt
     
+    def _create_generic_post(self, topic: str) -> GeneratedPostContent:
+        """
+        Create a generic LinkedIn post for when no articles are available.
+        
+        Args:
+            topic: News topic
+            
+        Returns:
+            Generic post content
+        """
+        generic_content = f"📢 Stay tuned for the latest updates on {topic}! 🚀\n\nNo specific news items available at the moment, but exciting developments are always happening in this space.\n\n#{''.join(topic.split())} #TechNews #Innovation"
+        
+        return GeneratedPostContent(
+            content=generic_content,
+            char_count=len(generic_content),
+            hashtags=self._extract_hashtags(generic_content),
+            shortened_urls=None
+        )
+    
+    def _check_providers_configured(self) -> None:
+        """
+        Ensure at least one LLM provider is configured.
+            
+        Raises:
+            LLMProviderError: When no LLM providers are configured
+        """
+        if not self.llm_providers:
+            raise LLMProviderError(
+                provider="none",
+                original_error="No LLM providers are configured. Please set at least one API key (ANTHROPIC_API_KEY, OPENAI_API_KEY, or GOOGLE_API_KEY) in your environment variables."
+            )
+        
+    def _log_provider_fallback(self, requested_model: str, used_model: str, session_id: str, workflow_id: str) -> None:
+        """Log when the router served a request with a different model than requested."""
+        if used_model == requested_model:
+            return
+        
+        self.logger.log_processing_step(
+            session_id=session_id,
+            workflow_id=workflow_id,
+            step="llm_provider_fallback",
+            message=f"LLM provider {requested_model} unavailable or unhealthy, using fallback: {used_model}",
+            extra_data={
+                "requested_model": requested_model,
+                "fallback_model": used_model,
+                "available_models": list(self.llm_providers.keys())
+            }
+        )
+    
+    def _build_messages(self, state: PostState) -> List[Any]:
+        """
+        Build the chat messages for LinkedIn post generation.
+        
+        Args:
+            state: Current workflow state
+            
+        Returns:
+            System and human messages for the LLM
+        """
+        return [
+            SystemMessage(content="You are a professional social media content creator specializing in LinkedIn posts for the tech industry."),
+            HumanMessage(content=self._create_linkedin_prompt(state))
+        ]
+    
+    def _finalize_post(self, generated_content: str) -> GeneratedPostContent:
+        """
+        Enforce the character limit and build the post content object.
+        
+        Args:
+            generated_content: Raw LLM output
+            
+        Returns:
+            Final post content
+        """
+        generated_content = generated_content.strip()
+        
+        # Validate character count
+        char_count = len(generated_content)
+        if char_count > self.MAX_CHAR_LIMIT:
+            # Truncate and add ellipsis
+            generated_content = generated_content[:self.MAX_CHAR_LIMIT - 3] + "..."
+            char_count = self.MAX_CHAR_LIMIT
+        
+        return GeneratedPostContent(
+            content=generated_content,
+            char_count=char_count,
+            hashtags=self._extract_hashtags(generated_content),
+            shortened_urls=None  # URLs not shortened for LinkedIn
+        )
+    
+    async def astream_post(self, state: PostState) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Generate a LinkedIn post, yielding tokens as the provider streams them.
+        
+        Yields {"type": "token", "content": ...} for each streamed chunk,
+        then {"type": "post", "post": GeneratedPostContent, "llm_model": ...}
+        with the finalized post. Streaming stops once the output passes
+        the character limit, since the final post is truncated to it.
+        
+        Args:
+            state: Initial post workflow state
+            
+        Yields:
+            Token events followed by one post event
+            
+        Raises:
+            LLMProviderError: When no LLM provider is available
+            Exception: Provider errors raised after tokens were streamed, or by the last provider
+        """
+        session_id = state["session_id"]
+        workflow_id = state["workflow_id"]
+        articles = state.get("articles", [])
+        
+        self.logger.log_processing_step(
+            session_id=session_id,
+            workflow_id=workflow_id,
+            step="linkedin_post_stream_start",
+            message=f"Streaming LinkedIn post for {len(articles)} articles",
+            extra_data={
+                "topic": state.get("topic", ""),
+                "article_count": len(articles),
+                "llm_model": state["llm_model"]
+            }
+        )
+        
+        if not articles:
+            linkedin_post = self._create_generic_post(state.get("topic", "Unknown Topic"))
+            yield {"type": "token", "content": linkedin_post["content"]}
+            yield {"type": "post", "post": linkedin_post, "llm_model": state["llm_model"]}
+            return
+        
+        self._check_providers_configured()
+        
+        router = get_provider_router()
+        routed_models = router.route(state["llm_model"], list(self.llm_providers))
+        if not routed_models:
+            raise LLMProviderError("all_providers", "No LLM provider available: all circuits are open")
+        
+        chunks: List[str] = []
+        messages = self._build_messages(state)
+        
+        for llm_model in routed_models:
+            if router.is_open(llm_model):
+                # Tripped by a concurrent request, or another caller holds its trial call
+                if llm_model == routed_models[-1]:
+                    raise LLMProviderError("all_providers", "No LLM provider available: all circuits are open")
+                continue
+            
+            streamed_chars = 0
+            limiter = get_rate_limiter(llm_model)
+            
+            try:
+                await limiter.acquire(estimate_tokens(messages, self.LLM_MAX_TOKENS.get(llm_model, 4096)))
+            except RateLimitExceededError:
+                router.release_trial(llm_model)
+                # Queued too long behind this model's rate limit; try the next one
+                if llm_model == routed_models[-1]:
+                    raise
+                continue
+            
+            start_time = time.perf_counter()
+            
+            try:
+                async for chunk in self.llm_providers[llm_model].astream(messages):
+                    text = self._chunk_text(chunk.content)
+                    if not text:
+                        continue
+                    
+                    chunks.append(text)
+                    streamed_chars += len(text)
+                    yield {"type": "token", "content": text}
+                    
+                    if streamed_chars > self.MAX_CHAR_LIMIT:
+                        break
+            
+            except Exception as e:
+                router.record_failure(llm_model, time.perf_counter() - start_time)
+                await limiter.record_error(e)
+                
+                # Tokens already sent cannot be taken back; only fail over before the first one
+                if chunks or llm_model == routed_models[-1]:
+                    raise
+                continue
+            
+            router.record_success(llm_model, time.perf_counter() - start_time)
+            break
+            
+        self._log_provider_fallback(state["llm_model"], llm_model, session_id, workflow_id)
+        
+        linkedin_post = self._finalize_post("".join(chunks))
+        
+        self.logger.log_processing_step(
+            session_id=session_id,
+            workflow_id=workflow_id,
+            step="linkedin_post_stream_complete",
+            message=f"Streamed LinkedIn post ({linkedin_post['char_count']} chars)",
+            extra_data={
+                "char_count": linkedin_post["char_count"],
+                "chunk_count": len(chunks),
+                "llm_model": llm_model
+            }
+        )
+        
+        yield {"type": "post", "post": linkedin_post, "llm_model": llm_model}
+    
+    @staticmethod
+    def _chunk_text(content: Any) -> str:
+        """
+        Get the text of a streamed message chunk.
+        
+        Providers stream either plain strings or lists of content blocks.
+        """
+        if isinstance(content, str):
+            return content
+        
+        return "".join(
+            block.get("text", "") if isinstance(block, dict) else str(block)
+            for block in content or []
+        )
+    
     async def __call__(self, state: PostState) -> PostState:
         """
         Generate LinkedIn post from news articles.
@@ -244,14 +448,7 @@ Generate the LinkedIn post now:"""
             
             if not articles or len(articles) == 0:
                 # Create a generic post about the topic
-                generic_content = f"📢 Stay tuned for the latest updates on {topic}! 🚀\n\nNo specific news items available at the moment, but exciting developments are always happening in this space.\n\n#{''.join(topic.split())} #TechNews #Innovation"
-                
-                linkedin_post = GeneratedPostContent(
-                    content=generic_content,
-                    char_count=len(generic_content),
-                    hashtags=self._extract_hashtags(generic_content),
-                    shortened_urls=None
-                )
+                linkedin_post = self._create_generic_post(topic)
                 
                 # Create updated state maintaining all existing fields
                 updated_state = state.copy()
@@ -271,65 +468,22 @@ Generate the LinkedIn post now:"""
                 
                 return updated_state
             
-            # Check if any LLM providers are available
-            if not self.llm_providers:
-                raise LLMProviderError(
-                    provider="none",
-                    original_error="No LLM providers are configured. Please set at least one API key (ANTHROPIC_API_KEY, OPENAI_API_KEY, or GOOGLE_API_KEY) in your environment variables."
-                )
-            
-            # Get LLM provider with fallback logic
-            llm = self.llm_providers.get(llm_model)
-            if not llm:
-                available_models = list(self.llm_providers.keys())
-                # Try to use the first available provider as fallback
-                if available_models:
-                    fallback_model = available_models[0]
-                    self.logger.log_processing_step(
-                        session_id=session_id,
-                        workflow_id=workflow_id,
-                        step="llm_provider_fallback",
-                        message=f"LLM provider {llm_model} not available, using fallback: {fallback_model}",
-                        extra_data={
-                            "requested_model": llm_model,
-                            "fallback_model": fallback_model,
-                            "available_models": available_models
-                        }
-                    )
-                    llm = self.llm_providers[fallback_model]
-                    llm_model = fallback_model  # Update the model name for state
-                else:
-                    raise LLMProviderError(
-                        provider=llm_model,
-                        original_error=f"LLM provider {llm_model} not available. Available providers: {', '.join(available_models)}"
-                    )
-            
-            # Create prompt
-            prompt = self._create_linkedin_prompt(state)
-            
-            # Generate post
-            messages = [
-                SystemMessage(content="You are a professional social media content creator specializing in LinkedIn posts for the tech industry."),
-                HumanMessage(content=prompt)
-            ]
-            
-            response = await llm.ainvoke(messages)
-            generated_content = response.content.strip()
+            self._check_providers_configured()
             
-            # Validate character count
-            char_count = len(generated_content)
-            if char_count > self.MAX_CHAR_LIMIT:
-                # Truncate and add ellipsis
-                generated_content = generated_content[:self.MAX_CHAR_LIMIT - 3] + "..."
-                char_count = self.MAX_CHAR_LIMIT
-            
-            # Create post content object
-            linkedin_post = GeneratedPostContent(
-                content=generated_content,
-                char_count=char_count,
-                hashtags=self._extract_hashtags(generated_content),
-                shortened_urls=None  # URLs not shortened for LinkedIn
+            # Generate post on the healthiest provider, failing over on errors and hedging slow calls
+            messages = self._build_messages(state)
+            response, used_model = await get_provider_router().invoke_with_routing(
+                llm_model,
+                lambda model: self.llm_providers[model].ainvoke(messages),
+                candidates=list(self.llm_providers),
+                hedge_budget=get_hedge_budget("linkedin_post"),
+                tokens=estimate_tokens(messages, self.LLM_MAX_TOKENS.get(llm_model, 4096))
             )
+            self._log_provider_fallback(llm_model, used_model, session_id, workflow_id)
+            llm_model = used_model
+            
+            linkedin_post = self._finalize_post(response.content)
+            char_count = linkedin_post["char_count"]
             
             # Log successful generation
             self.logger.log_processing_step(
@@ -9,16 +9,19 @@ This node follows LangGraph best practices:
 """
 import time
 from typing import List
-from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.langgraph.state.news_state import NewsState, NewsArticle, mark_step_completed, calculate_processing_time
 from app.langgraph.utils.logging_config import StructuredLogger
+from app.langgraph.utils.request_coalescer import get_request_coalescer
 from app.langgraph.utils.error_handlers import (
     DatabaseError,
     handle_node_error
 )
-from app.core.database import AsyncSessionLocal
-from app.models.news_cache import NewsCache
+from app.langgraph.utils.news_cache_writer import (
+    build_news_cache_rows,
+    insert_news_cache_rows,
+    get_news_cache_queue
+)
 
 
 class SaveResultsNode:
@@ -73,8 +76,8 @@ class SaveResultsNode:
             # Get summarized articles
             summarized_articles = state.get("summarized_articles", [])
             
-            if summarized_articles:
-                # Save articles to cache
+            if summarized_articles and not state.get("cache_hit", False) and not state.get("coalesced", False):
+                # Save articles to cache (cache hits and coalesced results are already persisted)
                 await self._save_articles_to_cache(
                     articles=summarized_articles,
                     topic=state["topic"],
@@ -90,6 +93,13 @@ class SaveResultsNode:
                     message=f"Cached {len(summarized_articles)} articles",
                     extra_data={"cached_count": len(summarized_articles)}
                 )
+                
+                # Share results with identical requests waiting on this workflow
+                get_request_coalescer().resolve(state["workflow_id"], {
+                    "articles": summarized_articles,
+                    "total_found": state.get("total_found", len(summarized_articles)),
+                    "llm_provider": state.get("current_llm_provider")
+                })
             
             # Calculate final processing time
             final_state = calculate_processing_time(new_state)
@@ -185,9 +195,12 @@ class SaveResultsNode:
         date: str,
         session_id: str,
         workflow_id: str
-    ) -> None:
+    ) -> int:
         """
-        Save processed articles to database cache.
+        Save processed articles to database cache in one bulk insert.
+        
+        When the news_cache write-behind queue is running, rows are queued
+        and written by its worker instead of before the response.
         
         Args:
             articles: List of processed articles to cache
@@ -196,99 +209,53 @@ class SaveResultsNode:
             session_id: Session identifier for logging
             workflow_id: Workflow identifier for logging
             
+        Returns:
+            Number of articles inserted or refreshed, or queued for insertion
+            
         Raises:
             DatabaseError: When caching operations fail
         """
-        try:
-            async with AsyncSessionLocal() as db_session:
-                cached_count = 0
-                
-                for article in articles:
-                    try:
-                        # Check if article already exists in cache
-                        existing_cache = await self._check_existing_cache(
-                            db_session,
-                            article.get("content_hash", "")
-                        )
-                        
-                        if existing_cache:
-                            # Article already cached, skip
-                            continue
-                        
-                        # Create new cache entry
-                        cache_entry = NewsCache(
-                            topic=topic,
-                            date_fetched=date,
-                            source=article.get("source", ""),
-                            title=article.get("title", ""),
-                            url=article.get("url", ""),
-                            summary=article.get("summary", ""),
-                            content_hash=article.get("content_hash", "")
-                        )
-                        
-                        db_session.add(cache_entry)
-                        cached_count += 1
-                        
-                    except Exception as e:
-                        # Log individual article caching failure but continue
-                        self.logger.log_processing_step(
-                            session_id=session_id,
-                            workflow_id=workflow_id,
-                            step="article_cache_failed",
-                            message=f"Failed to cache article: {str(e)}",
-                            extra_data={
-                                "article_title": article.get("title", "")[:50],
-                                "error": str(e)
-                            }
-                        )
-                        continue
-                
-                # Commit all cache entries
-                await db_session.commit()
-                
-                self.logger.log_processing_step(
-                    session_id=session_id,
-                    workflow_id=workflow_id,
-                    step="cache_commit",
-                    message=f"Successfully cached {cached_count} new articles",
-                    extra_data={
-                        "total_articles": len(articles),
-                        "cached_articles": cached_count,
-                        "skipped_articles": len(articles) - cached_count
-                    }
-                )
-                
-        except Exception as e:
-            raise DatabaseError("article_caching", str(e))
-    
-    async def _check_existing_cache(
-        self,
-        db_session: AsyncSession,
-        content_hash: str
-    ) -> bool:
-        """
-        Check if article already exists in cache.
+        rows = build_news_cache_rows(articles, topic, date)
         
-        Args:
-            db_session: Database session
-            content_hash: Content hash to check
+        if not rows:
+            return 0
+        
+        # Hand rows to the write-behind worker so the response does not wait on the commit
+        queue = get_news_cache_queue()
+        if queue is not None and queue.running:
+            await queue.put_many(rows)
             
-        Returns:
-            True if article exists in cache, False otherwise
-        """
-        if not content_hash:
-            return False
+            self.logger.log_processing_step(
+                session_id=session_id,
+                workflow_id=workflow_id,
+                step="cache_enqueued",
+                message=f"Queued {len(rows)} articles for caching",
+                extra_data={
+                    "total_articles": len(articles),
+                    "queued_articles": len(rows),
+                    "queue_pending": queue.get_stats()["pending"]
+                }
+            )
+            
+            return len(rows)
         
         try:
-            from sqlalchemy import select
+            # Single round trip; rows already cached for the topic and date are refreshed
+            cached_count = await insert_news_cache_rows(rows)
             
-            result = await db_session.execute(
-                select(NewsCache).where(NewsCache.content_hash == content_hash)
+            self.logger.log_processing_step(
+                session_id=session_id,
+                workflow_id=workflow_id,
+                step="cache_commit",
+                message=f"Successfully cached {cached_count} articles",
+                extra_data={
+                    "total_articles": len(articles),
+                    "cached_articles": cached_count,
+                    "skipped_articles": len(articles) - cached_count
+                }
             )
-            existing = result.scalar_one_or_none()
             
-            return existing is not None
+            return cached_count
             
-        except Exception:
-            # If check fails, assume article doesn't exist
-            return False
+        except Exception as e:
+            raise DatabaseError("article_caching", str(e))
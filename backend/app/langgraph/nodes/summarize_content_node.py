@@ -4,16 +4,18 @@ Content summarization node for news processing workflow.
 This node follows LangGraph best practices:
 - Single responsibility: Generate AI summaries for articles
 - Multi-LLM provider support with fallback mechanisms
+- Bounded concurrent per-article or single-call batched summarization
+- Per-article summary cache shared across sessions and topics
+- Health-aware provider routing with per-model circuit breakers
+- Optional hedging of slow calls on a backup provider
 - Retry logic with exponential backoff
 - Comprehensive logging and error handling
 - Immutable state updates
 """
 import time
+import json
 import asyncio
-from typing import List, Dict, Any, Optional
-from langchain_anthropic import ChatAnthropic
-from langchain_openai import ChatOpenAI
-from langchain_google_genai import ChatGoogleGenerativeAI
+from typing import List, Dict, Any, Optional, Tuple
 from langchain_core.messages import HumanMessage
 
 from app.langgraph.state.news_state import NewsState, NewsArticle, mark_step_completed, mark_step_error
@@ -23,8 +25,17 @@ from app.langgraph.utils.error_handlers import (
     RetryableError,
     handle_node_error
 )
+from app.langgraph.utils.llm_client_pool import get_llm_client_pool
+from app.langgraph.utils.provider_router import get_provider_router
+from app.langgraph.utils.hedging import get_hedge_budget, hedged_invoke
+from app.langgraph.utils.rate_limiter import estimate_tokens, is_rate_limit_error
+from app.langgraph.utils.streaming import emit_stream_event
+from app.langgraph.utils.summary_cache import get_summary_cache
 from app.core.config import settings
 
+# Part of the summary cache key; bump when the summarization prompts change
+SUMMARY_PROMPT_VERSION = "1"
+
 
 class SummarizeContentNode:
     """
@@ -51,6 +62,9 @@ class SummarizeContentNode:
         
         # LLM provider order for fallbacks
         self.provider_order = ["claude-3-5-sonnet", "gpt-4-turbo", "gemini-pro"]
+        
+        # Per-provider semaphores bounding concurrent summary calls
+        self._provider_semaphores: Dict[str, asyncio.Semaphore] = {}
     
     async def __call__(self, state: NewsState) -> NewsState:
         """
@@ -202,6 +216,9 @@ class SummarizeContentNode:
         """
         Get LLM provider order starting with user's preference.
         
+        The provider router skips providers whose circuit is open and may
+        move a clearly faster or healthier provider ahead of the preferred one.
+        
         Args:
             preferred_model: User's preferred LLM model
             
@@ -216,7 +233,7 @@ class SummarizeContentNode:
             if provider != preferred_model:
                 order.append(provider)
         
-        return order
+        return get_provider_router().route(preferred_model, order)
     
     async def _summarize_with_fallback(
         self,
@@ -229,6 +246,10 @@ class SummarizeContentNode:
         """
         Attempt summarization with provider fallbacks.
         
+        Providers whose circuit is open are skipped. If a provider's
+        circuit opens while it is summarizing, only the articles it failed
+        on are sent to the next provider.
+        
         Args:
             articles: List of articles to summarize
             provider_order: Order of providers to try
@@ -243,8 +264,15 @@ class SummarizeContentNode:
             LLMProviderError: When all providers fail
         """
         last_error = None
+        router = get_provider_router()
+        summarized_articles: List[Optional[NewsArticle]] = [None] * len(articles)
+        pending_indices = list(range(len(articles)))
         
-        for provider in provider_order:
+        for provider_index, provider in enumerate(provider_order):
+            if router.is_open(provider, claim_trial=False):
+                # Opened by failures earlier in this request (or a concurrent one)
+                continue
+            
             try:
                 providers_tried.append(provider)
                 
@@ -253,20 +281,63 @@ class SummarizeContentNode:
                     workflow_id=workflow_id,
                     step="trying_provider",
                     message=f"Attempting summarization with {provider}",
-                    extra_data={"provider": provider}
+                    extra_data={"provider": provider, "articles_count": len(pending_indices)}
                 )
                 
-                # Initialize LLM client
-                llm_client = self._initialize_llm_client(provider)
-                
-                # Generate summaries for all articles
-                summarized_articles = await self._generate_summaries(
-                    articles=articles,
-                    llm_client=llm_client,
+                # Reuse cached summaries; only misses go to the provider
+                cached_articles = await self._apply_cached_summaries(
+                    articles=[articles[i] for i in pending_indices],
                     provider=provider,
                     session_id=session_id,
-                    workflow_id=workflow_id
+                    workflow_id=workflow_id,
+                    stream_indices=pending_indices
+                )
+                for i, cached_article in zip(pending_indices, cached_articles):
+                    summarized_articles[i] = cached_article
+                missing_indices = [i for i in pending_indices if summarized_articles[i] is None]
+                failed_indices = []
+                
+                if missing_indices:
+                    # Initialize LLM client
+                    llm_client = self._initialize_llm_client(provider)
+                    served_by: Dict[str, str] = {}
+                    
+                    generated_articles = await self._generate_summaries(
+                        articles=[articles[i] for i in missing_indices],
+                        llm_client=llm_client,
+                        provider=provider,
+                        session_id=session_id,
+                        workflow_id=workflow_id,
+                        stream_indices=missing_indices,
+                        served_by=served_by
+                    )
+                    
+                    for i, generated_article in zip(missing_indices, generated_articles):
+                        summarized_articles[i] = generated_article
+                        if generated_article.get("summary", "") == articles[i].get("summary", "")[:self.summary_max_length]:
+                            failed_indices.append(i)
+                    
+                    await self._cache_generated_summaries(
+                        original_articles=[articles[i] for i in missing_indices],
+                        generated_articles=generated_articles,
+                        provider=provider,
+                        served_by=served_by
+                    )
+                
+                has_next_provider = any(
+                    not router.is_open(p, claim_trial=False) for p in provider_order[provider_index + 1:]
                 )
+                if failed_indices and router.is_open(provider, claim_trial=False) and has_next_provider:
+                    # The provider went down mid-request: send only its failed articles to the next one
+                    self.logger.log_processing_step(
+                        session_id=session_id,
+                        workflow_id=workflow_id,
+                        step="provider_circuit_open",
+                        message=f"Circuit for {provider} opened, retrying {len(failed_indices)} articles with the next provider",
+                        extra_data={"provider": provider, "failed_articles": len(failed_indices)}
+                    )
+                    pending_indices = failed_indices
+                    continue
                 
                 self.logger.log_processing_step(
                     session_id=session_id,
@@ -293,7 +364,10 @@ class SummarizeContentNode:
                 continue
         
         # All providers failed
-        error_message = f"All LLM providers failed. Last error: {str(last_error)}"
+        if last_error is None:
+            error_message = "All LLM providers failed. Last error: all provider circuits are open"
+        else:
+            error_message = f"All LLM providers failed. Last error: {str(last_error)}"
         self.logger.log_error(
             session_id=session_id,
             workflow_id=workflow_id,
@@ -303,9 +377,101 @@ class SummarizeContentNode:
         
         raise LLMProviderError("all_providers", error_message)
     
+    async def _apply_cached_summaries(
+        self,
+        articles: List[NewsArticle],
+        provider: str,
+        session_id: str,
+        workflow_id: str,
+        stream_indices: Optional[List[int]] = None
+    ) -> List[Optional[NewsArticle]]:
+        """
+        Fill in cached summaries for a provider with one bulk lookup.
+        
+        Args:
+            articles: List of articles to summarize
+            provider: Provider the summaries must come from
+            session_id: Session identifier for logging
+            workflow_id: Workflow identifier for logging
+            stream_indices: Article positions to report in stream events;
+                defaults to each article's position in articles
+            
+        Returns:
+            Articles with cached summaries, None where the cache missed
+        """
+        if not settings.SUMMARY_CACHE_ENABLED:
+            return [None] * len(articles)
+        
+        cached = await get_summary_cache().get_many(
+            [article.get("content_hash", "") for article in articles if article.get("content_hash")],
+            provider,
+            SUMMARY_PROMPT_VERSION
+        )
+        
+        summarized_articles: List[Optional[NewsArticle]] = []
+        for i, article in enumerate(articles):
+            summary = cached.get(article.get("content_hash", ""))
+            if summary is None:
+                summarized_articles.append(None)
+                continue
+            
+            summarized_article = article.copy()
+            summarized_article["summary"] = summary
+            summarized_articles.append(summarized_article)
+            self._emit_article(stream_indices[i] if stream_indices else i, summarized_article, provider)
+        
+        hits = len(articles) - summarized_articles.count(None)
+        self.logger.log_processing_step(
+            session_id=session_id,
+            workflow_id=workflow_id,
+            step="summary_cache_lookup",
+            message=f"Found {hits}/{len(articles)} cached summaries for {provider}",
+            extra_data={"provider": provider, "cache_hits": hits, "cache_misses": len(articles) - hits}
+        )
+        
+        return summarized_articles
+    
+    async def _cache_generated_summaries(
+        self,
+        original_articles: List[NewsArticle],
+        generated_articles: List[NewsArticle],
+        provider: str,
+        served_by: Optional[Dict[str, str]] = None
+    ) -> None:
+        """
+        Store newly generated summaries in the summary cache.
+        
+        Articles whose summary failed keep their truncated snippet as a
+        fallback; those are recognized and never cached. Summaries are
+        cached under the provider that actually wrote them, so one won
+        by a hedge on the backup provider is keyed to the backup.
+        
+        Args:
+            original_articles: Articles as they were sent for summarization
+            generated_articles: The same articles with generated summaries
+            provider: Provider the summaries were requested from
+            served_by: Serving provider by content hash, where known
+        """
+        if not settings.SUMMARY_CACHE_ENABLED:
+            return
+        
+        summaries: Dict[str, Dict[str, str]] = {provider: {}}
+        for original, generated in zip(original_articles, generated_articles):
+            summary = generated.get("summary", "")
+            fallback = original.get("summary", "")[:self.summary_max_length]
+            if original.get("content_hash") and summary and summary != fallback:
+                serving_provider = (served_by or {}).get(original["content_hash"], provider)
+                summaries.setdefault(serving_provider, {})[original["content_hash"]] = summary
+        
+        for serving_provider, provider_summaries in summaries.items():
+            await get_summary_cache().put_many(provider_summaries, serving_provider, SUMMARY_PROMPT_VERSION)
+    
     def _initialize_llm_client(self, provider: str):
         """
-        Initialize LLM client for the specified provider.
+        Get the shared LLM client for the specified provider.
+        
+        Clients come from the process-wide pool so connections are
+        reused across articles and requests.
         
         Args:
             provider: LLM provider name
@@ -317,55 +483,204 @@ class SummarizeContentNode:
             LLMProviderError: When provider initialization fails
         """
         try:
-            if provider == "claude-3-5-sonnet":
-                if not settings.ANTHROPIC_API_KEY:
-                    raise LLMProviderError(provider, "Anthropic API key not configured")
-                
-                return ChatAnthropic(
-                    model="claude-3-5-sonnet-20241022",
-                    api_key=settings.ANTHROPIC_API_KEY,
-                    max_tokens=settings.LLM_MAX_TOKENS,
-                    temperature=settings.LLM_TEMPERATURE
-                )
+            return get_llm_client_pool().get_client(
+                provider,
+                max_tokens=settings.LLM_MAX_TOKENS,
+                temperature=settings.LLM_TEMPERATURE
+            )
+                
+        except Exception as e:
+            raise LLMProviderError(provider, f"Failed to initialize: {str(e)}")
+    
+    def _get_provider_semaphore(self, provider: str) -> asyncio.Semaphore:
+        """
+        Get the semaphore bounding concurrent summary calls for a provider.
+        
+        Args:
+            provider: LLM provider name
             
-            elif provider == "gpt-4-turbo":
-                if not settings.OPENAI_API_KEY:
-                    raise LLMProviderError(provider, "OpenAI API key not configured")
+        Returns:
+            Semaphore sized from the configured per-provider concurrency limit
+        """
+        semaphore = self._provider_semaphores.get(provider)
+        
+        if semaphore is None:
+            limit = settings.LLM_PROVIDER_CONCURRENCY.get(provider, settings.LLM_DEFAULT_CONCURRENCY)
+            semaphore = asyncio.Semaphore(max(1, limit))
+            self._provider_semaphores[provider] = semaphore
+        
+        return semaphore
+    
+    async def _generate_summaries(
+        self,
+        articles: List[NewsArticle],
+        llm_client,
+        provider: str,
+        session_id: str,
+        workflow_id: str,
+        stream_indices: Optional[List[int]] = None,
+        served_by: Optional[Dict[str, str]] = None
+    ) -> List[NewsArticle]:
+        """
+        Generate summaries for all articles using the configured strategy.
+        
+        Args:
+            articles: List of articles to summarize
+            llm_client: Initialized LLM client
+            provider: Provider name for logging
+            session_id: Session identifier for logging
+            workflow_id: Workflow identifier for logging
+            stream_indices: Article positions to report in stream events;
+                defaults to each article's position in articles
+            served_by: Filled with the provider that wrote each summary, by content hash
+            
+        Returns:
+            List of articles with generated summaries
+            
+        Raises:
+            LLMProviderError: When summarization fails
+        """
+        if settings.SUMMARY_STRATEGY == "batch":
+            return await self._generate_summaries_batch(
+                articles=articles,
+                llm_client=llm_client,
+                provider=provider,
+                session_id=session_id,
+                workflow_id=workflow_id,
+                stream_indices=stream_indices,
+                served_by=served_by
+            )
+        
+        if settings.SUMMARY_STRATEGY == "sequential":
+            return await self._generate_summaries_sequential(
+                articles=articles,
+                llm_client=llm_client,
+                provider=provider,
+                session_id=session_id,
+                workflow_id=workflow_id,
+                stream_indices=stream_indices,
+                served_by=served_by
+            )
+        
+        return await self._generate_summaries_concurrent(
+            articles=articles,
+            llm_client=llm_client,
+            provider=provider,
+            session_id=session_id,
+            workflow_id=workflow_id,
+            stream_indices=stream_indices,
+            served_by=served_by
+        )
+    
+    async def _generate_summaries_concurrent(
+        self,
+        articles: List[NewsArticle],
+        llm_client,
+        provider: str,
+        session_id: str,
+        workflow_id: str,
+        stream_indices: Optional[List[int]] = None,
+        served_by: Optional[Dict[str, str]] = None
+    ) -> List[NewsArticle]:
+        """
+        Generate summaries for all articles concurrently.
+        
+        Per-article calls are fanned out with asyncio.gather; each LLM
+        call attempt holds the provider's semaphore, retry backoff does
+        not. Results keep the input article order, and a failed article
+        falls back to its original snippet. Each summarized article is
+        emitted as a stream event as soon as its summary is ready.
+        
+        Args:
+            articles: List of articles to summarize
+            llm_client: Initialized LLM client
+            provider: Provider name for logging
+            session_id: Session identifier for logging
+            workflow_id: Workflow identifier for logging
+            stream_indices: Article positions to report in stream events;
+                defaults to each article's position in articles
+            served_by: Filled with the provider that wrote each summary, by content hash
+            
+        Returns:
+            List of articles with generated summaries
+            
+        Raises:
+            LLMProviderError: When summarization fails
+        """
+        semaphore = self._get_provider_semaphore(provider)
+        total = len(articles)
+        completed = 0
+        
+        async def summarize_article(index: int, article: NewsArticle) -> NewsArticle:
+            nonlocal completed
+            
+            try:
+                summary, used_provider = await self._generate_single_summary(
+                    article=article,
+                    llm_client=llm_client,
+                    provider=provider,
+                    session_id=session_id,
+                    workflow_id=workflow_id,
+                    semaphore=semaphore
+                )
                 
-                return ChatOpenAI(
-                    model="gpt-4-turbo-preview",
-                    api_key=settings.OPENAI_API_KEY,
-                    max_tokens=settings.LLM_MAX_TOKENS,
-                    temperature=settings.LLM_TEMPERATURE
+                summarized_article = article.copy()
+                summarized_article["summary"] = summary
+                self._record_serving_provider(served_by, article, used_provider)
+                self._emit_article(
+                    stream_indices[index] if stream_indices else index,
+                    summarized_article,
+                    used_provider
                 )
-            
-            elif provider == "gemini-pro":
-                if not settings.GOOGLE_API_KEY:
-                    raise LLMProviderError(provider, "Google API key not configured")
                 
-                return ChatGoogleGenerativeAI(
-                    model="gemini-pro",
-                    google_api_key=settings.GOOGLE_API_KEY,
-                    max_output_tokens=settings.LLM_MAX_TOKENS,
-                    temperature=settings.LLM_TEMPERATURE
+            except Exception as e:
+                # Log individual article failure but continue
+                self.logger.log_processing_step(
+                    session_id=session_id,
+                    workflow_id=workflow_id,
+                    step="article_summary_failed",
+                    message=f"Failed to summarize article {index + 1}: {str(e)}",
+                    extra_data={"article_index": index + 1, "error": str(e)}
                 )
-            
-            else:
-                raise LLMProviderError(provider, f"Unknown provider: {provider}")
                 
-        except Exception as e:
-            raise LLMProviderError(provider, f"Failed to initialize: {str(e)}")
+                # Use original snippet as fallback; not emitted, as the next provider may retry it
+                summarized_article = article.copy()
+                summarized_article["summary"] = article.get("summary", "")[:self.summary_max_length]
+            
+            # Log progress
+            completed += 1
+            if completed % 3 == 0 or completed == total:
+                self.logger.log_processing_step(
+                    session_id=session_id,
+                    workflow_id=workflow_id,
+                    step="summary_progress",
+                    message=f"Generated {completed}/{total} summaries",
+                    extra_data={"progress": f"{completed}/{total}"}
+                )
+            
+            return summarized_article
+        
+        summarized_articles = await asyncio.gather(
+            *(summarize_article(i, article) for i, article in enumerate(articles))
+        )
+        
+        if not summarized_articles:
+            raise LLMProviderError(provider, "Failed to summarize any articles")
+        
+        return list(summarized_articles)
     
-    async def _generate_summaries(
+    async def _generate_summaries_sequential(
         self,
         articles: List[NewsArticle],
         llm_client,
         provider: str,
         session_id: str,
-        workflow_id: str
+        workflow_id: str,
+        stream_indices: Optional[List[int]] = None,
+        served_by: Optional[Dict[str, str]] = None
     ) -> List[NewsArticle]:
         """
-        Generate summaries for all articles using the LLM client.
+        Generate summaries for all articles one after another.
         
         Args:
             articles: List of articles to summarize
@@ -373,6 +688,9 @@ class SummarizeContentNode:
             provider: Provider name for logging
             session_id: Session identifier for logging
             workflow_id: Workflow identifier for logging
+            stream_indices: Article positions to report in stream events;
+                defaults to each article's position in articles
+            served_by: Filled with the provider that wrote each summary, by content hash
             
         Returns:
             List of articles with generated summaries
@@ -385,7 +703,7 @@ class SummarizeContentNode:
         for i, article in enumerate(articles):
             try:
                 # Generate summary for individual article
-                summary = await self._generate_single_summary(
+                summary, used_provider = await self._generate_single_summary(
                     article=article,
                     llm_client=llm_client,
                     provider=provider,
@@ -397,6 +715,8 @@ class SummarizeContentNode:
                 summarized_article = article.copy()
                 summarized_article["summary"] = summary
                 summarized_articles.append(summarized_article)
+                self._record_serving_provider(served_by, article, used_provider)
+                self._emit_article(stream_indices[i] if stream_indices else i, summarized_article, used_provider)
                 
                 # Log progress
                 if (i + 1) % 3 == 0 or (i + 1) == len(articles):
@@ -418,7 +738,7 @@ class SummarizeContentNode:
                     extra_data={"article_index": i + 1, "error": str(e)}
                 )
                 
-                # Use original snippet as fallback
+                # Use original snippet as fallback; not emitted, as the next provider may retry it
                 fallback_article = article.copy()
                 fallback_article["summary"] = article.get("summary", "")[:self.summary_max_length]
                 summarized_articles.append(fallback_article)
@@ -428,14 +748,181 @@ class SummarizeContentNode:
         
         return summarized_articles
     
+    async def _generate_summaries_batch(
+        self,
+        articles: List[NewsArticle],
+        llm_client,
+        provider: str,
+        session_id: str,
+        workflow_id: str,
+        stream_indices: Optional[List[int]] = None,
+        served_by: Optional[Dict[str, str]] = None
+    ) -> List[NewsArticle]:
+        """
+        Generate summaries for all articles with a single LLM request.
+        
+        The response is parsed back by article index. Articles missing
+        from a malformed or partial response are summarized with
+        per-article calls; all other articles keep their batch summary.
+        
+        Args:
+            articles: List of articles to summarize
+            llm_client: Initialized LLM client
+            provider: Provider name for logging
+            session_id: Session identifier for logging
+            workflow_id: Workflow identifier for logging
+            stream_indices: Article positions to report in stream events;
+                defaults to each article's position in articles
+            served_by: Filled with the provider that wrote each summary, by content hash
+            
+        Returns:
+            List of articles with generated summaries
+            
+        Raises:
+            LLMProviderError: When summarization fails
+        """
+        prompt = self._build_batch_summarization_prompt(articles)
+        messages = [HumanMessage(content=prompt)]
+        batch_summaries: Dict[int, str] = {}
+        
+        for attempt in range(self.max_retries + 1):
+            if get_provider_router().is_open(provider):
+                # Tripped by other calls, or a half-open trial is already in flight
+                break
+            
+            try:
+                api_start_time = time.time()
+                
+                response = await get_provider_router().call_model(
+                    provider,
+                    lambda model: llm_client.ainvoke(messages),
+                    tokens=estimate_tokens(messages, settings.LLM_MAX_TOKENS)
+                )
+                
+                api_duration = time.time() - api_start_time
+                
+                self.logger.log_api_call(
+                    session_id=session_id,
+                    workflow_id=workflow_id,
+                    api_name=provider,
+                    method="POST",
+                    url="llm_api",
+                    duration=api_duration,
+                    extra_data={"batch_size": len(articles)}
+                )
+                
+                batch_summaries = self._parse_batch_summaries(response.content, len(articles))
+                break
+                
+            except Exception as e:
+                if attempt < self.max_retries and not get_provider_router().is_open(provider, claim_trial=False):
+                    # Calculate delay with exponential backoff; the rate limiter paces 429 retries
+                    delay = 0 if is_rate_limit_error(e) else self.retry_delay * (2 ** attempt)
+                    
+                    self.logger.log_processing_step(
+                        session_id=session_id,
+                        workflow_id=workflow_id,
+                        step="summary_retry",
+                        message=f"Batch summary request failed (attempt {attempt + 1}/{self.max_retries + 1}), retrying in {delay}s",
+                        extra_data={
+                            "attempt": attempt + 1,
+                            "max_attempts": self.max_retries + 1,
+                            "delay": delay,
+                            "error": str(e)
+                        }
+                    )
+                    
+                    await asyncio.sleep(delay)
+                else:
+                    self.logger.log_processing_step(
+                        session_id=session_id,
+                        workflow_id=workflow_id,
+                        step="batch_summary_failed",
+                        message=f"Batch summary request failed, falling back to per-article calls: {str(e)}",
+                        extra_data={"error": str(e)}
+                    )
+        
+        summarized_articles: List[Optional[NewsArticle]] = [None] * len(articles)
+        missing_indices = []
+        
+        for i, article in enumerate(articles):
+            summary = batch_summaries.get(i)
+            if summary:
+                summarized_article = article.copy()
+                summarized_article["summary"] = summary
+                summarized_articles[i] = summarized_article
+                self._emit_article(stream_indices[i] if stream_indices else i, summarized_article, provider)
+            else:
+                missing_indices.append(i)
+        
+        self.logger.log_processing_step(
+            session_id=session_id,
+            workflow_id=workflow_id,
+            step="summary_progress",
+            message=f"Generated {len(articles) - len(missing_indices)}/{len(articles)} summaries in batch",
+            extra_data={
+                "progress": f"{len(articles) - len(missing_indices)}/{len(articles)}",
+                "missing_articles": len(missing_indices)
+            }
+        )
+        
+        if missing_indices:
+            # Only re-summarize the articles the batch response did not cover
+            fallback_articles = await self._generate_summaries_concurrent(
+                articles=[articles[i] for i in missing_indices],
+                llm_client=llm_client,
+                provider=provider,
+                session_id=session_id,
+                workflow_id=workflow_id,
+                stream_indices=[stream_indices[i] for i in missing_indices] if stream_indices else missing_indices,
+                served_by=served_by
+            )
+            
+            for i, fallback_article in zip(missing_indices, fallback_articles):
+                summarized_articles[i] = fallback_article
+        
+        return summarized_articles
+    
+    @staticmethod
+    def _record_serving_provider(
+        served_by: Optional[Dict[str, str]],
+        article: NewsArticle,
+        used_provider: str
+    ) -> None:
+        """Note which provider wrote an article's summary, for caching."""
+        if served_by is not None and article.get("content_hash"):
+            served_by[article["content_hash"]] = used_provider
+    
+    def _emit_article(self, index: int, article: NewsArticle, provider: str) -> None:
+        """
+        Emit a summarized article to streaming callers.
+        
+        Only generated or cached summaries are emitted. Snippet fallbacks
+        may still be re-summarized by the next provider, so the workflow
+        emits them from the final state once summarization is done; each
+        index is therefore emitted once.
+        
+        Args:
+            index: Article position in the filtered article list
+            article: Article with its generated summary
+            provider: Provider that generated the summary
+        """
+        emit_stream_event({
+            "type": "article",
+            "index": index,
+            "provider": provider,
+            "article": article
+        })
+    
     async def _generate_single_summary(
         self,
         article: NewsArticle,
         llm_client,
         provider: str,
         session_id: str,
-        workflow_id: str
-    ) -> str:
+        workflow_id: str,
+        semaphore: Optional[asyncio.Semaphore] = None
+    ) -> Tuple[str, str]:
         """
         Generate summary for a single article with retry logic.
         
@@ -445,25 +932,52 @@ class SummarizeContentNode:
             provider: Provider name for logging
             session_id: Session identifier for logging
             workflow_id: Workflow identifier for logging
+            semaphore: Held around each LLM call attempt, but not during
+                retry backoff, to bound concurrent calls to the provider
             
         Returns:
-            Generated summary text
+            (summary, provider) with the provider that served the call,
+            which is the hedge backup when it answered first
             
         Raises:
             LLMProviderError: When summary generation fails
         """
         # Construct prompt for summarization
         prompt = self._build_summarization_prompt(article)
+        message = HumanMessage(content=prompt)
+        
+        # Slow calls may be hedged on the next healthy provider
+        backup_provider = self._get_hedge_backup(provider)
+        
+        async def call(model: str):
+            client = llm_client if model == provider else self._initialize_llm_client(model)
+            return await client.ainvoke([message])
         
         last_error = None
         
         for attempt in range(self.max_retries + 1):
+            if get_provider_router().is_open(provider):
+                # Skip calls to a provider other articles have already tripped
+                raise LLMProviderError(provider, f"Circuit open, skipping call: {str(last_error)}")
+            
             try:
                 # Make LLM API call
                 api_start_time = time.time()
                 
-                message = HumanMessage(content=prompt)
-                response = await llm_client.ainvoke([message])
+                if semaphore is not None:
+                    await semaphore.acquire()
+                try:
+                    response, used_provider = await hedged_invoke(
+                        get_provider_router(),
+                        provider,
+                        call,
+                        backup_provider,
+                        get_hedge_budget("summarize_content"),
+                        tokens=estimate_tokens([message], settings.LLM_MAX_TOKENS)
+                    )
+                finally:
+                    if semaphore is not None:
+                        semaphore.release()
                 
                 api_duration = time.time() - api_start_time
                 
@@ -471,11 +985,11 @@ class SummarizeContentNode:
                 self.logger.log_api_call(
                     session_id=session_id,
                     workflow_id=workflow_id,
-                    api_name=provider,
+                    api_name=used_provider,
                     method="POST",
                     url="llm_api",
                     duration=api_duration,
-                    extra_data={"article_title": article["title"][:50]}
+                    extra_data=lambda: {"article_title": article["title"][:50]}
                 )
                 
                 # Extract and validate summary
@@ -488,14 +1002,15 @@ class SummarizeContentNode:
                 if len(summary) > self.summary_max_length:
                     summary = summary[:self.summary_max_length - 3] + "..."
                 
-                return summary
+                return summary, used_provider
                 
             except Exception as e:
                 last_error = e
                 
-                if attempt < self.max_retries:
-                    # Calculate delay with exponential backoff
-                    delay = self.retry_delay * (2 ** attempt)
+                # Backing off on a provider whose circuit is open only delays the fallback
+                if attempt < self.max_retries and not get_provider_router().is_open(provider, claim_trial=False):
+                    # Calculate delay with exponential backoff; the rate limiter paces 429 retries
+                    delay = 0 if is_rate_limit_error(e) else self.retry_delay * (2 ** attempt)
                     
                     self.logger.log_processing_step(
                         session_id=session_id,
@@ -518,6 +1033,26 @@ class SummarizeContentNode:
         # All retries failed
         raise LLMProviderError(provider, f"Summary generation failed after {self.max_retries} retries: {str(last_error)}")
     
+    def _get_hedge_backup(self, provider: str) -> Optional[str]:
+        """
+        Pick the provider to hedge slow calls on.
+        
+        Args:
+            provider: Provider serving the call
+            
+        Returns:
+            Best routed configured provider other than provider, or None
+        """
+        if not settings.LLM_HEDGING_ENABLED:
+            return None
+        
+        pool = get_llm_client_pool()
+        for candidate in get_provider_router().route(provider, self.provider_order):
+            if candidate != provider and pool.is_configured(candidate):
+                return candidate
+        
+        return None
+    
     def _build_summarization_prompt(self, article: NewsArticle) -> str:
         """
         Build prompt for article summarization.
@@ -548,3 +1083,98 @@ Requirements:
 Summary:"""
         
         return prompt
+    
+    def _build_batch_summarization_prompt(self, articles: List[NewsArticle]) -> str:
+        """
+        Build a single prompt that summarizes all articles at once.
+        
+        Args:
+            articles: Articles to summarize
+            
+        Returns:
+            Formatted prompt string
+        """
+        articles_text = "\n\n".join([
+            f"Article {i + 1}:\n"
+            f"Title: {article.get('title', '')}\n"
+            f"Source: {article.get('source', '')}\n"
+            f"Original Content: {article.get('summary', '')}"
+            for i, article in enumerate(articles)
+        ])
+        
+        prompt = f"""Please create a concise, professional summary of each of the following {len(articles)} news articles for LinkedIn sharing.
+
+{articles_text}
+
+Requirements for each summary:
+- Maximum {self.summary_max_length} characters
+- Professional tone suitable for LinkedIn
+- Focus on key insights and implications
+- Include relevant context for business professionals
+- Avoid promotional language
+
+Respond with ONLY a JSON array containing one object per article, in this exact format:
+[{{"index": 1, "summary": "..."}}, {{"index": 2, "summary": "..."}}]
+
+JSON:"""
+        
+        return prompt
+    
+    def _parse_batch_summaries(self, content: Any, article_count: int) -> Dict[int, str]:
+        """
+        Parse a batch summarization response into summaries keyed by article position.
+        
+        Malformed entries are skipped so that only the affected articles
+        need to be re-summarized.
+        
+        Args:
+            content: Raw LLM response content
+            article_count: Number of articles in the batch
+            
+        Returns:
+            Dictionary mapping zero-based article position to summary
+        """
+        if not isinstance(content, str):
+            return {}
+        
+        text = content.strip()
+        
+        # Tolerate markdown code fences and surrounding prose
+        start = text.find("[")
+        end = text.rfind("]")
+        if start == -1 or end <= start:
+            return {}
+        
+        try:
+            items = json.loads(text[start:end + 1])
+        except (ValueError, TypeError):
+            return {}
+        
+        if not isinstance(items, list):
+            return {}
+        
+        summaries = {}
+        for item in items:
+            if not isinstance(item, dict):
+                continue
+            
+            try:
+                position = int(item.get("index")) - 1
+            except (TypeError, ValueError):
+                continue
+            
+            summary = item.get("summary")
+            if not isinstance(summary, str) or not summary.strip():
+                continue
+            if position < 0 or position >= article_count or position in summaries:
+                continue
+            
+            summary = summary.strip()
+            
+            # Truncate if too long
+            if len(summary) > self.summary_max_length:
+                summary = summary[:self.summary_max_length - 3] + "..."
+            
+            summaries[position] = summary
+        
+        return summaries
@@ -5,11 +5,7 @@ This node generates concise X posts from news articles,
 including hashtags and shortened URLs.
 """
 import asyncio
-import aiohttp
 from typing import Dict, Any, List, Optional
-from langchain_anthropic import ChatAnthropic
-from langchain_openai import ChatOpenAI
-from langchain_google_genai import ChatGoogleGenerativeAI
 from langchain_core.messages import SystemMessage, HumanMessage
 
 from app.langgraph.state.post_state import (
@@ -23,6 +19,11 @@ from app.langgraph.state.post_state import (
 from datetime import datetime
 from app.langgraph.utils.logging_config import StructuredLogger
 from app.langgraph.utils.error_handlers import LLMProviderError
+from app.langgraph.utils.llm_client_pool import get_llm_client_pool
+from app.langgraph.utils.provider_router import get_provider_router
+from app.langgraph.utils.hedging import get_hedge_budget
+from app.langgraph.utils.rate_limiter import estimate_tokens
+from app.langgraph.utils.url_shortener import get_url_shortener
 from app.langgraph.utils.state_helpers import get_post_workflow_fields, StateAccessError, StateAccessHelper
 from app.core.config import settings
 
@@ -39,7 +40,15 @@ class XPostNode:
     """
     
     MAX_CHAR_LIMIT = 250
-    TINYURL_API_URL = "https://api.tinyurl.com/create"
+    
+    # Maximum output tokens per model
+    LLM_MAX_TOKENS = {
+        "claude-3-5-sonnet": 8192,
+        "claude-3-5-haiku": 8192,
+        "gpt-4-turbo": 1024,
+        "gemini-pro": 1024
+    }
+    LLM_TEMPERATURE = 0.7
     
     def __init__(self):
         """Initialize X post node with logger."""
@@ -47,49 +56,26 @@ class XPostNode:
         self.llm_providers = self._initialize_llm_providers()
     
     def _initialize_llm_providers(self) -> Dict[str, Any]:
-        """Initialize available LLM providers."""
-        providers = {}
-        
-        # Initialize Anthropic Claude (latest version)
-        if settings.ANTHROPIC_API_KEY:
-            providers["claude-3-5-sonnet"] = ChatAnthropic(
-                model="claude-3-5-sonnet-20241022",
-                api_key=settings.ANTHROPIC_API_KEY,
-                max_tokens=8192,
-                temperature=0.7
-            )
-            # Add Claude 3.5 Haiku for faster responses
-            providers["claude-3-5-haiku"] = ChatAnthropic(
-                model="claude-3-5-haiku-20241022",
-                api_key=settings.ANTHROPIC_API_KEY,
-                max_tokens=8192,
-                temperature=0.7
-            )
-        
-        # Initialize OpenAI GPT
-        if settings.OPENAI_API_KEY:
-            providers["gpt-4-turbo"] = ChatOpenAI(
-                model="gpt-4-turbo-preview",
-                api_key=settings.OPENAI_API_KEY,
-                max_tokens=1024,
-                temperature=0.7
-            )
+        """Get shared clients for all LLM providers with a configured API key."""
+        pool = get_llm_client_pool()
         
-        # Initialize Google Gemini
-        if settings.GOOGLE_API_KEY:
-            providers["gemini-pro"] = ChatGoogleGenerativeAI(
-                model="gemini-pro",
-                google_api_key=settings.GOOGLE_API_KEY,
-                max_output_tokens=1024,
-                temperature=0.7
+        return {
+            model_name: pool.get_client(
+                model_name,
+                max_tokens=self.LLM_MAX_TOKENS[model_name],
+                temperature=self.LLM_TEMPERATURE
             )
-        
-        return providers
+            for model_name in pool.configured_models()
+            if model_name in self.LLM_MAX_TOKENS
+        }
     
     async def _shorten_url(self, url: str) -> Optional[str]:
         """
         Shorten URL using TinyURL API.
         
+        Results are cached in process and in the short_urls table, and
+        concurrent requests for the same URL share one TinyURL call.
+        
         Args:
             url: Original URL to shorten
             
@@ -106,35 +92,16 @@ class XPostNode:
             return None
         
         try:
-            headers = {
-                "Authorization": f"Bearer {settings.TINYURL_API_KEY}",
-                "Content-Type": "application/json"
-            }
-            
-            data = {
-                "url": url,
-                "domain": "tinyurl.com"
-            }
-            
-            async with aiohttp.ClientSession() as session:
-                async with session.post(
-                    self.TINYURL_API_URL,
-                    headers=headers,
-                    json=data,
-                    timeout=aiohttp.ClientTimeout(total=5)
-                ) as response:
-                    if response.status == 200:
-                        result = await response.json()
-                        return result.get("data", {}).get("tiny_url")
-                    else:
-                        self.logger.log_error(
-                            session_id="system",
-                            workflow_id="system",
-                            step="url_shortening_failed",
-                            error=f"TinyURL API returned status {response.status}",
-                            extra_data={"url": url}
-                        )
-                        return None
+            shortened = await get_url_shortener().shorten(url)
+            if not shortened:
+                self.logger.log_error(
+                    session_id="system",
+                    workflow_id="system",
+                    step="url_shortening_failed",
+                    error="TinyURL shortening failed, using original URL",
+                    extra_data={"url": url}
+                )
+            return shortened
                         
         except Exception as e:
             self.logger.log_error(
@@ -357,32 +324,6 @@ Generate the X post now (EXACTLY 250 characters):"""
                     original_error="No LLM providers are configured. Please set at least one API key (ANTHROPIC_API_KEY, OPENAI_API_KEY, or GOOGLE_API_KEY) in your environment variables."
                 )
             
-            # Get LLM provider with fallback logic
-            llm = self.llm_providers.get(llm_model)
-            if not llm:
-                available_models = list(self.llm_providers.keys())
-                # Try to use the first available provider as fallback
-                if available_models:
-                    fallback_model = available_models[0]
-                    self.logger.log_processing_step(
-                        session_id=session_id,
-                        workflow_id=workflow_id,
-                        step="llm_provider_fallback",
-                        message=f"LLM provider {llm_model} not available, using fallback: {fallback_model}",
-                        extra_data={
-                            "requested_model": llm_model,
-                            "fallback_model": fallback_model,
-                            "available_models": available_models
-                        }
-                    )
-                    llm = self.llm_providers[fallback_model]
-                    llm_model = fallback_model  # Update the model name for state
-                else:
-                    raise LLMProviderError(
-                        provider=llm_model,
-                        original_error=f"LLM provider {llm_model} not available. Available providers: {', '.join(available_models)}"
-                    )
-            
             # Create prompt
             prompt = self._create_x_prompt(state)
             
@@ -392,7 +333,29 @@ Generate the X post now (EXACTLY 250 characters):"""
                 HumanMessage(content=prompt)
             ]
             
-            response = await llm.ainvoke(messages)
+            # Generate on the healthiest provider, failing over on errors and hedging slow calls
+            requested_model = llm_model
+            response, llm_model = await get_provider_router().invoke_with_routing(
+                requested_model,
+                lambda model: self.llm_providers[model].ainvoke(messages),
+                candidates=list(self.llm_providers),
+                hedge_budget=get_hedge_budget("x_post"),
+                tokens=estimate_tokens(messages, self.LLM_MAX_TOKENS.get(requested_model, 1024))
+            )
+            
+            if llm_model != requested_model:
+                self.logger.log_processing_step(
+                    session_id=session_id,
+                    workflow_id=workflow_id,
+                    step="llm_provider_fallback",
+                    message=f"LLM provider {requested_model} unavailable or unhealthy, using fallback: {llm_model}",
+                    extra_data={
+                        "requested_model": requested_model,
+                        "fallback_model": llm_model,
+                        "available_models": list(self.llm_providers.keys())
+                    }
+                )
+            
             generated_content = response.content.strip()
             
             # Extract URLs from content for shortening
@@ -13,6 +13,11 @@ def keep_state_key(existing: str, new: str) -> str:
     return existing if existing else new
 
 
+def keep_latest_error(existing: str, new: str) -> str:
+    """Reducer that keeps the latest non-empty error value from parallel nodes."""
+    return new if new else existing
+
+
 class MinimalState(TypedDict):
     """
     Minimal state that only contains a state_key.
@@ -24,9 +29,10 @@ class MinimalState(TypedDict):
     # The only field that goes through LangGraph - a reference to external state
     state_key: Annotated[str, keep_state_key]
     
-    # Optional fields for error handling (these can be lost, we don't care)
-    error_message: str
-    failed_step: str
+    # Optional fields for error handling. Reducers let parallel nodes
+    # report errors in the same step without conflicting updates.
+    error_message: Annotated[str, keep_latest_error]
+    failed_step: Annotated[str, keep_latest_error]
 
 
 def create_minimal_state(state_key: str) -> MinimalState:
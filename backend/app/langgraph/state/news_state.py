@@ -78,6 +78,7 @@ class NewsState(TypedDict):
     total_found: int
     processing_time: Optional[float]
     cache_hit: bool
+    coalesced: bool  # Articles shared from an identical in-flight request
     
     # Error handling
     error_message: Optional[str]
@@ -138,6 +139,7 @@ def create_initial_state(
         total_found=0,
         processing_time=None,
         cache_hit=False,
+        coalesced=False,
         
         # Error handling
         error_message=None,
@@ -142,6 +142,22 @@ class LLMProviderError(NewsProcessingError):
         )
 
 
+class RateLimitExceededError(NewsProcessingError):
+    """Raised when a call would wait too long for an upstream rate limit"""
+    
+    def __init__(self, upstream: str, wait_seconds: float):
+        message = f"Rate limit for {upstream} exceeded: would wait {wait_seconds:.1f}s"
+        super().__init__(
+            message=message,
+            severity=ErrorSeverity.MEDIUM,
+            error_code="RATE_LIMIT_EXCEEDED",
+            context={
+                "upstream": upstream,
+                "wait_seconds": wait_seconds
+            }
+        )
+
+
 class DatabaseError(NewsProcessingError):
     """Raised when database operations fail"""
     
@@ -238,7 +254,7 @@ def is_retryable_error(error: Exception) -> bool:
         return False
     if isinstance(error, (ValidationError, QuotaExceededError, DuplicateRequestError)):
         return False
-    if isinstance(error, (SerperAPIError, LLMProviderError)):
+    if isinstance(error, (SerperAPIError, LLMProviderError, RateLimitExceededError)):
         return True
     
     # Default to non-retryable for unknown errors
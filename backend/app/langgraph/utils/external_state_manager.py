@@ -5,10 +5,15 @@ This approach stores workflow state externally and passes only the state ID
 through LangGraph, completely avoiding the reducer issues.
 """
 import uuid
+import time
 import asyncio
-from typing import Dict, Any, Optional
-from datetime import datetime, timedelta
-import json
+import logging
+from typing import Dict, Any, List, Optional, Callable
+
+from app.langgraph.utils.state_backends import StateBackend, create_state_backend
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
 
 
 class ExternalStateManager:
@@ -16,18 +21,34 @@ class ExternalStateManager:
     External state manager that stores workflow state outside of LangGraph.
     
     This completely bypasses LangGraph's broken reducer system by:
-    1. Storing all state externally in memory/cache
+    1. Storing all state externally in a pluggable backend (memory, Redis, SQLite)
     2. Passing only a state_key through LangGraph nodes
     3. Nodes retrieve full state using the state_key
     4. Nodes update state externally and return minimal updates
+    
+    Updates are optimistic: each write is a compare-and-set on the
+    state's "_version", retried on conflict. This keeps concurrent
+    writers consistent across processes without shared locks.
     """
     
-    def __init__(self):
-        """Initialize the external state manager."""
-        self._states: Dict[str, Dict[str, Any]] = {}
-        self._state_locks: Dict[str, asyncio.Lock] = {}
-        self._cleanup_interval = 3600  # 1 hour cleanup interval
-        self._state_ttl = 7200  # 2 hour TTL for states
+    MAX_UPDATE_ATTEMPTS = 10
+    
+    def __init__(self, backend: Optional[StateBackend] = None):
+        """
+        Initialize the external state manager.
+        
+        Args:
+            backend: State storage backend. Defaults to the one selected by STATE_BACKEND.
+        """
+        self._backend = backend or create_state_backend()
+        self._state_ttl = settings.STATE_TTL_SECONDS
+        self._version_conflicts = 0
+        
+        # Background TTL sweeper
+        self._sweep_task: Optional[asyncio.Task] = None
+        self._expired_total = 0
+        self._last_sweep_at: Optional[float] = None
+        self._last_sweep_duration: Optional[float] = None
     
     async def create_state(self, initial_data: Dict[str, Any]) -> str:
         """
@@ -40,18 +61,17 @@ class ExternalStateManager:
             State key for accessing the state
         """
         state_key = str(uuid.uuid4())
+        now = time.time()
         
         # Add metadata
         state_data = {
             **initial_data,
-            "_created_at": datetime.utcnow().timestamp(),
-            "_last_accessed": datetime.utcnow().timestamp(),
+            "_created_at": now,
+            "_last_accessed": now,
             "_version": 1
         }
         
-        # Store state and create lock
-        self._states[state_key] = state_data
-        self._state_locks[state_key] = asyncio.Lock()
+        await self._backend.create(state_key, state_data, self._state_ttl)
         
         return state_key
     
@@ -63,16 +83,44 @@ class ExternalStateManager:
             state_key: State key
             
         Returns:
-            State data or None if not found
+            Copy of the state data or None if not found
+        """
+        return await self._backend.get(state_key)
+    
+    async def _apply_update(
+        self,
+        state_key: str,
+        mutate: Callable[[Dict[str, Any]], Dict[str, Any]]
+    ) -> bool:
         """
-        if state_key not in self._states:
-            return None
+        Apply an update with optimistic concurrency on "_version".
         
-        # Update last accessed time
-        self._states[state_key]["_last_accessed"] = datetime.utcnow().timestamp()
+        Args:
+            state_key: State key
+            mutate: Function returning the new state from the current one
+            
+        Returns:
+            True if successful, False if state not found or conflicts persisted
+        """
+        for attempt in range(self.MAX_UPDATE_ATTEMPTS):
+            current = await self._backend.get(state_key)
+            if current is None:
+                return False
+            
+            version = current.get("_version", 0)
+            new_state = mutate(current)
+            new_state["_last_accessed"] = time.time()
+            new_state["_version"] = version + 1
+            
+            if await self._backend.compare_and_set(state_key, version, new_state, self._state_ttl):
+                return True
+            
+            # Another writer won - back off briefly and retry on fresh state
+            self._version_conflicts += 1
+            await asyncio.sleep(0.005 * (attempt + 1))
         
-        # Return copy to prevent external modifications
-        return self._states[state_key].copy()
+        logger.warning(f"Giving up on state update for {state_key} after {self.MAX_UPDATE_ATTEMPTS} version conflicts")
+        return False
     
     async def update_state(self, state_key: str, updates: Dict[str, Any]) -> bool:
         """
@@ -85,16 +133,27 @@ class ExternalStateManager:
         Returns:
             True if successful, False if state not found
         """
-        if state_key not in self._states:
-            return False
+        return await self._apply_update(state_key, lambda current: {**current, **updates})
+    
+    async def append_state_list(self, state_key: str, field: str, items: List[Any]) -> bool:
+        """
+        Atomically append items to a list field in state.
         
-        async with self._state_locks[state_key]:
-            # Apply updates
-            self._states[state_key].update(updates)
-            self._states[state_key]["_last_accessed"] = datetime.utcnow().timestamp()
-            self._states[state_key]["_version"] += 1
+        Parallel nodes use this instead of read-modify-write so that
+        concurrent appends (e.g. processing_steps) are not lost.
         
-        return True
+        Args:
+            state_key: State key
+            field: Name of the list field
+            items: Items to append
+            
+        Returns:
+            True if successful, False if state not found
+        """
+        return await self._apply_update(
+            state_key,
+            lambda current: {**current, field: list(current.get(field) or []) + list(items)}
+        )
     
     async def delete_state(self, state_key: str) -> bool:
         """
@@ -106,41 +165,80 @@ class ExternalStateManager:
         Returns:
             True if deleted, False if not found
         """
-        if state_key not in self._states:
-            return False
-        
-        del self._states[state_key]
-        if state_key in self._state_locks:
-            del self._state_locks[state_key]
+        return await self._backend.delete(state_key)
+    
+    async def cleanup_expired_states(self) -> int:
+        """
+        Clean up expired states.
         
-        return True
+        Returns:
+            Number of states removed
+        """
+        return await self._backend.cleanup_expired(self._state_ttl)
     
-    async def cleanup_expired_states(self):
-        """Clean up expired states."""
-        current_time = datetime.utcnow().timestamp()
-        expired_keys = []
+    async def sweep(self) -> int:
+        """
+        Run one expiry sweep and record its duration.
+        
+        Returns:
+            Number of states removed
+        """
+        start_time = time.perf_counter()
+        removed = await self.cleanup_expired_states()
+        
+        self._expired_total += removed
+        self._last_sweep_at = time.time()
+        self._last_sweep_duration = time.perf_counter() - start_time
         
-        for state_key, state_data in self._states.items():
-            last_accessed = state_data.get("_last_accessed", 0)
-            if current_time - last_accessed > self._state_ttl:
-                expired_keys.append(state_key)
+        return removed
+    
+    async def _sweep_loop(self, interval: float) -> None:
+        """Sweep expired states every interval seconds."""
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                removed = await self.sweep()
+                if removed:
+                    logger.info(f"Swept {removed} expired workflow states in {self._last_sweep_duration:.3f}s")
+            except Exception as e:
+                logger.warning(f"Workflow state sweep failed: {e}")
+    
+    def start_sweeper(self, interval: Optional[float] = None) -> None:
+        """
+        Start the background TTL sweeper.
         
-        for key in expired_keys:
-            await self.delete_state(key)
+        Args:
+            interval: Seconds between sweeps. Defaults to STATE_SWEEP_INTERVAL.
+        """
+        if self._sweep_task is None or self._sweep_task.done():
+            self._sweep_task = asyncio.create_task(
+                self._sweep_loop(interval or settings.STATE_SWEEP_INTERVAL)
+            )
+    
+    async def stop_sweeper(self) -> None:
+        """Stop the background TTL sweeper."""
+        if self._sweep_task is not None:
+            self._sweep_task.cancel()
+            try:
+                await self._sweep_task
+            except asyncio.CancelledError:
+                pass
+            self._sweep_task = None
+    
+    async def close(self) -> None:
+        """Stop the sweeper and release backend resources."""
+        await self.stop_sweeper()
+        await self._backend.close()
     
     def get_stats(self) -> Dict[str, Any]:
         """Get manager statistics."""
         return {
-            "total_states": len(self._states),
-            "active_locks": len(self._state_locks),
-            "oldest_state": min(
-                (state["_created_at"] for state in self._states.values()),
-                default=None
-            ),
-            "newest_state": max(
-                (state["_created_at"] for state in self._states.values()),
-                default=None
-            )
+            **self._backend.get_stats(),
+            "version_conflicts": self._version_conflicts,
+            "state_ttl": self._state_ttl,
+            "expired_total": self._expired_total,
+            "last_sweep_at": self._last_sweep_at,
+            "last_sweep_duration": self._last_sweep_duration
         }
 
 
@@ -158,6 +256,15 @@ def get_external_state_manager() -> ExternalStateManager:
     return _external_state_manager
 
 
+async def close_external_state_manager() -> None:
+    """Close the external state manager's backend if it was created."""
+    global _external_state_manager
+    
+    if _external_state_manager is not None:
+        await _external_state_manager.close()
+        _external_state_manager = None
+
+
 class StatelessNodeBase:
     """
     Base class for stateless nodes that use external state management.
@@ -215,6 +322,23 @@ class StatelessNodeBase:
         
         return success
     
+    async def append_processing_step(self, state_key: str, step: Dict[str, Any]) -> bool:
+        """
+        Append a processing step to external state.
+        
+        Args:
+            state_key: State key
+            step: Processing step to append
+            
+        Returns:
+            True if successful
+        """
+        success = await self.state_manager.append_state_list(state_key, "processing_steps", [step])
+        if not success:
+            raise ValueError(f"Failed to append processing step for key {state_key} in {self.node_name}")
+        
+        return success
+    
     async def execute_with_external_state(self, langgraph_state: Dict[str, Any]) -> Dict[str, Any]:
         """
         Execute node logic with external state management.
@@ -0,0 +1,188 @@
+"""
+Hedged LLM requests for cutting tail latency.
+
+When hedging is enabled and a primary call has not returned within a
+quantile (LLM_HEDGING_QUANTILE, p95 by default) of its model's recent
+latencies, the same request is sent to a backup model. The hedge delay
+starts once the primary is past its rate limiter, as recorded latencies
+exclude limiter waits; a call that is only queued is never hedged. Whichever call
+succeeds first wins and the other is cancelled.
+
+Each node draws hedges from its own HedgeBudget: every primary call
+earns a fraction of a hedge (LLM_HEDGING_BUDGET_RATIO, overridable per
+node) up to a small burst, so hedging adds at most that fraction of
+extra LLM calls however slow a provider gets.
+"""
+import asyncio
+import logging
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+class HedgeBudget:
+    """Token bucket limiting hedged calls to a share of primary calls."""
+    
+    def __init__(self, name: str, ratio: float, burst: float):
+        """
+        Initialize the budget.
+        
+        Args:
+            name: Budget name for logs and statistics (usually the node name)
+            ratio: Hedges earned per primary call
+            burst: Maximum hedges that can be saved up
+        """
+        self.name = name
+        self._ratio = ratio
+        self._burst = burst
+        self._tokens = burst
+        self._stats = {
+            "calls": 0,
+            "hedged": 0,
+            "hedge_wins": 0,
+            "denied": 0
+        }
+    
+    def record_call(self) -> None:
+        """Record a primary call, earning part of a hedge."""
+        self._stats["calls"] += 1
+        self._tokens = min(self._burst, self._tokens + self._ratio)
+    
+    def try_acquire(self) -> bool:
+        """Spend one hedge if the budget allows it."""
+        if self._tokens < 1:
+            self._stats["denied"] += 1
+            return False
+        
+        self._tokens -= 1
+        self._stats["hedged"] += 1
+        return True
+    
+    def record_win(self) -> None:
+        """Record a hedge that returned before the primary call."""
+        self._stats["hedge_wins"] += 1
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """Get budget statistics."""
+        return {
+            **self._stats,
+            "hedge_rate": round(self._stats["hedged"] / self._stats["calls"], 3) if self._stats["calls"] else None,
+            "tokens": round(self._tokens, 2)
+        }
+
+
+async def hedged_invoke(
+    router,
+    model: str,
+    call: Callable[[str], Awaitable[Any]],
+    backup_model: Optional[str],
+    budget: HedgeBudget,
+    tokens: int = 0
+) -> Tuple[Any, str]:
+    """
+    Run an LLM call, hedging on backup_model if it is slower than usual.
+    
+    Without hedging (disabled, no backup, not enough latency history, or
+    no budget left) this is a plain call. Both calls go through
+    router.call_model, which rate-limits them and records their outcomes;
+    a cancelled call is not recorded.
+    
+    Args:
+        router: ProviderRouter holding per-model latency history
+        model: Primary application model name
+        call: Coroutine function making the call for a given model name
+        backup_model: Model to hedge on, or None
+        budget: The calling node's hedge budget
+        tokens: Estimated tokens per call, for rate limiting
+    
+    Returns:
+        (call result, model name that served it)
+    
+    Raises:
+        Exception: The primary call's error when no hedge succeeded
+    """
+    budget.record_call()
+    
+    hedge_delay = None
+    if settings.LLM_HEDGING_ENABLED and backup_model and not router.is_open(backup_model, claim_trial=False):
+        hedge_delay = router.latency_quantile(
+            model,
+            settings.LLM_HEDGING_QUANTILE,
+            min_samples=settings.LLM_HEDGING_MIN_SAMPLES
+        )
+    
+    primary_started = asyncio.Event()
+    primary = asyncio.create_task(router.call_model(model, call, tokens, started=primary_started))
+    tasks = {primary: model}
+    
+    try:
+        if hedge_delay is not None:
+            # Time the primary from when it leaves the rate limiter queue
+            started = asyncio.create_task(primary_started.wait())
+            try:
+                await asyncio.wait({primary, started}, return_when=asyncio.FIRST_COMPLETED)
+            finally:
+                started.cancel()
+            
+            if not primary.done():
+                await asyncio.wait({primary}, timeout=hedge_delay)
+            
+            # A half-open backup takes the hedge only as its trial call
+            if not primary.done() and not router.is_open(backup_model):
+                if budget.try_acquire():
+                    logger.info(
+                        f"Hedging {model} call on {backup_model} after {hedge_delay:.2f}s",
+                        extra={"budget": budget.name, "model": model, "backup_model": backup_model}
+                    )
+                    tasks[asyncio.create_task(router.call_model(backup_model, call, tokens))] = backup_model
+                else:
+                    router.release_trial(backup_model)
+        
+        pending = set(tasks)
+        primary_error: Optional[BaseException] = None
+        
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            
+            # Prefer the primary when both finish in the same iteration
+            for task in sorted(done, key=lambda task: task is not primary):
+                if task.exception() is None:
+                    if task is not primary:
+                        budget.record_win()
+                    return task.result(), tasks[task]
+                
+                if task is primary or primary_error is None:
+                    primary_error = task.exception()
+        
+        raise primary_error
+    
+    finally:
+        # Cancel the losing (or abandoned) call
+        for task in tasks:
+            if not task.done():
+                task.cancel()
+
+
+# Per-node budgets
+_hedge_budgets: Dict[str, HedgeBudget] = {}
+
+
+def get_hedge_budget(name: str) -> HedgeBudget:
+    """Get the hedge budget for a node, creating it on first use."""
+    budget = _hedge_budgets.get(name)
+    
+    if budget is None:
+        budget = _hedge_budgets[name] = HedgeBudget(
+            name=name,
+            ratio=settings.LLM_HEDGING_BUDGETS.get(name, settings.LLM_HEDGING_BUDGET_RATIO),
+            burst=settings.LLM_HEDGING_BUDGET_BURST
+        )
+    
+    return budget
+
+
+def get_hedge_budget_stats() -> Dict[str, Any]:
+    """Get statistics for every hedge budget in use."""
+    return {name: budget.get_stats() for name, budget in _hedge_budgets.items()}
@@ -0,0 +1,133 @@
+"""
+Precompiled multi-keyword matching for relevance scoring.
+
+KeywordMatcher builds an Aho-Corasick automaton over a topic's keywords
+once, then finds every keyword in a text with a single pass. Text and
+keywords are case-folded and split into word and punctuation tokens,
+and the automaton runs over tokens rather than characters. Matches
+therefore always fall on word boundaries: "AI" matches "AI-powered"
+and "the AI", but not "said".
+"""
+import re
+from collections import deque
+from functools import lru_cache
+from typing import Dict, List, Sequence, Set, Tuple
+
+# Words, or single punctuation characters so keywords like "C++" keep their symbols
+TOKEN_PATTERN = re.compile(r"\w+|[^\w\s]")
+
+
+def tokenize(text: str) -> List[str]:
+    """Case-fold text and split it into word and punctuation tokens."""
+    return TOKEN_PATTERN.findall(text.casefold())
+
+
+class KeywordMatcher:
+    """
+    Aho-Corasick automaton over keyword token sequences.
+    
+    match() returns the indices (into keywords) of every keyword found,
+    including overlapping ones such as "machine" and "machine learning".
+    Duplicate keywords keep separate indices, so callers that score per
+    keyword count them the same way as a per-keyword loop would.
+    """
+    
+    def __init__(self, keywords: Sequence[str]):
+        """
+        Compile the automaton.
+        
+        Args:
+            keywords: Keywords to match; empty or whitespace-only keywords never match
+        """
+        self.keywords = list(keywords)
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._output: List[Tuple[int, ...]] = [()]
+        
+        for index, keyword in enumerate(self.keywords):
+            self._add_keyword(index, tokenize(keyword))
+        
+        self._build_failure_links()
+    
+    def _add_keyword(self, index: int, tokens: List[str]) -> None:
+        """Insert a keyword's tokens into the trie."""
+        if not tokens:
+            return
+        
+        state = 0
+        for token in tokens:
+            next_state = self._goto[state].get(token)
+            if next_state is None:
+                next_state = len(self._goto)
+                self._goto[state][token] = next_state
+                self._goto.append({})
+                self._fail.append(0)
+                self._output.append(())
+            state = next_state
+        
+        self._output[state] += (index,)
+    
+    def _build_failure_links(self) -> None:
+        """Compute failure links breadth-first and merge outputs along them."""
+        queue = deque(self._goto[0].values())
+        
+        while queue:
+            state = queue.popleft()
+            
+            for token, next_state in self._goto[state].items():
+                queue.append(next_state)
+                
+                fallback = self._fail[state]
+                while fallback and token not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                
+                self._fail[next_state] = self._goto[fallback].get(token, 0)
+                self._output[next_state] += self._output[self._fail[next_state]]
+    
+    def match(self, text: str) -> Set[int]:
+        """
+        Find the keywords that occur in text.
+        
+        Args:
+            text: Text to scan
+        
+        Returns:
+            Indices of matched keywords
+        """
+        goto = self._goto
+        fail = self._fail
+        output = self._output
+        
+        found: Set[int] = set()
+        state = 0
+        
+        for token in tokenize(text):
+            while state and token not in goto[state]:
+                state = fail[state]
+            
+            state = goto[state].get(token, 0)
+            if output[state]:
+                found.update(output[state])
+        
+        return found
+    
+    def __len__(self) -> int:
+        return len(self.keywords)
+
+
+@lru_cache(maxsize=128)
+def _compile(keywords: Tuple[str, ...]) -> KeywordMatcher:
+    return KeywordMatcher(keywords)
+
+
+def get_keyword_matcher(keywords: Sequence[str]) -> KeywordMatcher:
+    """
+    Get the compiled matcher for a keyword list, building it on first use.
+    
+    Args:
+        keywords: Topic keywords
+    
+    Returns:
+        Cached KeywordMatcher for these keywords
+    """
+    return _compile(tuple(keywords))
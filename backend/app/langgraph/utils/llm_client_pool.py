@@ -0,0 +1,225 @@
+"""
+Process-wide LLM client pool shared by all LangGraph nodes.
+
+LangChain chat model clients own HTTP connection pools. Building a new
+client per call (or per node) throws those pools away and pays a fresh
+TLS handshake every time, so nodes get their clients from this pool
+instead. Clients are created lazily on first use and reused for every
+request with the same (provider, model, temperature, max_tokens).
+"""
+import inspect
+import logging
+from typing import Dict, Any, List, Tuple
+
+from langchain_anthropic import ChatAnthropic
+from langchain_openai import ChatOpenAI
+from langchain_google_genai import ChatGoogleGenerativeAI
+
+from app.langgraph.utils.error_handlers import LLMProviderError
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+# Application model name -> (provider, provider model identifier)
+MODEL_SPECS: Dict[str, Tuple[str, str]] = {
+    "claude-3-5-sonnet": ("anthropic", "claude-3-5-sonnet-20241022"),
+    "claude-3-5-haiku": ("anthropic", "claude-3-5-haiku-20241022"),
+    "gpt-4-turbo": ("openai", "gpt-4-turbo-preview"),
+    "gemini-pro": ("google", "gemini-pro"),
+}
+
+# Provider display names used in error messages
+PROVIDER_NAMES: Dict[str, str] = {
+    "anthropic": "Anthropic",
+    "openai": "OpenAI",
+    "google": "Google",
+}
+
+# Attributes on LangChain chat models that hold SDK clients owning connections
+_CLOSEABLE_ATTRIBUTES = (
+    "_async_client",
+    "_client",
+    "root_async_client",
+    "root_client",
+    "async_client_running",
+    "client",
+)
+
+
+class LLMClientPool:
+    """
+    Registry of shared LLM clients keyed by (provider, model, temperature, max_tokens).
+    
+    Clients are constructed on first request and kept for the life of
+    the process; aclose() releases their connection pools on shutdown.
+    """
+    
+    def __init__(self):
+        """Initialize an empty client pool."""
+        self._clients: Dict[Tuple[str, str, float, int], Any] = {}
+        self._hits = 0
+        self._misses = 0
+    
+    def is_configured(self, model_name: str) -> bool:
+        """
+        Check whether a model is known and its provider API key is configured.
+        
+        Args:
+            model_name: Application model name (e.g. "claude-3-5-sonnet")
+        
+        Returns:
+            True if a client can be created for the model
+        """
+        spec = MODEL_SPECS.get(model_name)
+        if not spec:
+            return False
+        
+        return bool(self._get_api_key(spec[0]))
+    
+    def configured_models(self) -> List[str]:
+        """Get application model names whose provider API key is configured."""
+        return [model_name for model_name in MODEL_SPECS if self.is_configured(model_name)]
+    
+    def get_client(self, model_name: str, max_tokens: int, temperature: float):
+        """
+        Get the shared client for a model, creating it on first use.
+        
+        Args:
+            model_name: Application model name (e.g. "claude-3-5-sonnet")
+            max_tokens: Maximum output tokens
+            temperature: Sampling temperature
+        
+        Returns:
+            LangChain chat model client
+        
+        Raises:
+            LLMProviderError: When the model is unknown or its API key is missing
+        """
+        spec = MODEL_SPECS.get(model_name)
+        if not spec:
+            raise LLMProviderError(model_name, f"Unknown provider: {model_name}")
+        
+        provider, model = spec
+        key = (provider, model, float(temperature), int(max_tokens))
+        
+        client = self._clients.get(key)
+        if client is not None:
+            self._hits += 1
+            return client
+        
+        api_key = self._get_api_key(provider)
+        if not api_key:
+            raise LLMProviderError(model_name, f"{PROVIDER_NAMES[provider]} API key not configured")
+        
+        client = self._create_client(provider, model, api_key, max_tokens, temperature)
+        self._clients[key] = client
+        self._misses += 1
+        
+        logger.info(
+            f"Created shared LLM client for {provider}/{model}",
+            extra={"provider": provider, "model": model, "max_tokens": max_tokens, "temperature": temperature}
+        )
+        
+        return client
+    
+    def _get_api_key(self, provider: str) -> str:
+        """Get the configured API key for a provider."""
+        if provider == "anthropic":
+            return settings.ANTHROPIC_API_KEY
+        if provider == "openai":
+            return settings.OPENAI_API_KEY
+        if provider == "google":
+            return settings.GOOGLE_API_KEY
+        return ""
+    
+    def _create_client(
+        self,
+        provider: str,
+        model: str,
+        api_key: str,
+        max_tokens: int,
+        temperature: float
+    ):
+        """Construct a LangChain chat model client for a provider."""
+        if provider == "anthropic":
+            return ChatAnthropic(
+                model=model,
+                api_key=api_key,
+                max_tokens=max_tokens,
+                temperature=temperature
+            )
+        
+        if provider == "openai":
+            return ChatOpenAI(
+                model=model,
+                api_key=api_key,
+                max_tokens=max_tokens,
+                temperature=temperature
+            )
+        
+        return ChatGoogleGenerativeAI(
+            model=model,
+            google_api_key=api_key,
+            max_output_tokens=max_tokens,
+            temperature=temperature
+        )
+    
+    async def aclose(self) -> None:
+        """Close all pooled clients and their underlying connection pools."""
+        closed = set()
+        
+        for key, client in list(self._clients.items()):
+            # Only look at already-created SDK clients; avoid instantiating lazy ones
+            for attribute in _CLOSEABLE_ATTRIBUTES:
+                resource = vars(client).get(attribute)
+                if resource is None or id(resource) in closed:
+                    continue
+                
+                closed.add(id(resource))
+                try:
+                    await self._close_resource(resource)
+                except Exception as e:
+                    logger.warning(f"Failed to close LLM client resource {attribute} for {key[0]}/{key[1]}: {e}")
+        
+        self._clients.clear()
+    
+    async def _close_resource(self, resource: Any) -> None:
+        """Close an SDK client, awaiting async close methods."""
+        for method_name in ("aclose", "close"):
+            method = getattr(resource, method_name, None)
+            if callable(method):
+                result = method()
+                if inspect.isawaitable(result):
+                    await result
+                return
+        
+        # gRPC-based clients expose close() on their transport
+        transport = getattr(resource, "transport", None)
+        if transport is not None and callable(getattr(transport, "close", None)):
+            result = transport.close()
+            if inspect.isawaitable(result):
+                await result
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """Get pool statistics."""
+        return {
+            "clients": len(self._clients),
+            "hits": self._hits,
+            "misses": self._misses,
+            "keys": [f"{provider}/{model}@{temperature}/{max_tokens}" for provider, model, temperature, max_tokens in self._clients]
+        }
+
+
+# Global instance
+_llm_client_pool = None
+
+
+def get_llm_client_pool() -> LLMClientPool:
+    """Get singleton instance of the LLM client pool."""
+    global _llm_client_pool
+    
+    if _llm_client_pool is None:
+        _llm_client_pool = LLMClientPool()
+    
+    return _llm_client_pool
@@ -1,13 +1,43 @@
 """
 Structured logging configuration for LangGraph nodes
+
+Records are handed to a QueueHandler on the calling thread and
+formatted and written by a QueueListener thread, so JSON encoding and
+stdout writes stay off the event loop. The listener writes records as
+they arrive and flushes the stream whenever the queue drains, batching
+writes under load. orjson is used for encoding when installed.
+
+StructuredLogger skips building records for disabled levels, accepts
+extra_data as a callable evaluated only when the record is emitted, and
+samples high-volume INFO events (LOG_SAMPLE_RATES); warnings and errors
+are never sampled.
 """
+import atexit
 import logging
+import logging.handlers
 import json
+import queue
+import random
 import sys
 from datetime import datetime
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Callable, Optional, Union
 from app.core.config import settings
 
+try:
+    import orjson
+except ImportError:  # optional: faster JSON encoding
+    orjson = None
+
+# extra_data may be passed as a callable so it is only built when logged
+ExtraData = Optional[Union[Dict[str, Any], Callable[[], Dict[str, Any]]]]
+
+
+def _dumps(data: Dict[str, Any]) -> str:
+    """Encode a log record as JSON, with orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(data, default=str).decode()
+    return json.dumps(data, default=str)
+
 
 class StructuredFormatter(logging.Formatter):
     """Custom formatter for structured JSON logging"""
@@ -15,7 +45,8 @@ class StructuredFormatter(logging.Formatter):
     def format(self, record: logging.LogRecord) -> str:
         """Format log record as structured JSON"""
         log_data = {
-            "timestamp": datetime.utcnow().isoformat(),
+            # Time the record was created, not when the listener formats it
+            "timestamp": datetime.utcfromtimestamp(record.created).isoformat(),
             "level": record.levelname,
             "logger": record.name,
             "message": record.getMessage(),
@@ -37,8 +68,56 @@ class StructuredFormatter(logging.Formatter):
             log_data["duration"] = record.duration
         if hasattr(record, 'error_type'):
             log_data["error_type"] = record.error_type
+        if hasattr(record, 'sample_rate'):
+            log_data["sample_rate"] = record.sample_rate
             
-        return json.dumps(log_data)
+        return _dumps(log_data)
+
+
+class LoopSafeQueueHandler(logging.handlers.QueueHandler):
+    """QueueHandler that leaves formatting to the listener thread."""
+    
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        """
+        Resolve the message arguments only.
+        
+        The queue never leaves the process, so exc_info can travel with
+        the record and the full formatting happens on the listener thread.
+        """
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+
+
+class DeferredFlushStreamHandler(logging.StreamHandler):
+    """StreamHandler that leaves flushing to the queue listener."""
+    
+    def emit(self, record: logging.LogRecord) -> None:
+        try:
+            self.stream.write(self.format(record) + self.terminator)
+        except Exception:
+            self.handleError(record)
+
+
+class BatchingQueueListener(logging.handlers.QueueListener):
+    """QueueListener that flushes its handlers each time the queue drains."""
+    
+    def dequeue(self, block: bool) -> logging.LogRecord:
+        if block and self.queue.empty():
+            self.flush()
+        return super().dequeue(block)
+    
+    def flush(self) -> None:
+        for handler in self.handlers:
+            handler.flush()
+    
+    def stop(self) -> None:
+        super().stop()
+        self.flush()
+
+
+# Active listener, stopped by stop_logging()
+_queue_listener: Optional[BatchingQueueListener] = None
 
 
 class StructuredLogger:
@@ -58,13 +137,44 @@ class StructuredLogger:
         """
         self.node_name = node_name
         self.logger = logging.getLogger(f"langgraph.{node_name}")
+    
+    def _should_log(self, level: int, sample_key: str) -> Optional[float]:
+        """
+        Decide whether to emit a record.
         
+        Args:
+            level: Record level
+            sample_key: Step or event name looked up in LOG_SAMPLE_RATES
+            
+        Returns:
+            None to skip the record, otherwise the sample rate it was kept at
+        """
+        if not self.logger.isEnabledFor(level):
+            return None
+        
+        # Warnings and errors are never sampled
+        if level >= logging.WARNING:
+            return 1.0
+        
+        rate = settings.LOG_SAMPLE_RATES.get(sample_key, 1.0)
+        if rate < 1.0 and random.random() >= rate:
+            return None
+        
+        return rate
+    
+    @staticmethod
+    def _resolve_extra(extra_data: ExtraData) -> Dict[str, Any]:
+        """Build extra_data, calling it if it was passed lazily."""
+        if callable(extra_data):
+            extra_data = extra_data()
+        return extra_data or {}
+    
     def log_node_entry(
         self, 
         session_id: str, 
         workflow_id: str, 
         step: str,
-        extra_data: Optional[Dict[str, Any]] = None
+        extra_data: ExtraData = None
     ) -> None:
         """
         Log node entry with context.
@@ -73,8 +183,11 @@ class StructuredLogger:
             session_id: User session identifier
             workflow_id: Workflow execution identifier
             step: Current processing step
-            extra_data: Additional data to log
+            extra_data: Additional data to log, or a callable returning it
         """
+        if self._should_log(logging.INFO, "node_entry") is None:
+            return
+        
         self.logger.info(
             f"Entering node: {self.node_name}",
             extra={
@@ -83,7 +196,7 @@ class StructuredLogger:
                 "node_name": self.node_name,
                 "step": step,
                 "event": "node_entry",
-                **(extra_data or {})
+                **self._resolve_extra(extra_data)
             }
         )
     
@@ -94,7 +207,7 @@ class StructuredLogger:
         step: str,
         success: bool,
         duration: Optional[float] = None,
-        extra_data: Optional[Dict[str, Any]] = None
+        extra_data: ExtraData = None
     ) -> None:
         """
         Log node exit with results.
@@ -105,9 +218,12 @@ class StructuredLogger:
             step: Processing step that completed
             success: Whether the node completed successfully
             duration: Processing duration in seconds
-            extra_data: Additional data to log
+            extra_data: Additional data to log, or a callable returning it
         """
         level = logging.INFO if success else logging.ERROR
+        if self._should_log(level, "node_exit") is None:
+            return
+        
         message = f"Exiting node: {self.node_name} - {'SUCCESS' if success else 'FAILURE'}"
         
         extra = {
@@ -117,7 +233,7 @@ class StructuredLogger:
             "step": step,
             "event": "node_exit",
             "success": success,
-            **(extra_data or {})
+            **self._resolve_extra(extra_data)
         }
         
         if duration is not None:
@@ -131,7 +247,7 @@ class StructuredLogger:
         workflow_id: str,
         step: str,
         message: str,
-        extra_data: Optional[Dict[str, Any]] = None
+        extra_data: ExtraData = None
     ) -> None:
         """
         Log a processing step within the node.
@@ -141,19 +257,25 @@ class StructuredLogger:
             workflow_id: Workflow execution identifier
             step: Current processing step
             message: Step description
-            extra_data: Additional data to log
+            extra_data: Additional data to log, or a callable returning it
         """
-        self.logger.info(
-            message,
-            extra={
-                "session_id": session_id,
-                "workflow_id": workflow_id,
-                "node_name": self.node_name,
-                "step": step,
-                "event": "processing_step",
-                **(extra_data or {})
-            }
-        )
+        sample_rate = self._should_log(logging.INFO, step)
+        if sample_rate is None:
+            return
+        
+        extra = {
+            "session_id": session_id,
+            "workflow_id": workflow_id,
+            "node_name": self.node_name,
+            "step": step,
+            "event": "processing_step",
+            **self._resolve_extra(extra_data)
+        }
+        
+        if sample_rate < 1.0:
+            extra["sample_rate"] = sample_rate
+        
+        self.logger.info(message, extra=extra)
     
     def log_error(
         self,
@@ -161,7 +283,7 @@ class StructuredLogger:
         workflow_id: str,
         step: str,
         error: Exception,
-        extra_data: Optional[Dict[str, Any]] = None
+        extra_data: ExtraData = None
     ) -> None:
         """
         Log an error with full context.
@@ -171,8 +293,11 @@ class StructuredLogger:
             workflow_id: Workflow execution identifier
             step: Step where error occurred
             error: Exception that occurred
-            extra_data: Additional data to log
+            extra_data: Additional data to log, or a callable returning it
         """
+        if not self.logger.isEnabledFor(logging.ERROR):
+            return
+        
         self.logger.error(
             f"Error in {self.node_name}: {str(error)}",
             extra={
@@ -183,7 +308,7 @@ class StructuredLogger:
                 "event": "error",
                 "error_type": type(error).__name__,
                 "error_message": str(error),
-                **(extra_data or {})
+                **self._resolve_extra(extra_data)
             },
             exc_info=True
         )
@@ -197,7 +322,7 @@ class StructuredLogger:
         url: str,
         status_code: Optional[int] = None,
         duration: Optional[float] = None,
-        extra_data: Optional[Dict[str, Any]] = None
+        extra_data: ExtraData = None
     ) -> None:
         """
         Log external API calls.
@@ -210,8 +335,13 @@ class StructuredLogger:
             url: API endpoint URL
             status_code: HTTP response status code
             duration: Request duration in seconds
-            extra_data: Additional data to log
+            extra_data: Additional data to log, or a callable returning it
         """
+        level = logging.INFO if not status_code or status_code < 400 else logging.WARNING
+        sample_rate = self._should_log(level, "api_call")
+        if sample_rate is None:
+            return
+        
         message = f"API call to {api_name}: {method} {url}"
         if status_code:
             message += f" -> {status_code}"
@@ -224,15 +354,16 @@ class StructuredLogger:
             "api_name": api_name,
             "method": method,
             "url": url,
-            **(extra_data or {})
+            **self._resolve_extra(extra_data)
         }
         
         if status_code is not None:
             extra["status_code"] = status_code
         if duration is not None:
             extra["duration"] = duration
+        if sample_rate < 1.0:
+            extra["sample_rate"] = sample_rate
             
-        level = logging.INFO if not status_code or status_code < 400 else logging.WARNING
         self.logger.log(level, message, extra=extra)
 
 
@@ -241,8 +372,14 @@ def setup_logging() -> None:
     Setup structured logging configuration for the application.
     
     Configures root logger with structured JSON formatter and
-    appropriate log levels based on settings.
+    appropriate log levels based on settings. With LOG_ASYNC the console
+    handler runs behind a queue on a listener thread.
     """
+    global _queue_listener
+    
+    # Replace the listener of an earlier setup
+    stop_logging()
+    
     # Get log level from settings
     log_level = getattr(logging, settings.LOG_LEVEL.upper(), logging.INFO)
     
@@ -262,11 +399,23 @@ def setup_logging() -> None:
     for handler in root_logger.handlers[:]:
         root_logger.removeHandler(handler)
     
-    # Add console handler
-    console_handler = logging.StreamHandler(sys.stdout)
+    # Add console handler, behind a queue when logging asynchronously
+    if settings.LOG_ASYNC:
+        console_handler = DeferredFlushStreamHandler(sys.stdout)
+    else:
+        console_handler = logging.StreamHandler(sys.stdout)
     console_handler.setLevel(log_level)
     console_handler.setFormatter(formatter)
-    root_logger.addHandler(console_handler)
+    
+    if settings.LOG_ASYNC:
+        log_queue: queue.SimpleQueue = queue.SimpleQueue()
+        root_logger.addHandler(LoopSafeQueueHandler(log_queue))
+        _queue_listener = BatchingQueueListener(log_queue, console_handler, respect_handler_level=True)
+        _queue_listener.start()
+        # The listener thread is a daemon; drain it on interpreter exit too
+        atexit.register(stop_logging)
+    else:
+        root_logger.addHandler(console_handler)
     
     # Configure specific loggers
     logging.getLogger("langgraph").setLevel(log_level)
@@ -277,5 +426,16 @@ def setup_logging() -> None:
     logger = logging.getLogger(__name__)
     logger.info("Structured logging configured successfully", extra={
         "log_level": settings.LOG_LEVEL,
-        "log_format": settings.LOG_FORMAT
+        "log_format": settings.LOG_FORMAT,
+        "log_async": settings.LOG_ASYNC,
+        "json_encoder": "orjson" if orjson is not None else "json"
     })
+
+
+def stop_logging() -> None:
+    """Stop the queue listener, writing out any queued records."""
+    global _queue_listener
+    
+    if _queue_listener is not None:
+        _queue_listener.stop()
+        _queue_listener = None
@@ -0,0 +1,125 @@
+"""
+news_cache writes, inline or through the write-behind queue.
+"""
+from datetime import datetime
+from typing import Dict, Any, List, Optional
+from sqlalchemy import func
+from sqlalchemy.dialects.postgresql import insert
+
+from app.core.config import settings
+from app.core.database import AsyncSessionLocal
+from app.langgraph.state.news_state import NewsArticle
+from app.langgraph.utils.write_behind import WriteBehindQueue
+from app.models.news_cache import NewsCache
+
+
+def build_news_cache_rows(articles: List[NewsArticle], topic: str, date: str) -> List[Dict[str, Any]]:
+    """
+    Build news_cache rows for articles, one per content hash.
+    
+    Articles without a content hash are skipped since they cannot be deduplicated.
+    created_at is the fetch time, so rows queued for write-behind keep it.
+    
+    Args:
+        articles: Processed articles to cache
+        topic: Topic for the articles
+        date: Date for the articles
+    
+    Returns:
+        Row dictionaries for insert_news_cache_rows
+    """
+    created_at = datetime.utcnow()
+    rows = {}
+    for article in articles:
+        content_hash = article.get("content_hash", "")
+        if content_hash and content_hash not in rows:
+            rows[content_hash] = {
+                "topic": topic,
+                "date_fetched": date,
+                "source": article.get("source", ""),
+                "title": article.get("title", ""),
+                "url": article.get("url", ""),
+                "summary": article.get("summary", ""),
+                "published_at": article.get("published_at"),
+                "relevance_score": article.get("relevance_score"),
+                "content_hash": content_hash,
+                "created_at": created_at
+            }
+    return list(rows.values())
+
+
+async def insert_news_cache_rows(rows: List[Dict[str, Any]]) -> int:
+    """
+    Upsert rows into news_cache in one statement.
+    
+    Rows are unique per (lower(topic), date_fetched, content_hash). A row
+    that is already cached for the topic and date is refreshed, including
+    created_at, so a refetch after NEWS_CACHE_TTL makes it fresh again.
+    
+    Args:
+        rows: Rows from build_news_cache_rows, possibly from several workflows
+    
+    Returns:
+        Number of rows inserted or refreshed
+    """
+    # Batches can span workflows; keep the newest row per key, since one
+    # statement cannot update the same row twice
+    unique_rows = {}
+    for row in rows:
+        unique_rows[(row["topic"].lower(), row["date_fetched"], row["content_hash"])] = row
+    
+    if not unique_rows:
+        return 0
+    
+    statement = insert(NewsCache).values(list(unique_rows.values()))
+    statement = statement.on_conflict_do_update(
+        index_elements=[func.lower(NewsCache.topic), NewsCache.date_fetched, NewsCache.content_hash],
+        set_={
+            column: statement.excluded[column]
+            for column in ("source", "title", "url", "summary", "published_at", "relevance_score", "created_at")
+        }
+    )
+    
+    async with AsyncSessionLocal() as db_session:
+        result = await db_session.execute(statement)
+        await db_session.commit()
+    
+    return max(result.rowcount, 0)
+
+
+# Global instance
+_news_cache_queue = None
+
+
+def get_news_cache_queue() -> Optional[WriteBehindQueue]:
+    """
+    Get the write-behind queue for news_cache rows.
+    
+    Returns:
+        WriteBehindQueue instance, or None when NEWS_CACHE_WRITE_BEHIND is disabled
+    """
+    global _news_cache_queue
+    
+    if not settings.NEWS_CACHE_WRITE_BEHIND:
+        return None
+    
+    if _news_cache_queue is None:
+        _news_cache_queue = WriteBehindQueue(
+            name="news_cache",
+            handler=insert_news_cache_rows,
+            max_size=settings.WRITE_BEHIND_MAX_SIZE,
+            batch_size=settings.WRITE_BEHIND_BATCH_SIZE,
+            flush_interval=settings.WRITE_BEHIND_FLUSH_INTERVAL,
+            max_retries=settings.WRITE_BEHIND_MAX_RETRIES
+        )
+    
+    return _news_cache_queue
+
+
+async def close_news_cache_queue() -> None:
+    """Drain and stop the news_cache queue if it was created."""
+    global _news_cache_queue
+    
+    if _news_cache_queue is not None:
+        await _news_cache_queue.stop(timeout=settings.WRITE_BEHIND_SHUTDOWN_TIMEOUT)
+        _news_cache_queue = None
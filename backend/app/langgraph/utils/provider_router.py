@@ -0,0 +1,445 @@
+"""
+Health-aware LLM provider routing shared by all LLM nodes.
+
+Every LLM call reports its outcome and latency to the router, which
+keeps a rolling window of recent calls per model. A model's circuit
+opens when its recent calls fail too often (or too many fail in a row)
+and stays open for LLM_ROUTER_OPEN_SECONDS; open models are skipped
+instead of being retried. After the cool-down the circuit is half-open:
+a single trial call is let through while every other caller keeps
+treating the model as open, and the trial's outcome closes or re-opens
+the circuit. A trial that never reports back (the caller gave up before
+calling) is given up after another cool-down.
+
+route() orders the models that can serve a request: models of the
+requested model's class first, ranked by recent latency penalized by
+error rate, then other models as a last resort. The requested model
+keeps first place unless it is clearly slower or less reliable than
+the best alternative.
+"""
+import asyncio
+import logging
+import time
+from collections import deque
+from typing import Any, Awaitable, Callable, Deque, Dict, List, Optional, Tuple
+
+from app.langgraph.utils.error_handlers import LLMProviderError
+from app.langgraph.utils.hedging import HedgeBudget, hedged_invoke
+from app.langgraph.utils.rate_limiter import get_rate_limiter
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+# Application model name -> model class; models in a class can stand in for each other
+MODEL_CLASSES: Dict[str, str] = {
+    "claude-3-5-sonnet": "large",
+    "gpt-4-turbo": "large",
+    "gemini-pro": "large",
+    "claude-3-5-haiku": "small",
+}
+
+# Upper bound on samples kept per model, whatever the window length
+MAX_WINDOW_SAMPLES = 200
+
+# How much a 100% error rate inflates a model's latency score
+ERROR_RATE_PENALTY = 4.0
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class ProviderHealth:
+    """Rolling call window and circuit state for one model."""
+    
+    def __init__(self):
+        self.samples: Deque[Tuple[float, float, bool]] = deque(maxlen=MAX_WINDOW_SAMPLES)
+        self.state = CLOSED
+        self.opened_at: Optional[float] = None
+        self.trial_in_flight = False
+        self.trial_started_at: Optional[float] = None
+        self.consecutive_failures = 0
+        self.opens = 0
+    
+    def prune(self, now: float) -> None:
+        """Drop samples older than the rolling window."""
+        cutoff = now - settings.LLM_ROUTER_WINDOW_SECONDS
+        while self.samples and self.samples[0][0] < cutoff:
+            self.samples.popleft()
+    
+    def error_rate(self) -> float:
+        """Share of failed calls in the window."""
+        if not self.samples:
+            return 0.0
+        return sum(1 for _, _, ok in self.samples if not ok) / len(self.samples)
+    
+    def end_trial(self) -> None:
+        """Clear the half-open trial call marker."""
+        self.trial_in_flight = False
+        self.trial_started_at = None
+    
+    def mean_latency(self) -> Optional[float]:
+        """Mean latency of successful calls in the window, if any."""
+        latencies = [latency for _, latency, ok in self.samples if ok]
+        if not latencies:
+            return None
+        return sum(latencies) / len(latencies)
+
+
+class ProviderRouter:
+    """Per-model circuit breakers and latency-aware routing."""
+    
+    def __init__(self):
+        """Initialize the router with no call history."""
+        self._health: Dict[str, ProviderHealth] = {}
+    
+    def _get_health(self, model: str) -> ProviderHealth:
+        health = self._health.get(model)
+        if health is None:
+            health = self._health[model] = ProviderHealth()
+        return health
+    
+    def is_open(self, model: str, claim_trial: bool = True) -> bool:
+        """
+        Check whether a model's circuit is open (model should be skipped).
+        
+        An open circuit whose cool-down has passed moves to half-open.
+        While half-open, exactly one caller is let through as the trial
+        call; everyone else sees the circuit as open until the trial's
+        outcome is recorded. A caller that gets False here with
+        claim_trial set must make the call, or give the trial back with
+        release_trial().
+        
+        Args:
+            model: Application model name
+            claim_trial: Take the half-open trial call if it is free.
+                False only checks, for callers that will not call the model.
+        
+        Returns:
+            True while the circuit is open or another caller holds the trial
+        """
+        health = self._health.get(model)
+        if health is None or health.state == CLOSED:
+            return False
+        
+        now = time.monotonic()
+        
+        if health.state == OPEN:
+            if now - health.opened_at < settings.LLM_ROUTER_OPEN_SECONDS:
+                return True
+            health.state = HALF_OPEN
+            health.end_trial()
+            logger.info(f"LLM circuit for {model} half-open, allowing a trial call")
+        
+        if health.trial_in_flight:
+            if now - health.trial_started_at < settings.LLM_ROUTER_OPEN_SECONDS:
+                return True
+            # The trial's caller never reported back; let another caller try
+            logger.warning(f"LLM circuit trial call for {model} did not report back, allowing another")
+            health.end_trial()
+        
+        if claim_trial:
+            health.trial_in_flight = True
+            health.trial_started_at = now
+        
+        return False
+    
+    def release_trial(self, model: str) -> None:
+        """
+        Give back a half-open trial call that was claimed but not made.
+        
+        Args:
+            model: Application model name
+        """
+        health = self._health.get(model)
+        if health is not None and health.state == HALF_OPEN:
+            health.end_trial()
+    
+    def record_success(self, model: str, latency: float) -> None:
+        """
+        Record a successful call.
+        
+        Args:
+            model: Application model name
+            latency: Call duration in seconds
+        """
+        now = time.monotonic()
+        health = self._get_health(model)
+        health.prune(now)
+        health.samples.append((now, latency, True))
+        health.consecutive_failures = 0
+        health.end_trial()
+        
+        if health.state != CLOSED:
+            logger.info(f"LLM circuit for {model} closed after a successful call")
+            health.state = CLOSED
+            health.opened_at = None
+    
+    def record_failure(self, model: str, latency: float = 0.0) -> None:
+        """
+        Record a failed call, opening the circuit on sustained failure.
+        
+        Args:
+            model: Application model name
+            latency: Call duration in seconds
+        """
+        now = time.monotonic()
+        health = self._get_health(model)
+        health.prune(now)
+        health.samples.append((now, latency, False))
+        health.consecutive_failures += 1
+        health.end_trial()
+        
+        if health.state == OPEN:
+            return
+        
+        # A failed trial call re-opens the circuit straight away
+        trips = (
+            health.state == HALF_OPEN
+            or health.consecutive_failures >= settings.LLM_ROUTER_CONSECUTIVE_FAILURES
+            or (
+                len(health.samples) >= settings.LLM_ROUTER_MIN_REQUESTS
+                and health.error_rate() >= settings.LLM_ROUTER_ERROR_THRESHOLD
+            )
+        )
+        
+        if trips:
+            health.state = OPEN
+            health.opened_at = now
+            health.opens += 1
+            logger.warning(
+                f"LLM circuit for {model} opened for {settings.LLM_ROUTER_OPEN_SECONDS}s",
+                extra={
+                    "model": model,
+                    "error_rate": round(health.error_rate(), 3),
+                    "consecutive_failures": health.consecutive_failures
+                }
+            )
+    
+    def latency_quantile(self, model: str, quantile: float, min_samples: int = 1) -> Optional[float]:
+        """
+        Latency quantile of a model's recent successful calls.
+        
+        Args:
+            model: Application model name
+            quantile: Quantile between 0 and 1 (0.95 for p95)
+            min_samples: Successful calls required in the window for an estimate
+        
+        Returns:
+            Latency in seconds, or None without enough history
+        """
+        health = self._health.get(model)
+        if health is None:
+            return None
+        
+        health.prune(time.monotonic())
+        latencies = sorted(latency for _, latency, ok in health.samples if ok)
+        if not latencies or len(latencies) < min_samples:
+            return None
+        
+        return latencies[min(len(latencies) - 1, int(quantile * len(latencies)))]
+    
+    def _score(self, model: str, default_latency: float) -> float:
+        """Latency estimate penalized by error rate; lower is better."""
+        health = self._health.get(model)
+        if health is None:
+            return default_latency
+        
+        health.prune(time.monotonic())
+        latency = health.mean_latency()
+        if latency is None:
+            latency = default_latency
+        
+        return latency * (1 + ERROR_RATE_PENALTY * health.error_rate())
+    
+    def route(self, model: str, candidates: Optional[List[str]] = None) -> List[str]:
+        """
+        Order the models to try for a request.
+        
+        Args:
+            model: Requested application model name
+            candidates: Models that may serve the request. Defaults to all known models.
+        
+        Returns:
+            Models with a closed or half-open circuit, best first; empty if all are open
+        """
+        candidates = list(dict.fromkeys(candidates if candidates is not None else [model, *MODEL_CLASSES]))
+        # Half-open models stay routable; callers claim the trial right before calling
+        available = [candidate for candidate in candidates if not self.is_open(candidate, claim_trial=False)]
+        
+        # Models without recent successes rank as average, keeping their configured order
+        known = [
+            health.mean_latency() for name, health in self._health.items()
+            if name in available and health.mean_latency() is not None
+        ]
+        default_latency = sum(known) / len(known) if known else 1.0
+        scores = {candidate: self._score(candidate, default_latency) for candidate in available}
+        
+        model_class = MODEL_CLASSES.get(model)
+        same_class = sorted(
+            (candidate for candidate in available if MODEL_CLASSES.get(candidate) == model_class),
+            key=scores.get
+        )
+        other_class = sorted(
+            (candidate for candidate in available if MODEL_CLASSES.get(candidate) != model_class),
+            key=scores.get
+        )
+        
+        # Keep the requested model first unless it is clearly worse than the best alternative
+        if model in same_class and same_class[0] != model:
+            if scores[model] <= scores[same_class[0]] * settings.LLM_ROUTER_PREFERENCE_SLACK:
+                same_class.remove(model)
+                same_class.insert(0, model)
+        
+        return same_class + other_class
+    
+    async def call_model(
+        self,
+        model: str,
+        call: Callable[[str], Awaitable[Any]],
+        tokens: int = 0,
+        started: Optional[asyncio.Event] = None
+    ) -> Any:
+        """
+        Make one LLM call under the model's rate limiter and record its outcome.
+        
+        Time spent waiting for the rate limiter is not counted as latency,
+        and a call rejected by the limiter is not counted as a failure. A
+        half-open trial held by a rejected or cancelled call is released.
+        
+        Args:
+            model: Application model name
+            call: Coroutine function making the call for a given model name
+            tokens: Estimated tokens the call will use
+            started: Set once the rate limiter lets the call through
+        
+        Returns:
+            The call result
+        
+        Raises:
+            RateLimitExceededError: When the rate limiter queue wait is too long
+            Exception: The call's own error
+        """
+        limiter = get_rate_limiter(model)
+        try:
+            await limiter.acquire(tokens)
+        except BaseException:
+            self.release_trial(model)
+            raise
+        
+        if started is not None:
+            started.set()
+        
+        start_time = time.perf_counter()
+        try:
+            result = await call(model)
+        except asyncio.CancelledError:
+            self.release_trial(model)
+            raise
+        except Exception as e:
+            self.record_failure(model, time.perf_counter() - start_time)
+            await limiter.record_error(e)
+            raise
+        
+        self.record_success(model, time.perf_counter() - start_time)
+        await limiter.record_usage(tokens, result)
+        return result
+    
+    async def invoke_with_routing(
+        self,
+        model: str,
+        call: Callable[[str], Awaitable[Any]],
+        candidates: Optional[List[str]] = None,
+        hedge_budget: Optional[HedgeBudget] = None,
+        tokens: int = 0
+    ) -> Tuple[Any, str]:
+        """
+        Run an LLM call on the best available model, failing over in route order.
+        
+        Args:
+            model: Requested application model name
+            call: Coroutine function making the call for a given model name
+            candidates: Models that may serve the request. Defaults to all known models.
+            hedge_budget: Budget for hedging each attempt on the next routed model
+                (see hedging.hedged_invoke); None disables hedging
+            tokens: Estimated tokens the call will use, for rate limiting
+        
+        Returns:
+            (call result, model name that served it)
+        
+        Raises:
+            LLMProviderError: When every routed model fails or all circuits are open
+        """
+        routed = self.route(model, candidates)
+        if not routed:
+            raise LLMProviderError("all_providers", "No LLM provider available: all circuits are open")
+        
+        last_error: Optional[Exception] = None
+        
+        for index, routed_model in enumerate(routed):
+            if self.is_open(routed_model):
+                # Tripped by a concurrent request, or another caller holds its trial call
+                last_error = last_error or LLMProviderError(routed_model, "Circuit open")
+                continue
+            
+            if hedge_budget is not None:
+                backup_model = routed[index + 1] if index + 1 < len(routed) else None
+                try:
+                    return await hedged_invoke(self, routed_model, call, backup_model, hedge_budget, tokens)
+                except Exception as e:
+                    last_error = e
+                    logger.warning(f"LLM call to {routed_model} failed, trying next provider: {e}")
+                    continue
+            
+            try:
+                return await self.call_model(routed_model, call, tokens), routed_model
+            except Exception as e:
+                last_error = e
+                logger.warning(f"LLM call to {routed_model} failed, trying next provider: {e}")
+                continue
+        
+        raise LLMProviderError("all_providers", f"All LLM providers failed. Last error: {str(last_error)}")
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """Get per-model health statistics."""
+        now = time.monotonic()
+        stats = {}
+        
+        for model, health in self._health.items():
+            health.prune(now)
+            latency = health.mean_latency()
+            stats[model] = {
+                "state": OPEN if self.is_open(model, claim_trial=False) else health.state,
+                "calls": len(health.samples),
+                "error_rate": round(health.error_rate(), 3),
+                "mean_latency": round(latency, 3) if latency is not None else None,
+                "consecutive_failures": health.consecutive_failures,
+                "opens": health.opens
+            }
+        
+        return stats
+
+
+# Global instance
+_provider_router = None
+
+
+def get_provider_router() -> ProviderRouter:
+    """Get singleton instance of the provider router."""
+    global _provider_router
+    
+    if _provider_router is None:
+        _provider_router = ProviderRouter()
+    
+    return _provider_router
+
+
+async def invoke_with_routing(
+    model: str,
+    call: Callable[[str], Awaitable[Any]],
+    candidates: Optional[List[str]] = None,
+    hedge_budget: Optional[HedgeBudget] = None,
+    tokens: int = 0
+) -> Tuple[Any, str]:
+    """Run an LLM call through the shared provider router (see ProviderRouter.invoke_with_routing)."""
+    return await get_provider_router().invoke_with_routing(model, call, candidates, hedge_budget, tokens)
@@ -0,0 +1,386 @@
+"""
+In-memory quota backend with write-behind persistence.
+
+The default quota path (QUOTA_BACKEND="database") checks duplicates,
+counts usage and records each request directly in Postgres. With
+QUOTA_BACKEND="memory", CheckQuotaNode uses this backend instead:
+
+- Per-session daily/monthly counters and recent request hashes are
+  kept in process and roll over at UTC day/month boundaries
+- Counters are warmed from the database on a session's first request
+- user_requests rows are written asynchronously in batches through a
+  bounded write-behind queue (inline while its worker is not running,
+  and the request is not charged if it cannot be recorded or queued);
+  rows that can never be written (e.g. for a session deleted while they
+  were queued) are isolated and dropped so they cannot block the queue
+
+Counters are per process, so the memory backend assumes a single API
+worker (or sticky sessions); use the database backend otherwise.
+"""
+import asyncio
+import logging
+import uuid
+from datetime import datetime, timedelta
+from typing import Dict, Any, List, Optional, Set, Tuple
+from sqlalchemy import select, insert, update
+
+from app.langgraph.utils.error_handlers import QuotaExceededError, DuplicateRequestError, DatabaseError
+from app.core.config import settings
+from app.core.database import AsyncSessionLocal
+from app.core.quota import get_quota_windows, get_quota_usage
+from app.langgraph.utils.write_behind import WriteBehindQueue
+from app.models.user_request import UserRequest
+from app.models.session import Session
+
+logger = logging.getLogger(__name__)
+
+# Window for duplicate request detection, matching the database path
+DUPLICATE_WINDOW = timedelta(hours=1)
+
+
+class SessionQuotaCounters:
+    """Quota counters and recent request hashes for one session."""
+    
+    def __init__(self, day_start: datetime, month_start: datetime, daily_used: int, monthly_used: int):
+        self.day_start = day_start
+        self.month_start = month_start
+        self.daily_used = daily_used
+        self.monthly_used = monthly_used
+        self.recent_hashes: Dict[str, datetime] = {}
+        self.last_access = datetime.utcnow()
+    
+    def roll_windows(self, day_start: datetime, month_start: datetime) -> None:
+        """Reset counters that belong to a previous UTC day or month."""
+        if month_start != self.month_start:
+            self.month_start = month_start
+            self.monthly_used = 0
+        
+        if day_start != self.day_start:
+            self.day_start = day_start
+            self.daily_used = 0
+    
+    def prune_hashes(self, now: datetime) -> None:
+        """Forget request hashes older than the duplicate window."""
+        cutoff = now - DUPLICATE_WINDOW
+        self.recent_hashes = {
+            request_hash: created_at
+            for request_hash, created_at in self.recent_hashes.items()
+            if created_at >= cutoff
+        }
+
+
+class InMemoryQuotaBackend:
+    """
+    Process-local quota counters backed by batched writes to user_requests.
+    
+    reserve() performs the duplicate check, limit check and request
+    recording atomically per session without touching the database,
+    except for the one-time warm-up on a session's first request.
+    """
+    
+    def __init__(self):
+        """Initialize the backend with empty counters and no pending writes."""
+        self._sessions: Dict[str, SessionQuotaCounters] = {}
+        self._warm_locks: Dict[str, asyncio.Lock] = {}
+        # Unwritten requests per session; counters are not evicted while any remain
+        self._pending_sessions: Dict[str, int] = {}
+        self._dropped_requests = 0
+        # Bad rows are dropped by _write_requests; whole batches are only
+        # retried while the database is unreachable, up to QUOTA_WRITE_MAX_RETRIES
+        self._queue = WriteBehindQueue(
+            name="quota_requests",
+            handler=self._write_requests,
+            max_size=settings.WRITE_BEHIND_MAX_SIZE,
+            batch_size=settings.QUOTA_FLUSH_BATCH_SIZE,
+            flush_interval=settings.QUOTA_FLUSH_INTERVAL,
+            max_retries=settings.QUOTA_WRITE_MAX_RETRIES,
+            on_drop=self._release_pending
+        )
+    
+    async def reserve(
+        self,
+        session_id: str,
+        topic: str,
+        date: str,
+        request_hash: str
+    ) -> Tuple[int, int]:
+        """
+        Check quota and duplicates for a request and record it.
+        
+        Args:
+            session_id: Session identifier
+            topic: News topic
+            date: Request date
+            request_hash: Request hash for duplicate detection
+        
+        Returns:
+            (daily_used, monthly_used) including this request
+        
+        Raises:
+            DuplicateRequestError: When the same request was made within the last hour
+            QuotaExceededError: When daily or monthly limits are reached
+            DatabaseError: When warming counters from the database fails, or
+                when the request cannot be recorded while the write-behind
+                worker is not running
+        """
+        counters = await self._get_counters(session_id)
+        
+        # Everything below is synchronous, so it is atomic on the event loop
+        now = datetime.utcnow()
+        day_start, _, month_start, _ = get_quota_windows(now)
+        counters.roll_windows(day_start, month_start)
+        counters.prune_hashes(now)
+        counters.last_access = now
+        
+        previous = counters.recent_hashes.get(request_hash)
+        if previous is not None:
+            raise DuplicateRequestError(request_hash, previous.isoformat())
+        
+        if counters.daily_used >= settings.DAILY_QUOTA_LIMIT:
+            raise QuotaExceededError("daily", counters.daily_used, settings.DAILY_QUOTA_LIMIT)
+        
+        if counters.monthly_used >= settings.MONTHLY_QUOTA_LIMIT:
+            raise QuotaExceededError("monthly", counters.monthly_used, settings.MONTHLY_QUOTA_LIMIT)
+        
+        counters.daily_used += 1
+        counters.monthly_used += 1
+        counters.recent_hashes[request_hash] = now
+        
+        daily_used, monthly_used = counters.daily_used, counters.monthly_used
+        self._pending_sessions[session_id] = self._pending_sessions.get(session_id, 0) + 1
+        row = {
+            "session_id": session_id,
+            "request_type": "news_fetch",
+            "topic": topic,
+            "date_requested": date,
+            "request_hash": request_hash,
+            "created_at": now
+        }
+        
+        try:
+            if self._queue.running:
+                # Waits only when the queue is full (backpressure from a slow database)
+                await self._queue.put(row)
+            else:
+                # No worker (not started yet, or stopped at shutdown): write inline
+                await self._write_requests([row])
+        except BaseException as e:
+            # The request was never recorded, so it must not count against the quota
+            self._release_reservation(counters, row, day_start, month_start)
+            if isinstance(e, Exception):
+                raise DatabaseError("quota_record", str(e))
+            raise
+        
+        return daily_used, monthly_used
+    
+    def _release_reservation(
+        self,
+        counters: SessionQuotaCounters,
+        row: Dict[str, Any],
+        day_start: datetime,
+        month_start: datetime
+    ) -> None:
+        """Undo reserve()'s counter increment for a request that was not recorded."""
+        if counters.day_start == day_start:
+            counters.daily_used = max(0, counters.daily_used - 1)
+        if counters.month_start == month_start:
+            counters.monthly_used = max(0, counters.monthly_used - 1)
+        if counters.recent_hashes.get(row["request_hash"]) == row["created_at"]:
+            del counters.recent_hashes[row["request_hash"]]
+        self._release_pending([row])
+    
+    async def _get_counters(self, session_id: str) -> SessionQuotaCounters:
+        """Get counters for a session, warming them from the database on first access."""
+        counters = self._sessions.get(session_id)
+        if counters is not None:
+            return counters
+        
+        lock = self._warm_locks.setdefault(session_id, asyncio.Lock())
+        async with lock:
+            counters = self._sessions.get(session_id)
+            if counters is None:
+                counters = await self._warm_counters(session_id)
+                self._sessions[session_id] = counters
+        
+        self._warm_locks.pop(session_id, None)
+        return counters
+    
+    async def _warm_counters(self, session_id: str) -> SessionQuotaCounters:
+        """Load a session's current usage and recent hashes from the database."""
+        now = datetime.utcnow()
+        day_start, _, month_start, _ = get_quota_windows(now)
+        
+        try:
+            async with AsyncSessionLocal() as db_session:
+                # Ensure session exists before any write-behind inserts reference it
+                result = await db_session.execute(
+                    select(Session).where(Session.id == session_id)
+                )
+                existing_session = result.scalar_one_or_none()
+                
+                if not existing_session:
+                    db_session.add(Session(id=session_id, preferences={}))
+                else:
+                    existing_session.last_active = now
+                
+                daily_used, monthly_used = await get_quota_usage(db_session, session_id)
+                
+                hash_result = await db_session.execute(
+                    select(UserRequest.request_hash, UserRequest.created_at).where(
+                        UserRequest.session_id == session_id,
+                        UserRequest.created_at >= now - DUPLICATE_WINDOW
+                    )
+                )
+                recent_hashes = {row.request_hash: row.created_at for row in hash_result}
+                
+                await db_session.commit()
+        
+        except Exception as e:
+            raise DatabaseError("quota_warm_up", str(e))
+        
+        counters = SessionQuotaCounters(day_start, month_start, daily_used, monthly_used)
+        counters.recent_hashes = recent_hashes
+        return counters
+    
+    async def start(self) -> None:
+        """Start the write-behind worker."""
+        await self._queue.start()
+    
+    async def stop(self) -> None:
+        """Write out pending requests and stop the write-behind worker."""
+        await self._queue.stop(timeout=settings.WRITE_BEHIND_SHUTDOWN_TIMEOUT)
+    
+    async def _write_requests(self, batch: List[Dict[str, Any]]) -> None:
+        """
+        Write a batch of requests to user_requests.
+        
+        When the batch insert fails, rows for sessions that no longer
+        exist are dropped and the rest are written one by one, dropping
+        any row that still fails. Raises only when the database cannot
+        be reached; the write-behind queue then retries the batch.
+        
+        Args:
+            batch: Request rows queued by reserve()
+        """
+        try:
+            await self._insert_requests(batch)
+        except Exception as e:
+            await self._write_rows_individually(batch, e)
+        
+        self._release_pending(batch)
+        self._evict_idle_sessions()
+    
+    async def _insert_requests(self, rows: List[Dict[str, Any]]) -> None:
+        """Insert request rows and touch their sessions in one transaction."""
+        async with AsyncSessionLocal() as db_session:
+            await db_session.execute(insert(UserRequest), rows)
+            await db_session.execute(
+                update(Session)
+                .where(Session.id.in_({row["session_id"] for row in rows}))
+                .values(last_active=datetime.utcnow())
+            )
+            await db_session.commit()
+    
+    async def _write_rows_individually(self, batch: List[Dict[str, Any]], error: Exception) -> None:
+        """
+        Isolate the rows that made a batch insert fail.
+        
+        Args:
+            batch: Request rows whose batch insert failed
+            error: Error raised by the batch insert
+        """
+        # Raises if the database is unreachable, so the whole batch is retried
+        existing_sessions = await self._existing_session_ids({row["session_id"] for row in batch})
+        
+        orphaned = [row for row in batch if row["session_id"] not in existing_sessions]
+        if orphaned:
+            self._dropped_requests += len(orphaned)
+            # Forget deleted sessions so a later request warms (and recreates) them
+            for row in orphaned:
+                self._sessions.pop(row["session_id"], None)
+            logger.error(
+                f"Dropped {len(orphaned)} quota request rows for deleted sessions "
+                f"{sorted({row['session_id'] for row in orphaned})}: {error}"
+            )
+        
+        for row in batch:
+            if row["session_id"] not in existing_sessions:
+                continue
+            try:
+                await self._insert_requests([row])
+            except Exception as row_error:
+                self._dropped_requests += 1
+                logger.error(
+                    f"Dropped quota request row for session {row['session_id']} "
+                    f"(topic={row['topic']}, date={row['date_requested']}, hash={row['request_hash']}): {row_error}"
+                )
+    
+    async def _existing_session_ids(self, session_ids: Set[str]) -> Set[str]:
+        """Return the given session IDs that still exist in the sessions table."""
+        parsed_ids = {}
+        for session_id in session_ids:
+            try:
+                parsed_ids[session_id] = uuid.UUID(session_id)
+            except ValueError:
+                continue
+        
+        if not parsed_ids:
+            return set()
+        
+        async with AsyncSessionLocal() as db_session:
+            result = await db_session.execute(
+                select(Session.id).where(Session.id.in_(set(parsed_ids.values())))
+            )
+            existing = set(result.scalars())
+        
+        return {session_id for session_id, parsed_id in parsed_ids.items() if parsed_id in existing}
+    
+    def _release_pending(self, batch: List[Dict[str, Any]]) -> None:
+        """Mark a batch's requests as no longer pending, written or dropped."""
+        for row in batch:
+            remaining = self._pending_sessions.get(row["session_id"], 0) - 1
+            if remaining > 0:
+                self._pending_sessions[row["session_id"]] = remaining
+            else:
+                self._pending_sessions.pop(row["session_id"], None)
+    
+    def _evict_idle_sessions(self) -> None:
+        """Drop counters for idle sessions whose requests have all been written."""
+        cutoff = datetime.utcnow() - DUPLICATE_WINDOW
+        
+        for session_id in [
+            session_id for session_id, counters in self._sessions.items()
+            if counters.last_access < cutoff and session_id not in self._pending_sessions
+        ]:
+            del self._sessions[session_id]
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """Get backend statistics."""
+        return {
+            "backend": "memory",
+            "sessions": len(self._sessions),
+            "dropped_requests": self._dropped_requests,
+            "write_behind": self._queue.get_stats()
+        }
+
+
+# Global instance
+_quota_backend = None
+
+
+def get_quota_backend() -> Optional[InMemoryQuotaBackend]:
+    """
+    Get the in-memory quota backend when QUOTA_BACKEND is "memory".
+    
+    Returns:
+        InMemoryQuotaBackend instance, or None for the database backend
+    """
+    global _quota_backend
+    
+    if settings.QUOTA_BACKEND != "memory":
+        return None
+    
+    if _quota_backend is None:
+        _quota_backend = InMemoryQuotaBackend()
+    
+    return _quota_backend
@@ -0,0 +1,442 @@
+"""
+Process-wide rate limiting for upstream APIs (Serper and each LLM model).
+
+Each upstream has a requests-per-second bucket and, for LLMs, a
+tokens-per-minute bucket (limits from RATE_LIMITS, falling back to
+RATE_LIMIT_DEFAULT_RPS / RATE_LIMIT_DEFAULT_TPM; 0 means unlimited).
+Callers wait in a FIFO queue for both buckets instead of failing, up to
+RATE_LIMIT_MAX_WAIT seconds. A 429 response blocks the whole upstream
+for its Retry-After period, so concurrent workflows pause together and
+resume at the limiter's pace rather than retrying at once.
+
+Bucket state lives in process memory, or in Redis (RATE_LIMIT_BACKEND
+"redis", using REDIS_URL) to share limits across workers. The FIFO
+queue is per process either way.
+"""
+import asyncio
+import logging
+import time
+from email.utils import parsedate_to_datetime
+from typing import Any, Dict, List, Optional
+
+from app.langgraph.utils.error_handlers import RateLimitExceededError, SerperAPIError
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+# Upstream name used for the Serper API
+SERPER_UPSTREAM = "serper"
+
+# Rough characters-per-token ratio for estimating prompt size
+CHARS_PER_TOKEN = 4
+
+
+class LocalBucketStore:
+    """Token buckets in process memory."""
+    
+    name = "memory"
+    
+    def __init__(self):
+        self._buckets: Dict[str, Dict[str, float]] = {}
+    
+    def _refill(self, upstream: str, rps: float, rps_capacity: float, tpm: float) -> Dict[str, float]:
+        now = time.monotonic()
+        bucket = self._buckets.get(upstream)
+        
+        if bucket is None:
+            bucket = self._buckets[upstream] = {
+                "requests": rps_capacity,
+                "tokens": tpm,
+                "updated": now,
+                "blocked_until": 0.0
+            }
+            return bucket
+        
+        elapsed = now - bucket["updated"]
+        bucket["requests"] = min(rps_capacity, bucket["requests"] + elapsed * rps)
+        bucket["tokens"] = min(tpm, bucket["tokens"] + elapsed * tpm / 60)
+        bucket["updated"] = now
+        return bucket
+    
+    async def reserve(self, upstream: str, rps: float, rps_capacity: float, tpm: float, tokens: int) -> float:
+        """
+        Take one request and tokens from the buckets if available.
+        
+        Returns:
+            0 when reserved, otherwise seconds to wait before trying again
+        """
+        bucket = self._refill(upstream, rps, rps_capacity, tpm)
+        
+        blocked_for = bucket["blocked_until"] - time.monotonic()
+        if blocked_for > 0:
+            return blocked_for
+        
+        waits = [0.0]
+        if rps > 0 and bucket["requests"] < 1:
+            waits.append((1 - bucket["requests"]) / rps)
+        # Requests larger than the bucket wait for a full bucket and go into debt
+        if tpm > 0 and bucket["tokens"] < min(tokens, tpm):
+            waits.append((min(tokens, tpm) - bucket["tokens"]) / (tpm / 60))
+        
+        if max(waits) > 0:
+            return max(waits)
+        
+        bucket["requests"] -= 1
+        bucket["tokens"] -= tokens
+        return 0.0
+    
+    async def adjust_tokens(self, upstream: str, delta: int) -> None:
+        """Take (or return, when negative) tokens after a call's real usage is known."""
+        bucket = self._buckets.get(upstream)
+        if bucket is not None:
+            bucket["tokens"] -= delta
+    
+    async def block(self, upstream: str, seconds: float) -> None:
+        """Refuse reservations for an upstream for the given time."""
+        # A new bucket starts full; the next refill caps it at the limits
+        bucket = self._buckets.setdefault(
+            upstream,
+            {"requests": float("inf"), "tokens": float("inf"), "updated": time.monotonic(), "blocked_until": 0.0}
+        )
+        bucket["blocked_until"] = max(bucket["blocked_until"], time.monotonic() + seconds)
+    
+    async def close(self) -> None:
+        return None
+
+
+class RedisBucketStore:
+    """
+    Token buckets in Redis, shared by every worker using the same REDIS_URL.
+    
+    Each upstream is a hash refilled and debited by one Lua script using
+    the Redis server clock, so workers agree on the buckets' state.
+    """
+    
+    name = "redis"
+    
+    KEY_PREFIX = "rate_limit:"
+    
+    # KEYS[1]=bucket hash; ARGV: rps, rps capacity, tpm, tokens
+    RESERVE_SCRIPT = """
+    local t = redis.call('TIME')
+    local now = tonumber(t[1]) + tonumber(t[2]) / 1000000
+    local rps, rps_capacity, tpm, tokens = tonumber(ARGV[1]), tonumber(ARGV[2]), tonumber(ARGV[3]), tonumber(ARGV[4])
+    local state = redis.call('HMGET', KEYS[1], 'requests', 'tokens', 'updated', 'blocked_until')
+    local requests = tonumber(state[1]) or rps_capacity
+    local available = tonumber(state[2]) or tpm
+    local updated = tonumber(state[3]) or now
+    local blocked_until = tonumber(state[4]) or 0
+    local elapsed = math.max(0, now - updated)
+    requests = math.min(rps_capacity, requests + elapsed * rps)
+    available = math.min(tpm, available + elapsed * tpm / 60)
+    local wait = 0
+    if blocked_until > now then
+        wait = blocked_until - now
+    else
+        if rps > 0 and requests < 1 then
+            wait = math.max(wait, (1 - requests) / rps)
+        end
+        local needed = math.min(tokens, tpm)
+        if tpm > 0 and available < needed then
+            wait = math.max(wait, (needed - available) / (tpm / 60))
+        end
+    end
+    if wait == 0 then
+        requests = requests - 1
+        available = available - tokens
+    end
+    redis.call('HSET', KEYS[1], 'requests', requests, 'tokens', available, 'updated', now)
+    redis.call('EXPIRE', KEYS[1], 3600)
+    return tostring(wait)
+    """
+    
+    # KEYS[1]=bucket hash; ARGV: seconds
+    BLOCK_SCRIPT = """
+    local t = redis.call('TIME')
+    local until_time = tonumber(t[1]) + tonumber(t[2]) / 1000000 + tonumber(ARGV[1])
+    local current = tonumber(redis.call('HGET', KEYS[1], 'blocked_until')) or 0
+    if until_time > current then
+        redis.call('HSET', KEYS[1], 'blocked_until', until_time)
+    end
+    redis.call('EXPIRE', KEYS[1], 3600)
+    return 1
+    """
+    
+    def __init__(self, redis_url: str):
+        try:
+            import redis.asyncio as redis_asyncio
+        except ImportError as e:
+            raise RuntimeError(
+                "RATE_LIMIT_BACKEND=redis requires the 'redis' package (pip install redis)"
+            ) from e
+        
+        self._redis = redis_asyncio.from_url(redis_url, decode_responses=True)
+        self._reserve_script = self._redis.register_script(self.RESERVE_SCRIPT)
+        self._block_script = self._redis.register_script(self.BLOCK_SCRIPT)
+    
+    def _key(self, upstream: str) -> str:
+        return f"{self.KEY_PREFIX}{upstream}"
+    
+    async def reserve(self, upstream: str, rps: float, rps_capacity: float, tpm: float, tokens: int) -> float:
+        wait = await self._reserve_script(keys=[self._key(upstream)], args=[rps, rps_capacity, tpm, tokens])
+        return float(wait)
+    
+    async def adjust_tokens(self, upstream: str, delta: int) -> None:
+        await self._redis.hincrbyfloat(self._key(upstream), "tokens", -delta)
+    
+    async def block(self, upstream: str, seconds: float) -> None:
+        await self._block_script(keys=[self._key(upstream)], args=[seconds])
+    
+    async def close(self) -> None:
+        await self._redis.aclose()
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """
+    Parse a Retry-After header (delay in seconds or an HTTP date).
+    
+    Returns:
+        Seconds to wait, or None when the header is missing or invalid
+    """
+    if not value:
+        return None
+    
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+def is_rate_limit_error(error: BaseException) -> bool:
+    """Whether an exception is an upstream 429 / rate limit response."""
+    if isinstance(error, SerperAPIError):
+        return error.context.get("status_code") == 429
+    
+    response = getattr(error, "response", None)
+    status_code = getattr(error, "status_code", None) or getattr(response, "status_code", None)
+    if status_code == 429:
+        return True
+    
+    return type(error).__name__ in ("RateLimitError", "ResourceExhausted")
+
+
+def estimate_tokens(messages: List[Any], max_output_tokens: int) -> int:
+    """
+    Estimate the tokens an LLM call will use (prompt plus maximum output).
+    
+    Args:
+        messages: LangChain messages (or strings) sent to the model
+        max_output_tokens: The call's max_tokens setting
+    """
+    chars = sum(len(str(getattr(message, "content", message))) for message in messages)
+    return chars // CHARS_PER_TOKEN + max_output_tokens
+
+
+class UpstreamRateLimiter:
+    """
+    Rate limiter for one upstream with a fair (FIFO) wait queue.
+    
+    Waiters queue on an asyncio.Lock, which wakes them in arrival order;
+    the holder sleeps until the buckets have room, so earlier requests
+    are never overtaken by later ones.
+    """
+    
+    def __init__(self, name: str, rps: float, tpm: float, store):
+        """
+        Initialize the limiter.
+        
+        Args:
+            name: Upstream name (SERPER_UPSTREAM or an application model name)
+            rps: Requests per second (0 for unlimited)
+            tpm: Tokens per minute (0 for unlimited)
+            store: LocalBucketStore or RedisBucketStore holding bucket state
+        """
+        self.name = name
+        self.rps = rps
+        self.tpm = tpm
+        self._rps_capacity = max(1.0, rps * settings.RATE_LIMIT_BURST_SECONDS)
+        self._store = store
+        self._lock = asyncio.Lock()
+        self._waiting = 0
+        
+        self._stats = {
+            "acquired": 0,
+            "waited": 0,
+            "rejected": 0,
+            "throttled": 0,
+            "total_wait_seconds": 0.0,
+            "max_wait_seconds": 0.0,
+            "max_queue_depth": 0
+        }
+    
+    async def acquire(self, tokens: int = 0) -> float:
+        """
+        Wait in line until the upstream's buckets allow a call.
+        
+        Args:
+            tokens: Estimated tokens the call will use (LLM calls)
+        
+        Returns:
+            Seconds spent waiting
+        
+        Raises:
+            RateLimitExceededError: When the wait would exceed RATE_LIMIT_MAX_WAIT
+        """
+        start_time = time.perf_counter()
+        self._waiting += 1
+        self._stats["max_queue_depth"] = max(self._stats["max_queue_depth"], self._waiting)
+        
+        try:
+            async with self._lock:
+                while True:
+                    wait = await self._store.reserve(self.name, self.rps, self._rps_capacity, self.tpm, tokens)
+                    if wait <= 0:
+                        break
+                    
+                    waited = time.perf_counter() - start_time
+                    if waited + wait > settings.RATE_LIMIT_MAX_WAIT:
+                        self._stats["rejected"] += 1
+                        raise RateLimitExceededError(self.name, waited + wait)
+                    
+                    await asyncio.sleep(wait)
+        finally:
+            self._waiting -= 1
+        
+        waited = time.perf_counter() - start_time
+        self._stats["acquired"] += 1
+        if waited > 0.001:
+            self._stats["waited"] += 1
+        self._stats["total_wait_seconds"] += waited
+        self._stats["max_wait_seconds"] = max(self._stats["max_wait_seconds"], waited)
+        return waited
+    
+    async def record_throttled(self, retry_after: Optional[float] = None) -> None:
+        """
+        Block the upstream after a 429 response.
+        
+        Args:
+            retry_after: Seconds from the Retry-After header, if any
+        """
+        seconds = retry_after if retry_after is not None else settings.RATE_LIMIT_DEFAULT_BACKOFF
+        self._stats["throttled"] += 1
+        logger.warning(f"Upstream {self.name} rate limited, pausing calls for {seconds:.1f}s")
+        await self._store.block(self.name, seconds)
+    
+    async def record_error(self, error: BaseException) -> None:
+        """Block the upstream if the error is a rate limit response."""
+        if not is_rate_limit_error(error):
+            return
+        
+        response = getattr(error, "response", None)
+        headers = getattr(response, "headers", None) or {}
+        await self.record_throttled(parse_retry_after(headers.get("retry-after")))
+    
+    async def record_usage(self, estimated_tokens: int, response: Any) -> None:
+        """
+        Correct the token bucket with a response's reported usage.
+        
+        Args:
+            estimated_tokens: Tokens taken in acquire()
+            response: LangChain message with usage_metadata, if reported
+        """
+        usage = getattr(response, "usage_metadata", None)
+        if self.tpm <= 0 or not usage or not usage.get("total_tokens"):
+            return
+        
+        await self._store.adjust_tokens(self.name, usage["total_tokens"] - estimated_tokens)
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """Get limiter statistics."""
+        acquired = self._stats["acquired"]
+        return {
+            "rps": self.rps,
+            "tpm": self.tpm,
+            "queue_depth": self._waiting,
+            **self._stats,
+            "mean_wait_seconds": round(self._stats["total_wait_seconds"] / acquired, 4) if acquired else None
+        }
+
+
+class NoopRateLimiter:
+    """Stand-in used when RATE_LIMIT_ENABLED is false."""
+    
+    name = "disabled"
+    
+    async def acquire(self, tokens: int = 0) -> float:
+        return 0.0
+    
+    async def record_throttled(self, retry_after: Optional[float] = None) -> None:
+        return None
+    
+    async def record_error(self, error: BaseException) -> None:
+        return None
+    
+    async def record_usage(self, estimated_tokens: int, response: Any) -> None:
+        return None
+
+
+# Global instances
+_bucket_store = None
+_rate_limiters: Dict[str, UpstreamRateLimiter] = {}
+_noop_rate_limiter = NoopRateLimiter()
+
+
+def _get_bucket_store():
+    global _bucket_store
+    
+    if _bucket_store is None:
+        backend_name = settings.RATE_LIMIT_BACKEND.lower()
+        if backend_name == "redis":
+            _bucket_store = RedisBucketStore(settings.REDIS_URL)
+        elif backend_name == "memory":
+            _bucket_store = LocalBucketStore()
+        else:
+            raise ValueError(f"Unknown rate limit backend: {backend_name}")
+    
+    return _bucket_store
+
+
+def get_rate_limiter(upstream: str):
+    """
+    Get the shared rate limiter for an upstream.
+    
+    Args:
+        upstream: SERPER_UPSTREAM or an application model name
+    
+    Returns:
+        UpstreamRateLimiter, or a no-op limiter when rate limiting is disabled
+    """
+    if not settings.RATE_LIMIT_ENABLED:
+        return _noop_rate_limiter
+    
+    limiter = _rate_limiters.get(upstream)
+    
+    if limiter is None:
+        limits = settings.RATE_LIMITS.get(upstream, {})
+        limiter = _rate_limiters[upstream] = UpstreamRateLimiter(
+            name=upstream,
+            rps=limits.get("rps", settings.RATE_LIMIT_DEFAULT_RPS),
+            tpm=limits.get("tpm", settings.RATE_LIMIT_DEFAULT_TPM if upstream != SERPER_UPSTREAM else 0),
+            store=_get_bucket_store()
+        )
+    
+    return limiter
+
+
+def get_rate_limiter_stats() -> Dict[str, Any]:
+    """Get statistics for every upstream rate limiter in use."""
+    return {name: limiter.get_stats() for name, limiter in _rate_limiters.items()}
+
+
+async def close_rate_limiters() -> None:
+    """Close the shared bucket store if it was created."""
+    global _bucket_store
+    
+    if _bucket_store is not None:
+        await _bucket_store.close()
+        _bucket_store = None
@@ -0,0 +1,144 @@
+"""
+Cross-session coalescing of identical in-flight news workflows.
+
+When several sessions request the same (topic, date, top_n, llm_model)
+at the same time, the first workflow becomes the leader and runs the
+fetch/filter/summarize pipeline. Workflows arriving while it is in
+flight become followers and await the leader's articles instead of
+repeating the Serper and LLM calls.
+
+Unlike SingleFlight, the leader's work spans several graph nodes, so
+the leader acquires a key in one node and resolves it in another.
+Quota is checked before coalescing, so every caller is still charged.
+"""
+import asyncio
+from typing import Dict, Any, Optional, Tuple
+
+
+def make_coalesce_key(topic: str, date: str, top_n: int, llm_model: str) -> str:
+    """
+    Build the coalescing key for a news request.
+    
+    Args:
+        topic: News topic (normalized case-insensitively)
+        date: Date in YYYY-MM-DD format
+        top_n: Number of articles requested
+        llm_model: LLM model used for summarization
+    
+    Returns:
+        Normalized key string
+    """
+    return f"{topic.strip().lower()}|{date}|{top_n}|{llm_model}"
+
+
+class RequestCoalescer:
+    """
+    Tracks leader workflows by coalescing key.
+    
+    The leader resolves the key with its results once they are saved.
+    If the leader fails, its workflow releases the key with no result
+    and followers fall back to running the pipeline themselves.
+    """
+    
+    def __init__(self):
+        """Initialize with no requests in flight."""
+        self._futures: Dict[str, asyncio.Future] = {}
+        self._leaders: Dict[str, str] = {}
+        self._stats = {
+            "leaders": 0,
+            "followers": 0,
+            "follower_fallbacks": 0
+        }
+    
+    def acquire(self, key: str, workflow_id: str) -> Tuple[bool, asyncio.Future]:
+        """
+        Become the leader for key, or join the leader already in flight.
+        
+        Args:
+            key: Coalescing key
+            workflow_id: Workflow asking for the key
+        
+        Returns:
+            (is_leader, future resolving to the leader's results or None)
+        """
+        future = self._futures.get(key)
+        if future is not None:
+            self._stats["followers"] += 1
+            return False, future
+        
+        future = asyncio.get_running_loop().create_future()
+        self._futures[key] = future
+        self._leaders[workflow_id] = key
+        self._stats["leaders"] += 1
+        return True, future
+    
+    async def wait(self, future: asyncio.Future, timeout: float) -> Optional[Dict[str, Any]]:
+        """
+        Wait for a leader's results.
+        
+        Args:
+            future: Future returned by acquire()
+            timeout: Maximum seconds to wait
+        
+        Returns:
+            Leader's results, or None if the leader failed or timed out
+        """
+        try:
+            # Shield so a cancelled or timed-out follower doesn't cancel the shared future
+            result = await asyncio.wait_for(asyncio.shield(future), timeout=timeout)
+        except asyncio.TimeoutError:
+            result = None
+        
+        if result is None:
+            self._stats["follower_fallbacks"] += 1
+        
+        return result
+    
+    def resolve(self, workflow_id: str, result: Dict[str, Any]) -> None:
+        """
+        Publish the leader's results to its followers.
+        
+        Args:
+            workflow_id: Leader workflow
+            result: Results shared with followers
+        """
+        self._finish(workflow_id, result)
+    
+    def release(self, workflow_id: str) -> None:
+        """
+        Release any key still led by workflow_id, without results.
+        
+        Called when a workflow ends; a no-op if it was not a leader or
+        has already resolved its key.
+        """
+        self._finish(workflow_id, None)
+    
+    def _finish(self, workflow_id: str, result: Optional[Dict[str, Any]]) -> None:
+        key = self._leaders.pop(workflow_id, None)
+        if key is None:
+            return
+        
+        future = self._futures.pop(key, None)
+        if future is not None and not future.done():
+            future.set_result(result)
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """Get coalescing statistics."""
+        return {
+            **self._stats,
+            "in_flight": len(self._futures)
+        }
+
+
+# Global instance
+_request_coalescer = None
+
+
+def get_request_coalescer() -> RequestCoalescer:
+    """Get singleton instance of the request coalescer."""
+    global _request_coalescer
+    
+    if _request_coalescer is None:
+        _request_coalescer = RequestCoalescer()
+    
+    return _request_coalescer
@@ -0,0 +1,288 @@
+"""
+Cached Serper search responses.
+
+Responses are keyed on the normalized (query, hl, gl) and looked up in
+an in-process LRU first, then the serper_response_cache table shared
+by all workers. Entries are:
+
+- fresh for SERPER_CACHE_TTL seconds and served directly
+- stale for a further SERPER_CACHE_STALE_TTL seconds, served immediately
+  while a background refresh fetches new results
+- expired after that, and re-fetched before responding
+
+The "num" parameter is handled monotonically: an entry fetched with
+num=20 answers later requests for fewer results from its top-ranked
+articles. Only a request for more results than an entry holds is a miss.
+Concurrent misses for the same key share one upstream call.
+"""
+import asyncio
+import hashlib
+import logging
+from collections import OrderedDict
+from datetime import datetime
+from typing import Dict, Any, List, Optional, Callable, Awaitable, Set
+
+from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert
+
+from app.langgraph.utils.single_flight import SingleFlight
+from app.core.config import settings
+from app.core.database import AsyncSessionLocal
+from app.models.serper_response import SerperResponse
+
+logger = logging.getLogger(__name__)
+
+# Fetches up to the given number of results from Serper
+FetchFn = Callable[[int], Awaitable[List[Dict[str, Any]]]]
+
+
+def normalize_query(query: str) -> str:
+    """Normalize a search query for cache keys (case and whitespace)."""
+    return " ".join(query.lower().split())
+
+
+def make_query_hash(query: str, hl: str, gl: str) -> str:
+    """Hash the normalized (query, hl, gl) into a cache key."""
+    return hashlib.sha256(f"{normalize_query(query)}|{hl}|{gl}".encode()).hexdigest()
+
+
+class CachedSerperResponse:
+    """Parsed Serper articles and the num they were fetched with."""
+    
+    def __init__(self, articles: List[Dict[str, Any]], num_results: int, fetched_at: datetime):
+        self.articles = articles
+        self.num_results = num_results
+        self.fetched_at = fetched_at
+    
+    def age(self) -> float:
+        """Seconds since the response was fetched."""
+        return (datetime.utcnow() - self.fetched_at).total_seconds()
+    
+    def covers(self, num_results: int) -> bool:
+        """Whether this response can answer a request for num_results."""
+        return self.num_results >= num_results
+
+
+class SerperCache:
+    """
+    Two-tier TTL cache for Serper responses with stale-while-revalidate.
+    
+    Cache failures never fail a fetch; they degrade to calling Serper.
+    """
+    
+    def __init__(self, max_entries: Optional[int] = None):
+        """
+        Initialize the cache.
+        
+        Args:
+            max_entries: In-process LRU size. Defaults to SERPER_CACHE_MAX_ENTRIES.
+        """
+        self._cache: "OrderedDict[str, CachedSerperResponse]" = OrderedDict()
+        self._max_entries = max_entries or settings.SERPER_CACHE_MAX_ENTRIES
+        self._single_flight = SingleFlight()
+        self._refreshing: Set[str] = set()
+        self._refresh_tasks: Set[asyncio.Task] = set()
+        self._stats = {
+            "fresh_hits": 0,
+            "stale_hits": 0,
+            "misses": 0,
+            "db_hits": 0,
+            "refreshes": 0,
+            "refresh_failures": 0
+        }
+    
+    async def get_or_fetch(
+        self,
+        query: str,
+        num_results: int,
+        hl: str,
+        gl: str,
+        fetch: FetchFn
+    ) -> List[Dict[str, Any]]:
+        """
+        Get articles for a search, calling fetch only on a cache miss.
+        
+        Args:
+            query: Serper search query
+            num_results: Number of results requested
+            hl: Serper language parameter
+            gl: Serper country parameter
+            fetch: Coroutine function fetching up to N results from Serper
+        
+        Returns:
+            Up to num_results articles in Serper ranking order
+        
+        Raises:
+            SerperAPIError: When a required fetch fails
+        """
+        query_hash = make_query_hash(query, hl, gl)
+        entry = await self._get_entry(query_hash)
+        
+        if entry is not None and entry.covers(num_results):
+            age = entry.age()
+            
+            if age < settings.SERPER_CACHE_TTL:
+                self._stats["fresh_hits"] += 1
+                return entry.articles[:num_results]
+            
+            if age < settings.SERPER_CACHE_TTL + settings.SERPER_CACHE_STALE_TTL:
+                self._stats["stale_hits"] += 1
+                self._schedule_refresh(query_hash, query, entry.num_results, fetch)
+                return entry.articles[:num_results]
+        
+        self._stats["misses"] += 1
+        
+        # Never shrink an entry that already holds more results
+        fetch_num = max(num_results, entry.num_results) if entry is not None else num_results
+        entry = await self._single_flight.do(
+            (query_hash, fetch_num),
+            lambda: self._fetch_and_store(query_hash, query, fetch_num, fetch)
+        )
+        
+        return entry.articles[:num_results]
+    
+    async def _get_entry(self, query_hash: str) -> Optional[CachedSerperResponse]:
+        """Get an entry from the LRU, falling back to the durable cache."""
+        entry = self._cache.get(query_hash)
+        if entry is not None:
+            self._cache.move_to_end(query_hash)
+            return entry
+        
+        entry = await self._load_from_db(query_hash)
+        if entry is not None:
+            self._stats["db_hits"] += 1
+            self._remember(query_hash, entry)
+        
+        return entry
+    
+    async def _fetch_and_store(
+        self,
+        query_hash: str,
+        query: str,
+        num_results: int,
+        fetch: FetchFn
+    ) -> CachedSerperResponse:
+        """Fetch from Serper and store the response in both tiers."""
+        articles = await fetch(num_results)
+        entry = CachedSerperResponse(articles, num_results, datetime.utcnow())
+        
+        self._remember(query_hash, entry)
+        await self._save_to_db(query_hash, query, entry)
+        
+        return entry
+    
+    def _schedule_refresh(self, query_hash: str, query: str, num_results: int, fetch: FetchFn) -> None:
+        """Refresh a stale entry in the background, at most once at a time per key."""
+        if query_hash in self._refreshing:
+            return
+        
+        self._refreshing.add(query_hash)
+        task = asyncio.create_task(self._refresh(query_hash, query, num_results, fetch))
+        self._refresh_tasks.add(task)
+        task.add_done_callback(self._refresh_tasks.discard)
+    
+    async def _refresh(self, query_hash: str, query: str, num_results: int, fetch: FetchFn) -> None:
+        """Run a background refresh; failures keep serving the stale entry."""
+        self._stats["refreshes"] += 1
+        
+        try:
+            await self._single_flight.do(
+                (query_hash, num_results),
+                lambda: self._fetch_and_store(query_hash, query, num_results, fetch)
+            )
+        except Exception as e:
+            self._stats["refresh_failures"] += 1
+            logger.warning(f"Background Serper refresh failed for {query!r}: {e}")
+        finally:
+            self._refreshing.discard(query_hash)
+    
+    async def _load_from_db(self, query_hash: str) -> Optional[CachedSerperResponse]:
+        """Load an entry from the serper_response_cache table."""
+        try:
+            async with AsyncSessionLocal() as db_session:
+                result = await db_session.execute(
+                    select(SerperResponse).where(SerperResponse.query_hash == query_hash)
+                )
+                row = result.scalar_one_or_none()
+        
+        except Exception as e:
+            # Durable cache is an optimization only
+            logger.warning(f"Serper cache lookup failed: {e}")
+            return None
+        
+        if row is None:
+            return None
+        
+        return CachedSerperResponse(row.articles, row.num_results, row.fetched_at)
+    
+    async def _save_to_db(self, query_hash: str, query: str, entry: CachedSerperResponse) -> None:
+        """Upsert an entry into the serper_response_cache table."""
+        try:
+            async with AsyncSessionLocal() as db_session:
+                await db_session.execute(
+                    insert(SerperResponse)
+                    .values(
+                        query_hash=query_hash,
+                        query=query,
+                        num_results=entry.num_results,
+                        articles=entry.articles,
+                        fetched_at=entry.fetched_at
+                    )
+                    .on_conflict_do_update(
+                        index_elements=["query_hash"],
+                        set_={
+                            "num_results": entry.num_results,
+                            "articles": entry.articles,
+                            "fetched_at": entry.fetched_at
+                        }
+                    )
+                )
+                await db_session.commit()
+        
+        except Exception as e:
+            logger.warning(f"Failed to persist Serper response: {e}")
+    
+    def _remember(self, query_hash: str, entry: CachedSerperResponse) -> None:
+        """Add an entry to the in-process LRU."""
+        self._cache[query_hash] = entry
+        self._cache.move_to_end(query_hash)
+        
+        while len(self._cache) > self._max_entries:
+            self._cache.popitem(last=False)
+    
+    async def close(self) -> None:
+        """Cancel background refreshes still in flight."""
+        for task in list(self._refresh_tasks):
+            task.cancel()
+        
+        if self._refresh_tasks:
+            await asyncio.gather(*self._refresh_tasks, return_exceptions=True)
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """Get cache statistics."""
+        return {
+            **self._stats,
+            "cached_queries": len(self._cache),
+            "refreshing": len(self._refreshing),
+            "shared_calls": self._single_flight.shared_calls
+        }
+
+
+# Global instance
+_serper_cache = None
+
+
+def get_serper_cache() -> SerperCache:
+    """Get singleton instance of the Serper response cache."""
+    global _serper_cache
+    
+    if _serper_cache is None:
+        _serper_cache = SerperCache()
+    
+    return _serper_cache
+
+
+async def close_serper_cache() -> None:
+    """Cancel the Serper cache's background refreshes if it was created."""
+    if _serper_cache is not None:
+        await _serper_cache.close()
@@ -0,0 +1,63 @@
+"""
+Single-flight de-duplication of concurrent async calls.
+
+Concurrent callers asking for the same key share one in-flight call
+instead of each hitting the upstream service.
+"""
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, Hashable
+
+
+class SingleFlight:
+    """
+    Coalesces concurrent calls by key.
+    
+    The first caller for a key runs the function; callers arriving
+    while it is in flight await the same result (or exception).
+    Nothing is cached once the call completes.
+    """
+    
+    def __init__(self):
+        """Initialize with no calls in flight."""
+        self._calls: Dict[Hashable, asyncio.Future] = {}
+        self.shared_calls = 0
+    
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Run fn for key, or join the call already in flight for key.
+        
+        Args:
+            key: De-duplication key
+            fn: Zero-argument coroutine function producing the result
+        
+        Returns:
+            Result of the (shared) call
+        """
+        future = self._calls.get(key)
+        if future is not None:
+            self.shared_calls += 1
+            # Shield so one cancelled follower doesn't cancel the shared call
+            return await asyncio.shield(future)
+        
+        future = asyncio.get_running_loop().create_future()
+        self._calls[key] = future
+        
+        try:
+            result = await fn()
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except BaseException as e:
+            future.set_exception(e)
+            # Mark retrieved so an exception nobody else awaited isn't logged
+            future.exception()
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            self._calls.pop(key, None)
+    
+    def in_flight(self) -> int:
+        """Get the number of calls currently in flight."""
+        return len(self._calls)
@@ -0,0 +1,369 @@
+"""
+Storage backends for ExternalStateManager.
+
+Workflow state is stored as a JSON-serializable dict carrying a
+monotonically increasing "_version". Backends provide atomic
+compare-and-set on that version so ExternalStateManager can apply
+updates optimistically, without process-local locks. This lets post
+workflows span multiple uvicorn workers or nodes.
+
+Backends:
+- InMemoryStateBackend: process-local dict (default, single worker)
+- RedisStateBackend: Redis protocol with native TTLs, shared across workers
+- SQLiteStateBackend: embedded stand-in for tests and local development
+"""
+import json
+import time
+import asyncio
+import sqlite3
+import threading
+from collections import OrderedDict
+from typing import Dict, Any, Optional
+
+from app.core.config import settings
+
+
+def serialize_state(state: Dict[str, Any]) -> str:
+    """Serialize state for storage."""
+    return json.dumps(state, default=str)
+
+
+def deserialize_state(payload: str) -> Dict[str, Any]:
+    """Deserialize stored state."""
+    return json.loads(payload)
+
+
+class StateBackend:
+    """
+    Base class for external state storage.
+    
+    Every stored state includes a "_version" integer. Implementations
+    must make compare_and_set atomic with respect to other writers.
+    """
+    
+    name = "base"
+    
+    async def create(self, state_key: str, state: Dict[str, Any], ttl: int) -> None:
+        """Store a new state under state_key with a TTL in seconds."""
+        raise NotImplementedError("Subclasses must implement create")
+    
+    async def get(self, state_key: str) -> Optional[Dict[str, Any]]:
+        """Get a copy of the state, or None if missing or expired."""
+        raise NotImplementedError("Subclasses must implement get")
+    
+    async def compare_and_set(
+        self,
+        state_key: str,
+        expected_version: int,
+        state: Dict[str, Any],
+        ttl: int
+    ) -> bool:
+        """
+        Replace the state if its stored version equals expected_version.
+        
+        Returns:
+            True if the state was replaced, False on version conflict or missing state
+        """
+        raise NotImplementedError("Subclasses must implement compare_and_set")
+    
+    async def delete(self, state_key: str) -> bool:
+        """Delete a state. Returns True if it existed."""
+        raise NotImplementedError("Subclasses must implement delete")
+    
+    async def cleanup_expired(self, ttl: int) -> int:
+        """Remove expired states. Returns the number removed."""
+        return 0
+    
+    async def close(self) -> None:
+        """Release backend resources."""
+        return None
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """Get backend statistics."""
+        return {"backend": self.name}
+
+
+class InMemoryStateBackend(StateBackend):
+    """
+    Process-local state storage. Operations never yield, so they are atomic on the event loop.
+    
+    States are kept in LRU order and capped at max_entries; the least
+    recently used state is evicted when a new one would exceed the cap.
+    A state idle for longer than its TTL is treated as missing even
+    before the sweeper removes it. The serialized size of the states is
+    computed when stats are read, so writes don't pay for it.
+    """
+    
+    name = "memory"
+    
+    def __init__(self, max_entries: Optional[int] = None):
+        self._states: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._ttls: Dict[str, int] = {}
+        self._max_entries = max_entries if max_entries is not None else settings.STATE_MAX_ENTRIES
+        self._evictions = 0
+    
+    def _store(self, state_key: str, state: Dict[str, Any], ttl: int) -> None:
+        """Store a state as most recently used."""
+        self._states[state_key] = state
+        self._ttls[state_key] = ttl
+        self._states.move_to_end(state_key)
+    
+    def _remove(self, state_key: str) -> bool:
+        """Remove a state and its TTL."""
+        self._ttls.pop(state_key, None)
+        return self._states.pop(state_key, None) is not None
+    
+    def _get_live(self, state_key: str) -> Optional[Dict[str, Any]]:
+        """Get a stored state, removing it if it has been idle past its TTL."""
+        state = self._states.get(state_key)
+        if state is None:
+            return None
+        
+        if state.get("_last_accessed", 0) < time.time() - self._ttls[state_key]:
+            self._remove(state_key)
+            return None
+        
+        return state
+    
+    async def create(self, state_key: str, state: Dict[str, Any], ttl: int) -> None:
+        self._store(state_key, dict(state), ttl)
+        
+        while self._max_entries and len(self._states) > self._max_entries:
+            oldest_key = next(iter(self._states))
+            self._remove(oldest_key)
+            self._evictions += 1
+    
+    async def get(self, state_key: str) -> Optional[Dict[str, Any]]:
+        state = self._get_live(state_key)
+        if state is None:
+            return None
+        
+        # Reads count as access for idle expiry and LRU order
+        state["_last_accessed"] = time.time()
+        self._states.move_to_end(state_key)
+        return state.copy()
+    
+    async def compare_and_set(
+        self,
+        state_key: str,
+        expected_version: int,
+        state: Dict[str, Any],
+        ttl: int
+    ) -> bool:
+        current = self._get_live(state_key)
+        if current is None or current.get("_version") != expected_version:
+            return False
+        
+        self._store(state_key, dict(state), ttl)
+        return True
+    
+    async def delete(self, state_key: str) -> bool:
+        return self._remove(state_key)
+    
+    async def cleanup_expired(self, ttl: int) -> int:
+        cutoff = time.time() - ttl
+        expired_keys = [
+            state_key for state_key, state in self._states.items()
+            if state.get("_last_accessed", 0) < cutoff
+        ]
+        
+        for state_key in expired_keys:
+            self._remove(state_key)
+        
+        return len(expired_keys)
+    
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "backend": self.name,
+            "total_states": len(self._states),
+            "max_entries": self._max_entries,
+            "evictions": self._evictions,
+            "bytes_held": sum(len(serialize_state(state)) for state in self._states.values()),
+            "oldest_state": min(
+                (state["_created_at"] for state in self._states.values()),
+                default=None
+            ),
+            "newest_state": max(
+                (state["_created_at"] for state in self._states.values()),
+                default=None
+            )
+        }
+
+
+class RedisStateBackend(StateBackend):
+    """
+    Redis-protocol state storage shared across workers.
+    
+    Each state is a hash with the serialized state in "data" and its
+    version in "version". Expiry uses native key TTLs; compare-and-set
+    runs as a Lua script so the version check and write are atomic.
+    """
+    
+    name = "redis"
+    
+    KEY_PREFIX = "workflow_state:"
+    
+    # KEYS[1]=state key; ARGV: expected version, data, new version, ttl
+    CAS_SCRIPT = """
+    local current = redis.call('HGET', KEYS[1], 'version')
+    if not current then
+        return -1
+    end
+    if tonumber(current) ~= tonumber(ARGV[1]) then
+        return 0
+    end
+    redis.call('HSET', KEYS[1], 'data', ARGV[2], 'version', ARGV[3])
+    redis.call('EXPIRE', KEYS[1], ARGV[4])
+    return 1
+    """
+    
+    def __init__(self, redis_url: str):
+        try:
+            import redis.asyncio as redis_asyncio
+        except ImportError as e:
+            raise RuntimeError(
+                "STATE_BACKEND=redis requires the 'redis' package (pip install redis)"
+            ) from e
+        
+        self._redis = redis_asyncio.from_url(redis_url, decode_responses=True)
+        self._cas_script = self._redis.register_script(self.CAS_SCRIPT)
+    
+    def _key(self, state_key: str) -> str:
+        return f"{self.KEY_PREFIX}{state_key}"
+    
+    async def create(self, state_key: str, state: Dict[str, Any], ttl: int) -> None:
+        key = self._key(state_key)
+        async with self._redis.pipeline(transaction=True) as pipe:
+            pipe.hset(key, mapping={"data": serialize_state(state), "version": state["_version"]})
+            pipe.expire(key, ttl)
+            await pipe.execute()
+    
+    async def get(self, state_key: str) -> Optional[Dict[str, Any]]:
+        payload = await self._redis.hget(self._key(state_key), "data")
+        if payload is None:
+            return None
+        
+        return deserialize_state(payload)
+    
+    async def compare_and_set(
+        self,
+        state_key: str,
+        expected_version: int,
+        state: Dict[str, Any],
+        ttl: int
+    ) -> bool:
+        result = await self._cas_script(
+            keys=[self._key(state_key)],
+            args=[expected_version, serialize_state(state), state["_version"], ttl]
+        )
+        
+        return int(result) == 1
+    
+    async def delete(self, state_key: str) -> bool:
+        return bool(await self._redis.delete(self._key(state_key)))
+    
+    async def close(self) -> None:
+        await self._redis.aclose()
+
+
+class SQLiteStateBackend(StateBackend):
+    """
+    Embedded SQLite state storage for tests and local development.
+    
+    Uses a single connection guarded by a thread lock; blocking calls
+    run in a worker thread so they don't stall the event loop.
+    """
+    
+    name = "sqlite"
+    
+    def __init__(self, path: str = ":memory:"):
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS workflow_states (
+                state_key TEXT PRIMARY KEY,
+                data TEXT NOT NULL,
+                version INTEGER NOT NULL,
+                expires_at REAL NOT NULL
+            )
+            """
+        )
+    
+    def _execute(self, sql: str, params: tuple = ()) -> sqlite3.Cursor:
+        with self._lock:
+            return self._conn.execute(sql, params)
+    
+    async def _run(self, sql: str, params: tuple = ()) -> sqlite3.Cursor:
+        return await asyncio.to_thread(self._execute, sql, params)
+    
+    async def create(self, state_key: str, state: Dict[str, Any], ttl: int) -> None:
+        await self._run(
+            "INSERT OR REPLACE INTO workflow_states (state_key, data, version, expires_at) VALUES (?, ?, ?, ?)",
+            (state_key, serialize_state(state), state["_version"], time.time() + ttl)
+        )
+    
+    async def get(self, state_key: str) -> Optional[Dict[str, Any]]:
+        cursor = await self._run(
+            "SELECT data FROM workflow_states WHERE state_key = ? AND expires_at > ?",
+            (state_key, time.time())
+        )
+        row = cursor.fetchone()
+        return deserialize_state(row[0]) if row else None
+    
+    async def compare_and_set(
+        self,
+        state_key: str,
+        expected_version: int,
+        state: Dict[str, Any],
+        ttl: int
+    ) -> bool:
+        cursor = await self._run(
+            "UPDATE workflow_states SET data = ?, version = ?, expires_at = ? "
+            "WHERE state_key = ? AND version = ? AND expires_at > ?",
+            (serialize_state(state), state["_version"], time.time() + ttl, state_key, expected_version, time.time())
+        )
+        return cursor.rowcount == 1
+    
+    async def delete(self, state_key: str) -> bool:
+        cursor = await self._run("DELETE FROM workflow_states WHERE state_key = ?", (state_key,))
+        return cursor.rowcount > 0
+    
+    async def cleanup_expired(self, ttl: int) -> int:
+        cursor = await self._run("DELETE FROM workflow_states WHERE expires_at <= ?", (time.time(),))
+        return cursor.rowcount
+    
+    async def close(self) -> None:
+        await asyncio.to_thread(self._conn.close)
+    
+    def get_stats(self) -> Dict[str, Any]:
+        row = self._execute("SELECT COUNT(*) FROM workflow_states").fetchone()
+        return {
+            "backend": self.name,
+            "total_states": row[0]
+        }
+
+
+def create_state_backend(backend_name: Optional[str] = None) -> StateBackend:
+    """
+    Create the state backend selected by STATE_BACKEND.
+    
+    Args:
+        backend_name: Override for settings.STATE_BACKEND
+    
+    Returns:
+        Configured StateBackend
+    
+    Raises:
+        ValueError: When the backend name is unknown
+    """
+    backend_name = (backend_name or settings.STATE_BACKEND).lower()
+    
+    if backend_name == "memory":
+        return InMemoryStateBackend()
+    if backend_name == "redis":
+        return RedisStateBackend(settings.REDIS_URL)
+    if backend_name == "sqlite":
+        return SQLiteStateBackend(settings.STATE_SQLITE_PATH)
+    
+    raise ValueError(f"Unknown state backend: {backend_name}")
@@ -0,0 +1,32 @@
+"""
+Custom stream events for LangGraph workflows.
+
+Nodes call emit_stream_event() to push progress to callers that run
+the workflow with stream_mode="custom" (e.g. NewsWorkflow.execute_stream).
+Outside a streaming run the call is a no-op, so nodes behave the same
+under ainvoke() and when called directly in tests.
+"""
+from typing import Dict, Any
+
+
+def emit_stream_event(event: Dict[str, Any]) -> None:
+    """
+    Emit a custom event to the current LangGraph stream, if any.
+    
+    Args:
+        event: JSON-serializable event payload with a "type" key
+    """
+    try:
+        # Imported here so nodes import without langgraph.config available
+        # (e.g. when app/ is on sys.path and app/langgraph shadows the library)
+        from langgraph.config import get_stream_writer
+        writer = get_stream_writer()
+    except Exception:
+        # Not running inside a graph (direct node call)
+        return
+    
+    try:
+        writer(event)
+    except Exception:
+        # Streaming is best effort and must never fail a node
+        pass
@@ -0,0 +1,228 @@
+"""
+Cached per-article summaries.
+
+Summaries are keyed on (content_hash, provider, prompt_version), so the
+same syndicated article is summarized once per provider and prompt
+template, whichever session or topic surfaces it. Lookups check an
+in-process LRU first, then fetch all remaining keys from the
+article_summary_cache table in one query. New summaries go into the LRU
+immediately and are written to the table by a write-behind queue when
+its worker is running, or inline otherwise.
+
+Cache failures never fail summarization; they degrade to calling the
+provider.
+"""
+import logging
+from collections import OrderedDict
+from typing import Dict, Any, List, Optional, Tuple
+
+from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert
+
+from app.langgraph.utils.write_behind import WriteBehindQueue
+from app.core.config import settings
+from app.core.database import AsyncSessionLocal
+from app.models.article_summary import ArticleSummary
+
+logger = logging.getLogger(__name__)
+
+SummaryKey = Tuple[str, str, str]
+
+
+class SummaryCache:
+    """Two-tier (LRU and Postgres) cache of article summaries."""
+    
+    def __init__(self, max_entries: Optional[int] = None):
+        """
+        Initialize the cache.
+        
+        Args:
+            max_entries: In-process LRU size. Defaults to SUMMARY_CACHE_MAX_ENTRIES.
+        """
+        self._cache: "OrderedDict[SummaryKey, str]" = OrderedDict()
+        self._max_entries = max_entries or settings.SUMMARY_CACHE_MAX_ENTRIES
+        self._queue = WriteBehindQueue(
+            name="article_summary_cache",
+            handler=self._save_to_db,
+            max_size=settings.WRITE_BEHIND_MAX_SIZE,
+            batch_size=settings.WRITE_BEHIND_BATCH_SIZE,
+            flush_interval=settings.WRITE_BEHIND_FLUSH_INTERVAL,
+            max_retries=settings.WRITE_BEHIND_MAX_RETRIES
+        )
+        self._stats = {
+            "memory_hits": 0,
+            "db_hits": 0,
+            "misses": 0,
+            "stored": 0
+        }
+    
+    async def get_many(
+        self,
+        content_hashes: List[str],
+        provider: str,
+        prompt_version: str
+    ) -> Dict[str, str]:
+        """
+        Look up summaries for several articles at once.
+        
+        Args:
+            content_hashes: Article content hashes
+            provider: LLM provider the summaries must come from
+            prompt_version: Summarization prompt template version
+        
+        Returns:
+            Summaries by content hash for the articles found in the cache
+        """
+        found: Dict[str, str] = {}
+        missing: List[str] = []
+        
+        for content_hash in dict.fromkeys(content_hashes):
+            key = (content_hash, provider, prompt_version)
+            summary = self._cache.get(key)
+            
+            if summary is not None:
+                self._cache.move_to_end(key)
+                found[content_hash] = summary
+            else:
+                missing.append(content_hash)
+        
+        self._stats["memory_hits"] += len(found)
+        
+        if missing:
+            loaded = await self._load_from_db(missing, provider, prompt_version)
+            
+            for content_hash, summary in loaded.items():
+                self._remember((content_hash, provider, prompt_version), summary)
+            
+            found.update(loaded)
+            self._stats["db_hits"] += len(loaded)
+            self._stats["misses"] += len(missing) - len(loaded)
+        
+        return found
+    
+    async def put_many(
+        self,
+        summaries: Dict[str, str],
+        provider: str,
+        prompt_version: str
+    ) -> None:
+        """
+        Store generated summaries.
+        
+        Args:
+            summaries: Summaries by content hash
+            provider: LLM provider that generated the summaries
+            prompt_version: Summarization prompt template version
+        """
+        rows = []
+        
+        for content_hash, summary in summaries.items():
+            if not content_hash or not summary:
+                continue
+            
+            self._remember((content_hash, provider, prompt_version), summary)
+            rows.append({
+                "content_hash": content_hash,
+                "provider": provider,
+                "prompt_version": prompt_version,
+                "summary": summary
+            })
+        
+        if not rows:
+            return
+        
+        self._stats["stored"] += len(rows)
+        
+        if self._queue.running:
+            await self._queue.put_many(rows)
+            return
+        
+        try:
+            await self._save_to_db(rows)
+        except Exception as e:
+            logger.warning(f"Failed to persist article summaries: {e}")
+    
+    async def _load_from_db(
+        self,
+        content_hashes: List[str],
+        provider: str,
+        prompt_version: str
+    ) -> Dict[str, str]:
+        """Load summaries for several content hashes in one query."""
+        try:
+            async with AsyncSessionLocal() as db_session:
+                result = await db_session.execute(
+                    select(ArticleSummary.content_hash, ArticleSummary.summary).where(
+                        ArticleSummary.content_hash.in_(content_hashes),
+                        ArticleSummary.provider == provider,
+                        ArticleSummary.prompt_version == prompt_version
+                    )
+                )
+                return {row.content_hash: row.summary for row in result}
+        
+        except Exception as e:
+            # Durable cache is an optimization only
+            logger.warning(f"Summary cache lookup failed: {e}")
+            return {}
+    
+    async def _save_to_db(self, rows: List[Dict[str, Any]]) -> None:
+        """Insert summary rows, keeping any summary already stored for a key."""
+        unique_rows = {}
+        for row in rows:
+            unique_rows.setdefault((row["content_hash"], row["provider"], row["prompt_version"]), row)
+        
+        async with AsyncSessionLocal() as db_session:
+            await db_session.execute(
+                insert(ArticleSummary)
+                .values(list(unique_rows.values()))
+                .on_conflict_do_nothing(index_elements=["content_hash", "provider", "prompt_version"])
+            )
+            await db_session.commit()
+    
+    def _remember(self, key: SummaryKey, summary: str) -> None:
+        """Add a summary to the in-process LRU."""
+        self._cache[key] = summary
+        self._cache.move_to_end(key)
+        
+        while len(self._cache) > self._max_entries:
+            self._cache.popitem(last=False)
+    
+    async def start(self) -> None:
+        """Start writing summaries to the database in the background."""
+        await self._queue.start()
+    
+    async def close(self) -> None:
+        """Write out queued summaries and stop the background writer."""
+        await self._queue.stop(timeout=settings.WRITE_BEHIND_SHUTDOWN_TIMEOUT)
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """Get cache statistics."""
+        lookups = self._stats["memory_hits"] + self._stats["db_hits"] + self._stats["misses"]
+        hits = self._stats["memory_hits"] + self._stats["db_hits"]
+        
+        return {
+            **self._stats,
+            "hit_rate": round(hits / lookups, 3) if lookups else None,
+            "cached_summaries": len(self._cache),
+            "write_behind": self._queue.get_stats()
+        }
+
+
+# Global instance
+_summary_cache = None
+
+
+def get_summary_cache() -> SummaryCache:
+    """Get singleton instance of the article summary cache."""
+    global _summary_cache
+    
+    if _summary_cache is None:
+        _summary_cache = SummaryCache()
+    
+    return _summary_cache
+
+
+async def close_summary_cache() -> None:
+    """Flush and stop the summary cache's background writer if it was created."""
+    if _summary_cache is not None:
+        await _summary_cache.close()
@@ -0,0 +1,67 @@
+"""
+Topic configuration lookup shared by the fetch and filter nodes.
+"""
+from typing import Dict, Any, Optional
+from sqlalchemy import select
+
+from app.langgraph.utils.error_handlers import DatabaseError
+from app.core.database import AsyncSessionLocal
+from app.models.topic_config import TopicConfig
+
+# Configured topics matched when a requested topic contains their name
+COMMON_TOPICS = ["ai", "finance", "healthcare", "technology", "business"]
+
+
+def topic_config_to_dict(topic_config: TopicConfig) -> Dict[str, Any]:
+    """Convert a TopicConfig row to the dict format used by workflow nodes."""
+    return {
+        "topicName": topic_config.topic_name,
+        "keywords": topic_config.keywords,
+        "trustedSources": topic_config.trusted_sources,
+        "priorityWeight": topic_config.priority_weight
+    }
+
+
+async def load_topic_config(topic: str) -> Optional[Dict[str, Any]]:
+    """
+    Load the configuration for a topic.
+    
+    Tries an exact (case-insensitive) match first, then the first common
+    topic contained in the requested topic. Callers can compare the
+    returned "topicName" with the topic to tell the two apart.
+    
+    Args:
+        topic: Requested news topic
+    
+    Returns:
+        Topic configuration dictionary, or None if no configuration matches
+    
+    Raises:
+        DatabaseError: When the lookup fails
+    """
+    try:
+        async with AsyncSessionLocal() as db_session:
+            # Try to find exact match first
+            result = await db_session.execute(
+                select(TopicConfig).where(TopicConfig.topic_name == topic.lower())
+            )
+            topic_config = result.scalar_one_or_none()
+            
+            if topic_config:
+                return topic_config_to_dict(topic_config)
+            
+            # Try partial matches for common topics
+            for common_topic in COMMON_TOPICS:
+                if common_topic in topic.lower():
+                    result = await db_session.execute(
+                        select(TopicConfig).where(TopicConfig.topic_name == common_topic)
+                    )
+                    topic_config = result.scalar_one_or_none()
+                    
+                    if topic_config:
+                        return topic_config_to_dict(topic_config)
+            
+            return None
+    
+    except Exception as e:
+        raise DatabaseError("topic_config_load", str(e))
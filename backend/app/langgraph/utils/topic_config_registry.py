@@ -0,0 +1,258 @@
+"""
+In-process registry of topic configurations.
+
+All topic_configs rows are loaded at startup and indexed by topic name,
+so workflow nodes resolve a topic without a database round trip. A
+background task polls a cheap version query (row count and latest
+updated_at) and reloads the registry when it changes; the admin API can
+force a reload after out-of-band edits. Until the first load succeeds,
+lookups fall back to querying the database directly.
+"""
+import asyncio
+import logging
+import time
+from typing import Dict, Any, List, Optional, Tuple
+from sqlalchemy import select, func
+
+from app.core.config import settings
+from app.core.database import AsyncSessionLocal
+from app.models.topic_config import TopicConfig
+from app.langgraph.utils.keyword_matcher import get_keyword_matcher
+from app.langgraph.utils.topic_config_loader import (
+    COMMON_TOPICS,
+    topic_config_to_dict,
+    load_topic_config
+)
+
+logger = logging.getLogger(__name__)
+
+
+class TopicConfigRegistry:
+    """
+    Topic configurations indexed for exact and partial topic matching.
+    
+    Matching follows load_topic_config: an exact (case-insensitive) topic
+    name first, then the first common topic contained in the requested
+    topic. The partial index keeps only the common topics that have a
+    configuration, in COMMON_TOPICS order.
+    """
+    
+    def __init__(self):
+        """Initialize an empty (not yet loaded) registry."""
+        self._exact: Dict[str, Dict[str, Any]] = {}
+        self._partial: Tuple[Tuple[str, Dict[str, Any]], ...] = ()
+        self._version: Optional[Tuple[int, Any]] = None
+        self._loaded = False
+        self._lock = asyncio.Lock()
+        
+        # Background version polling
+        self._poll_task: Optional[asyncio.Task] = None
+        self._reloads = 0
+        self._last_reload_at: Optional[float] = None
+        self._last_reload_duration: Optional[float] = None
+    
+    @property
+    def loaded(self) -> bool:
+        """Whether the registry holds a successful load."""
+        return self._loaded
+    
+    async def _fetch_version(self, db_session) -> Tuple[int, Any]:
+        """Get the (row count, latest updated_at) version of topic_configs."""
+        result = await db_session.execute(
+            select(func.count(TopicConfig.id), func.max(TopicConfig.updated_at))
+        )
+        count, updated_at = result.one()
+        return count, updated_at
+    
+    async def _current_version(self) -> Tuple[int, Any]:
+        """Read the topic_configs version."""
+        async with AsyncSessionLocal() as db_session:
+            return await self._fetch_version(db_session)
+    
+    async def _load_configs(self) -> Tuple[Tuple[int, Any], List[Dict[str, Any]]]:
+        """Read the topic_configs version and all configurations."""
+        async with AsyncSessionLocal() as db_session:
+            version = await self._fetch_version(db_session)
+            result = await db_session.execute(select(TopicConfig))
+            return version, [topic_config_to_dict(row) for row in result.scalars().all()]
+    
+    async def reload(self) -> int:
+        """
+        Load all topic configurations and swap in new indexes.
+        
+        Keyword matchers for every configuration are compiled here so the
+        first request for a topic does not pay for it.
+        
+        Returns:
+            Number of topic configurations loaded
+        """
+        async with self._lock:
+            start_time = time.perf_counter()
+            
+            version, configs = await self._load_configs()
+            
+            exact = {config["topicName"].lower(): config for config in configs}
+            partial = tuple(
+                (common_topic, exact[common_topic])
+                for common_topic in COMMON_TOPICS
+                if common_topic in exact
+            )
+            
+            for config in configs:
+                if config["keywords"]:
+                    get_keyword_matcher(config["keywords"])
+            
+            # Swap both indexes at once; lookups never see a partial reload
+            self._exact, self._partial = exact, partial
+            self._version = version
+            self._loaded = True
+            
+            self._reloads += 1
+            self._last_reload_at = time.time()
+            self._last_reload_duration = time.perf_counter() - start_time
+            
+            return len(configs)
+    
+    async def refresh_if_changed(self) -> bool:
+        """
+        Reload the registry if the topic_configs version changed.
+        
+        Returns:
+            True if the registry was reloaded
+        """
+        version = await self._current_version()
+        
+        if self._loaded and version == self._version:
+            return False
+        
+        await self.reload()
+        return True
+    
+    def lookup(self, topic: str) -> Optional[Dict[str, Any]]:
+        """
+        Resolve a topic from the in-memory indexes.
+        
+        Args:
+            topic: Requested news topic
+        
+        Returns:
+            Topic configuration dictionary, or None if no configuration matches
+        """
+        topic_lower = topic.lower()
+        
+        config = self._exact.get(topic_lower)
+        if config is not None:
+            return config
+        
+        for common_topic, config in self._partial:
+            if common_topic in topic_lower:
+                return config
+        
+        return None
+    
+    async def get(self, topic: str) -> Optional[Dict[str, Any]]:
+        """
+        Resolve a topic, querying the database until the registry is loaded.
+        
+        Args:
+            topic: Requested news topic
+        
+        Returns:
+            Topic configuration dictionary, or None if no configuration matches
+        
+        Raises:
+            DatabaseError: When the registry is not loaded and the lookup fails
+        """
+        if self._loaded:
+            return self.lookup(topic)
+        
+        return await load_topic_config(topic)
+    
+    async def _poll_loop(self, interval: float) -> None:
+        """Check the topic_configs version every interval seconds."""
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                if await self.refresh_if_changed():
+                    logger.info(f"Reloaded {len(self._exact)} topic configs in {self._last_reload_duration:.3f}s")
+            except Exception as e:
+                logger.warning(f"Topic config version check failed: {e}")
+    
+    async def start(self, interval: Optional[float] = None) -> None:
+        """
+        Load the registry and start version polling.
+        
+        A failed initial load is logged, not raised; lookups query the
+        database until a later poll loads the registry.
+        
+        Args:
+            interval: Seconds between version checks. Defaults to TOPIC_CONFIG_POLL_INTERVAL.
+        """
+        try:
+            count = await self.reload()
+            logger.info(f"Loaded {count} topic configs into registry")
+        except Exception as e:
+            logger.warning(f"Topic config registry load failed, querying database per request: {e}")
+        
+        interval = interval or settings.TOPIC_CONFIG_POLL_INTERVAL
+        if interval > 0 and (self._poll_task is None or self._poll_task.done()):
+            self._poll_task = asyncio.create_task(self._poll_loop(interval))
+    
+    async def stop(self) -> None:
+        """Stop version polling."""
+        if self._poll_task is not None:
+            self._poll_task.cancel()
+            try:
+                await self._poll_task
+            except asyncio.CancelledError:
+                pass
+            self._poll_task = None
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """Get registry statistics."""
+        return {
+            "loaded": self._loaded,
+            "topics": len(self._exact),
+            "reloads": self._reloads,
+            "last_reload_at": self._last_reload_at,
+            "last_reload_duration": self._last_reload_duration
+        }
+
+
+# Global instance
+_topic_config_registry = None
+
+
+def get_topic_config_registry() -> TopicConfigRegistry:
+    """Get singleton instance of the topic config registry."""
+    global _topic_config_registry
+    
+    if _topic_config_registry is None:
+        _topic_config_registry = TopicConfigRegistry()
+    
+    return _topic_config_registry
+
+
+async def close_topic_config_registry() -> None:
+    """Stop the topic config registry's polling if it was created."""
+    global _topic_config_registry
+    
+    if _topic_config_registry is not None:
+        await _topic_config_registry.stop()
+        _topic_config_registry = None
+
+
+async def get_topic_config(topic: str) -> Optional[Dict[str, Any]]:
+    """
+    Get the configuration for a topic from the registry.
+    
+    Args:
+        topic: Requested news topic
+    
+    Returns:
+        Topic configuration dictionary, or None if no configuration matches
+    
+    Raises:
+        DatabaseError: When the registry is not loaded and the lookup fails
+    """
+    return await get_topic_config_registry().get(topic)
@@ -0,0 +1,204 @@
+"""
+Cached URL shortening for X posts.
+
+Lookups go through three tiers:
+1. In-process LRU of recently shortened URLs
+2. Durable short_urls table shared by all workers
+3. TinyURL API, de-duplicated with single-flight so concurrent
+   requests for the same URL make one upstream call
+
+The TinyURL calls share one app-scoped aiohttp session, which is
+closed in the application lifespan.
+"""
+import hashlib
+import logging
+from collections import OrderedDict
+from typing import Dict, Any, Optional
+
+import aiohttp
+from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert
+
+from app.langgraph.utils.single_flight import SingleFlight
+from app.core.config import settings
+from app.core.database import AsyncSessionLocal
+from app.models.short_url import ShortUrl
+
+logger = logging.getLogger(__name__)
+
+
+class UrlShortener:
+    """
+    Two-tier cache in front of the TinyURL API.
+    
+    Failed shortenings are not cached, so callers fall back to the
+    original URL and a later request retries upstream.
+    """
+    
+    TINYURL_API_URL = "https://api.tinyurl.com/create"
+    
+    def __init__(self, max_entries: Optional[int] = None):
+        """
+        Initialize the shortener.
+        
+        Args:
+            max_entries: In-process LRU size. Defaults to URL_SHORTENER_CACHE_SIZE.
+        """
+        self._cache: "OrderedDict[str, str]" = OrderedDict()
+        self._max_entries = max_entries or settings.URL_SHORTENER_CACHE_SIZE
+        self._single_flight = SingleFlight()
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._stats = {
+            "memory_hits": 0,
+            "db_hits": 0,
+            "upstream_calls": 0,
+            "upstream_failures": 0
+        }
+    
+    async def shorten(self, url: str) -> Optional[str]:
+        """
+        Get the short URL for a long URL.
+        
+        Args:
+            url: Original URL to shorten
+        
+        Returns:
+            Shortened URL or None if shortening failed
+        """
+        short_url = self._cache.get(url)
+        if short_url is not None:
+            self._cache.move_to_end(url)
+            self._stats["memory_hits"] += 1
+            return short_url
+        
+        short_url = await self._single_flight.do(url, lambda: self._shorten_uncached(url))
+        if short_url:
+            self._remember(url, short_url)
+        
+        return short_url
+    
+    async def _shorten_uncached(self, url: str) -> Optional[str]:
+        """Look up the durable cache, then call TinyURL and persist the result."""
+        url_hash = hashlib.sha256(url.encode()).hexdigest()
+        
+        short_url = await self._load_from_db(url_hash)
+        if short_url:
+            self._stats["db_hits"] += 1
+            return short_url
+        
+        short_url = await self._call_tinyurl(url)
+        if short_url:
+            await self._save_to_db(url_hash, url, short_url)
+        
+        return short_url
+    
+    async def _load_from_db(self, url_hash: str) -> Optional[str]:
+        """Load a short URL from the short_urls table."""
+        try:
+            async with AsyncSessionLocal() as db_session:
+                result = await db_session.execute(
+                    select(ShortUrl.short_url).where(ShortUrl.url_hash == url_hash)
+                )
+                return result.scalar_one_or_none()
+        
+        except Exception as e:
+            # Durable cache is an optimization only
+            logger.warning(f"Short URL lookup failed: {e}")
+            return None
+    
+    async def _save_to_db(self, url_hash: str, url: str, short_url: str) -> None:
+        """Persist a short URL, ignoring rows another worker already wrote."""
+        try:
+            async with AsyncSessionLocal() as db_session:
+                await db_session.execute(
+                    insert(ShortUrl)
+                    .values(url_hash=url_hash, long_url=url, short_url=short_url)
+                    .on_conflict_do_nothing(index_elements=["url_hash"])
+                )
+                await db_session.commit()
+        
+        except Exception as e:
+            logger.warning(f"Failed to persist short URL: {e}")
+    
+    async def _call_tinyurl(self, url: str) -> Optional[str]:
+        """Shorten a URL with the TinyURL API."""
+        self._stats["upstream_calls"] += 1
+        
+        headers = {
+            "Authorization": f"Bearer {settings.TINYURL_API_KEY}",
+            "Content-Type": "application/json"
+        }
+        
+        data = {
+            "url": url,
+            "domain": "tinyurl.com"
+        }
+        
+        try:
+            async with self._get_session().post(
+                self.TINYURL_API_URL,
+                headers=headers,
+                json=data,
+                timeout=aiohttp.ClientTimeout(total=5)
+            ) as response:
+                if response.status == 200:
+                    result = await response.json()
+                    return result.get("data", {}).get("tiny_url")
+                
+                self._stats["upstream_failures"] += 1
+                logger.warning(f"TinyURL API returned status {response.status} for {url}")
+                return None
+        
+        except Exception as e:
+            self._stats["upstream_failures"] += 1
+            logger.warning(f"TinyURL request failed for {url}: {e}")
+            return None
+    
+    def _get_session(self) -> aiohttp.ClientSession:
+        """Get the shared aiohttp session, creating it on first use."""
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession()
+        
+        return self._session
+    
+    def _remember(self, url: str, short_url: str) -> None:
+        """Add a short URL to the in-process LRU."""
+        self._cache[url] = short_url
+        self._cache.move_to_end(url)
+        
+        while len(self._cache) > self._max_entries:
+            self._cache.popitem(last=False)
+    
+    async def close(self) -> None:
+        """Close the shared aiohttp session."""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """Get shortener statistics."""
+        return {
+            **self._stats,
+            "cached_urls": len(self._cache),
+            "shared_calls": self._single_flight.shared_calls
+        }
+
+
+# Global instance
+_url_shortener = None
+
+
+def get_url_shortener() -> UrlShortener:
+    """Get singleton instance of the URL shortener."""
+    global _url_shortener
+    
+    if _url_shortener is None:
+        _url_shortener = UrlShortener()
+    
+    return _url_shortener
+
+
+async def close_url_shortener() -> None:
+    """Close the URL shortener's session if it was created."""
+    if _url_shortener is not None:
+        await _url_shortener.close()
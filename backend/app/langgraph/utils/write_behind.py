@@ -0,0 +1,201 @@
+"""
+Bounded write-behind queue for database writes off the request path.
+
+Producers enqueue rows and return immediately; a worker task started in
+the application lifespan drains the queue in batches and hands each
+batch to a write handler. The queue is bounded: when it is full, put()
+waits for the worker (backpressure) and the wait is recorded in the
+queue's statistics. stop() drains what is left before shutdown.
+"""
+import asyncio
+import logging
+import time
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+BatchHandler = Callable[[List[Any]], Awaitable[Any]]
+DropHandler = Callable[[List[Any]], None]
+
+
+class WriteBehindQueue:
+    """
+    asyncio.Queue drained in batches by a background worker.
+    
+    The worker waits for a first item, then collects more until the
+    batch is full or flush_interval has passed. A failed batch is
+    retried after flush_interval; with max_retries set it is dropped
+    (counted, and passed to on_drop) once the retries are used up,
+    otherwise it is retried until it succeeds while new items queue up
+    behind it.
+    """
+    
+    def __init__(
+        self,
+        name: str,
+        handler: BatchHandler,
+        max_size: int,
+        batch_size: int,
+        flush_interval: float,
+        max_retries: Optional[int] = None,
+        on_drop: Optional[DropHandler] = None
+    ):
+        """
+        Initialize the queue.
+        
+        Args:
+            name: Queue name for logs and statistics
+            handler: Coroutine function writing one batch of items
+            max_size: Maximum number of queued items
+            batch_size: Maximum number of items per handler call
+            flush_interval: Seconds to collect a batch, and between retries
+            max_retries: Retries before a failed batch is dropped (None retries forever)
+            on_drop: Called with each dropped batch
+        """
+        self.name = name
+        self._handler = handler
+        self._queue: asyncio.Queue = asyncio.Queue(maxsize=max_size)
+        self._batch_size = batch_size
+        self._flush_interval = flush_interval
+        self._max_retries = max_retries
+        self._on_drop = on_drop
+        self._worker_task: Optional[asyncio.Task] = None
+        
+        self._stats = {
+            "enqueued": 0,
+            "written": 0,
+            "batches": 0,
+            "failed_batches": 0,
+            "dropped": 0,
+            "blocked_puts": 0,
+            "blocked_seconds": 0.0,
+            "high_watermark": 0
+        }
+        self._last_flush_duration: Optional[float] = None
+    
+    @property
+    def running(self) -> bool:
+        """Whether the worker task is draining the queue."""
+        return self._worker_task is not None and not self._worker_task.done()
+    
+    async def put(self, item: Any) -> None:
+        """
+        Enqueue an item, waiting for free capacity when the queue is full.
+        
+        Args:
+            item: Item passed to the handler in a later batch
+        """
+        if self._queue.full():
+            self._stats["blocked_puts"] += 1
+            start_time = time.perf_counter()
+            await self._queue.put(item)
+            self._stats["blocked_seconds"] += time.perf_counter() - start_time
+        else:
+            self._queue.put_nowait(item)
+        
+        self._stats["enqueued"] += 1
+        self._stats["high_watermark"] = max(self._stats["high_watermark"], self._queue.qsize())
+    
+    async def put_many(self, items: List[Any]) -> None:
+        """Enqueue several items in order."""
+        for item in items:
+            await self.put(item)
+    
+    async def _collect_batch(self) -> List[Any]:
+        """Wait for an item, then gather more until the batch is full or the interval passes."""
+        batch = [await self._queue.get()]
+        deadline = time.monotonic() + self._flush_interval
+        
+        while len(batch) < self._batch_size:
+            if not self._queue.empty():
+                batch.append(self._queue.get_nowait())
+                continue
+            
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            
+            try:
+                batch.append(await asyncio.wait_for(self._queue.get(), timeout=remaining))
+            except asyncio.TimeoutError:
+                break
+        
+        return batch
+    
+    async def _write_batch(self, batch: List[Any]) -> None:
+        """Hand a batch to the handler, retrying failures."""
+        attempt = 0
+        
+        while True:
+            start_time = time.perf_counter()
+            try:
+                await self._handler(batch)
+                self._last_flush_duration = time.perf_counter() - start_time
+                self._stats["written"] += len(batch)
+                self._stats["batches"] += 1
+                return
+            
+            except asyncio.CancelledError:
+                raise
+            
+            except Exception as e:
+                self._stats["failed_batches"] += 1
+                attempt += 1
+                
+                if self._max_retries is not None and attempt > self._max_retries:
+                    self._stats["dropped"] += len(batch)
+                    logger.error(f"Write-behind queue '{self.name}' dropped {len(batch)} items after {attempt} attempts: {e}")
+                    if self._on_drop is not None:
+                        self._on_drop(batch)
+                    return
+                
+                logger.warning(f"Write-behind queue '{self.name}' batch of {len(batch)} failed, retrying: {e}")
+                await asyncio.sleep(self._flush_interval)
+    
+    async def _worker(self) -> None:
+        """Drain the queue batch by batch."""
+        while True:
+            batch = await self._collect_batch()
+            try:
+                await self._write_batch(batch)
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+    
+    async def start(self) -> None:
+        """Start the background worker."""
+        if not self.running:
+            self._worker_task = asyncio.create_task(self._worker())
+    
+    async def stop(self, timeout: float = 10.0) -> None:
+        """
+        Drain queued items and stop the worker.
+        
+        Args:
+            timeout: Seconds to wait for the queue to drain before giving up
+        """
+        if self._worker_task is None:
+            return
+        
+        if self.running:
+            try:
+                await asyncio.wait_for(self._queue.join(), timeout=timeout)
+            except asyncio.TimeoutError:
+                logger.error(f"Write-behind queue '{self.name}' stopped with {self._queue.qsize()} unwritten items")
+        
+        self._worker_task.cancel()
+        try:
+            await self._worker_task
+        except asyncio.CancelledError:
+            pass
+        self._worker_task = None
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """Get queue statistics."""
+        return {
+            "running": self.running,
+            "pending": self._queue.qsize(),
+            "max_size": self._queue.maxsize,
+            "last_flush_duration": self._last_flush_duration,
+            **self._stats
+        }
@@ -8,17 +8,21 @@ This workflow follows LangGraph best practices:
 - Modular node composition
 """
 import uuid
-from typing import Dict, Any
+from typing import Dict, Any, AsyncIterator
 from langgraph.graph import StateGraph, START, END
 
 from app.langgraph.state.news_state import NewsState, create_initial_state
 from app.langgraph.nodes.validate_input_node import ValidateInputNode
 from app.langgraph.nodes.check_quota_node import CheckQuotaNode
+from app.langgraph.nodes.check_cache_node import CheckCacheNode
+from app.langgraph.nodes.coalesce_request_node import CoalesceRequestNode
 from app.langgraph.nodes.fetch_news_node import FetchNewsNode
 from app.langgraph.nodes.filter_articles_node import FilterArticlesNode
 from app.langgraph.nodes.summarize_content_node import SummarizeContentNode
 from app.langgraph.nodes.save_results_node import SaveResultsNode
 from app.langgraph.utils.logging_config import StructuredLogger
+from app.langgraph.utils.request_coalescer import get_request_coalescer
+from app.core.http_client import get_serper_client
 
 
 class NewsWorkflow:
@@ -28,11 +32,14 @@ class NewsWorkflow:
     Workflow Steps:
     1. START -> validate_input: Validate all input parameters
     2. validate_input -> check_quota: Check user quotas and duplicates
-    3. check_quota -> fetch_news (if quota available) or END (if quota exceeded)
-    4. fetch_news -> filter_articles: Filter and rank articles
-    5. filter_articles -> summarize_content: Generate AI summaries
-    6. summarize_content -> save_results: Cache results and finalize
-    7. save_results -> END: Complete workflow
+    3. check_quota -> check_cache (if quota available) or END (if quota exceeded)
+    4. check_cache -> save_results (cache hit) or coalesce_request (cache miss)
+    5. coalesce_request -> save_results (shared from an identical in-flight
+       request) or fetch_news (this workflow leads)
+    6. fetch_news -> filter_articles: Filter and rank articles
+    7. filter_articles -> summarize_content: Generate AI summaries
+    8. summarize_content -> save_results: Cache results and finalize
+    9. save_results -> END: Complete workflow
     
     This workflow implements proper error handling, conditional
     flow control, and comprehensive state management.
@@ -56,7 +63,9 @@ class NewsWorkflow:
         # Add all nodes
         workflow.add_node("validate_input", ValidateInputNode())
         workflow.add_node("check_quota", CheckQuotaNode())
-        workflow.add_node("fetch_news", FetchNewsNode())
+        workflow.add_node("check_cache", CheckCacheNode())
+        workflow.add_node("coalesce_request", CoalesceRequestNode())
+        workflow.add_node("fetch_news", FetchNewsNode(http_client=get_serper_client()))
         workflow.add_node("filter_articles", FilterArticlesNode())
         workflow.add_node("summarize_content", SummarizeContentNode())
         workflow.add_node("save_results", SaveResultsNode())
@@ -86,11 +95,31 @@ class NewsWorkflow:
             "check_quota",
             self._should_continue_after_quota,
             {
-                "continue": "fetch_news",
+                "continue": "check_cache",
                 "end": END
             }
         )
         
+        # Conditional edge after cache lookup
+        workflow.add_conditional_edges(
+            "check_cache",
+            self._should_fetch_after_cache,
+            {
+                "fetch": "coalesce_request",
+                "cached": "save_results"
+            }
+        )
+        
+        # Conditional edge after joining identical in-flight requests
+        workflow.add_conditional_edges(
+            "coalesce_request",
+            self._should_fetch_after_coalesce,
+            {
+                "fetch": "fetch_news",
+                "coalesced": "save_results"
+            }
+        )
+        
         # Continue linear flow
         workflow.add_edge("fetch_news", "filter_articles")
         workflow.add_edge("filter_articles", "summarize_content")
@@ -118,6 +147,36 @@ class NewsWorkflow:
         else:
             return "end"
     
+    def _should_fetch_after_cache(self, state: NewsState) -> str:
+        """
+        Determine if workflow needs to fetch fresh articles after cache lookup.
+        
+        Args:
+            state: Current workflow state
+            
+        Returns:
+            "cached" if articles were served from cache, "fetch" otherwise
+        """
+        if state.get("cache_hit") and state.get("summarized_articles"):
+            return "cached"
+        
+        return "fetch"
+    
+    def _should_fetch_after_coalesce(self, state: NewsState) -> str:
+        """
+        Determine if workflow needs to fetch articles after request coalescing.
+        
+        Args:
+            state: Current workflow state
+            
+        Returns:
+            "coalesced" if articles were shared by a leader, "fetch" otherwise
+        """
+        if state.get("coalesced") and state.get("summarized_articles"):
+            return "coalesced"
+        
+        return "fetch"
+    
     async def execute(
         self,
         topic: str,
@@ -204,6 +263,162 @@ class NewsWorkflow:
             )
             
             raise
+        
+        finally:
+            # Release a coalescing key this workflow led but never resolved
+            get_request_coalescer().release(workflow_id)
+    
+    async def execute_stream(
+        self,
+        topic: str,
+        date: str,
+        top_n: int,
+        llm_model: str,
+        session_id: str
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Execute the news processing workflow, yielding progress events.
+        
+        Runs the graph with astream() and yields:
+        - {"type": "step", "step": {...}} for each processing step as its node finishes
+        - {"type": "article", "index": i, "article": {...}} once per article, as
+          its summary is ready; snippet fallbacks follow once summarization ends
+        - {"type": "complete", "result": {...}} with the same payload as execute_news_workflow
+        
+        Args:
+            topic: News topic to search for
+            date: Date in YYYY-MM-DD format
+            top_n: Number of articles to fetch (1-12)
+            llm_model: LLM model to use for summarization
+            session_id: User session identifier
+            
+        Yields:
+            Stream events in workflow order
+            
+        Raises:
+            Various workflow errors depending on failure point
+        """
+        workflow_id = str(uuid.uuid4())
+        
+        self.logger.log_processing_step(
+            session_id=session_id,
+            workflow_id=workflow_id,
+            step="workflow_start",
+            message="Starting streaming news processing workflow",
+            extra_data={
+                "topic": topic,
+                "date": date,
+                "top_n": top_n,
+                "llm_model": llm_model
+            }
+        )
+        
+        try:
+            initial_state = create_initial_state(
+                topic=topic,
+                date=date,
+                top_n=top_n,
+                llm_model=llm_model,
+                session_id=session_id,
+                workflow_id=workflow_id
+            )
+            
+            final_state = dict(initial_state)
+            steps_emitted = len(initial_state["processing_steps"])
+            articles_emitted = set()
+            
+            async for mode, chunk in self.workflow.astream(
+                initial_state,
+                stream_mode=["updates", "custom"]
+            ):
+                if mode == "custom":
+                    if chunk.get("type") == "article":
+                        articles_emitted.add(chunk["index"])
+                    yield chunk
+                    continue
+                
+                # Nodes return the full state, so each update replaces it
+                for update in chunk.values():
+                    if update:
+                        final_state.update(update)
+                
+                processing_steps = final_state.get("processing_steps", [])
+                for step in processing_steps[steps_emitted:]:
+                    yield {"type": "step", "step": _serialize_step(step)}
+                steps_emitted = len(processing_steps)
+                
+                # Articles that did not stream from summarization (cache hits, snippet fallbacks)
+                for index, article in enumerate(final_state.get("summarized_articles") or []):
+                    if index not in articles_emitted:
+                        articles_emitted.add(index)
+                        yield {"type": "article", "index": index, "article": article}
+            
+            self.logger.log_processing_step(
+                session_id=session_id,
+                workflow_id=workflow_id,
+                step="workflow_complete",
+                message="Streaming news processing workflow completed successfully",
+                extra_data={
+                    "processing_time": final_state.get("processing_time"),
+                    "articles_processed": len(final_state.get("summarized_articles", [])),
+                    "final_step": final_state.get("current_step")
+                }
+            )
+            
+            yield {"type": "complete", "result": format_news_result(final_state)}
+            
+        except Exception as e:
+            self.logger.log_error(
+                session_id=session_id,
+                workflow_id=workflow_id,
+                step="workflow_error",
+                error=e,
+                extra_data={
+                    "topic": topic,
+                    "date": date,
+                    "top_n": top_n,
+                    "llm_model": llm_model
+                }
+            )
+            
+            raise
+        
+        finally:
+            # Release a coalescing key this workflow led but never resolved
+            get_request_coalescer().release(workflow_id)
+
+
+def _serialize_step(step: Dict[str, Any]) -> Dict[str, Any]:
+    """Convert a ProcessingStep to a JSON-friendly dict."""
+    status = step.get("status")
+    return {
+        **step,
+        "status": getattr(status, "value", status)
+    }
+
+
+def format_news_result(final_state: NewsState) -> Dict[str, Any]:
+    """
+    Format a final workflow state for the API response.
+    
+    Args:
+        final_state: Final workflow state
+        
+    Returns:
+        Formatted workflow results
+    """
+    summarized_articles = final_state.get("summarized_articles", [])
+    quota_info = final_state.get("quota_info", {})
+    
+    return {
+        "articles": summarized_articles,
+        "total_found": final_state.get("total_found", len(summarized_articles)),
+        "processing_time": final_state.get("processing_time", 0.0),
+        "quota_remaining": quota_info.get("remaining", 0),
+        "workflow_id": final_state.get("workflow_id"),
+        "llm_provider_used": final_state.get("current_llm_provider"),
+        "cache_hit": final_state.get("cache_hit", False)
+    }
 
 
 # Global workflow instance
@@ -261,15 +476,4 @@ async def execute_news_workflow(
     )
     
     # Format results for API response
-    summarized_articles = final_state.get("summarized_articles", [])
-    quota_info = final_state.get("quota_info", {})
-    
-    return {
-        "articles": summarized_articles,
-        "total_found": final_state.get("total_found", len(summarized_articles)),
-        "processing_time": final_state.get("processing_time", 0.0),
-        "quota_remaining": quota_info.get("remaining", 0),
-        "workflow_id": final_state.get("workflow_id"),
-        "llm_provider_used": final_state.get("current_llm_provider"),
-        "cache_hit": final_state.get("cache_hit", False)
-    }
+    return format_news_result(final_state)
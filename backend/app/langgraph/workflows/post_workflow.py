@@ -2,10 +2,10 @@
 Post generation workflow composition using LangGraph.
 
 This workflow generates LinkedIn and X posts from news articles
-using serial processing to ensure proper state propagation.
+in parallel branches that join before the posts are saved.
 """
 import uuid
-from typing import Dict, Any, List
+from typing import Dict, Any, List, AsyncIterator
 from langgraph.graph import StateGraph, START, END
 
 from app.langgraph.state.post_state import PostState, create_initial_post_state
@@ -13,21 +13,23 @@ from app.langgraph.nodes.linkedin_post_node import LinkedInPostNode
 from app.langgraph.nodes.x_post_node import XPostNode
 from app.langgraph.nodes.save_posts_node import SavePostsNode
 from app.langgraph.utils.logging_config import StructuredLogger
-from app.langgraph.utils.error_handlers import NewsProcessingError
+from app.langgraph.utils.error_handlers import NewsProcessingError, DatabaseError
 
 
 class PostWorkflow:
     """
     Complete post generation workflow using LangGraph.
     
-    Workflow Steps (SERIAL EXECUTION):
-    1. START -> generate_linkedin_post: Generate LinkedIn post
-    2. generate_linkedin_post -> generate_x_post: Generate X (Twitter) post
-    3. generate_x_post -> save_posts: Save both posts to database
-    4. save_posts -> END: Complete workflow
+    Workflow Steps (PARALLEL GENERATION):
+    1. START -> generate_linkedin_post | generate_x_post: Generate LinkedIn
+       and X (Twitter) posts concurrently
+    2. [generate_linkedin_post, generate_x_post] -> save_posts: Save generated posts
+    3. save_posts -> END: Complete workflow
     
-    This workflow implements serial processing to ensure proper state
-    propagation, error handling, and comprehensive state management.
+    The two generators are independent LLM calls, so they fan out from
+    START and save_posts waits for both. PostState reducers merge the
+    parallel updates. If one platform fails, the other platform's post
+    is still saved and returned.
     """
     
     def __init__(self):
@@ -50,15 +52,12 @@ class PostWorkflow:
         workflow.add_node("generate_x_post", XPostNode())
         workflow.add_node("save_posts", SavePostsNode())
         
-        # Define workflow edges - SERIAL execution to ensure state propagation
-        # Start with LinkedIn post generation
+        # Define workflow edges - fan out to both generators in parallel
         workflow.add_edge(START, "generate_linkedin_post")
+        workflow.add_edge(START, "generate_x_post")
         
-        # Then generate X post
-        workflow.add_edge("generate_linkedin_post", "generate_x_post")
-        
-        # Finally save both posts
-        workflow.add_edge("generate_x_post", "save_posts")
+        # Fan in: save posts once both generators have finished
+        workflow.add_edge(["generate_linkedin_post", "generate_x_post"], "save_posts")
         
         # Save posts to END
         workflow.add_edge("save_posts", END)
@@ -238,9 +237,24 @@ class PostWorkflow:
                     context={"workflow_id": workflow_id, "session_id": session_id}
                 )
             
-            # Check if workflow completed successfully
+            # Check if workflow completed successfully. A failure in one
+            # generator is a partial success as long as the other post was saved.
             has_error = final_state.get("error_message") is not None
-            if has_error:
+            has_posts = bool(final_state.get("linkedin_post") or final_state.get("x_post"))
+            if has_error and has_posts and final_state.get("failed_step") != "save_posts":
+                self.logger.log_processing_step(
+                    session_id=session_id,
+                    workflow_id=workflow_id,
+                    step="post_workflow_partial_failure",
+                    message=f"Post generation partially failed at step '{final_state.get('failed_step', 'unknown')}'",
+                    extra_data={
+                        "failed_step": final_state.get("failed_step"),
+                        "error_message": final_state.get("error_message"),
+                        "has_linkedin": final_state.get("linkedin_post") is not None,
+                        "has_x": final_state.get("x_post") is not None
+                    }
+                )
+            elif has_error:
                 self.logger.log_error(
                     session_id=session_id,
                     workflow_id=workflow_id,
@@ -390,3 +404,74 @@ async def execute_post_workflow(
         }
     
     return result
+
+
+async def stream_linkedin_post(
+    articles: List[Dict[str, Any]],
+    topic: str,
+    llm_model: str,
+    session_id: str,
+    news_workflow_id: str
+) -> AsyncIterator[Dict[str, Any]]:
+    """
+    Generate a LinkedIn post token by token and save it once complete.
+    
+    Yields {"type": "token", "content": ...} while the provider streams,
+    then {"type": "complete", "result": {...}} in the execute_post_workflow
+    result shape after SavePostsNode has persisted the post.
+    
+    Args:
+        articles: List of news articles to generate the post from
+        topic: News topic
+        llm_model: LLM model to use for generation
+        session_id: User session identifier
+        news_workflow_id: ID of the news workflow that produced these articles
+        
+    Yields:
+        Token events followed by one complete event
+        
+    Raises:
+        LLMProviderError: When no LLM provider is available
+        DatabaseError: When the generated post cannot be saved
+    """
+    state = create_initial_post_state(
+        articles=articles,
+        topic=topic,
+        llm_model=llm_model,
+        session_id=session_id,
+        workflow_id=str(uuid.uuid4()),
+        news_workflow_id=news_workflow_id
+    )
+    
+    linkedin_post = None
+    async for event in LinkedInPostNode().astream_post(state):
+        if event["type"] == "token":
+            yield event
+        else:
+            linkedin_post = event["post"]
+            state["current_llm_provider"] = event["llm_model"]
+    
+    state["linkedin_post"] = linkedin_post
+    save_result = await SavePostsNode()(state)
+    
+    if save_result.get("failed_step"):
+        raise DatabaseError(
+            operation="save_linkedin_post",
+            original_error=save_result.get("error_message", "Unknown error")
+        )
+    
+    yield {
+        "type": "complete",
+        "result": {
+            "workflow_id": state["workflow_id"],
+            "processing_time": save_result.get("processing_time") or 0.0,
+            "llm_model_used": state["current_llm_provider"],
+            "posts": {
+                "linkedin": {
+                    "content": linkedin_post["content"],
+                    "char_count": linkedin_post["char_count"],
+                    "hashtags": linkedin_post.get("hashtags", [])
+                }
+            }
+        }
+    }
@@ -55,21 +55,20 @@ class StatelessLinkedInPostNode(StatelessNodeBase):
             "shortened_urls": None
         }
         
-        # Update external state
+        # Update external state. processing_steps is appended atomically
+        # because the X generator runs in parallel on the same state.
         updates = {
             "linkedin_post": linkedin_post,
-            "current_step": "stateless_linkedin_generation",
-            "processing_steps": external_state.get("processing_steps", []) + [
-                {
-                    "step": "stateless_linkedin_generation",
-                    "status": "completed",
-                    "message": f"Generated LinkedIn post with {len(linkedin_content)} characters",
-                    "timestamp": datetime.utcnow().isoformat()
-                }
-            ]
+            "current_step": "stateless_linkedin_generation"
         }
         
         await self.save_external_state(langgraph_state["state_key"], updates)
+        await self.append_processing_step(langgraph_state["state_key"], {
+            "step": "stateless_linkedin_generation",
+            "status": "completed",
+            "message": f"Generated LinkedIn post with {len(linkedin_content)} characters",
+            "timestamp": datetime.utcnow().isoformat()
+        })
         
         self.logger.log_processing_step(
             session_id=session_id,
@@ -125,21 +124,20 @@ class StatelessXPostNode(StatelessNodeBase):
             "shortened_urls": None
         }
         
-        # Update external state
+        # Update external state. processing_steps is appended atomically
+        # because the LinkedIn generator runs in parallel on the same state.
         updates = {
             "x_post": x_post,
-            "current_step": "stateless_x_generation",
-            "processing_steps": external_state.get("processing_steps", []) + [
-                {
-                    "step": "stateless_x_generation",
-                    "status": "completed",
-                    "message": f"Generated X post with {len(x_content)} characters",
-                    "timestamp": datetime.utcnow().isoformat()
-                }
-            ]
+            "current_step": "stateless_x_generation"
         }
         
         await self.save_external_state(langgraph_state["state_key"], updates)
+        await self.append_processing_step(langgraph_state["state_key"], {
+            "step": "stateless_x_generation",
+            "status": "completed",
+            "message": f"Generated X post with {len(x_content)} characters",
+            "timestamp": datetime.utcnow().isoformat()
+        })
         
         self.logger.log_processing_step(
             session_id=session_id,
@@ -174,24 +172,26 @@ class StatelessSavePostsNode(StatelessNodeBase):
             message="Starting stateless save posts operation"
         )
         
+        # Either generator may have failed; save whatever was generated
+        if not external_state.get("linkedin_post") and not external_state.get("x_post"):
+            raise ValueError("No posts generated to save - both LinkedIn and X posts are missing")
+        
         # For demo purposes, just mark as saved
         # In real implementation, you would save to database here
         processing_time = datetime.utcnow().timestamp() - external_state.get("start_time", 0)
         
         updates = {
             "current_step": "stateless_save_posts",
-            "processing_time": processing_time,
-            "processing_steps": external_state.get("processing_steps", []) + [
-                {
-                    "step": "stateless_save_posts",
-                    "status": "completed",
-                    "message": "Successfully saved posts to database",
-                    "timestamp": datetime.utcnow().isoformat()
-                }
-            ]
+            "processing_time": processing_time
         }
         
         await self.save_external_state(langgraph_state["state_key"], updates)
+        await self.append_processing_step(langgraph_state["state_key"], {
+            "step": "stateless_save_posts",
+            "status": "completed",
+            "message": "Successfully saved posts to database",
+            "timestamp": datetime.utcnow().isoformat()
+        })
         
         self.logger.log_processing_step(
             session_id=session_id,
@@ -212,6 +212,7 @@ class StatelessPostWorkflow:
     2. Only passes a state_key through LangGraph
     3. Nodes load/save state externally
     4. Completely avoids LangGraph reducer issues
+    5. Generates LinkedIn and X posts in parallel before saving
     """
     
     def __init__(self):
@@ -230,10 +231,10 @@ class StatelessPostWorkflow:
         workflow.add_node("generate_x_post", StatelessXPostNode())
         workflow.add_node("save_posts", StatelessSavePostsNode())
         
-        # Define workflow edges (same as before)
+        # Define workflow edges - generators run in parallel, save waits for both
         workflow.add_edge(START, "generate_linkedin_post")
-        workflow.add_edge("generate_linkedin_post", "generate_x_post")
-        workflow.add_edge("generate_x_post", "save_posts")
+        workflow.add_edge(START, "generate_x_post")
+        workflow.add_edge(["generate_linkedin_post", "generate_x_post"], "save_posts")
         workflow.add_edge("save_posts", END)
         
         return workflow.compile()
@@ -300,11 +301,25 @@ class StatelessPostWorkflow:
                     context={"state_key": state_key, "workflow_id": workflow_id}
                 )
             
-            # Check for errors
+            # Check for errors. A failed generator is a partial success as
+            # long as the other post was generated and saved.
             if result.get("error_message"):
-                raise NewsProcessingError(
-                    message=f"Workflow failed: {result['error_message']}",
-                    context={"workflow_id": workflow_id, "session_id": session_id}
+                has_posts = bool(final_external_state.get("linkedin_post") or final_external_state.get("x_post"))
+                if not has_posts or result.get("failed_step") == "stateless_save_posts":
+                    raise NewsProcessingError(
+                        message=f"Workflow failed: {result['error_message']}",
+                        context={"workflow_id": workflow_id, "session_id": session_id}
+                    )
+                
+                self.logger.log_processing_step(
+                    session_id=session_id,
+                    workflow_id=workflow_id,
+                    step="stateless_workflow_partial_failure",
+                    message=f"Post generation partially failed at step '{result.get('failed_step')}'",
+                    extra_data={
+                        "failed_step": result.get("failed_step"),
+                        "error_message": result.get("error_message")
+                    }
                 )
             
             self.logger.log_processing_step(
@@ -10,9 +10,33 @@ from fastapi.middleware.trustedhost import TrustedHostMiddleware
 from app.core.config import settings
 from app.core.database import engine
 from app.core.db_status import set_database_status, get_database_status
+from app.core.http_client import (
+    create_serper_client,
+    set_serper_client,
+    get_serper_client,
+    get_client_pool_stats
+)
 from app.models import Base
-from app.api.routes import news, sessions, posts
-from app.langgraph.utils.logging_config import setup_logging
+from app.api.routes import news, sessions, posts, admin
+from app.langgraph.utils.logging_config import setup_logging, stop_logging
+from app.langgraph.utils.llm_client_pool import get_llm_client_pool
+from app.langgraph.utils.quota_backend import get_quota_backend
+from app.langgraph.utils.url_shortener import close_url_shortener
+from app.langgraph.utils.news_cache_writer import get_news_cache_queue, close_news_cache_queue
+from app.langgraph.utils.summary_cache import get_summary_cache, close_summary_cache
+from app.langgraph.utils.provider_router import get_provider_router
+from app.langgraph.utils.hedging import get_hedge_budget_stats
+from app.langgraph.utils.rate_limiter import get_rate_limiter_stats, close_rate_limiters
+from app.langgraph.utils.serper_cache import get_serper_cache, close_serper_cache
+from app.langgraph.utils.request_coalescer import get_request_coalescer
+from app.langgraph.utils.topic_config_registry import (
+    get_topic_config_registry,
+    close_topic_config_registry
+)
+from app.langgraph.utils.external_state_manager import (
+    get_external_state_manager,
+    close_external_state_manager
+)
 import re
 from typing import List
 
@@ -58,10 +82,57 @@ async def lifespan(app: FastAPI):
         logger.error(f"Failed to connect to database: {str(e)}")
         logger.warning("Application starting without database connection")
     
+    # Create the shared Serper HTTP client (keep-alive connection pool)
+    set_serper_client(create_serper_client())
+    
+    # Start write-behind flushing for the in-memory quota backend
+    quota_backend = get_quota_backend()
+    if quota_backend is not None:
+        await quota_backend.start()
+    
+    # Write news_cache rows in the background, off the response path
+    news_cache_queue = get_news_cache_queue()
+    if news_cache_queue is not None:
+        await news_cache_queue.start()
+    
+    await get_summary_cache().start()
+    
+    # Load topic configs into memory and poll for changes
+    await get_topic_config_registry().start()
+    
+    # Expire abandoned workflow states in the background
+    get_external_state_manager().start_sweeper()
+    
     yield
     
     # Shutdown
     logger.info("Shutting down Social Media Post Manager API")
+    
+    # Write out pending quota records and cached articles before the database goes away
+    if quota_backend is not None:
+        await quota_backend.stop()
+    
+    await close_news_cache_queue()
+    await close_summary_cache()
+    
+    # Stop background Serper cache refreshes before their client closes
+    await close_serper_cache()
+    
+    # Release pooled HTTP and LLM client connections
+    serper_client = get_serper_client()
+    if serper_client is not None:
+        await serper_client.aclose()
+        set_serper_client(None)
+    
+    await get_llm_client_pool().aclose()
+    await close_rate_limiters()
+    await close_url_shortener()
+    
+    await close_external_state_manager()
+    await close_topic_config_registry()
+    
+    # Write out queued log records last
+    stop_logging()
 
 
 # Create FastAPI application
@@ -125,6 +196,12 @@ app.include_router(
     tags=["posts"]
 )
 
+app.include_router(
+    admin.router,
+    prefix="/api/admin",
+    tags=["admin"]
+)
+
 
 @app.get("/")
 async def root():
@@ -160,9 +237,29 @@ async def health_check():
         "services": {
             "api": "running",
             "database": get_database_status()
+        },
+        "http_pools": {
+            "serper": get_client_pool_stats(get_serper_client())
         }
     }
     
+    quota_backend = get_quota_backend()
+    if quota_backend is not None:
+        response["quota_backend"] = quota_backend.get_stats()
+    
+    news_cache_queue = get_news_cache_queue()
+    if news_cache_queue is not None:
+        response["news_cache_write_behind"] = news_cache_queue.get_stats()
+    
+    response["workflow_state"] = get_external_state_manager().get_stats()
+    response["request_coalescing"] = get_request_coalescer().get_stats()
+    response["serper_cache"] = get_serper_cache().get_stats()
+    response["summary_cache"] = get_summary_cache().get_stats()
+    response["llm_providers"] = get_provider_router().get_stats()
+    response["llm_hedging"] = get_hedge_budget_stats()
+    response["rate_limiters"] = get_rate_limiter_stats()
+    response["topic_config_registry"] = get_topic_config_registry().get_stats()
+    
     if db_error:
         response["database_error"] = db_error
     
@@ -7,5 +7,8 @@ from .user_request import UserRequest
 from .news_cache import NewsCache
 from .topic_config import TopicConfig
 from .generated_post import GeneratedPost, PostType
+from .short_url import ShortUrl
+from .serper_response import SerperResponse
+from .article_summary import ArticleSummary
 
-__all__ = ["Base", "Session", "UserRequest", "NewsCache", "TopicConfig", "GeneratedPost", "PostType"]
+__all__ = ["Base", "Session", "UserRequest", "NewsCache", "TopicConfig", "GeneratedPost", "PostType", "ShortUrl", "SerperResponse", "ArticleSummary"]
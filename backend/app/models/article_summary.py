@@ -0,0 +1,33 @@
+"""
+Article summary cache model for reusing generated summaries
+"""
+from datetime import datetime
+from sqlalchemy import Column, Integer, String, Text, DateTime, Index
+
+from app.core.database import Base
+
+
+class ArticleSummary(Base):
+    """Generated article summaries keyed by (content_hash, provider, prompt_version)"""
+    
+    __tablename__ = "article_summary_cache"
+    
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    content_hash = Column(String(64), nullable=False)  # NewsArticle content_hash
+    provider = Column(String(50), nullable=False)  # LLM provider that wrote the summary
+    prompt_version = Column(String(20), nullable=False)  # Summarization prompt template version
+    summary = Column(Text, nullable=False)
+    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    
+    def __repr__(self):
+        return f"<ArticleSummary(id={self.id}, content_hash={self.content_hash}, provider={self.provider})>"
+
+
+# Cache key, and the target of ON CONFLICT when storing summaries
+Index(
+    "ux_article_summary_cache_key",
+    ArticleSummary.content_hash,
+    ArticleSummary.provider,
+    ArticleSummary.prompt_version,
+    unique=True
+)
@@ -2,7 +2,7 @@
 News cache model for storing fetched articles
 """
 from datetime import datetime
-from sqlalchemy import Column, Integer, String, Text, DateTime
+from sqlalchemy import Column, Integer, String, Text, Float, DateTime, Index, func
 
 from app.core.database import Base
 
@@ -19,8 +19,28 @@ class NewsCache(Base):
     title = Column(Text, nullable=False)
     url = Column(Text, nullable=False)
     summary = Column(Text, nullable=False)
-    content_hash = Column(String(64), nullable=False)  # For deduplication
+    published_at = Column(Text, nullable=True)  # As reported by the search API
+    relevance_score = Column(Float, nullable=True)
+    content_hash = Column(String(64), nullable=False)  # For deduplication per topic and date (unique index below)
     created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
     
     def __repr__(self):
         return f"<NewsCache(id={self.id}, topic={self.topic}, title={self.title[:50]}...)>"
+
+
+# Supports the read-through cache lookup by (lower(topic), date) within the TTL
+Index(
+    "ix_news_cache_topic_date_created",
+    func.lower(NewsCache.topic),
+    NewsCache.date_fetched,
+    NewsCache.created_at
+)
+
+# Target of the cache write's ON CONFLICT ... DO UPDATE, which refreshes created_at
+Index(
+    "ux_news_cache_topic_date_hash",
+    func.lower(NewsCache.topic),
+    NewsCache.date_fetched,
+    NewsCache.content_hash,
+    unique=True
+)
@@ -0,0 +1,23 @@
+"""
+Serper response cache model for reusing news search results
+"""
+from datetime import datetime
+from sqlalchemy import Column, Integer, String, Text, DateTime, JSON
+
+from app.core.database import Base
+
+
+class SerperResponse(Base):
+    """Cached Serper search results keyed by normalized (query, hl, gl)"""
+    
+    __tablename__ = "serper_response_cache"
+    
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    query_hash = Column(String(64), unique=True, nullable=False)  # SHA-256 of normalized query, hl and gl
+    query = Column(Text, nullable=False)
+    num_results = Column(Integer, nullable=False)  # "num" the articles were fetched with
+    articles = Column(JSON, nullable=False)  # Parsed articles in Serper ranking order
+    fetched_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    
+    def __repr__(self):
+        return f"<SerperResponse(id={self.id}, query={self.query}, num_results={self.num_results})>"
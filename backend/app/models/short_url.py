@@ -0,0 +1,22 @@
+"""
+Short URL model for caching shortened article URLs
+"""
+from datetime import datetime
+from sqlalchemy import Column, Integer, String, Text, DateTime
+
+from app.core.database import Base
+
+
+class ShortUrl(Base):
+    """Short URL model mapping long article URLs to shortened URLs"""
+    
+    __tablename__ = "short_urls"
+    
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    url_hash = Column(String(64), unique=True, nullable=False)  # SHA-256 of long_url
+    long_url = Column(Text, nullable=False)
+    short_url = Column(String(255), nullable=False)
+    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    
+    def __repr__(self):
+        return f"<ShortUrl(id={self.id}, short_url={self.short_url})>"
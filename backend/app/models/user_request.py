@@ -2,7 +2,7 @@
 User request model for quota tracking
 """
 from datetime import datetime
-from sqlalchemy import Column, Integer, String, DateTime, ForeignKey
+from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Index
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 
@@ -13,6 +13,12 @@ class UserRequest(Base):
     """User request model for tracking API usage and quotas"""
     
     __tablename__ = "user_requests"
+    __table_args__ = (
+        # Quota counts by session over created_at ranges
+        Index("ix_user_requests_session_created", "session_id", "created_at"),
+        # Duplicate request detection within a recent window
+        Index("ix_user_requests_session_hash_created", "session_id", "request_hash", "created_at"),
+    )
     
     id = Column(Integer, primary_key=True, autoincrement=True)
     session_id = Column(UUID(as_uuid=True), ForeignKey("sessions.id"), nullable=False)
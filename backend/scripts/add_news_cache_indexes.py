@@ -0,0 +1,98 @@
+"""
+Script to add the news_cache lookup and dedup indexes to an existing database.
+
+New databases get these columns and indexes from Base.metadata.create_all;
+this script adds them on databases where news_cache already exists.
+"""
+import asyncio
+import sys
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.append(str(Path(__file__).parent.parent))
+
+from sqlalchemy import text
+from app.core.database import engine
+
+
+# Cached articles keep the fields fresh responses carry
+COLUMN_STATEMENTS = [
+    "ALTER TABLE news_cache ADD COLUMN IF NOT EXISTS published_at TEXT",
+    "ALTER TABLE news_cache ADD COLUMN IF NOT EXISTS relevance_score DOUBLE PRECISION",
+]
+
+# Superseded by ux_news_cache_topic_date_hash, which allows one row per topic and date
+DROP_STATEMENT = "DROP INDEX CONCURRENTLY IF EXISTS ux_news_cache_content_hash"
+
+# Keep the newest row per (topic, date, content_hash) so the unique index can be built
+DEDUPE_STATEMENT = """
+    DELETE FROM news_cache a
+    USING news_cache b
+    WHERE lower(a.topic) = lower(b.topic)
+      AND a.date_fetched = b.date_fetched
+      AND a.content_hash = b.content_hash
+      AND (a.created_at, a.id) < (b.created_at, b.id)
+"""
+
+INDEX_STATEMENTS = [
+    (
+        "ix_news_cache_topic_date_created",
+        """
+        CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_news_cache_topic_date_created
+        ON news_cache (lower(topic), date_fetched, created_at)
+        """
+    ),
+    (
+        "ux_news_cache_topic_date_hash",
+        """
+        CREATE UNIQUE INDEX CONCURRENTLY IF NOT EXISTS ux_news_cache_topic_date_hash
+        ON news_cache (lower(topic), date_fetched, content_hash)
+        """
+    ),
+]
+
+
+async def create_news_cache_indexes():
+    """Create the news_cache columns and indexes if they don't exist."""
+    
+    print("Creating news_cache indexes...")
+    
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction block
+    async with engine.connect() as conn:
+        conn = await conn.execution_options(isolation_level="AUTOCOMMIT")
+        
+        for statement in COLUMN_STATEMENTS:
+            await conn.execute(text(statement))
+        print("✓ news_cache columns are present")
+        
+        await conn.execute(text(DROP_STATEMENT))
+        print("✓ Dropped the old content_hash unique index")
+        
+        result = await conn.execute(text(DEDUPE_STATEMENT))
+        print(f"✓ Removed {result.rowcount} duplicate news_cache rows")
+        
+        for index_name, statement in INDEX_STATEMENTS:
+            await conn.execute(text(statement))
+            print(f"✓ Index '{index_name}' is present")
+
+
+async def main():
+    """Main function to run the migration."""
+    print("Starting news_cache index migration...")
+    print(f"Database URL: {engine.url}")
+    
+    try:
+        await create_news_cache_indexes()
+        print("\n✓ Migration completed successfully!")
+    
+    except Exception as e:
+        print(f"\n✗ Migration failed: {str(e)}")
+        sys.exit(1)
+    
+    finally:
+        # Dispose of the engine
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
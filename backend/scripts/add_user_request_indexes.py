@@ -0,0 +1,69 @@
+"""
+Script to add the user_requests quota indexes to an existing database.
+
+New databases get these indexes from Base.metadata.create_all; this
+script creates them on databases where user_requests already exists.
+"""
+import asyncio
+import sys
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.append(str(Path(__file__).parent.parent))
+
+from sqlalchemy import text
+from app.core.database import engine
+
+
+INDEX_STATEMENTS = [
+    (
+        "ix_user_requests_session_created",
+        """
+        CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_user_requests_session_created
+        ON user_requests (session_id, created_at)
+        """
+    ),
+    (
+        "ix_user_requests_session_hash_created",
+        """
+        CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_user_requests_session_hash_created
+        ON user_requests (session_id, request_hash, created_at)
+        """
+    ),
+]
+
+
+async def create_user_request_indexes():
+    """Create the user_requests indexes if they don't exist."""
+    
+    print("Creating user_requests indexes...")
+    
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction block
+    async with engine.connect() as conn:
+        conn = await conn.execution_options(isolation_level="AUTOCOMMIT")
+        
+        for index_name, statement in INDEX_STATEMENTS:
+            await conn.execute(text(statement))
+            print(f"✓ Index '{index_name}' is present")
+
+
+async def main():
+    """Main function to run the migration."""
+    print("Starting user_requests index migration...")
+    print(f"Database URL: {engine.url}")
+    
+    try:
+        await create_user_request_indexes()
+        print("\n✓ Migration completed successfully!")
+    
+    except Exception as e:
+        print(f"\n✗ Migration failed: {str(e)}")
+        sys.exit(1)
+    
+    finally:
+        # Dispose of the engine
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,119 @@
+"""
+Benchmark relevance keyword matching: per-keyword substring loop vs KeywordMatcher.
+
+The loop is the scoring FilterArticlesNode used before the compiled
+matcher: lower-case every keyword and field, then test each keyword
+against each field. Both approaches score the same synthetic articles.
+
+Usage:
+    python scripts/benchmark_keyword_matcher.py [keywords] [articles]
+"""
+import random
+import sys
+import time
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.append(str(Path(__file__).parent.parent))
+
+from app.langgraph.utils.keyword_matcher import KeywordMatcher
+
+
+WORDS = [
+    "ai", "model", "startup", "funding", "market", "chip", "cloud", "data", "robot",
+    "health", "bank", "crypto", "policy", "energy", "quantum", "security", "open",
+    "source", "launch", "research", "training", "inference", "agent", "platform"
+]
+
+
+def make_keywords(count: int, rng: random.Random) -> list:
+    """Generate unique one- to three-word keywords."""
+    keywords = set()
+    while len(keywords) < count:
+        length = rng.choice((1, 2, 2, 3))
+        keywords.add(" ".join(rng.choice(WORDS) + str(rng.randint(0, count)) for _ in range(length)))
+    return list(keywords)
+
+
+def make_articles(count: int, keywords: list, rng: random.Random) -> list:
+    """Generate articles whose fields mention a few keywords among filler words."""
+    def text(words: int) -> str:
+        parts = [rng.choice(WORDS) for _ in range(words)]
+        for _ in range(rng.randint(0, 3)):
+            parts.insert(rng.randrange(len(parts) + 1), rng.choice(keywords))
+        return " ".join(parts).title()
+    
+    return [
+        {"title": text(10), "snippet": text(35), "source": text(2)}
+        for _ in range(count)
+    ]
+
+
+def score_with_loop(articles: list, keywords: list) -> list:
+    """Previous scoring loop (substring containment per keyword and field)."""
+    scores = []
+    for article in articles:
+        title = article.get("title", "").lower()
+        snippet = article.get("snippet", "").lower()
+        source = article.get("source", "").lower()
+        
+        score = 0.0
+        for keyword in keywords:
+            keyword_lower = keyword.lower()
+            if keyword_lower in title:
+                score += 0.4
+            if keyword_lower in snippet:
+                score += 0.2
+            if keyword_lower in source:
+                score += 0.1
+        
+        scores.append(min(score / len(keywords), 1.0))
+    return scores
+
+
+def score_with_matcher(articles: list, matcher: KeywordMatcher) -> list:
+    """Scoring with the compiled matcher, as in FilterArticlesNode."""
+    return [
+        min((
+            0.4 * len(matcher.match(article.get("title", ""))) +
+            0.2 * len(matcher.match(article.get("snippet", ""))) +
+            0.1 * len(matcher.match(article.get("source", "")))
+        ) / len(matcher), 1.0)
+        for article in articles
+    ]
+
+
+def main():
+    keyword_count = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    article_count = int(sys.argv[2]) if len(sys.argv) > 2 else 1000
+    
+    rng = random.Random(42)
+    keywords = make_keywords(keyword_count, rng)
+    articles = make_articles(article_count, keywords, rng)
+    
+    print(f"Scoring {article_count} articles against {keyword_count} keywords")
+    print("=" * 60)
+    
+    start = time.perf_counter()
+    matcher = KeywordMatcher(keywords)
+    build_time = time.perf_counter() - start
+    
+    start = time.perf_counter()
+    loop_scores = score_with_loop(articles, keywords)
+    loop_time = time.perf_counter() - start
+    
+    start = time.perf_counter()
+    matcher_scores = score_with_matcher(articles, matcher)
+    matcher_time = time.perf_counter() - start
+    
+    # Word-boundary matching only drops substring hits inside longer words
+    differing = sum(1 for a, b in zip(loop_scores, matcher_scores) if abs(a - b) > 1e-9)
+    
+    print(f"{'substring loop':<20} {loop_time * 1000:10.1f} ms")
+    print(f"{'KeywordMatcher':<20} {matcher_time * 1000:10.1f} ms  (+{build_time * 1000:.1f} ms one-time build)")
+    print(f"{'speedup':<20} {loop_time / matcher_time:10.1f}x")
+    print(f"{'differing scores':<20} {differing:10d}  (substring hits without word boundaries)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+"""
+Benchmark ExternalStateManager get/update latency across state backends.
+
+Runs the in-memory and SQLite backends, plus Redis when REDIS_URL is
+reachable and the redis package is installed.
+
+Usage:
+    python scripts/benchmark_state_backends.py [iterations]
+"""
+import asyncio
+import statistics
+import sys
+import time
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.append(str(Path(__file__).parent.parent))
+
+from app.core.config import settings
+from app.langgraph.utils.external_state_manager import ExternalStateManager
+from app.langgraph.utils.state_backends import (
+    InMemoryStateBackend,
+    RedisStateBackend,
+    SQLiteStateBackend
+)
+
+
+# Roughly the size of a stateless post workflow state
+SAMPLE_STATE = {
+    "session_id": "benchmark-session",
+    "workflow_id": "benchmark-workflow",
+    "llm_model": "claude-3-5-sonnet",
+    "topic": "AI Technology",
+    "articles": [
+        {
+            "title": f"Benchmark article {i}",
+            "url": f"https://example.com/article-{i}",
+            "source": "example.com",
+            "summary": "Lorem ipsum dolor sit amet, " * 10,
+            "published_at": None,
+            "relevance_score": 0.5
+        }
+        for i in range(12)
+    ],
+    "processing_steps": []
+}
+
+
+def summarize(timings):
+    """Format latency percentiles in milliseconds."""
+    timings = sorted(timings)
+    p50 = timings[len(timings) // 2] * 1000
+    p95 = timings[int(len(timings) * 0.95) - 1] * 1000
+    mean = statistics.mean(timings) * 1000
+    return f"mean {mean:7.3f} ms | p50 {p50:7.3f} ms | p95 {p95:7.3f} ms"
+
+
+async def benchmark_backend(name, backend, iterations):
+    """Benchmark get and update on one backend."""
+    manager = ExternalStateManager(backend=backend)
+    state_key = await manager.create_state(SAMPLE_STATE)
+    
+    get_timings = []
+    update_timings = []
+    
+    for i in range(iterations):
+        start = time.perf_counter()
+        await manager.get_state(state_key)
+        get_timings.append(time.perf_counter() - start)
+        
+        start = time.perf_counter()
+        await manager.update_state(state_key, {"current_step": f"step_{i}"})
+        update_timings.append(time.perf_counter() - start)
+    
+    await manager.delete_state(state_key)
+    await manager.close()
+    
+    print(f"{name:<8} get    | {summarize(get_timings)}")
+    print(f"{name:<8} update | {summarize(update_timings)}")
+
+
+async def main():
+    """Run the benchmark for each available backend."""
+    iterations = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    
+    print(f"Benchmarking state backends ({iterations} iterations each)...\n")
+    
+    await benchmark_backend("memory", InMemoryStateBackend(), iterations)
+    await benchmark_backend("sqlite", SQLiteStateBackend(":memory:"), iterations)
+    
+    try:
+        redis_backend = RedisStateBackend(settings.REDIS_URL)
+        await redis_backend._redis.ping()
+    except Exception as e:
+        print(f"redis    skipped ({e})")
+        return
+    
+    await benchmark_backend("redis", redis_backend, iterations)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,118 @@
+"""
+Test the batched summarization strategy in SummarizeContentNode.
+
+Verifies that batch responses are parsed back by article index and that
+only articles missing from a malformed response are re-summarized.
+"""
+import asyncio
+import sys
+import os
+from types import SimpleNamespace
+
+# Add the backend directory to the Python path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__)))
+
+from app.langgraph.nodes.summarize_content_node import SummarizeContentNode
+
+
+class FakeLLMClient:
+    """LLM client stand-in that returns canned responses in order."""
+    
+    def __init__(self, responses):
+        self.responses = list(responses)
+        self.calls = 0
+    
+    async def ainvoke(self, messages):
+        self.calls += 1
+        response = self.responses.pop(0) if self.responses else "Per-article summary"
+        return SimpleNamespace(content=response)
+
+
+def make_articles(count):
+    """Create test articles."""
+    return [
+        {
+            "title": f"Test Article {i + 1}",
+            "url": f"https://example.com/article-{i + 1}",
+            "source": "example.com",
+            "summary": f"Original snippet for article {i + 1}",
+            "published_at": None,
+            "relevance_score": 0.5,
+            "content_hash": f"hash-{i + 1}"
+        }
+        for i in range(count)
+    ]
+
+
+def test_parse_batch_summaries():
+    """Test parsing of batch summary responses."""
+    print("🧪 Testing batch summary parsing...")
+    
+    node = SummarizeContentNode()
+    
+    # Well-formed response wrapped in a code fence
+    content = '```json\n[{"index": 2, "summary": "Second"}, {"index": 1, "summary": "First"}]\n```'
+    summaries = node._parse_batch_summaries(content, 2)
+    assert summaries == {0: "First", 1: "Second"}, f"Unexpected summaries: {summaries}"
+    print("   ✅ Parsed summaries by index")
+    
+    # Out-of-range, duplicate and empty entries are skipped
+    content = '[{"index": 1, "summary": "First"}, {"index": 1, "summary": "Dup"}, {"index": 5, "summary": "X"}, {"index": 2, "summary": ""}]'
+    summaries = node._parse_batch_summaries(content, 2)
+    assert summaries == {0: "First"}, f"Unexpected summaries: {summaries}"
+    print("   ✅ Skipped invalid entries")
+    
+    # Malformed JSON yields no summaries
+    assert node._parse_batch_summaries("not json at all", 3) == {}
+    assert node._parse_batch_summaries('[{"index": 1, "summary": "oops"', 3) == {}
+    print("   ✅ Malformed responses handled")
+    
+    return True
+
+
+async def test_batch_fallback_for_missing_articles():
+    """Test that only missing articles fall back to per-article calls."""
+    print("\n🧪 Testing batch fallback for missing articles...")
+    
+    node = SummarizeContentNode()
+    articles = make_articles(3)
+    
+    client = FakeLLMClient([
+        '[{"index": 1, "summary": "Batch one"}, {"index": 3, "summary": "Batch three"}]',
+        "Fallback two"
+    ])
+    
+    results = await node._generate_summaries_batch(
+        articles=articles,
+        llm_client=client,
+        provider="claude-3-5-sonnet",
+        session_id="test-session",
+        workflow_id="test-workflow"
+    )
+    
+    assert [a["summary"] for a in results] == ["Batch one", "Fallback two", "Batch three"], \
+        f"Unexpected summaries: {[a['summary'] for a in results]}"
+    assert client.calls == 2, f"Expected 2 LLM calls, got {client.calls}"
+    print("   ✅ One batch call plus one per-article call for the missing article")
+    
+    return True
+
+
+async def main():
+    """Run batch summarization tests."""
+    print("🚀 Starting Batch Summarization Tests")
+    print("=" * 80)
+    
+    test1_success = test_parse_batch_summaries()
+    test2_success = await test_batch_fallback_for_missing_articles()
+    
+    print("\n" + "=" * 80)
+    print(f"Batch Parsing Test: {'✅ PASSED' if test1_success else '❌ FAILED'}")
+    print(f"Batch Fallback Test: {'✅ PASSED' if test2_success else '❌ FAILED'}")
+    
+    return test1_success and test2_success
+
+
+if __name__ == "__main__":
+    success = asyncio.run(main())
+    sys.exit(0 if success else 1)
@@ -0,0 +1,139 @@
+"""
+Test the concurrent summarization strategy in SummarizeContentNode.
+
+Per-article calls are answered by a fake LLM client with per-article
+delays and failures, so the tests cover result order, snippet fallback,
+the per-provider concurrency limit and retry backoff outside it.
+"""
+import asyncio
+import sys
+import os
+from types import SimpleNamespace
+from unittest.mock import patch
+
+# Add the backend directory to the Python path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__)))
+
+from app.langgraph.nodes.summarize_content_node import SummarizeContentNode
+from app.langgraph.utils.provider_router import ProviderRouter
+from app.langgraph.utils.rate_limiter import NoopRateLimiter
+
+NODE = "app.langgraph.nodes.summarize_content_node"
+
+
+class FakeLLMClient:
+    """LLM client stand-in with per-article delays, failures and a concurrency gauge."""
+    
+    def __init__(self, delays, failing=()):
+        self.delays = delays
+        self.failing = set(failing)
+        self.calls = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+    
+    async def ainvoke(self, messages):
+        index = next(i for i in self.delays if f"Test Article {i + 1}\n" in messages[0].content)
+        self.calls.append(index)
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(self.delays[index])
+        finally:
+            self.in_flight -= 1
+        if index in self.failing:
+            raise RuntimeError("503 Service Unavailable")
+        return SimpleNamespace(content=f"Summary {index + 1}")
+
+
+def make_articles(count):
+    """Create test articles."""
+    return [
+        {
+            "title": f"Test Article {i + 1}",
+            "url": f"https://example.com/article-{i + 1}",
+            "source": "example.com",
+            "summary": f"Original snippet for article {i + 1}",
+            "published_at": None,
+            "relevance_score": 0.5,
+            "content_hash": f"hash-{i + 1}"
+        }
+        for i in range(count)
+    ]
+
+
+async def summarize(node, client, articles, limit):
+    """Run the concurrent strategy with a fresh router and the given provider limit."""
+    with patch(f"{NODE}.HumanMessage", lambda content: SimpleNamespace(content=content)), \
+         patch(f"{NODE}.get_provider_router", return_value=ProviderRouter()), \
+         patch("app.langgraph.utils.provider_router.get_rate_limiter", return_value=NoopRateLimiter()), \
+         patch(f"{NODE}.settings.LLM_PROVIDER_CONCURRENCY", {"claude-3-5-sonnet": limit}):
+        return await node._generate_summaries_concurrent(
+            articles=articles,
+            llm_client=client,
+            provider="claude-3-5-sonnet",
+            session_id="session",
+            workflow_id="workflow"
+        )
+
+
+async def test_order_fallback_and_limit():
+    """Test input order, snippet fallback and the concurrency limit."""
+    print("🧪 Testing concurrent summarization...")
+    
+    node = SummarizeContentNode()
+    node.max_retries = 0
+    articles = make_articles(6)
+    # Later articles answer first
+    client = FakeLLMClient({i: 0.06 - i * 0.01 for i in range(6)}, failing={2})
+    
+    summarized = await summarize(node, client, articles, limit=3)
+    
+    assert [a["title"] for a in summarized] == [a["title"] for a in articles], "Results must keep input order"
+    expected = [f"Summary {i + 1}" for i in range(6)]
+    expected[2] = "Original snippet for article 3"
+    assert [a["summary"] for a in summarized] == expected, [a["summary"] for a in summarized]
+    print("   ✅ Out-of-order answers returned in input order, failed article kept its snippet")
+    
+    assert client.max_in_flight == 3, f"Expected 3 concurrent calls, saw {client.max_in_flight}"
+    print(f"   ✅ At most {client.max_in_flight} calls in flight with a limit of 3")
+    
+    return True
+
+
+async def test_backoff_releases_slot():
+    """Test that an article backing off between retries does not hold a concurrency slot."""
+    print("\n🧪 Testing retry backoff outside the semaphore...")
+    
+    node = SummarizeContentNode()
+    node.max_retries = 1
+    node.retry_delay = 0.2
+    client = FakeLLMClient({i: 0.01 for i in range(4)}, failing={0})
+    
+    summarized = await summarize(node, client, make_articles(4), limit=1)
+    
+    assert client.calls[:4] == [0, 1, 2, 3], f"Other articles should run while article 1 backs off: {client.calls}"
+    assert client.calls.count(0) == 2 and client.max_in_flight == 1
+    assert summarized[0]["summary"] == "Original snippet for article 1"
+    print(f"   ✅ Call order {client.calls}: the retrying article gave up its slot while waiting")
+    
+    return True
+
+
+async def main():
+    """Run concurrent summarization tests."""
+    print("🚀 Starting Concurrent Summarization Tests")
+    print("=" * 80)
+    
+    test1_success = await test_order_fallback_and_limit()
+    test2_success = await test_backoff_releases_slot()
+    
+    print("\n" + "=" * 80)
+    print(f"Order/Fallback/Limit Test: {'✅ PASSED' if test1_success else '❌ FAILED'}")
+    print(f"Backoff Slot Test: {'✅ PASSED' if test2_success else '❌ FAILED'}")
+    
+    return test1_success and test2_success
+
+
+if __name__ == "__main__":
+    success = asyncio.run(main())
+    sys.exit(0 if success else 1)
@@ -0,0 +1,180 @@
+"""
+Test hedged LLM requests and hedge budgets.
+"""
+import asyncio
+import sys
+import os
+from unittest.mock import patch
+
+# Add the backend directory to the Python path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__)))
+
+from app.langgraph.utils.hedging import HedgeBudget, hedged_invoke
+from app.langgraph.utils.provider_router import ProviderRouter
+from app.langgraph.utils.rate_limiter import NoopRateLimiter
+
+SETTINGS = "app.langgraph.utils.hedging.settings"
+
+
+def make_router():
+    """Build a router where the primary model's p95 is 0.05s."""
+    router = ProviderRouter()
+    for _ in range(20):
+        router.record_success("claude-3-5-sonnet", 0.05)
+        router.record_success("gpt-4-turbo", 0.05)
+    return router
+
+
+def make_call(delays, calls, cancelled):
+    """Build a call that sleeps per model and records starts and cancellations."""
+    async def call(model):
+        calls.append(model)
+        try:
+            await asyncio.sleep(delays[model] or 0)
+        except asyncio.CancelledError:
+            cancelled.append(model)
+            raise
+        if delays[model] is None:
+            raise RuntimeError(f"{model} failed")
+        return f"response from {model}"
+    return call
+
+
+async def test_hedge_wins():
+    """Test that a slow primary is hedged, the backup wins and the primary is cancelled."""
+    print("🧪 Testing hedge on a slow primary...")
+    
+    router = make_router()
+    budget = HedgeBudget("test", ratio=1.0, burst=1.0)
+    calls, cancelled = [], []
+    call = make_call({"claude-3-5-sonnet": 1.0, "gpt-4-turbo": 0.01}, calls, cancelled)
+    
+    with patch(f"{SETTINGS}.LLM_HEDGING_ENABLED", True):
+        result, used = await hedged_invoke(router, "claude-3-5-sonnet", call, "gpt-4-turbo", budget)
+        await asyncio.sleep(0)
+    
+    assert (result, used) == ("response from gpt-4-turbo", "gpt-4-turbo"), f"Unexpected result: {result}, {used}"
+    assert calls == ["claude-3-5-sonnet", "gpt-4-turbo"] and cancelled == ["claude-3-5-sonnet"]
+    assert budget.get_stats()["hedge_wins"] == 1
+    assert router.get_stats()["claude-3-5-sonnet"]["error_rate"] == 0, "Cancelled primary must not count as a failure"
+    print("   ✅ Backup answered first and the primary was cancelled")
+    
+    return True
+
+
+async def test_no_hedge():
+    """Test that fast calls, disabled hedging and an empty budget never hedge."""
+    print("\n🧪 Testing calls that must not be hedged...")
+    
+    router = make_router()
+    delays = {"claude-3-5-sonnet": 0.01, "gpt-4-turbo": 0.01}
+    
+    calls, cancelled = [], []
+    with patch(f"{SETTINGS}.LLM_HEDGING_ENABLED", True):
+        await hedged_invoke(router, "claude-3-5-sonnet", make_call(delays, calls, cancelled), "gpt-4-turbo", HedgeBudget("t", 1.0, 1.0))
+    assert calls == ["claude-3-5-sonnet"], f"Fast primary should not be hedged: {calls}"
+    print("   ✅ Primary faster than its p95 is not hedged")
+    
+    delays["claude-3-5-sonnet"] = 0.2
+    calls, cancelled = [], []
+    with patch(f"{SETTINGS}.LLM_HEDGING_ENABLED", False):
+        await hedged_invoke(router, "claude-3-5-sonnet", make_call(delays, calls, cancelled), "gpt-4-turbo", HedgeBudget("t", 1.0, 1.0))
+    assert calls == ["claude-3-5-sonnet"], "Hedging disabled by default"
+    print("   ✅ Disabled hedging makes a plain call")
+    
+    budget = HedgeBudget("t", ratio=0.0, burst=0.0)
+    calls, cancelled = [], []
+    with patch(f"{SETTINGS}.LLM_HEDGING_ENABLED", True):
+        result, used = await hedged_invoke(router, "claude-3-5-sonnet", make_call(delays, calls, cancelled), "gpt-4-turbo", budget)
+    assert used == "claude-3-5-sonnet" and calls == ["claude-3-5-sonnet"] and budget.get_stats()["denied"] == 1
+    print("   ✅ Exhausted budget waits for the primary")
+    
+    return True
+
+
+async def test_budget_and_failures():
+    """Test budget accrual and that a failed hedge falls back to the primary."""
+    print("\n🧪 Testing budget accrual and hedge failure...")
+    
+    budget = HedgeBudget("t", ratio=0.25, burst=2.0)
+    budget._tokens = 0
+    acquired = 0
+    for _ in range(100):
+        budget.record_call()
+        acquired += budget.try_acquire()
+    assert acquired == 25, f"Ratio 0.25 should allow 25 hedges per 100 calls, got {acquired}"
+    print("   ✅ Budget allows the configured share of hedges")
+    
+    router = make_router()
+    calls, cancelled = [], []
+    call = make_call({"claude-3-5-sonnet": 0.2, "gpt-4-turbo": None}, calls, cancelled)
+    
+    with patch(f"{SETTINGS}.LLM_HEDGING_ENABLED", True):
+        result, used = await hedged_invoke(router, "claude-3-5-sonnet", call, "gpt-4-turbo", HedgeBudget("t", 1.0, 1.0))
+    assert used == "claude-3-5-sonnet", "Primary result is used when the hedge fails"
+    print("   ✅ Failed hedge falls back to the primary result")
+    
+    return True
+
+
+class QueuedRateLimiter(NoopRateLimiter):
+    """Rate limiter that holds every call in its queue for a fixed wait."""
+    
+    def __init__(self, wait):
+        self.wait = wait
+    
+    async def acquire(self, tokens: int = 0) -> float:
+        await asyncio.sleep(self.wait)
+        return self.wait
+
+
+async def test_limiter_wait_not_hedged():
+    """Test that the hedge delay starts after the primary leaves its rate limiter."""
+    print("\n🧪 Testing hedge delay under rate limiting...")
+    
+    router = make_router()
+    limiters = {"claude-3-5-sonnet": QueuedRateLimiter(0.2), "gpt-4-turbo": NoopRateLimiter()}
+    calls, cancelled = [], []
+    call = make_call({"claude-3-5-sonnet": 0.01, "gpt-4-turbo": 0.01}, calls, cancelled)
+    
+    with patch(f"{SETTINGS}.LLM_HEDGING_ENABLED", True), \
+         patch("app.langgraph.utils.provider_router.get_rate_limiter", side_effect=limiters.get):
+        result, used = await hedged_invoke(router, "claude-3-5-sonnet", call, "gpt-4-turbo", HedgeBudget("t", 1.0, 1.0))
+        assert used == "claude-3-5-sonnet" and calls == ["claude-3-5-sonnet"], f"Queued primary was hedged: {calls}"
+        print("   ✅ Primary queued 4x its p95 in the rate limiter was not hedged")
+        
+        calls, cancelled = [], []
+        call = make_call({"claude-3-5-sonnet": 1.0, "gpt-4-turbo": 0.01}, calls, cancelled)
+        start = asyncio.get_running_loop().time()
+        result, used = await hedged_invoke(router, "claude-3-5-sonnet", call, "gpt-4-turbo", HedgeBudget("t", 1.0, 1.0))
+        elapsed = asyncio.get_running_loop().time() - start
+        await asyncio.sleep(0)
+        assert used == "gpt-4-turbo" and cancelled == ["claude-3-5-sonnet"]
+        assert elapsed >= 0.25, f"Hedge should wait for the limiter plus p95, answered after {elapsed:.2f}s"
+        print(f"   ✅ Slow primary hedged after its limiter wait plus p95 ({elapsed:.2f}s)")
+    
+    return True
+
+
+async def main():
+    """Run hedging tests."""
+    print("🚀 Starting Hedging Tests")
+    print("=" * 80)
+    
+    test1_success = await test_hedge_wins()
+    test2_success = await test_no_hedge()
+    test3_success = await test_budget_and_failures()
+    test4_success = await test_limiter_wait_not_hedged()
+    
+    print("\n" + "=" * 80)
+    print(f"Hedge Win Test: {'✅ PASSED' if test1_success else '❌ FAILED'}")
+    print(f"No Hedge Test: {'✅ PASSED' if test2_success else '❌ FAILED'}")
+    print(f"Budget/Failure Test: {'✅ PASSED' if test3_success else '❌ FAILED'}")
+    print(f"Limiter Wait Test: {'✅ PASSED' if test4_success else '❌ FAILED'}")
+    
+    return test1_success and test2_success and test3_success and test4_success
+
+
+if __name__ == "__main__":
+    success = asyncio.run(main())
+    sys.exit(0 if success else 1)
@@ -0,0 +1,182 @@
+"""
+Test the shared Serper HTTP client.
+
+httpx.AsyncClient is replaced with a fake, so the tests cover creating
+and closing the client in the application lifespan, the one-off client
+FetchNewsNode falls back to, and the pool stats reported by /health.
+"""
+import asyncio
+import sys
+import os
+from types import SimpleNamespace
+from unittest.mock import patch, AsyncMock, MagicMock
+
+# Add the backend directory to the Python path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__)))
+
+from app.core import http_client
+from app.core.http_client import get_client_pool_stats, get_serper_client, set_serper_client
+from app.langgraph.nodes.fetch_news_node import FetchNewsNode
+from app.main import app, lifespan
+
+STATS_KEYS = {"status", "connections", "in_use", "idle", "max_connections", "max_keepalive_connections"}
+
+
+class FakeAsyncClient:
+    """httpx.AsyncClient stand-in that records its options and closing."""
+    
+    def __init__(self, **kwargs):
+        self.kwargs = kwargs
+        self.is_closed = False
+    
+    async def aclose(self):
+        self.is_closed = True
+    
+    async def __aenter__(self):
+        return self
+    
+    async def __aexit__(self, *args):
+        await self.aclose()
+        return False
+
+
+class FakeConnection:
+    """httpcore connection stand-in."""
+    
+    def __init__(self, idle=False, closed=False):
+        self.idle = idle
+        self.closed = closed
+    
+    def is_idle(self):
+        return self.idle
+    
+    def is_closed(self):
+        return self.closed
+
+
+async def test_lifespan_client():
+    """Test that the lifespan creates the shared client and closes it on shutdown."""
+    print("🧪 Testing Serper client lifespan...")
+    
+    # Stand in for every other startup and shutdown hook
+    hooks = {
+        "engine": MagicMock(begin=MagicMock(side_effect=RuntimeError("no database"))),
+        "get_quota_backend": MagicMock(return_value=None),
+        "get_news_cache_queue": MagicMock(return_value=None),
+        "get_summary_cache": MagicMock(return_value=MagicMock(start=AsyncMock())),
+        "get_topic_config_registry": MagicMock(return_value=MagicMock(start=AsyncMock())),
+        "get_external_state_manager": MagicMock(),
+        "get_llm_client_pool": MagicMock(return_value=MagicMock(aclose=AsyncMock())),
+        "stop_logging": MagicMock(),
+    }
+    for name in ("close_news_cache_queue", "close_summary_cache", "close_serper_cache", "close_rate_limiters",
+                 "close_url_shortener", "close_external_state_manager", "close_topic_config_registry"):
+        hooks[name] = AsyncMock()
+    
+    patches = [patch(f"app.main.{name}", hook) for name, hook in hooks.items()]
+    patches.append(patch.object(http_client.httpx, "AsyncClient", FakeAsyncClient))
+    for p in patches:
+        p.start()
+    
+    try:
+        async with lifespan(app):
+            client = get_serper_client()
+            assert isinstance(client, FakeAsyncClient) and not client.is_closed, "Lifespan should open the shared client"
+            assert client.kwargs["timeout"] and "limits" in client.kwargs
+            assert get_client_pool_stats(client)["status"] == "open"
+            print("   ✅ Shared client created on startup")
+        
+        assert client.is_closed and get_serper_client() is None, "Lifespan should close and clear the shared client"
+        assert get_client_pool_stats(get_serper_client()) == {"status": "not_initialized"}
+        print("   ✅ Shared client closed and cleared on shutdown")
+    finally:
+        for p in patches:
+            p.stop()
+    
+    return True
+
+
+async def test_fetch_node_fallback():
+    """Test that FetchNewsNode uses the shared client and falls back to a one-off client."""
+    print("\n🧪 Testing FetchNewsNode client fallback...")
+    
+    shared = FakeAsyncClient()
+    set_serper_client(shared)
+    
+    with patch("app.langgraph.nodes.fetch_news_node.httpx.AsyncClient", FakeAsyncClient):
+        try:
+            node = FetchNewsNode()
+            async with node._get_http_client() as client:
+                assert client is shared, "Open shared client should be used"
+            assert not shared.is_closed, "Shared client must stay open after the call"
+            print("   ✅ Open shared client used and left open")
+            
+            await shared.aclose()
+            async with node._get_http_client() as client:
+                one_off = client
+                assert client is not shared and not client.is_closed, "Closed shared client falls back to a one-off"
+            assert one_off.is_closed, "One-off client is closed after the call"
+            
+            set_serper_client(None)
+            async with FetchNewsNode()._get_http_client() as client:
+                assert client.kwargs == {"timeout": node.timeout}
+            print("   ✅ Closed or missing shared client replaced by a one-off client closed after the call")
+        finally:
+            set_serper_client(None)
+    
+    return True
+
+
+async def test_pool_stats_shape():
+    """Test pool stats for known and unknown httpcore pool layouts."""
+    print("\n🧪 Testing pool stats...")
+    
+    client = FakeAsyncClient()
+    pool = SimpleNamespace(connections=[FakeConnection(idle=True), FakeConnection(closed=True), FakeConnection()])
+    client._transport = SimpleNamespace(_pool=pool)
+    
+    stats = get_client_pool_stats(client)
+    assert set(stats) == STATS_KEYS, f"Unexpected keys: {stats}"
+    assert (stats["connections"], stats["in_use"], stats["idle"]) == (3, 1, 1), f"Unexpected counts: {stats}"
+    print("   ✅ Connections counted from the httpcore pool")
+    
+    class BrokenPool:
+        @property
+        def connections(self):
+            raise RuntimeError("pool layout changed")
+    
+    for transport in (None, SimpleNamespace(), SimpleNamespace(_pool=BrokenPool())):
+        client._transport = transport
+        stats = get_client_pool_stats(client)
+        assert set(stats) == STATS_KEYS and stats["status"] == "open" and stats["connections"] is None, stats
+    
+    client._transport = SimpleNamespace(_pool=SimpleNamespace(connections=[object(), FakeConnection(idle=True)]))
+    assert get_client_pool_stats(client)["idle"] == 1, "Connections without state methods count as in use"
+    print("   ✅ Unknown pool layouts report None counts instead of raising")
+    
+    await client.aclose()
+    assert get_client_pool_stats(client) == {"status": "closed"}
+    
+    return True
+
+
+async def main():
+    """Run HTTP client tests."""
+    print("🚀 Starting HTTP Client Tests")
+    print("=" * 80)
+    
+    test1_success = await test_lifespan_client()
+    test2_success = await test_fetch_node_fallback()
+    test3_success = await test_pool_stats_shape()
+    
+    print("\n" + "=" * 80)
+    print(f"Lifespan Test: {'✅ PASSED' if test1_success else '❌ FAILED'}")
+    print(f"Fetch Node Fallback Test: {'✅ PASSED' if test2_success else '❌ FAILED'}")
+    print(f"Pool Stats Test: {'✅ PASSED' if test3_success else '❌ FAILED'}")
+    
+    return test1_success and test2_success and test3_success
+
+
+if __name__ == "__main__":
+    success = asyncio.run(main())
+    sys.exit(0 if success else 1)
@@ -0,0 +1,87 @@
+"""
+Test the compiled keyword matcher used for relevance scoring.
+"""
+import sys
+import os
+
+# Add the backend directory to the Python path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__)))
+
+from app.langgraph.utils.keyword_matcher import KeywordMatcher, get_keyword_matcher
+
+
+def matched(matcher, text):
+    """Return the matched keywords (not indices) for readable assertions."""
+    return {matcher.keywords[i] for i in matcher.match(text)}
+
+
+def test_word_boundaries():
+    """Test that keywords only match whole words, case-insensitively."""
+    print("🧪 Testing word-boundary matching...")
+    
+    matcher = KeywordMatcher(["AI", "machine learning", "C++"])
+    
+    assert matched(matcher, "He said the rain would stop") == set(), "AI must not match inside 'said'"
+    assert matched(matcher, "The AI boom") == {"AI"}
+    assert matched(matcher, "AI-powered tools") == {"AI"}, "Punctuation is a word boundary"
+    assert matched(matcher, "Why ai?") == {"AI"}, "Matching should be case-insensitive"
+    assert matched(matcher, "Machine   Learning at scale") == {"machine learning"}
+    assert matched(matcher, "machine learnings") == set(), "Partial last word must not match"
+    assert matched(matcher, "Written in C++ and Rust") == {"C++"}
+    assert matched(matcher, "Written in C and Rust") == set(), "C++ needs its symbols"
+    print("   ✅ Whole-word, case-insensitive matches only")
+    
+    return True
+
+
+def test_overlapping_keywords():
+    """Test that overlapping and nested keywords are all reported."""
+    print("\n🧪 Testing overlapping keywords...")
+    
+    matcher = KeywordMatcher(["machine", "machine learning", "learning", "deep learning systems", "learning systems"])
+    assert matched(matcher, "deep learning systems and machine learning") == {
+        "machine", "machine learning", "learning", "deep learning systems", "learning systems"
+    }
+    print("   ✅ Nested and overlapping keywords found in one pass")
+    
+    # Duplicate keywords keep separate indices, as the per-keyword loop counted them
+    matcher = KeywordMatcher(["AI", "ai", ""])
+    assert matcher.match("AI news") == {0, 1}, "Duplicates count separately; empty keywords never match"
+    print("   ✅ Duplicate keywords counted separately")
+    
+    return True
+
+
+def test_matcher_cache():
+    """Test that matchers are compiled once per keyword list."""
+    print("\n🧪 Testing matcher cache...")
+    
+    first = get_keyword_matcher(["AI", "LLM"])
+    second = get_keyword_matcher(["AI", "LLM"])
+    assert first is second, "Same keywords should reuse the compiled matcher"
+    assert get_keyword_matcher(["AI"]) is not first
+    print("   ✅ Compiled matcher reused")
+    
+    return True
+
+
+def main():
+    """Run keyword matcher tests."""
+    print("🚀 Starting Keyword Matcher Tests")
+    print("=" * 80)
+    
+    test1_success = test_word_boundaries()
+    test2_success = test_overlapping_keywords()
+    test3_success = test_matcher_cache()
+    
+    print("\n" + "=" * 80)
+    print(f"Word Boundary Test: {'✅ PASSED' if test1_success else '❌ FAILED'}")
+    print(f"Overlapping Keywords Test: {'✅ PASSED' if test2_success else '❌ FAILED'}")
+    print(f"Matcher Cache Test: {'✅ PASSED' if test3_success else '❌ FAILED'}")
+    
+    return test1_success and test2_success and test3_success
+
+
+if __name__ == "__main__":
+    success = main()
+    sys.exit(0 if success else 1)
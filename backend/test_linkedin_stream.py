@@ -0,0 +1,173 @@
+"""
+Test streaming LinkedIn post generation.
+
+Providers are replaced with fake streaming clients, so the tests cover
+token order, truncation at MAX_CHAR_LIMIT, failover before the first
+token, the save-failure error event and malformed session IDs.
+"""
+import asyncio
+import sys
+import os
+import json
+from types import SimpleNamespace
+from unittest.mock import patch, MagicMock
+
+# Add the backend directory to the Python path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__)))
+
+from app.langgraph.nodes.linkedin_post_node import LinkedInPostNode
+from app.langgraph.state.post_state import create_initial_post_state
+from app.langgraph.utils.provider_router import ProviderRouter
+from app.langgraph.utils.rate_limiter import NoopRateLimiter
+from app.langgraph.utils.error_handlers import ValidationError
+from app.api.routes.posts import _linkedin_post_events, _validate_session_exists, _map_post_error
+
+NODE = "app.langgraph.nodes.linkedin_post_node"
+WORKFLOW = "app.langgraph.workflows.post_workflow"
+
+
+class FakeStreamingLLM:
+    """Streams the given chunks, optionally failing before chunk fail_at."""
+    
+    def __init__(self, chunks, fail_at=None):
+        self.chunks = chunks
+        self.fail_at = fail_at
+        self.calls = 0
+        self.streamed = 0
+    
+    async def astream(self, messages):
+        self.calls += 1
+        for index, text in enumerate(self.chunks):
+            if index == self.fail_at:
+                raise RuntimeError("provider stream failed")
+            self.streamed += 1
+            yield SimpleNamespace(content=text)
+
+
+def make_state():
+    """Build the initial state for a streamed LinkedIn post."""
+    articles = [{"title": "AI News", "url": "https://example.com/ai", "source": "example.com", "summary": "Summary"}]
+    return create_initial_post_state(articles, "AI", "claude-3-5-sonnet", "session", "workflow", "news-workflow")
+
+
+async def collect_events(providers, router=None):
+    """Run astream_post with fake providers and return its events."""
+    node = LinkedInPostNode()
+    node.llm_providers = providers
+    
+    with patch(f"{NODE}.get_provider_router", return_value=router or ProviderRouter()), \
+         patch(f"{NODE}.get_rate_limiter", return_value=NoopRateLimiter()):
+        return [event async for event in node.astream_post(make_state())]
+
+
+async def test_token_order_and_truncation():
+    """Test that tokens arrive in order and streaming stops past the limit."""
+    print("🧪 Testing token order and truncation...")
+    
+    chunks = ["Exciting ", "news ", "in ", "AI ", "today."]
+    events = await collect_events({"claude-3-5-sonnet": FakeStreamingLLM(chunks)})
+    
+    assert [e["content"] for e in events if e["type"] == "token"] == chunks, "Tokens must arrive in provider order"
+    assert events[-1]["type"] == "post" and events[-1]["post"]["content"] == "".join(chunks).strip()
+    print("   ✅ Tokens streamed in order, followed by the finalized post")
+    
+    long_llm = FakeStreamingLLM(["x" * 500] * 20)
+    events = await collect_events({"claude-3-5-sonnet": long_llm})
+    post = events[-1]["post"]
+    
+    assert long_llm.streamed == 7, f"Streaming should stop once past {LinkedInPostNode.MAX_CHAR_LIMIT} chars, read {long_llm.streamed}"
+    assert post["char_count"] <= LinkedInPostNode.MAX_CHAR_LIMIT, f"Post exceeds the limit: {post['char_count']}"
+    print(f"   ✅ Stream stopped after {long_llm.streamed} chunks, post truncated to {post['char_count']} chars")
+    
+    return True
+
+
+async def test_failover():
+    """Test that providers fail over only before the first token."""
+    print("\n🧪 Testing failover...")
+    
+    primary = FakeStreamingLLM(["never sent"], fail_at=0)
+    backup = FakeStreamingLLM(["Backup ", "post"])
+    router = ProviderRouter()
+    events = await collect_events({"claude-3-5-sonnet": primary, "gpt-4-turbo": backup}, router)
+    
+    assert events[-1]["llm_model"] == "gpt-4-turbo" and events[-1]["post"]["content"] == "Backup post"
+    assert router.get_stats()["claude-3-5-sonnet"]["error_rate"] == 1.0, "Primary failure must be recorded"
+    print("   ✅ Failure before the first token fails over to the backup")
+    
+    primary = FakeStreamingLLM(["Partial ", "post"], fail_at=1)
+    backup = FakeStreamingLLM(["Backup post"])
+    try:
+        await collect_events({"claude-3-5-sonnet": primary, "gpt-4-turbo": backup})
+        print("   ❌ Failure after the first token should not fail over")
+        return False
+    except RuntimeError:
+        pass
+    
+    assert backup.calls == 0, "Backup must not be used once tokens were sent"
+    print("   ✅ Failure after the first token is raised instead of switching providers")
+    
+    return True
+
+
+async def test_error_events():
+    """Test the save-failure error event and malformed session IDs."""
+    print("\n🧪 Testing error events...")
+    
+    class FakeLinkedInPostNode:
+        async def astream_post(self, state):
+            yield {"type": "token", "content": "Hello "}
+            yield {"type": "token", "content": "LinkedIn"}
+            post = {"content": "Hello LinkedIn", "char_count": 14, "hashtags": []}
+            yield {"type": "post", "post": post, "llm_model": "claude-3-5-sonnet"}
+    
+    async def failing_save(state):
+        return {**state, "failed_step": "save_posts", "error_message": "database unavailable"}
+    
+    request = SimpleNamespace(
+        articles=make_state()["articles"], topic="AI", llmModel="claude-3-5-sonnet",
+        sessionId="session", newsWorkflowId="news-workflow"
+    )
+    
+    with patch(f"{WORKFLOW}.LinkedInPostNode", FakeLinkedInPostNode), \
+         patch(f"{WORKFLOW}.SavePostsNode", return_value=failing_save):
+        messages = [message async for message in _linkedin_post_events(request)]
+    
+    names = [message.split("\n")[0] for message in messages]
+    assert names == ["event: token", "event: token", "event: error"], f"Unexpected events: {names}"
+    error = json.loads(messages[-1].split("\n")[1][len("data: "):])
+    assert error["status"] == 500 and error["error"] == "DatabaseError", f"Unexpected error event: {error}"
+    print("   ✅ Save failure sent as an error event after the tokens")
+    
+    try:
+        await _validate_session_exists(MagicMock(), "not-a-uuid")
+        print("   ❌ Malformed session ID was accepted")
+        return False
+    except ValidationError as e:
+        status_code, detail = _map_post_error(e)
+        assert status_code == 400 and detail["details"]["field"] == "sessionId"
+    print("   ✅ Malformed session ID maps to 400")
+    
+    return True
+
+
+async def main():
+    """Run LinkedIn streaming tests."""
+    print("🚀 Starting LinkedIn Streaming Tests")
+    print("=" * 80)
+    
+    test1_success = await test_token_order_and_truncation()
+    test2_success = await test_failover()
+    test3_success = await test_error_events()
+    
+    print("\n" + "=" * 80)
+    print(f"Token Order/Truncation Test: {'✅ PASSED' if test1_success else '❌ FAILED'}")
+    print(f"Failover Test: {'✅ PASSED' if test2_success else '❌ FAILED'}")
+    print(f"Error Event Test: {'✅ PASSED' if test3_success else '❌ FAILED'}")
+    
+    return test1_success and test2_success and test3_success
+
+
+if __name__ == "__main__":
+    success = asyncio.run(main())
+    sys.exit(0 if success else 1)
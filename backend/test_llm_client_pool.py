@@ -0,0 +1,160 @@
+"""
+Test the process-wide LLM client pool.
+
+LangChain chat model classes are replaced with fakes holding SDK client
+stand-ins, so the tests cover client reuse per key, configuration errors
+and closing the underlying SDK clients on shutdown.
+"""
+import asyncio
+import sys
+import os
+from unittest.mock import patch
+
+# Add the backend directory to the Python path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__)))
+
+from app.langgraph.utils.llm_client_pool import LLMClientPool
+from app.langgraph.utils.error_handlers import LLMProviderError
+
+POOL = "app.langgraph.utils.llm_client_pool"
+
+
+class FakeAsyncSDKClient:
+    """Async SDK client stand-in with an awaitable close()."""
+    
+    def __init__(self, fail=False):
+        self.closed = 0
+        self.fail = fail
+    
+    async def close(self):
+        self.closed += 1
+        if self.fail:
+            raise RuntimeError("already closed")
+
+
+class FakeSyncSDKClient:
+    """Sync SDK client stand-in with a plain close()."""
+    
+    def __init__(self):
+        self.closed = 0
+    
+    def close(self):
+        self.closed += 1
+
+
+class FakeChatModel:
+    """LangChain chat model stand-in holding an async and a sync SDK client."""
+    
+    def __init__(self, **kwargs):
+        self.kwargs = kwargs
+        self._async_client = FakeAsyncSDKClient()
+        self._client = FakeSyncSDKClient()
+
+
+def patched_pool():
+    """Patch the chat model classes and API keys used by the pool."""
+    return [
+        patch(f"{POOL}.ChatAnthropic", FakeChatModel),
+        patch(f"{POOL}.ChatOpenAI", FakeChatModel),
+        patch(f"{POOL}.settings.ANTHROPIC_API_KEY", "anthropic-key"),
+        patch(f"{POOL}.settings.OPENAI_API_KEY", "openai-key"),
+        patch(f"{POOL}.settings.GOOGLE_API_KEY", ""),
+    ]
+
+
+async def test_client_reuse():
+    """Test that equal keys share a client and different keys do not."""
+    print("🧪 Testing client reuse...")
+    
+    pool = LLMClientPool()
+    patches = patched_pool()
+    for p in patches:
+        p.start()
+    
+    try:
+        client = pool.get_client("claude-3-5-sonnet", 1000, 0.3)
+        assert pool.get_client("claude-3-5-sonnet", 1000, 0.3) is client, "Same key must return the same client"
+        assert pool.get_client("claude-3-5-sonnet", 1000.0, 0.30) is client, "Keys are normalized before lookup"
+        print("   ✅ Same (provider, model, temperature, max_tokens) reuses the client")
+        
+        others = [
+            pool.get_client("claude-3-5-sonnet", 1000, 0.7),
+            pool.get_client("claude-3-5-sonnet", 2000, 0.3),
+            pool.get_client("claude-3-5-haiku", 1000, 0.3),
+            pool.get_client("gpt-4-turbo", 1000, 0.3),
+        ]
+        assert len({id(c) for c in [client, *others]}) == 5, "Each distinct key gets its own client"
+        assert others[3].kwargs["api_key"] == "openai-key"
+        stats = pool.get_stats()
+        assert stats["clients"] == 5 and stats["hits"] == 2 and stats["misses"] == 5, f"Unexpected stats: {stats}"
+        print("   ✅ Different temperature, max_tokens, model or provider get separate clients")
+        
+        for model_name in ("unknown-model", "gemini-pro"):
+            try:
+                pool.get_client(model_name, 1000, 0.3)
+                print(f"   ❌ {model_name} should not get a client")
+                return False
+            except LLMProviderError:
+                pass
+        assert pool.configured_models() == ["claude-3-5-sonnet", "claude-3-5-haiku", "gpt-4-turbo"]
+        print("   ✅ Unknown models and missing API keys raise LLMProviderError")
+    finally:
+        for p in patches:
+            p.stop()
+    
+    return True
+
+
+async def test_aclose():
+    """Test that aclose() closes every SDK client once and empties the pool."""
+    print("\n🧪 Testing pool shutdown...")
+    
+    pool = LLMClientPool()
+    patches = patched_pool()
+    for p in patches:
+        p.start()
+    
+    try:
+        first = pool.get_client("claude-3-5-sonnet", 1000, 0.3)
+        second = pool.get_client("gpt-4-turbo", 1000, 0.3)
+        # Clients built from one SDK client must not close it twice
+        shared = pool.get_client("claude-3-5-haiku", 1000, 0.3)
+        shared._async_client = first._async_client
+        # A failing close must not stop the others
+        second._async_client = FakeAsyncSDKClient(fail=True)
+        
+        await pool.aclose()
+        
+        assert first._async_client.closed == 1 and first._client.closed == 1, "Async and sync SDK clients are closed"
+        assert second._async_client.closed == 1 and second._client.closed == 1, "Close continues past a failure"
+        assert shared._client.closed == 1
+        assert pool.get_stats()["clients"] == 0, "Pool is emptied"
+        print("   ✅ SDK clients closed once each and the pool emptied")
+        
+        assert pool.get_client("claude-3-5-sonnet", 1000, 0.3) is not first, "A new client is built after aclose()"
+        print("   ✅ Clients requested after shutdown are rebuilt")
+    finally:
+        for p in patches:
+            p.stop()
+    
+    return True
+
+
+async def main():
+    """Run LLM client pool tests."""
+    print("🚀 Starting LLM Client Pool Tests")
+    print("=" * 80)
+    
+    test1_success = await test_client_reuse()
+    test2_success = await test_aclose()
+    
+    print("\n" + "=" * 80)
+    print(f"Client Reuse Test: {'✅ PASSED' if test1_success else '❌ FAILED'}")
+    print(f"Shutdown Test: {'✅ PASSED' if test2_success else '❌ FAILED'}")
+    
+    return test1_success and test2_success
+
+
+if __name__ == "__main__":
+    success = asyncio.run(main())
+    sys.exit(0 if success else 1)
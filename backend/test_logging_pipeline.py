@@ -0,0 +1,114 @@
+"""
+Test the queued, level-guarded and sampled structured logging pipeline.
+"""
+import io
+import json
+import logging
+import sys
+import os
+import threading
+from unittest.mock import patch
+
+# Add the backend directory to the Python path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__)))
+
+from app.langgraph.utils import logging_config
+from app.langgraph.utils.logging_config import StructuredLogger, setup_logging, stop_logging
+
+
+def read_records(stream):
+    """Parse the JSON lines written so far."""
+    return [json.loads(line) for line in stream.getvalue().splitlines() if line.strip()]
+
+
+def test_queue_pipeline():
+    """Test that records are formatted on the listener thread and drained on stop."""
+    print("🧪 Testing queued logging pipeline...")
+    
+    stream = io.StringIO()
+    format_threads = set()
+    original_format = logging_config.StructuredFormatter.format
+    
+    def tracking_format(self, record):
+        format_threads.add(threading.current_thread().name)
+        return original_format(self, record)
+    
+    with patch.object(sys, "stdout", stream), \
+         patch.object(logging_config.StructuredFormatter, "format", tracking_format), \
+         patch.object(logging_config.settings, "LOG_ASYNC", True), \
+         patch.object(logging_config.settings, "LOG_FORMAT", "json"):
+        setup_logging()
+        logger = StructuredLogger("test_node")
+        for i in range(50):
+            logger.log_node_entry("session", "workflow", f"step-{i}")
+        stop_logging()
+    
+    records = read_records(stream)
+    entries = [r for r in records if r.get("node_name") == "test_node"]
+    assert len(entries) == 50, f"Expected 50 queued records after stop, got {len(entries)}"
+    assert threading.current_thread().name not in format_threads, "Formatting must happen on the listener thread"
+    assert entries[0]["step"] == "step-0" and entries[-1]["step"] == "step-49", "Records keep their order"
+    print(f"   ✅ 50 records formatted on {format_threads} and drained on stop")
+    
+    return True
+
+
+def test_guards_and_sampling():
+    """Test lazy extra_data, level guards and sampling of high-volume events."""
+    print("\n🧪 Testing level guards and sampling...")
+    
+    logger = StructuredLogger("guard_node")
+    built = []
+    
+    def expensive_extra():
+        built.append(True)
+        return {"details": "expensive"}
+    
+    logger.logger.setLevel(logging.WARNING)
+    logger.log_processing_step("s", "w", "step", "disabled", extra_data=expensive_extra)
+    assert not built, "Callable extra_data must not be built for disabled levels"
+    print("   ✅ Callable extra_data skipped for disabled levels")
+    
+    logger.logger.setLevel(logging.INFO)
+    emitted = []
+    with patch.object(logger.logger, "info", side_effect=lambda msg, extra: emitted.append(extra)), \
+         patch.object(logger.logger, "log", side_effect=lambda level, msg, extra: emitted.append(extra)), \
+         patch.object(logging_config.settings, "LOG_SAMPLE_RATES", {"summary_progress": 0.2, "api_call": 0.0}):
+        logger.log_processing_step("s", "w", "other_step", "kept", extra_data=expensive_extra)
+        assert built and emitted[-1]["details"] == "expensive" and "sample_rate" not in emitted[-1]
+        
+        emitted.clear()
+        for _ in range(1000):
+            logger.log_processing_step("s", "w", "summary_progress", "progress")
+        assert 120 < len(emitted) < 280, f"Expected about 20% of progress records, got {len(emitted)}"
+        assert emitted[0]["sample_rate"] == 0.2
+        print(f"   ✅ summary_progress sampled at 20% ({len(emitted)}/1000 kept)")
+        
+        emitted.clear()
+        logger.log_api_call("s", "w", "Serper", "POST", "https://example.com", status_code=200)
+        logger.log_api_call("s", "w", "Serper", "POST", "https://example.com", status_code=429)
+        assert len(emitted) == 1 and emitted[0]["status_code"] == 429, "Warnings are never sampled"
+        print("   ✅ Failed API calls logged even when api_call is sampled out")
+    
+    logger.logger.setLevel(logging.NOTSET)
+    return True
+
+
+def main():
+    """Run logging pipeline tests."""
+    print("🚀 Starting Logging Pipeline Tests")
+    print("=" * 80)
+    
+    test1_success = test_queue_pipeline()
+    test2_success = test_guards_and_sampling()
+    
+    print("\n" + "=" * 80)
+    print(f"Queue Pipeline Test: {'✅ PASSED' if test1_success else '❌ FAILED'}")
+    print(f"Guards/Sampling Test: {'✅ PASSED' if test2_success else '❌ FAILED'}")
+    
+    return test1_success and test2_success
+
+
+if __name__ == "__main__":
+    success = main()
+    sys.exit(0 if success else 1)
@@ -0,0 +1,231 @@
+"""
+Test the streaming news workflow and its SSE route.
+
+The compiled graph is replaced by a fake that replays node updates, and
+summarization runs the real fallback logic against fake providers, so
+the tests cover step/article/complete/error event order, the cache-hit
+path and one article event per index when a provider fails over.
+"""
+import asyncio
+import sys
+import os
+import json
+from types import SimpleNamespace
+from unittest.mock import patch
+
+# Add the backend directory to the Python path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__)))
+
+from app.langgraph.workflows.news_workflow import NewsWorkflow
+from app.langgraph.nodes.summarize_content_node import SummarizeContentNode
+from app.langgraph.state.news_state import mark_step_completed
+from app.langgraph.utils.provider_router import ProviderRouter
+from app.langgraph.utils.rate_limiter import NoopRateLimiter
+from app.langgraph.utils.error_handlers import QuotaExceededError
+from app.api.routes.news import _news_events
+
+NODE = "app.langgraph.nodes.summarize_content_node"
+
+
+class FakeGraph:
+    """Compiled graph stand-in whose astream() replays the given chunks."""
+    
+    def __init__(self, build_chunks):
+        self.build_chunks = build_chunks
+    
+    async def astream(self, state, stream_mode):
+        async for chunk in self.build_chunks(state):
+            yield chunk
+
+
+def make_articles(count):
+    """Create filtered articles as the summarize node receives them."""
+    return [
+        {
+            "title": f"Test Article {i + 1}",
+            "url": f"https://example.com/article-{i + 1}",
+            "source": "example.com",
+            "summary": f"Original snippet for article {i + 1}",
+            "published_at": None,
+            "relevance_score": 0.5,
+            "content_hash": f"hash-{i + 1}"
+        }
+        for i in range(count)
+    ]
+
+
+def make_client(provider):
+    """
+    Fake LLM client: claude-3-5-sonnet goes down after two articles and
+    gpt-4-turbo cannot summarize article 4.
+    """
+    async def ainvoke(messages):
+        content = messages[0].content
+        if provider == "claude-3-5-sonnet" and "Test Article 1\n" not in content and "Test Article 2\n" not in content:
+            raise RuntimeError("503 Service Unavailable")
+        if provider == "gpt-4-turbo" and "Test Article 4\n" in content:
+            raise RuntimeError("content filtered")
+        return SimpleNamespace(content=f"Summary by {provider}")
+    return SimpleNamespace(ainvoke=ainvoke)
+
+
+async def failover_chunks(state):
+    """Graph updates for a request whose provider fails over mid-summarization."""
+    state = mark_step_completed(state, "validate_input")
+    yield "updates", {"validate_input": state}
+    
+    node = SummarizeContentNode()
+    node.retry_delay = 0
+    events = []
+    
+    with patch(f"{NODE}.HumanMessage", lambda content: SimpleNamespace(content=content)), \
+         patch(f"{NODE}.emit_stream_event", events.append), \
+         patch(f"{NODE}.get_provider_router", return_value=ProviderRouter()), \
+         patch("app.langgraph.utils.provider_router.get_rate_limiter", return_value=NoopRateLimiter()), \
+         patch.object(node, "_initialize_llm_client", side_effect=make_client), \
+         patch(f"{NODE}.settings.SUMMARY_CACHE_ENABLED", False), \
+         patch(f"{NODE}.settings.SUMMARY_STRATEGY", "sequential"):
+        summarized = await node._summarize_with_fallback(
+            make_articles(4), ["claude-3-5-sonnet", "gpt-4-turbo"], [], "session", state["workflow_id"]
+        )
+    
+    for event in events:
+        yield "custom", event
+    
+    state = mark_step_completed({**state, "summarized_articles": summarized, "current_llm_provider": "gpt-4-turbo"}, "summarize_content")
+    yield "updates", {"summarize_content": state}
+    
+    state = mark_step_completed({**state, "quota_info": {"remaining": 9}, "total_found": 4, "processing_time": 1.5}, "save_results")
+    yield "updates", {"save_results": state}
+
+
+async def cache_hit_chunks(state):
+    """Graph updates for a request served from the news cache."""
+    state = mark_step_completed(state, "validate_input")
+    yield "updates", {"validate_input": state}
+    
+    cached = [{**article, "summary": f"Cached summary {i + 1}"} for i, article in enumerate(make_articles(3))]
+    state = mark_step_completed(
+        {**state, "cache_hit": True, "summarized_articles": cached, "current_llm_provider": "claude-3-5-sonnet"},
+        "check_cache"
+    )
+    yield "updates", {"check_cache": state}
+    
+    state = mark_step_completed({**state, "quota_info": {"remaining": 9}, "total_found": 4, "processing_time": 1.5}, "save_results")
+    yield "updates", {"save_results": state}
+
+
+async def quota_exceeded_chunks(state):
+    """Graph updates for a request rejected by the quota check."""
+    yield "updates", {"validate_input": mark_step_completed(state, "validate_input")}
+    raise QuotaExceededError("daily", 50, 50)
+
+
+async def stream(build_chunks):
+    """Run the SSE route over a workflow replaying build_chunks; return (event, data) pairs."""
+    workflow = NewsWorkflow()
+    workflow.workflow = FakeGraph(build_chunks)
+    request = SimpleNamespace(topic="AI", date="2025-01-01", topN=4, llmModel="claude-3-5-sonnet", sessionId="session")
+    
+    with patch("app.api.routes.news.get_news_workflow", return_value=workflow):
+        messages = [message async for message in _news_events(request)]
+    
+    events = []
+    for message in messages:
+        name, data = message.strip().split("\n")
+        events.append((name[len("event: "):], json.loads(data[len("data: "):])))
+    return events
+
+
+def describe(events):
+    """Short labels for event order assertions."""
+    labels = []
+    for name, data in events:
+        if name == "step":
+            labels.append(f"step:{data['step']}")
+        elif name == "article":
+            labels.append(f"article:{data['index']}")
+        else:
+            labels.append(name)
+    return labels
+
+
+async def test_failover_stream():
+    """Test event order and one article event per index when a provider fails over."""
+    print("🧪 Testing streamed summarization with provider failover...")
+    
+    events = await stream(failover_chunks)
+    
+    assert describe(events) == [
+        "step:validate_input", "article:0", "article:1", "article:2",
+        "step:summarize_content", "article:3", "step:save_results", "complete"
+    ], f"Unexpected event order: {describe(events)}"
+    print("   ✅ Steps, articles and complete arrive in workflow order")
+    
+    articles = {data["index"]: data["article"]["summary"] for name, data in events if name == "article"}
+    assert articles == {
+        0: "Summary by claude-3-5-sonnet",
+        1: "Summary by claude-3-5-sonnet",
+        2: "Summary by gpt-4-turbo",
+        3: "Original snippet for article 4"
+    }, f"Unexpected articles: {articles}"
+    print("   ✅ Failed-over article sent once with the backup's summary, unsummarized one sent once with its snippet")
+    
+    complete = events[-1][1]
+    assert [a["summary"] for a in complete["articles"]] == list(articles.values()) and not complete["cacheHit"]
+    assert complete["quotaRemaining"] == 9 and complete["llmProviderUsed"] == "gpt-4-turbo"
+    print("   ✅ Complete event matches the streamed articles")
+    
+    return True
+
+
+async def test_cache_hit_stream():
+    """Test that cache hits stream their articles after the check_cache step."""
+    print("\n🧪 Testing streamed cache hit...")
+    
+    events = await stream(cache_hit_chunks)
+    
+    assert describe(events) == [
+        "step:validate_input", "step:check_cache", "article:0", "article:1", "article:2",
+        "step:save_results", "complete"
+    ], f"Unexpected event order: {describe(events)}"
+    complete = events[-1][1]
+    assert complete["cacheHit"] and [a["summary"] for a in complete["articles"]] == [f"Cached summary {i}" for i in (1, 2, 3)]
+    print("   ✅ Cached articles streamed once each, complete reports the cache hit")
+    
+    return True
+
+
+async def test_error_stream():
+    """Test that a workflow failure after the first event is sent as an error event."""
+    print("\n🧪 Testing streamed workflow error...")
+    
+    events = await stream(quota_exceeded_chunks)
+    
+    assert describe(events) == ["step:validate_input", "error"], f"Unexpected event order: {describe(events)}"
+    assert events[-1][1]["status"] == 429 and events[-1][1]["error"] == "QuotaExceeded", events[-1][1]
+    print("   ✅ Quota failure sent as a 429 error event")
+    
+    return True
+
+
+async def main():
+    """Run news streaming tests."""
+    print("🚀 Starting News Streaming Tests")
+    print("=" * 80)
+    
+    test1_success = await test_failover_stream()
+    test2_success = await test_cache_hit_stream()
+    test3_success = await test_error_stream()
+    
+    print("\n" + "=" * 80)
+    print(f"Failover Stream Test: {'✅ PASSED' if test1_success else '❌ FAILED'}")
+    print(f"Cache Hit Stream Test: {'✅ PASSED' if test2_success else '❌ FAILED'}")
+    print(f"Error Stream Test: {'✅ PASSED' if test3_success else '❌ FAILED'}")
+    
+    return test1_success and test2_success and test3_success
+
+
+if __name__ == "__main__":
+    success = asyncio.run(main())
+    sys.exit(0 if success else 1)
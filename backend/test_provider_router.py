@@ -0,0 +1,221 @@
+"""
+Test health-aware LLM provider routing and per-model circuit breakers.
+"""
+import asyncio
+import sys
+import os
+from unittest.mock import patch, MagicMock
+
+# Add the backend directory to the Python path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__)))
+
+from app.langgraph.utils.provider_router import ProviderRouter
+from app.langgraph.utils.error_handlers import LLMProviderError
+from app.langgraph.nodes.summarize_content_node import SummarizeContentNode
+
+
+async def test_circuit_breaker():
+    """Test that a circuit opens on failures, half-opens and closes again."""
+    print("🧪 Testing circuit breaker...")
+    
+    router = ProviderRouter()
+    
+    with patch("app.langgraph.utils.provider_router.settings.LLM_ROUTER_OPEN_SECONDS", 0.05):
+        router.record_failure("gpt-4-turbo")
+        router.record_failure("gpt-4-turbo")
+        assert not router.is_open("gpt-4-turbo"), "Two failures should not trip the circuit"
+        router.record_failure("gpt-4-turbo")
+        assert router.is_open("gpt-4-turbo"), "Three consecutive failures should trip the circuit"
+        assert "gpt-4-turbo" not in router.route("claude-3-5-sonnet"), "Open models must not be routed to"
+        print("   ✅ Circuit opens after consecutive failures")
+        
+        await asyncio.sleep(0.06)
+        assert not router.is_open("gpt-4-turbo"), "Circuit should half-open after the cool-down"
+        router.record_failure("gpt-4-turbo")
+        assert router.is_open("gpt-4-turbo"), "A failed trial call should re-open the circuit"
+        
+        await asyncio.sleep(0.06)
+        router.is_open("gpt-4-turbo")
+        router.record_success("gpt-4-turbo", 0.5)
+        assert router.get_stats()["gpt-4-turbo"]["state"] == "closed"
+        assert router.get_stats()["gpt-4-turbo"]["opens"] == 2
+        print("   ✅ Trial call re-opens on failure and closes on success")
+    
+    # Interleaved failures trip on error rate once enough calls are in the window
+    for _ in range(3):
+        router.record_success("gemini-pro", 0.4)
+        router.record_failure("gemini-pro")
+    assert router.is_open("gemini-pro"), "A 50% error rate over the window should trip the circuit"
+    print("   ✅ Circuit opens on windowed error rate")
+    
+    return True
+
+
+async def test_half_open_single_trial():
+    """Test that a half-open circuit lets exactly one concurrent caller through."""
+    print("\n🧪 Testing half-open trial call...")
+    
+    router = ProviderRouter()
+    
+    async def check(model):
+        await asyncio.sleep(0)
+        return router.is_open(model)
+    
+    with patch("app.langgraph.utils.provider_router.settings.LLM_ROUTER_OPEN_SECONDS", 0.05):
+        for _ in range(3):
+            router.record_failure("gpt-4-turbo")
+        await asyncio.sleep(0.06)
+        
+        assert not router.is_open("gpt-4-turbo", claim_trial=False), "Checking must not take the trial"
+        results = await asyncio.gather(*(check("gpt-4-turbo") for _ in range(10)))
+        assert results.count(False) == 1, f"Exactly one caller should get the trial, got {results}"
+        assert router.get_stats()["gpt-4-turbo"]["state"] == "open", "Others see the circuit as open"
+        print("   ✅ 1 of 10 concurrent checks let through, the rest kept out")
+        
+        router.release_trial("gpt-4-turbo")
+        assert not router.is_open("gpt-4-turbo") and router.is_open("gpt-4-turbo"), "A released trial can be taken again"
+        router.record_success("gpt-4-turbo", 0.5)
+        results = await asyncio.gather(*(check("gpt-4-turbo") for _ in range(10)))
+        assert not any(results), "A successful trial closes the circuit for everyone"
+        print("   ✅ Released trial is handed out again; a successful trial closes the circuit")
+        
+        # Concurrent routed calls: only the trial reaches the recovering model
+        for _ in range(3):
+            router.record_failure("gpt-4-turbo")
+        await asyncio.sleep(0.06)
+        calls = []
+        
+        async def slow_call(model):
+            calls.append(model)
+            await asyncio.sleep(0.01)
+            return model
+        
+        results = await asyncio.gather(*(
+            router.invoke_with_routing("gpt-4-turbo", slow_call, ["gpt-4-turbo"]) for _ in range(5)
+        ), return_exceptions=True)
+        assert calls == ["gpt-4-turbo"], f"Only the trial call should reach the half-open model, got {calls}"
+        assert sum(isinstance(r, LLMProviderError) for r in results) == 4, f"Unexpected results: {results}"
+        assert router.get_stats()["gpt-4-turbo"]["state"] == "closed"
+        print("   ✅ 5 concurrent requests sent 1 trial call to the recovering model")
+    
+    return True
+
+
+async def test_routing():
+    """Test latency-aware ordering within a model class."""
+    print("\n🧪 Testing routing order...")
+    
+    router = ProviderRouter()
+    candidates = ["claude-3-5-sonnet", "claude-3-5-haiku", "gpt-4-turbo", "gemini-pro"]
+    
+    assert router.route("claude-3-5-sonnet", candidates) == [
+        "claude-3-5-sonnet", "gpt-4-turbo", "gemini-pro", "claude-3-5-haiku"
+    ], "Without history, same-class models keep their order and other classes come last"
+    print("   ✅ Same-class models first, other classes as a last resort")
+    
+    for _ in range(3):
+        router.record_success("claude-3-5-sonnet", 0.9)
+        router.record_success("gpt-4-turbo", 1.0)
+        router.record_success("gemini-pro", 0.5)
+    assert router.route("claude-3-5-sonnet", candidates)[:3] == ["claude-3-5-sonnet", "gemini-pro", "gpt-4-turbo"], \
+        "A slightly slower requested model keeps first place"
+    
+    for _ in range(3):
+        router.record_success("claude-3-5-sonnet", 6.0)
+    assert router.route("claude-3-5-sonnet", candidates)[0] == "gemini-pro", "A much slower requested model is demoted"
+    print("   ✅ Requested model demoted only when clearly slower")
+    
+    return True
+
+
+async def test_invoke_failover():
+    """Test failover in route order and the all-failed error."""
+    print("\n🧪 Testing invoke failover...")
+    
+    router = ProviderRouter()
+    calls = []
+    
+    async def call(model):
+        calls.append(model)
+        if model == "claude-3-5-sonnet":
+            raise RuntimeError("overloaded")
+        return f"response from {model}"
+    
+    result, used = await router.invoke_with_routing("claude-3-5-sonnet", call, ["claude-3-5-sonnet", "gpt-4-turbo"])
+    assert (result, used) == ("response from gpt-4-turbo", "gpt-4-turbo") and calls == ["claude-3-5-sonnet", "gpt-4-turbo"]
+    print("   ✅ Failed model falls over to the next routed model")
+    
+    async def failing_call(model):
+        raise RuntimeError("down")
+    
+    try:
+        await router.invoke_with_routing("gemini-pro", failing_call, ["gemini-pro"])
+        return False
+    except LLMProviderError:
+        print("   ✅ LLMProviderError raised when every model fails")
+    
+    return True
+
+
+async def test_summarize_skips_open_provider():
+    """Test that the summarize node stops retrying a tripped provider and fails over its articles."""
+    print("\n🧪 Testing summarize node failover...")
+    
+    node = SummarizeContentNode()
+    node.retry_delay = 0
+    router = ProviderRouter()
+    articles = [
+        {"title": f"Article {i}", "url": f"https://example.com/{i}", "source": "example.com", "summary": f"Snippet {i}"}
+        for i in range(4)
+    ]
+    calls = {"claude-3-5-sonnet": 0, "gpt-4-turbo": 0}
+    
+    def make_client(provider):
+        async def ainvoke(messages):
+            calls[provider] += 1
+            if provider == "claude-3-5-sonnet":
+                raise RuntimeError("503 Service Unavailable")
+            return MagicMock(content=f"Summary by {provider}")
+        return MagicMock(ainvoke=ainvoke)
+    
+    with patch("app.langgraph.nodes.summarize_content_node.get_provider_router", return_value=router), \
+         patch.object(node, "_initialize_llm_client", side_effect=make_client), \
+         patch("app.langgraph.nodes.summarize_content_node.settings.SUMMARY_CACHE_ENABLED", False), \
+         patch("app.langgraph.nodes.summarize_content_node.settings.SUMMARY_STRATEGY", "sequential"):
+        providers_tried = []
+        summarized = await node._summarize_with_fallback(
+            articles, ["claude-3-5-sonnet", "gpt-4-turbo"], providers_tried, "session", "workflow"
+        )
+    
+    assert calls["claude-3-5-sonnet"] == 3, f"Dead provider should be skipped once tripped, got {calls}"
+    assert providers_tried == ["claude-3-5-sonnet", "gpt-4-turbo"]
+    assert all(a["summary"] == "Summary by gpt-4-turbo" for a in summarized), [a["summary"] for a in summarized]
+    print(f"   ✅ {calls['claude-3-5-sonnet']} calls to the dead provider, all articles summarized by the fallback")
+    
+    return True
+
+
+async def main():
+    """Run provider router tests."""
+    print("🚀 Starting Provider Router Tests")
+    print("=" * 80)
+    
+    test1_success = await test_circuit_breaker()
+    test2_success = await test_routing()
+    test3_success = await test_invoke_failover()
+    test4_success = await test_summarize_skips_open_provider()
+    test5_success = await test_half_open_single_trial()
+    
+    print("\n" + "=" * 80)
+    print(f"Circuit Breaker Test: {'✅ PASSED' if test1_success else '❌ FAILED'}")
+    print(f"Routing Test: {'✅ PASSED' if test2_success else '❌ FAILED'}")
+    print(f"Invoke Failover Test: {'✅ PASSED' if test3_success else '❌ FAILED'}")
+    print(f"Summarize Failover Test: {'✅ PASSED' if test4_success else '❌ FAILED'}")
+    print(f"Half-Open Trial Test: {'✅ PASSED' if test5_success else '❌ FAILED'}")
+    
+    return test1_success and test2_success and test3_success and test4_success and test5_success
+
+
+if __name__ == "__main__":
+    success = asyncio.run(main())
+    sys.exit(0 if success else 1)
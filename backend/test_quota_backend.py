@@ -0,0 +1,205 @@
+"""
+Test the in-memory quota backend.
+
+Counters are seeded directly so the tests don't need a database for
+warm-up, and database writes are patched; requests are queued when a
+test starts the write-behind worker and written inline otherwise.
+"""
+import asyncio
+import sys
+import os
+import uuid
+from datetime import datetime, timedelta
+from unittest.mock import patch, AsyncMock
+
+# Add the backend directory to the Python path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__)))
+
+from app.langgraph.utils.quota_backend import InMemoryQuotaBackend, SessionQuotaCounters
+from app.langgraph.utils.error_handlers import QuotaExceededError, DuplicateRequestError, DatabaseError
+from app.core.quota import get_quota_windows
+from app.core.config import settings
+
+
+def seed_session(backend, session_id, daily_used=0, monthly_used=0):
+    """Seed counters for a session as if warmed from the database."""
+    day_start, _, month_start, _ = get_quota_windows()
+    backend._sessions[session_id] = SessionQuotaCounters(day_start, month_start, daily_used, monthly_used)
+
+
+async def test_reserve_and_duplicates():
+    """Test that requests are counted and duplicates rejected."""
+    print("🧪 Testing reserve and duplicate detection...")
+    
+    backend = InMemoryQuotaBackend()
+    backend._insert_requests = AsyncMock()
+    seed_session(backend, "session-1", daily_used=2, monthly_used=5)
+    await backend.start()
+    
+    daily_used, monthly_used = await backend.reserve("session-1", "AI", "2025-01-01", "hash-1")
+    assert (daily_used, monthly_used) == (3, 6), f"Unexpected usage: {daily_used}, {monthly_used}"
+    assert backend.get_stats()["write_behind"]["enqueued"] == 1, "Request should be queued for write-behind"
+    print("   ✅ Request counted and queued")
+    
+    try:
+        await backend.reserve("session-1", "AI", "2025-01-01", "hash-1")
+        print("   ❌ Duplicate request was accepted")
+        return False
+    except DuplicateRequestError:
+        print("   ✅ Duplicate request rejected")
+    
+    await backend.stop()
+    assert backend._insert_requests.await_count == 1, "Queued request should be written on stop"
+    
+    return True
+
+
+async def test_quota_limits():
+    """Test that daily limits are enforced."""
+    print("\n🧪 Testing quota limits...")
+    
+    backend = InMemoryQuotaBackend()
+    seed_session(backend, "session-2", daily_used=settings.DAILY_QUOTA_LIMIT, monthly_used=settings.DAILY_QUOTA_LIMIT)
+    
+    try:
+        await backend.reserve("session-2", "AI", "2025-01-01", "hash-2")
+        print("   ❌ Request over the daily limit was accepted")
+        return False
+    except QuotaExceededError:
+        print("   ✅ Daily limit enforced")
+    
+    assert backend.get_stats()["write_behind"]["pending"] == 0, "Rejected requests must not be recorded"
+    return True
+
+
+async def test_day_rollover():
+    """Test that counters and hashes from a previous day are reset."""
+    print("\n🧪 Testing UTC day rollover...")
+    
+    backend = InMemoryQuotaBackend()
+    backend._insert_requests = AsyncMock()
+    yesterday = datetime.utcnow() - timedelta(days=1)
+    day_start, _, month_start, _ = get_quota_windows(yesterday)
+    counters = SessionQuotaCounters(day_start, month_start, settings.DAILY_QUOTA_LIMIT, settings.DAILY_QUOTA_LIMIT)
+    counters.recent_hashes["hash-3"] = yesterday
+    backend._sessions["session-3"] = counters
+    
+    daily_used, _ = await backend.reserve("session-3", "AI", "2025-01-01", "hash-3")
+    assert daily_used == 1, f"Daily counter should reset, got {daily_used}"
+    print("   ✅ Daily counter reset at the day boundary")
+    
+    return True
+
+
+async def test_failed_rows_isolated():
+    """Test that rows for a deleted session are dropped without blocking the queue."""
+    print("\n🧪 Testing failed row isolation...")
+    
+    backend = InMemoryQuotaBackend()
+    live, deleted = str(uuid.uuid4()), str(uuid.uuid4())
+    seed_session(backend, live)
+    seed_session(backend, deleted)
+    written = []
+    
+    async def fake_insert(rows):
+        if any(row["session_id"] == deleted for row in rows):
+            raise RuntimeError("insert violates foreign key constraint on sessions.id")
+        written.extend(rows)
+    
+    with patch.object(backend, "_insert_requests", side_effect=fake_insert), \
+         patch.object(backend, "_existing_session_ids", AsyncMock(return_value={live})):
+        await backend.start()
+        await backend.reserve(live, "AI", "2025-01-01", "hash-a")
+        await backend.reserve(deleted, "AI", "2025-01-01", "hash-b")
+        await backend.reserve(live, "AI", "2025-01-01", "hash-c")
+        await backend.stop()
+    
+    stats = backend.get_stats()
+    assert [row["request_hash"] for row in written] == ["hash-a", "hash-c"], f"Live rows should be written: {written}"
+    assert stats["dropped_requests"] == 1 and stats["write_behind"]["failed_batches"] == 0, f"Unexpected stats: {stats}"
+    assert not backend._pending_sessions and deleted not in backend._sessions, "Dropped rows must not stay pending"
+    print("   ✅ Deleted session's row dropped, live rows written, queue not blocked")
+    
+    with patch.object(backend, "_insert_requests", AsyncMock(side_effect=RuntimeError("connection refused"))), \
+         patch.object(backend, "_existing_session_ids", AsyncMock(side_effect=RuntimeError("connection refused"))):
+        try:
+            await backend._write_requests([{"session_id": live, "request_hash": "hash-d"}])
+            print("   ❌ Unreachable database should fail the batch")
+            return False
+        except RuntimeError:
+            pass
+    print("   ✅ Unreachable database leaves the batch for the queue to retry")
+    
+    return True
+
+
+async def test_unrecorded_requests_released():
+    """Test inline writes without a worker and quota given back for unrecorded requests."""
+    print("\n🧪 Testing requests that cannot be queued...")
+    
+    backend = InMemoryQuotaBackend()
+    session_id = str(uuid.uuid4())
+    seed_session(backend, session_id, daily_used=2, monthly_used=5)
+    
+    backend._insert_requests = AsyncMock()
+    await backend.reserve(session_id, "AI", "2025-01-01", "hash-1")
+    rows = backend._insert_requests.await_args.args[0]
+    assert [row["request_hash"] for row in rows] == ["hash-1"] and not backend._pending_sessions
+    print("   ✅ Request written inline while the worker is not running")
+    
+    backend._insert_requests = AsyncMock(side_effect=RuntimeError("connection refused"))
+    with patch.object(backend, "_existing_session_ids", AsyncMock(side_effect=RuntimeError("connection refused"))):
+        try:
+            await backend.reserve(session_id, "AI", "2025-01-01", "hash-2")
+            print("   ❌ Unrecorded request was accepted")
+            return False
+        except DatabaseError:
+            pass
+    
+    counters = backend._sessions[session_id]
+    assert (counters.daily_used, counters.monthly_used) == (3, 6), "Failed inline write must not be charged"
+    assert "hash-2" not in counters.recent_hashes and not backend._pending_sessions
+    print("   ✅ Failed inline write raised DatabaseError and gave the quota back")
+    
+    backend._insert_requests = AsyncMock()
+    await backend.start()
+    with patch.object(backend._queue, "put", AsyncMock(side_effect=asyncio.CancelledError)):
+        try:
+            await backend.reserve(session_id, "AI", "2025-01-01", "hash-2")
+            print("   ❌ Cancelled enqueue was not raised")
+            return False
+        except asyncio.CancelledError:
+            pass
+    await backend.stop()
+    
+    assert (counters.daily_used, counters.monthly_used) == (3, 6), "Cancelled enqueue must not be charged"
+    assert "hash-2" not in counters.recent_hashes and not backend._pending_sessions
+    print("   ✅ Cancelled enqueue gave the quota back, so the request can be retried")
+    
+    return True
+
+
+async def main():
+    """Run quota backend tests."""
+    print("🚀 Starting Quota Backend Tests")
+    print("=" * 80)
+    
+    test1_success = await test_reserve_and_duplicates()
+    test2_success = await test_quota_limits()
+    test3_success = await test_day_rollover()
+    test4_success = await test_failed_rows_isolated()
+    test5_success = await test_unrecorded_requests_released()
+    
+    print("\n" + "=" * 80)
+    print(f"Reserve/Duplicate Test: {'✅ PASSED' if test1_success else '❌ FAILED'}")
+    print(f"Quota Limit Test: {'✅ PASSED' if test2_success else '❌ FAILED'}")
+    print(f"Day Rollover Test: {'✅ PASSED' if test3_success else '❌ FAILED'}")
+    print(f"Row Isolation Test: {'✅ PASSED' if test4_success else '❌ FAILED'}")
+    print(f"Unrecorded Request Test: {'✅ PASSED' if test5_success else '❌ FAILED'}")
+    
+    return test1_success and test2_success and test3_success and test4_success and test5_success
+
+
+if __name__ == "__main__":
+    success = asyncio.run(main())
+    sys.exit(0 if success else 1)
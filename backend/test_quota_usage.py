@@ -0,0 +1,167 @@
+"""
+Test quota usage accounting in app.core.quota.
+
+The user_requests table is replaced by an in-memory list that applies
+the query's own WHERE and FILTER clauses, so the tests cover the
+half-open day and month boundaries. The statement is also compiled
+against the PostgreSQL dialect to check the FILTER aggregate.
+"""
+import asyncio
+import sys
+import os
+import operator
+import uuid
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+from unittest.mock import patch
+
+# Add the backend directory to the Python path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__)))
+
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.sql import operators
+
+from app.core.quota import get_quota_windows, get_quota_usage
+
+OPERATORS = {
+    operators.eq: operator.eq,
+    operators.ge: operator.ge,
+    operators.gt: operator.gt,
+    operators.le: operator.le,
+    operators.lt: operator.lt
+}
+
+
+def frozen_datetime(now):
+    """datetime stand-in whose utcnow() returns now."""
+    class FrozenDatetime(datetime):
+        @classmethod
+        def utcnow(cls):
+            return now
+    return FrozenDatetime
+
+
+def matches(row, clause):
+    """Evaluate an AND of simple column comparisons against a row."""
+    criteria = getattr(clause, "clauses", [clause])
+    return all(
+        OPERATORS[criterion.operator](row[criterion.left.name], criterion.right.value)
+        for criterion in criteria
+    )
+
+
+class FakeUserRequests:
+    """In-memory user_requests table answering the quota usage query."""
+    
+    def __init__(self, rows):
+        self.rows = rows
+        self.statements = []
+    
+    async def execute(self, statement):
+        self.statements.append(statement)
+        rows = [row for row in self.rows if matches(row, statement.whereclause)]
+        
+        daily_filter = statement.selected_columns[0].criterion
+        daily = sum(1 for row in rows if matches(row, daily_filter))
+        return SimpleNamespace(one=lambda: (daily, len(rows)))
+
+
+async def usage_at(now, created_at):
+    """Count one session's requests created at the given times, as seen at now."""
+    session_id = uuid.uuid4()
+    rows = [{"id": i, "session_id": session_id, "created_at": at} for i, at in enumerate(created_at)]
+    rows.append({"id": len(rows), "session_id": uuid.uuid4(), "created_at": now})
+    
+    db = FakeUserRequests(rows)
+    with patch("app.core.quota.datetime", frozen_datetime(now)):
+        return await get_quota_usage(db, session_id)
+
+
+async def test_quota_windows():
+    """Test the day and month windows, including month and year rollover."""
+    print("🧪 Testing quota windows...")
+    
+    assert get_quota_windows(datetime(2025, 3, 15, 12, 30)) == (
+        datetime(2025, 3, 15), datetime(2025, 3, 16), datetime(2025, 3, 1), datetime(2025, 4, 1)
+    )
+    assert get_quota_windows(datetime(2025, 3, 1)) == (
+        datetime(2025, 3, 1), datetime(2025, 3, 2), datetime(2025, 3, 1), datetime(2025, 4, 1)
+    ), "00:00 starts a new day and month"
+    assert get_quota_windows(datetime(2025, 2, 28, 23, 59, 59, 999999)) == (
+        datetime(2025, 2, 28), datetime(2025, 3, 1), datetime(2025, 2, 1), datetime(2025, 3, 1)
+    ), "The last instant still belongs to the old day and month"
+    assert get_quota_windows(datetime(2024, 12, 31, 18))[3] == datetime(2025, 1, 1), "December rolls into January"
+    print("   ✅ Day and month windows are half-open and roll over correctly")
+    
+    return True
+
+
+async def test_usage_boundaries():
+    """Test that midnight counts toward the new window and the instant before does not."""
+    print("\n🧪 Testing quota usage boundaries...")
+    
+    just_before = timedelta(microseconds=1)
+    
+    # Day boundary inside a month
+    day = datetime(2025, 3, 15)
+    daily, monthly = await usage_at(day + timedelta(hours=9), [day, day - just_before])
+    assert (daily, monthly) == (1, 2), f"Expected (1, 2), got {(daily, monthly)}"
+    print("   ✅ A request at 00:00 counts for the day, one just before counts only for the month")
+    
+    # Month boundary
+    month = datetime(2025, 4, 1)
+    daily, monthly = await usage_at(month + timedelta(hours=9), [month, month - just_before])
+    assert (daily, monthly) == (1, 1), f"Expected (1, 1), got {(daily, monthly)}"
+    
+    # Asking at exactly 00:00 starts empty windows
+    daily, monthly = await usage_at(month - just_before, [month - just_before, month - timedelta(days=2)])
+    assert (daily, monthly) == (1, 2), f"Expected (1, 2), got {(daily, monthly)}"
+    daily, monthly = await usage_at(month, [month - just_before, month - timedelta(days=2)])
+    assert (daily, monthly) == (0, 0), f"Expected (0, 0), got {(daily, monthly)}"
+    print("   ✅ A request at 00:00 on the 1st counts for the new month, the previous instant does not")
+    
+    return True
+
+
+async def test_postgres_filter_aggregate():
+    """Test the statement compiled for PostgreSQL uses FILTER and plain created_at ranges."""
+    print("\n🧪 Testing PostgreSQL quota query...")
+    
+    db = FakeUserRequests([])
+    with patch("app.core.quota.datetime", frozen_datetime(datetime(2025, 3, 15, 9))):
+        await get_quota_usage(db, uuid.uuid4())
+    
+    compiled = db.statements[0].compile(dialect=postgresql.dialect())
+    sql = " ".join(str(compiled).split())
+    
+    assert "count(user_requests.id) FILTER (WHERE user_requests.created_at >= " in sql, sql
+    assert "date(" not in sql.lower(), "created_at must not be cast, so the index can serve the scan"
+    assert sql.count("user_requests.created_at >= ") == 2 and sql.count("user_requests.created_at < ") == 2, sql
+    
+    params = set(compiled.params.values())
+    assert {datetime(2025, 3, 15), datetime(2025, 3, 16), datetime(2025, 3, 1), datetime(2025, 4, 1)} <= params, params
+    print("   ✅ Daily count compiled as count(...) FILTER (WHERE ...) over half-open ranges")
+    
+    return True
+
+
+async def main():
+    """Run quota usage tests."""
+    print("🚀 Starting Quota Usage Tests")
+    print("=" * 80)
+    
+    test1_success = await test_quota_windows()
+    test2_success = await test_usage_boundaries()
+    test3_success = await test_postgres_filter_aggregate()
+    
+    print("\n" + "=" * 80)
+    print(f"Quota Windows Test: {'✅ PASSED' if test1_success else '❌ FAILED'}")
+    print(f"Usage Boundaries Test: {'✅ PASSED' if test2_success else '❌ FAILED'}")
+    print(f"PostgreSQL Filter Test: {'✅ PASSED' if test3_success else '❌ FAILED'}")
+    
+    return test1_success and test2_success and test3_success
+
+
+if __name__ == "__main__":
+    success = asyncio.run(main())
+    sys.exit(0 if success else 1)
@@ -0,0 +1,124 @@
+"""
+Test upstream rate limiting: token buckets, fair queueing and Retry-After.
+"""
+import asyncio
+import sys
+import os
+import time
+from types import SimpleNamespace
+from unittest.mock import patch
+
+# Add the backend directory to the Python path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__)))
+
+from app.langgraph.utils.rate_limiter import (
+    LocalBucketStore,
+    UpstreamRateLimiter,
+    parse_retry_after,
+    is_rate_limit_error
+)
+from app.langgraph.utils.error_handlers import RateLimitExceededError, SerperAPIError
+
+
+async def test_rps_and_fairness():
+    """Test requests-per-second pacing and FIFO order of waiters."""
+    print("🧪 Testing RPS pacing and fairness...")
+    
+    # Burst of a single request, so every request after the first is paced
+    with patch("app.langgraph.utils.rate_limiter.settings.RATE_LIMIT_BURST_SECONDS", 0.05):
+        limiter = UpstreamRateLimiter("serper", rps=20, tpm=0, store=LocalBucketStore())
+    order = []
+    
+    async def request(index):
+        await limiter.acquire()
+        order.append(index)
+    
+    start_time = time.perf_counter()
+    tasks = []
+    for index in range(6):
+        tasks.append(asyncio.create_task(request(index)))
+        await asyncio.sleep(0)
+    await asyncio.gather(*tasks)
+    elapsed = time.perf_counter() - start_time
+    
+    # One request from the burst bucket, then one every 50ms
+    assert elapsed >= 0.2, f"6 requests at 20 rps should take about 0.25s, took {elapsed:.3f}s"
+    assert order == list(range(6)), f"Waiters must be served in arrival order: {order}"
+    stats = limiter.get_stats()
+    assert stats["acquired"] == 6 and stats["max_queue_depth"] >= 5 and stats["queue_depth"] == 0, stats
+    print(f"   ✅ 6 requests paced over {elapsed:.2f}s in arrival order (max queue depth {stats['max_queue_depth']})")
+    
+    return True
+
+
+async def test_retry_after():
+    """Test that a 429 blocks every caller for the Retry-After period."""
+    print("\n🧪 Testing Retry-After handling...")
+    
+    assert parse_retry_after("2") == 2.0 and parse_retry_after("soon") is None and parse_retry_after(None) is None
+    assert is_rate_limit_error(SerperAPIError("API returned status 429", status_code=429))
+    assert is_rate_limit_error(SimpleNamespace(status_code=429)) and not is_rate_limit_error(RuntimeError("boom"))
+    print("   ✅ Retry-After parsed and 429 errors recognised")
+    
+    limiter = UpstreamRateLimiter("gpt-4-turbo", rps=0, tpm=0, store=LocalBucketStore())
+    error = RuntimeError("Too Many Requests")
+    error.status_code = 429
+    error.response = SimpleNamespace(headers={"retry-after": "0.2"})
+    await limiter.record_error(error)
+    
+    start_time = time.perf_counter()
+    await asyncio.gather(limiter.acquire(), limiter.acquire())
+    elapsed = time.perf_counter() - start_time
+    assert elapsed >= 0.15, f"Callers should wait out Retry-After, waited {elapsed:.3f}s"
+    assert limiter.get_stats()["throttled"] == 1
+    print(f"   ✅ Concurrent callers paused {elapsed:.2f}s together after a 429")
+    
+    return True
+
+
+async def test_tpm_and_max_wait():
+    """Test the tokens-per-minute bucket, usage correction and the wait cap."""
+    print("\n🧪 Testing TPM bucket and max wait...")
+    
+    store = LocalBucketStore()
+    limiter = UpstreamRateLimiter("claude-3-5-sonnet", rps=0, tpm=6000, store=store)
+    
+    await limiter.acquire(tokens=5000)
+    # Reported usage was much lower than the estimate: tokens go back in the bucket
+    await limiter.record_usage(5000, SimpleNamespace(usage_metadata={"total_tokens": 1000}))
+    waited = await limiter.acquire(tokens=4000)
+    assert waited < 0.05, f"Corrected bucket should have room, waited {waited:.3f}s"
+    print("   ✅ Reported usage corrects the token estimate")
+    
+    with patch("app.langgraph.utils.rate_limiter.settings.RATE_LIMIT_MAX_WAIT", 0.5):
+        try:
+            await limiter.acquire(tokens=6000)
+            return False
+        except RateLimitExceededError:
+            pass
+    assert limiter.get_stats()["rejected"] == 1
+    print("   ✅ Call rejected when the queue wait would exceed RATE_LIMIT_MAX_WAIT")
+    
+    return True
+
+
+async def main():
+    """Run rate limiter tests."""
+    print("🚀 Starting Rate Limiter Tests")
+    print("=" * 80)
+    
+    test1_success = await test_rps_and_fairness()
+    test2_success = await test_retry_after()
+    test3_success = await test_tpm_and_max_wait()
+    
+    print("\n" + "=" * 80)
+    print(f"RPS/Fairness Test: {'✅ PASSED' if test1_success else '❌ FAILED'}")
+    print(f"Retry-After Test: {'✅ PASSED' if test2_success else '❌ FAILED'}")
+    print(f"TPM/Max Wait Test: {'✅ PASSED' if test3_success else '❌ FAILED'}")
+    
+    return test1_success and test2_success and test3_success
+
+
+if __name__ == "__main__":
+    success = asyncio.run(main())
+    sys.exit(0 if success else 1)
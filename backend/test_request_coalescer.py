@@ -0,0 +1,170 @@
+"""
+Test cross-session request coalescing.
+
+Exercises RequestCoalescer directly: one leader per key, followers
+sharing its results, and followers falling back when the leader fails.
+CoalesceRequestNode is checked for the step it logs in each role.
+"""
+import asyncio
+import sys
+import os
+from unittest.mock import patch, MagicMock
+
+# Add the backend directory to the Python path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__)))
+
+from app.langgraph.utils.request_coalescer import RequestCoalescer, make_coalesce_key
+from app.langgraph.nodes.coalesce_request_node import CoalesceRequestNode
+from app.langgraph.state.news_state import create_initial_state
+
+NODE = "app.langgraph.nodes.coalesce_request_node"
+
+
+async def test_followers_share_leader_results():
+    """Test that concurrent identical requests share one leader's results."""
+    print("🧪 Testing followers sharing leader results...")
+    
+    coalescer = RequestCoalescer()
+    key = make_coalesce_key("  AI ", "2025-01-01", 5, "claude-3-5-sonnet")
+    assert key == make_coalesce_key("ai", "2025-01-01", 5, "claude-3-5-sonnet"), "Topic should be normalized"
+    
+    is_leader, _ = coalescer.acquire(key, "workflow-1")
+    assert is_leader, "First workflow should lead"
+    
+    followers = []
+    for i in range(3):
+        is_leader, future = coalescer.acquire(key, f"workflow-{i + 2}")
+        assert not is_leader, "Concurrent workflows should follow"
+        followers.append(asyncio.create_task(coalescer.wait(future, timeout=1.0)))
+    
+    await asyncio.sleep(0)
+    result = {"articles": [{"title": "A"}], "total_found": 1, "llm_provider": "claude-3-5-sonnet"}
+    coalescer.resolve("workflow-1", result)
+    
+    results = await asyncio.gather(*followers)
+    assert all(r == result for r in results), f"Followers got unexpected results: {results}"
+    print("   ✅ 3 followers received the leader's articles")
+    
+    is_leader, _ = coalescer.acquire(key, "workflow-5")
+    assert is_leader, "Key should be free once the leader resolved"
+    coalescer.release("workflow-5")
+    print("   ✅ Key released after resolution")
+    
+    stats = coalescer.get_stats()
+    assert stats["leaders"] == 2 and stats["followers"] == 3 and stats["in_flight"] == 0, f"Unexpected stats: {stats}"
+    
+    return True
+
+
+async def test_leader_failure_releases_followers():
+    """Test that followers fall back when the leader ends without results."""
+    print("\n🧪 Testing leader failure...")
+    
+    coalescer = RequestCoalescer()
+    key = make_coalesce_key("Finance", "2025-01-01", 3, "gpt-4-turbo")
+    
+    coalescer.acquire(key, "leader")
+    _, future = coalescer.acquire(key, "follower")
+    follower = asyncio.create_task(coalescer.wait(future, timeout=1.0))
+    
+    await asyncio.sleep(0)
+    coalescer.release("leader")
+    
+    result = await follower
+    assert result is None, "Follower should get no result from a failed leader"
+    assert coalescer.get_stats()["follower_fallbacks"] == 1
+    print("   ✅ Follower released to fetch on its own")
+    
+    # Releasing a non-leader is a no-op
+    coalescer.release("follower")
+    
+    return True
+
+
+async def test_follower_timeout():
+    """Test that a slow leader doesn't block followers past the timeout."""
+    print("\n🧪 Testing follower timeout...")
+    
+    coalescer = RequestCoalescer()
+    key = make_coalesce_key("Healthcare", "2025-01-01", 5, "gemini-pro")
+    
+    coalescer.acquire(key, "leader")
+    _, future = coalescer.acquire(key, "follower")
+    
+    result = await coalescer.wait(future, timeout=0.05)
+    assert result is None, "Timed out follower should get no result"
+    assert not future.cancelled(), "Follower timeout must not cancel the shared future"
+    print("   ✅ Follower timed out without cancelling the leader's future")
+    
+    coalescer.release("leader")
+    
+    return True
+
+
+async def test_node_logged_steps():
+    """Test that the node logs leader, follower and fallback steps distinctly."""
+    print("\n🧪 Testing coalesce node logging...")
+    
+    coalescer = RequestCoalescer()
+    
+    async def run_node(workflow_id):
+        node = CoalesceRequestNode()
+        node.logger = MagicMock()
+        state = create_initial_state("AI", "2025-01-01", 5, "claude-3-5-sonnet", "session", workflow_id)
+        new_state = await node(state)
+        steps = [call.kwargs["step"] for call in node.logger.log_processing_step.call_args_list]
+        return new_state, steps
+    
+    with patch(f"{NODE}.get_request_coalescer", return_value=coalescer), \
+         patch(f"{NODE}.settings.NEWS_COALESCE_ENABLED", True), \
+         patch(f"{NODE}.settings.NEWS_COALESCE_TIMEOUT", 0.05):
+        state, steps = await run_node("leader")
+        assert not state["coalesced"] and steps == ["coalesce_leader"], f"Unexpected leader steps: {steps}"
+        
+        # Follower of a leader that succeeds
+        follower = asyncio.create_task(run_node("follower-1"))
+        await asyncio.sleep(0.01)
+        coalescer.resolve("leader", {"articles": [{"title": "A"}], "total_found": 1, "llm_provider": "claude-3-5-sonnet"})
+        state, steps = await follower
+        assert state["coalesced"] and steps == ["coalesce_wait", "coalesce_follower"], f"Unexpected follower steps: {steps}"
+        
+        # Followers of a leader that fails, and of one that times out
+        await run_node("leader-2")
+        follower = asyncio.create_task(run_node("follower-2"))
+        await asyncio.sleep(0.01)
+        coalescer.release("leader-2")
+        results = [await follower]
+        await run_node("leader-3")
+        results.append(await run_node("follower-3"))
+        for state, steps in results:
+            assert not state["coalesced"], "Fallback follower should fetch on its own"
+            assert steps == ["coalesce_wait", "coalesce_fallback"], f"Unexpected fallback steps: {steps}"
+    
+    coalescer.release("leader-3")
+    print("   ✅ Leader, follower and fallback followers log their own steps")
+    
+    return True
+
+
+async def main():
+    """Run request coalescing tests."""
+    print("🚀 Starting Request Coalescing Tests")
+    print("=" * 80)
+    
+    test1_success = await test_followers_share_leader_results()
+    test2_success = await test_leader_failure_releases_followers()
+    test3_success = await test_follower_timeout()
+    test4_success = await test_node_logged_steps()
+    
+    print("\n" + "=" * 80)
+    print(f"Shared Results Test: {'✅ PASSED' if test1_success else '❌ FAILED'}")
+    print(f"Leader Failure Test: {'✅ PASSED' if test2_success else '❌ FAILED'}")
+    print(f"Follower Timeout Test: {'✅ PASSED' if test3_success else '❌ FAILED'}")
+    print(f"Node Logging Test: {'✅ PASSED' if test4_success else '❌ FAILED'}")
+    
+    return test1_success and test2_success and test3_success and test4_success
+
+
+if __name__ == "__main__":
+    success = asyncio.run(main())
+    sys.exit(0 if success else 1)
@@ -0,0 +1,170 @@
+"""
+Test the Serper response cache.
+
+The durable tier is patched out so the tests exercise the in-process
+cache, monotonic num handling and stale-while-revalidate without a
+database.
+"""
+import asyncio
+import sys
+import os
+from datetime import datetime, timedelta
+from unittest.mock import patch, AsyncMock
+
+# Add the backend directory to the Python path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__)))
+
+from app.langgraph.utils.serper_cache import SerperCache, make_query_hash
+from app.core.config import settings
+
+
+class FakeSerper:
+    """Counts fetches and returns num ranked articles."""
+    
+    def __init__(self, delay: float = 0.0):
+        self.calls = []
+        self.delay = delay
+    
+    async def fetch(self, num):
+        self.calls.append(num)
+        await asyncio.sleep(self.delay)
+        return [{"title": f"Article {i}", "url": f"https://example.com/{i}"} for i in range(num)]
+
+
+def create_cache():
+    """Create a cache with the database tier disabled."""
+    cache = SerperCache(max_entries=10)
+    cache._load_from_db = AsyncMock(return_value=None)
+    cache._save_to_db = AsyncMock(return_value=None)
+    return cache
+
+
+async def test_monotonic_num_results():
+    """Test that a larger cached response answers smaller requests."""
+    print("🧪 Testing monotonic num handling...")
+    
+    cache = create_cache()
+    serper = FakeSerper()
+    
+    articles = await cache.get_or_fetch("AI after:2025-01-01", 10, "en", "us", serper.fetch)
+    assert len(articles) == 10
+    
+    articles = await cache.get_or_fetch("  ai   AFTER:2025-01-01 ", 5, "en", "us", serper.fetch)
+    assert [a["title"] for a in articles] == [f"Article {i}" for i in range(5)], "Should serve top 5 of cached 10"
+    assert serper.calls == [10], f"Smaller request should not call Serper: {serper.calls}"
+    print("   ✅ num=5 served from cached num=10 response")
+    
+    await cache.get_or_fetch("AI after:2025-01-01", 12, "en", "us", serper.fetch)
+    assert serper.calls == [10, 12], f"Larger request should call Serper: {serper.calls}"
+    print("   ✅ num=12 fetched fresh")
+    
+    await cache.get_or_fetch("AI after:2025-01-01", 5, "en", "gb", serper.fetch)
+    assert serper.calls == [10, 12, 5], "Different gl must not share entries"
+    print("   ✅ Entries keyed by hl/gl")
+    
+    return True
+
+
+async def test_concurrent_misses_share_fetch():
+    """Test that concurrent misses make one upstream call."""
+    print("\n🧪 Testing concurrent misses...")
+    
+    cache = create_cache()
+    serper = FakeSerper(delay=0.05)
+    
+    results = await asyncio.gather(*(
+        cache.get_or_fetch("Finance after:2025-01-01", 5, "en", "us", serper.fetch)
+        for _ in range(5)
+    ))
+    
+    assert all(len(r) == 5 for r in results)
+    assert serper.calls == [5], f"Expected one upstream call, got {serper.calls}"
+    print("   ✅ 5 concurrent misses made 1 Serper call")
+    
+    return True
+
+
+async def test_stale_while_revalidate():
+    """Test that stale entries are served while refreshing in the background."""
+    print("\n🧪 Testing stale-while-revalidate...")
+    
+    cache = create_cache()
+    serper = FakeSerper()
+    query = "Healthcare after:2025-01-01"
+    
+    await cache.get_or_fetch(query, 5, "en", "us", serper.fetch)
+    entry = cache._cache[make_query_hash(query, "en", "us")]
+    
+    # Age the entry past the fresh TTL but within the stale window
+    entry.fetched_at = datetime.utcnow() - timedelta(seconds=settings.SERPER_CACHE_TTL + 1)
+    stale_fetched_at = entry.fetched_at
+    
+    articles = await cache.get_or_fetch(query, 5, "en", "us", serper.fetch)
+    assert len(articles) == 5, "Stale entry should be served"
+    assert cache.get_stats()["stale_hits"] == 1
+    
+    await asyncio.gather(*cache._refresh_tasks)
+    refreshed = cache._cache[make_query_hash(query, "en", "us")]
+    assert serper.calls == [5, 5], f"Expected one background refresh, got {serper.calls}"
+    assert refreshed.fetched_at > stale_fetched_at, "Refresh should replace the stale entry"
+    print("   ✅ Stale entry served and refreshed in the background")
+    
+    # Age past the stale window: must fetch before responding
+    refreshed.fetched_at = datetime.utcnow() - timedelta(
+        seconds=settings.SERPER_CACHE_TTL + settings.SERPER_CACHE_STALE_TTL + 1
+    )
+    await cache.get_or_fetch(query, 5, "en", "us", serper.fetch)
+    assert serper.calls == [5, 5, 5], "Expired entry should be re-fetched"
+    print("   ✅ Expired entry re-fetched")
+    
+    return True
+
+
+async def test_failed_refresh_keeps_stale_entry():
+    """Test that a failed background refresh keeps serving the stale entry."""
+    print("\n🧪 Testing failed refresh...")
+    
+    cache = create_cache()
+    serper = FakeSerper()
+    query = "Business after:2025-01-01"
+    
+    await cache.get_or_fetch(query, 3, "en", "us", serper.fetch)
+    cache._cache[make_query_hash(query, "en", "us")].fetched_at = (
+        datetime.utcnow() - timedelta(seconds=settings.SERPER_CACHE_TTL + 1)
+    )
+    
+    failing_fetch = AsyncMock(side_effect=RuntimeError("Serper down"))
+    with patch("app.langgraph.utils.serper_cache.logger"):
+        articles = await cache.get_or_fetch(query, 3, "en", "us", failing_fetch)
+        await asyncio.gather(*cache._refresh_tasks)
+    
+    assert len(articles) == 3
+    assert cache.get_stats()["refresh_failures"] == 1
+    assert cache.get_stats()["refreshing"] == 0, "Failed refresh should allow a later retry"
+    print("   ✅ Stale entry kept after refresh failure")
+    
+    return True
+
+
+async def main():
+    """Run Serper cache tests."""
+    print("🚀 Starting Serper Cache Tests")
+    print("=" * 80)
+    
+    test1_success = await test_monotonic_num_results()
+    test2_success = await test_concurrent_misses_share_fetch()
+    test3_success = await test_stale_while_revalidate()
+    test4_success = await test_failed_refresh_keeps_stale_entry()
+    
+    print("\n" + "=" * 80)
+    print(f"Monotonic Num Test: {'✅ PASSED' if test1_success else '❌ FAILED'}")
+    print(f"Concurrent Miss Test: {'✅ PASSED' if test2_success else '❌ FAILED'}")
+    print(f"Stale-While-Revalidate Test: {'✅ PASSED' if test3_success else '❌ FAILED'}")
+    print(f"Failed Refresh Test: {'✅ PASSED' if test4_success else '❌ FAILED'}")
+    
+    return test1_success and test2_success and test3_success and test4_success
+
+
+if __name__ == "__main__":
+    success = asyncio.run(main())
+    sys.exit(0 if success else 1)
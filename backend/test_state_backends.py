@@ -0,0 +1,128 @@
+"""
+Test ExternalStateManager against the pluggable state backends.
+
+Runs against the in-memory and embedded SQLite backends; the Redis
+backend shares the same compare-and-set contract.
+"""
+import asyncio
+import sys
+import os
+import time
+
+# Add the backend directory to the Python path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__)))
+
+from app.langgraph.utils.external_state_manager import ExternalStateManager
+from app.langgraph.utils.state_backends import InMemoryStateBackend, SQLiteStateBackend
+
+
+async def check_backend(name, backend):
+    """Run the state manager contract against one backend."""
+    print(f"🧪 Testing {name} backend...")
+    
+    manager = ExternalStateManager(backend=backend)
+    
+    state_key = await manager.create_state({"topic": "AI", "processing_steps": []})
+    state = await manager.get_state(state_key)
+    assert state["topic"] == "AI", "State should round-trip"
+    assert state["_version"] == 1, "New state should start at version 1"
+    print("   ✅ Create and get")
+    
+    assert await manager.update_state(state_key, {"topic": "ML"})
+    state = await manager.get_state(state_key)
+    assert state["topic"] == "ML" and state["_version"] == 2, f"Unexpected state: {state}"
+    print("   ✅ Update bumps version")
+    
+    # A stale writer must lose the compare-and-set
+    stale = dict(state, _version=3, topic="stale")
+    assert not await backend.compare_and_set(state_key, 1, stale, 60), "Stale version should conflict"
+    print("   ✅ Stale compare-and-set rejected")
+    
+    # Concurrent appends all land thanks to the retry loop
+    await asyncio.gather(*[
+        manager.append_state_list(state_key, "processing_steps", [i])
+        for i in range(10)
+    ])
+    state = await manager.get_state(state_key)
+    assert sorted(state["processing_steps"]) == list(range(10)), f"Lost appends: {state['processing_steps']}"
+    print("   ✅ Concurrent appends preserved")
+    
+    assert await manager.delete_state(state_key)
+    assert await manager.get_state(state_key) is None
+    assert not await manager.update_state(state_key, {"topic": "gone"})
+    print("   ✅ Delete")
+    
+    await manager.close()
+    return True
+
+
+async def test_memory_bounds():
+    """Test LRU eviction, size accounting and expiry sweeps."""
+    print("\n🧪 Testing in-memory bounds and sweeper...")
+    
+    backend = InMemoryStateBackend(max_entries=3)
+    manager = ExternalStateManager(backend=backend)
+    
+    keys = [await manager.create_state({"index": i}) for i in range(3)]
+    
+    # Touch the oldest state so the second one becomes least recently used
+    await manager.get_state(keys[0])
+    keys.append(await manager.create_state({"index": 3}))
+    
+    assert await manager.get_state(keys[1]) is None, "Least recently used state should be evicted"
+    assert await manager.get_state(keys[0]) is not None, "Recently used state should be kept"
+    stats = manager.get_stats()
+    assert stats["total_states"] == 3 and stats["evictions"] == 1, f"Unexpected stats: {stats}"
+    assert stats["bytes_held"] > 0, "Bytes held should be tracked"
+    print("   ✅ LRU eviction at the entry cap")
+    
+    for key in keys:
+        await manager.delete_state(key)
+    assert manager.get_stats()["bytes_held"] == 0, "Deleting all states should release all bytes"
+    print("   ✅ Size accounting released on delete")
+    
+    # A zero TTL expires everything on the next sweep
+    await manager.create_state({"index": 4})
+    manager._state_ttl = 0
+    removed = await manager.sweep()
+    stats = manager.get_stats()
+    assert removed == 1 and stats["total_states"] == 0, f"Sweep should expire the state: {stats}"
+    assert stats["last_sweep_duration"] is not None, "Sweep duration should be recorded"
+    print("   ✅ Sweep removes expired states")
+    
+    # Idle states expire on read, before any sweep
+    manager._state_ttl = 60
+    idle_key = await manager.create_state({"index": 5})
+    active_key = await manager.create_state({"index": 6})
+    backend._states[idle_key]["_last_accessed"] -= 61
+    backend._states[active_key]["_last_accessed"] -= 59
+    assert await manager.get_state(idle_key) is None, "State idle past its TTL should read as missing"
+    assert not await manager.update_state(idle_key, {"index": 7}), "Expired state should not be updated"
+    assert await manager.get_state(active_key) is not None, "State within its TTL should be kept"
+    assert backend._states[active_key]["_last_accessed"] > time.time() - 1, "Reads should refresh idle expiry"
+    assert manager.get_stats()["total_states"] == 1, "Expired state should be removed on read"
+    print("   ✅ Idle states expire on read")
+    
+    return True
+
+
+async def main():
+    """Run state backend tests."""
+    print("🚀 Starting State Backend Tests")
+    print("=" * 80)
+    
+    memory_success = await check_backend("memory", InMemoryStateBackend())
+    sqlite_success = await check_backend("sqlite", SQLiteStateBackend(":memory:"))
+    bounds_success = await test_memory_bounds()
+    
+    print("\n" + "=" * 80)
+    print(f"Memory Backend Test: {'✅ PASSED' if memory_success else '❌ FAILED'}")
+    print(f"SQLite Backend Test: {'✅ PASSED' if sqlite_success else '❌ FAILED'}")
+    print(f"Memory Bounds Test: {'✅ PASSED' if bounds_success else '❌ FAILED'}")
+    
+    return memory_success and sqlite_success and bounds_success
+
+
+if __name__ == "__main__":
+    success = asyncio.run(main())
+    sys.exit(0 if success else 1)
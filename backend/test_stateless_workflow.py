@@ -61,6 +61,29 @@ async def test_external_state_manager():
     return True
 
 
+async def test_concurrent_step_appends():
+    """Test that parallel nodes appending processing steps don't lose updates."""
+    print("\n🔀 Testing Concurrent Processing Step Appends...")
+    
+    state_manager = get_external_state_manager()
+    state_key = await state_manager.create_state({"processing_steps": []})
+    
+    # Simulate the parallel LinkedIn and X branches appending at the same time
+    await asyncio.gather(*[
+        state_manager.append_state_list(state_key, "processing_steps", [{"step": f"step_{i}"}])
+        for i in range(10)
+    ])
+    
+    final_state = await state_manager.get_state(state_key)
+    steps = [step["step"] for step in final_state["processing_steps"]]
+    assert len(steps) == 10, f"Expected 10 steps, got {len(steps)}"
+    assert set(steps) == {f"step_{i}" for i in range(10)}, "All appended steps should be present"
+    print(f"✅ All {len(steps)} concurrent appends preserved")
+    
+    await state_manager.delete_state(state_key)
+    return True
+
+
 async def test_stateless_workflow():
     """Test the complete stateless workflow."""
     print("\n🚀 Testing Stateless Workflow...")
@@ -233,6 +256,9 @@ async def main():
     # Test 4: Error handling
     test4_success = await test_error_handling()
     
+    # Test 5: Concurrent appends from parallel branches
+    test5_success = await test_concurrent_step_appends()
+    
     print("\n" + "=" * 80)
     print("📋 STATELESS WORKFLOW TEST SUMMARY")
     print("=" * 80)
@@ -240,8 +266,9 @@ async def main():
     print(f"Stateless Workflow Test: {'✅ PASSED' if test2_success else '❌ FAILED'}")
     print(f"State Isolation Test: {'✅ PASSED' if test3_success else '❌ FAILED'}")
     print(f"Error Handling Test: {'✅ PASSED' if test4_success else '❌ FAILED'}")
+    print(f"Concurrent Appends Test: {'✅ PASSED' if test5_success else '❌ FAILED'}")
     
-    all_passed = test1_success and test2_success and test3_success and test4_success
+    all_passed = test1_success and test2_success and test3_success and test4_success and test5_success
     
     if all_passed:
         print("\n🎉 ALL STATELESS WORKFLOW TESTS PASSED!")
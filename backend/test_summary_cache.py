@@ -0,0 +1,147 @@
+"""
+Test the per-article summary cache.
+
+Database reads and writes are patched, so the tests cover the LRU tier,
+bulk lookups and the summarize node's use of the cache.
+"""
+import asyncio
+import sys
+import os
+from unittest.mock import patch, AsyncMock, MagicMock
+
+# Add the backend directory to the Python path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__)))
+
+from app.langgraph.utils.summary_cache import SummaryCache
+from app.langgraph.nodes.summarize_content_node import SummarizeContentNode, SUMMARY_PROMPT_VERSION
+
+
+def make_article(index):
+    """Build a filtered article with a stable content hash."""
+    return {
+        "title": f"Article {index}",
+        "url": f"https://example.com/{index}",
+        "source": "example.com",
+        "summary": f"Snippet {index}",
+        "content_hash": f"hash-{index}"
+    }
+
+
+async def test_cache_tiers():
+    """Test LRU hits, bulk database lookups and key separation."""
+    print("🧪 Testing summary cache tiers...")
+    
+    cache = SummaryCache(max_entries=10)
+    load = AsyncMock(return_value={"hash-2": "Stored summary 2"})
+    
+    with patch.object(cache, "_save_to_db", AsyncMock()) as save, \
+         patch.object(cache, "_load_from_db", load):
+        await cache.put_many({"hash-1": "Summary 1", "hash-x": ""}, "gpt-4-turbo", "1")
+        assert save.await_count == 1 and len(save.await_args.args[0]) == 1, "Empty summaries must not be stored"
+        print("   ✅ Summaries written through (worker not running)")
+        
+        found = await cache.get_many(["hash-1", "hash-2", "hash-3"], "gpt-4-turbo", "1")
+        assert found == {"hash-1": "Summary 1", "hash-2": "Stored summary 2"}, f"Unexpected lookup: {found}"
+        assert load.await_args.args[0] == ["hash-2", "hash-3"], "Only LRU misses should reach the database, in one query"
+        print("   ✅ LRU hit, database hit and miss in one bulk lookup")
+        
+        load.return_value = {}
+        assert await cache.get_many(["hash-1"], "claude-3-5-sonnet", "1") == {}, "Provider is part of the key"
+        assert await cache.get_many(["hash-1"], "gpt-4-turbo", "2") == {}, "Prompt version is part of the key"
+        print("   ✅ Provider and prompt version separate entries")
+    
+    stats = cache.get_stats()
+    assert stats["memory_hits"] == 1 and stats["db_hits"] == 1 and stats["misses"] == 3, f"Unexpected stats: {stats}"
+    print(f"   ✅ Hit/miss counters recorded (hit rate {stats['hit_rate']})")
+    
+    return True
+
+
+async def test_node_uses_cache():
+    """Test that the summarize node only sends cache misses to the provider."""
+    print("\n🧪 Testing summarize node cache use...")
+    
+    node = SummarizeContentNode()
+    cache = SummaryCache()
+    articles = [make_article(i) for i in range(3)]
+    summarized = []
+    
+    async def fake_summary(article, llm_client, provider, session_id, workflow_id, semaphore=None):
+        summarized.append(article["content_hash"])
+        if article["content_hash"] == "hash-2":
+            raise RuntimeError("provider error")
+        return f"LLM summary of {article['title']}", provider
+    
+    with patch("app.langgraph.nodes.summarize_content_node.get_summary_cache", return_value=cache), \
+         patch.object(cache, "_load_from_db", AsyncMock(return_value={})), \
+         patch.object(cache, "_save_to_db", AsyncMock()), \
+         patch.object(node, "_initialize_llm_client", MagicMock()), \
+         patch.object(node, "_generate_single_summary", side_effect=fake_summary), \
+         patch("app.langgraph.nodes.summarize_content_node.settings.SUMMARY_STRATEGY", "concurrent"):
+        first = await node._summarize_with_fallback(articles, ["gpt-4-turbo"], [], "session", "workflow-1")
+        assert sorted(summarized) == ["hash-0", "hash-1", "hash-2"]
+        assert first[2]["summary"] == "Snippet 2", "Failed article falls back to its snippet"
+        print("   ✅ First run summarizes every article")
+        
+        summarized.clear()
+        second = await node._summarize_with_fallback(articles, ["gpt-4-turbo"], [], "session", "workflow-2")
+        assert summarized == ["hash-2"], f"Only the uncached article should be summarized, got {summarized}"
+        assert [a["summary"] for a in second[:2]] == ["LLM summary of Article 0", "LLM summary of Article 1"]
+        print("   ✅ Second run reuses cached summaries; fallback snippets are never cached")
+    
+    assert cache.get_stats()["stored"] == 2
+    
+    return True
+
+
+async def test_hedged_summary_keyed_to_backup():
+    """Test that a summary won by a hedge is cached under the backup provider."""
+    print("\n🧪 Testing hedged summary cache key...")
+    
+    node = SummarizeContentNode()
+    cache = SummaryCache()
+    articles = [make_article(i) for i in range(2)]
+    
+    async def fake_summary(article, llm_client, provider, session_id, workflow_id, semaphore=None):
+        # The hedge on claude-3-5-sonnet answers first for article 1
+        used_provider = "claude-3-5-sonnet" if article["content_hash"] == "hash-1" else provider
+        return f"{used_provider} summary of {article['title']}", used_provider
+    
+    with patch("app.langgraph.nodes.summarize_content_node.get_summary_cache", return_value=cache), \
+         patch.object(cache, "_load_from_db", AsyncMock(return_value={})), \
+         patch.object(cache, "_save_to_db", AsyncMock()), \
+         patch.object(node, "_initialize_llm_client", MagicMock()), \
+         patch.object(node, "_generate_single_summary", side_effect=fake_summary), \
+         patch("app.langgraph.nodes.summarize_content_node.settings.SUMMARY_STRATEGY", "concurrent"):
+        await node._summarize_with_fallback(articles, ["gpt-4-turbo"], [], "session", "workflow-1")
+        
+        gpt_cached = await cache.get_many(["hash-0", "hash-1"], "gpt-4-turbo", SUMMARY_PROMPT_VERSION)
+        claude_cached = await cache.get_many(["hash-1"], "claude-3-5-sonnet", SUMMARY_PROMPT_VERSION)
+    
+    assert list(gpt_cached) == ["hash-0"], f"Backup's summary must not be cached for the primary: {gpt_cached}"
+    assert claude_cached == {"hash-1": "claude-3-5-sonnet summary of Article 1"}, f"Unexpected backup entry: {claude_cached}"
+    print("   ✅ Hedge-won summary cached under the backup provider only")
+    
+    return True
+
+
+async def main():
+    """Run summary cache tests."""
+    print("🚀 Starting Summary Cache Tests")
+    print("=" * 80)
+    
+    test1_success = await test_cache_tiers()
+    test2_success = await test_node_uses_cache()
+    test3_success = await test_hedged_summary_keyed_to_backup()
+    
+    print("\n" + "=" * 80)
+    print(f"Cache Tier Test: {'✅ PASSED' if test1_success else '❌ FAILED'}")
+    print(f"Summarize Node Test: {'✅ PASSED' if test2_success else '❌ FAILED'}")
+    print(f"Hedged Summary Test: {'✅ PASSED' if test3_success else '❌ FAILED'}")
+    
+    return test1_success and test2_success and test3_success
+
+
+if __name__ == "__main__":
+    success = asyncio.run(main())
+    sys.exit(0 if success else 1)
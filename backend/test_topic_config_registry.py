@@ -0,0 +1,110 @@
+"""
+Test the in-memory topic config registry.
+
+Database reads are patched, so the tests cover indexing, matching
+and version-based refresh only.
+"""
+import asyncio
+import sys
+import os
+from unittest.mock import patch, AsyncMock
+
+# Add the backend directory to the Python path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__)))
+
+from app.langgraph.utils.topic_config_registry import TopicConfigRegistry
+
+CONFIGS = [
+    {"topicName": "AI", "keywords": ["AI", "LLM"], "trustedSources": ["techcrunch.com"], "priorityWeight": 1.0},
+    {"topicName": "finance", "keywords": ["stocks"], "trustedSources": ["ft.com"], "priorityWeight": 1.0},
+    {"topicName": "technology", "keywords": ["tech"], "trustedSources": ["wired.com"], "priorityWeight": 1.0},
+    {"topicName": "space exploration", "keywords": ["NASA"], "trustedSources": ["space.com"], "priorityWeight": 1.0}
+]
+
+
+async def test_lookup():
+    """Test exact and partial matching against the loaded indexes."""
+    print("🧪 Testing registry lookup...")
+    
+    registry = TopicConfigRegistry()
+    with patch.object(registry, "_load_configs", AsyncMock(return_value=((4, "v1"), CONFIGS))):
+        count = await registry.reload()
+    assert count == 4 and registry.loaded
+    
+    assert registry.lookup("Space Exploration")["topicName"] == "space exploration"
+    assert registry.lookup("ai")["topicName"] == "AI"
+    print("   ✅ Exact matches are case-insensitive")
+    
+    assert registry.lookup("fintech and finance news")["topicName"] == "finance", "Common topics are checked in order"
+    assert registry.lookup("AI in technology")["topicName"] == "AI"
+    assert registry.lookup("healthcare") is None, "Common topics without a config never match"
+    assert registry.lookup("gardening") is None
+    print("   ✅ Partial matches follow COMMON_TOPICS order")
+    
+    return True
+
+
+async def test_fallback_before_load():
+    """Test that lookups query the database until the registry loads."""
+    print("\n🧪 Testing fallback before the first load...")
+    
+    registry = TopicConfigRegistry()
+    fallback = AsyncMock(return_value=CONFIGS[1])
+    with patch("app.langgraph.utils.topic_config_registry.load_topic_config", fallback):
+        config = await registry.get("finance")
+    assert config["topicName"] == "finance" and fallback.await_count == 1
+    print("   ✅ Unloaded registry queries the database")
+    
+    with patch.object(registry, "_load_configs", AsyncMock(return_value=((4, "v1"), CONFIGS))):
+        await registry.reload()
+    with patch("app.langgraph.utils.topic_config_registry.load_topic_config", fallback):
+        await registry.get("finance")
+    assert fallback.await_count == 1, "Loaded registry should not query the database"
+    print("   ✅ Loaded registry answers from memory")
+    
+    return True
+
+
+async def test_refresh_if_changed():
+    """Test that polling reloads only when the table version changes."""
+    print("\n🧪 Testing version polling...")
+    
+    registry = TopicConfigRegistry()
+    load = AsyncMock(return_value=((4, "v1"), CONFIGS))
+    with patch.object(registry, "_load_configs", load):
+        await registry.reload()
+        
+        with patch.object(registry, "_current_version", AsyncMock(return_value=(4, "v1"))):
+            assert not await registry.refresh_if_changed()
+        assert load.await_count == 1
+        print("   ✅ Unchanged version skips the reload")
+        
+        load.return_value = ((3, "v2"), CONFIGS[:3])
+        with patch.object(registry, "_current_version", AsyncMock(return_value=(3, "v2"))):
+            assert await registry.refresh_if_changed()
+        assert registry.lookup("space exploration") is None
+        print("   ✅ Changed version reloads the registry")
+    
+    return True
+
+
+async def main():
+    """Run topic config registry tests."""
+    print("🚀 Starting Topic Config Registry Tests")
+    print("=" * 80)
+    
+    test1_success = await test_lookup()
+    test2_success = await test_fallback_before_load()
+    test3_success = await test_refresh_if_changed()
+    
+    print("\n" + "=" * 80)
+    print(f"Lookup Test: {'✅ PASSED' if test1_success else '❌ FAILED'}")
+    print(f"Fallback Test: {'✅ PASSED' if test2_success else '❌ FAILED'}")
+    print(f"Version Polling Test: {'✅ PASSED' if test3_success else '❌ FAILED'}")
+    
+    return test1_success and test2_success and test3_success
+
+
+if __name__ == "__main__":
+    success = asyncio.run(main())
+    sys.exit(0 if success else 1)
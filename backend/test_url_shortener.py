@@ -0,0 +1,150 @@
+"""
+Test the cached URL shortener and single-flight de-duplication.
+
+Database reads and writes and the TinyURL session are patched, so the
+tests cover the LRU tier, the short_urls fallback, upstream failures
+and concurrent requests sharing one upstream call.
+"""
+import asyncio
+import sys
+import os
+from unittest.mock import patch, AsyncMock, MagicMock
+
+# Add the backend directory to the Python path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__)))
+
+from app.langgraph.utils.url_shortener import UrlShortener
+from app.langgraph.utils.single_flight import SingleFlight
+
+
+class FakeResponse:
+    """aiohttp response stand-in for the TinyURL API."""
+    
+    def __init__(self, status, payload=None):
+        self.status = status
+        self.payload = payload or {}
+    
+    async def json(self):
+        return self.payload
+    
+    async def __aenter__(self):
+        return self
+    
+    async def __aexit__(self, *args):
+        return False
+
+
+async def test_cache_tiers():
+    """Test LRU hits, the short_urls fallback and LRU eviction."""
+    print("🧪 Testing shortener cache tiers...")
+    
+    shortener = UrlShortener(max_entries=2)
+    load = AsyncMock(return_value="https://tinyurl.com/stored")
+    upstream = AsyncMock(return_value="https://tinyurl.com/new")
+    
+    with patch.object(shortener, "_load_from_db", load), \
+         patch.object(shortener, "_save_to_db", AsyncMock()) as save, \
+         patch.object(shortener, "_call_tinyurl", upstream):
+        assert await shortener.shorten("https://example.com/a") == "https://tinyurl.com/stored"
+        assert upstream.await_count == 0 and save.await_count == 0, "Database hits must not call TinyURL"
+        print("   ✅ Miss in the LRU served from short_urls")
+        
+        assert await shortener.shorten("https://example.com/a") == "https://tinyurl.com/stored"
+        assert load.await_count == 1, "Second lookup should be an LRU hit"
+        print("   ✅ Repeat lookup served from the LRU")
+        
+        load.return_value = None
+        assert await shortener.shorten("https://example.com/b") == "https://tinyurl.com/new"
+        assert upstream.await_count == 1 and save.await_count == 1, "New short URLs are persisted"
+        await shortener.shorten("https://example.com/c")
+        assert "https://example.com/a" not in shortener._cache, "Least recently used entry is evicted"
+        print("   ✅ Upstream results persisted and LRU bounded")
+    
+    stats = shortener.get_stats()
+    assert stats["memory_hits"] == 1 and stats["db_hits"] == 1 and stats["cached_urls"] == 2, f"Unexpected stats: {stats}"
+    
+    return True
+
+
+async def test_upstream_failure():
+    """Test that a TinyURL failure returns None and is not cached."""
+    print("\n🧪 Testing TinyURL failure...")
+    
+    shortener = UrlShortener()
+    session = MagicMock()
+    session.post.return_value = FakeResponse(500)
+    
+    with patch.object(shortener, "_load_from_db", AsyncMock(return_value=None)), \
+         patch.object(shortener, "_save_to_db", AsyncMock()) as save, \
+         patch.object(shortener, "_get_session", return_value=session):
+        assert await shortener.shorten("https://example.com/a") is None
+        assert save.await_count == 0 and not shortener._cache, "Failures must not be cached"
+        print("   ✅ Failed shortening returned None and was not cached")
+        
+        session.post.return_value = FakeResponse(200, {"data": {"tiny_url": "https://tinyurl.com/ok"}})
+        assert await shortener.shorten("https://example.com/a") == "https://tinyurl.com/ok"
+        assert session.post.call_count == 2, "A later request retries upstream"
+        print("   ✅ Later request retried TinyURL")
+    
+    stats = shortener.get_stats()
+    assert stats["upstream_calls"] == 2 and stats["upstream_failures"] == 1, f"Unexpected stats: {stats}"
+    
+    return True
+
+
+async def test_concurrent_shorten():
+    """Test that concurrent requests for one URL share a single upstream call."""
+    print("\n🧪 Testing single-flight de-duplication...")
+    
+    shortener = UrlShortener()
+    
+    async def slow_tinyurl(url):
+        await asyncio.sleep(0.05)
+        return "https://tinyurl.com/shared"
+    
+    upstream = AsyncMock(side_effect=slow_tinyurl)
+    with patch.object(shortener, "_load_from_db", AsyncMock(return_value=None)), \
+         patch.object(shortener, "_save_to_db", AsyncMock()), \
+         patch.object(shortener, "_call_tinyurl", upstream):
+        results = await asyncio.gather(*(shortener.shorten("https://example.com/a") for _ in range(5)))
+    
+    assert results == ["https://tinyurl.com/shared"] * 5, f"Unexpected results: {results}"
+    assert upstream.await_count == 1 and shortener.get_stats()["shared_calls"] == 4
+    print("   ✅ 5 concurrent requests made 1 upstream call")
+    
+    single_flight = SingleFlight()
+    calls = []
+    
+    async def failing_call():
+        calls.append(True)
+        await asyncio.sleep(0.01)
+        raise RuntimeError("upstream down")
+    
+    results = await asyncio.gather(*(single_flight.do("key", failing_call) for _ in range(3)), return_exceptions=True)
+    assert len(calls) == 1 and all(isinstance(r, RuntimeError) for r in results), f"Unexpected results: {results}"
+    assert single_flight.in_flight() == 0, "Nothing is kept once the call completes"
+    print("   ✅ Shared failure raised to every caller and not kept")
+    
+    return True
+
+
+async def main():
+    """Run URL shortener tests."""
+    print("🚀 Starting URL Shortener Tests")
+    print("=" * 80)
+    
+    test1_success = await test_cache_tiers()
+    test2_success = await test_upstream_failure()
+    test3_success = await test_concurrent_shorten()
+    
+    print("\n" + "=" * 80)
+    print(f"Cache Tier Test: {'✅ PASSED' if test1_success else '❌ FAILED'}")
+    print(f"Upstream Failure Test: {'✅ PASSED' if test2_success else '❌ FAILED'}")
+    print(f"Single-Flight Test: {'✅ PASSED' if test3_success else '❌ FAILED'}")
+    
+    return test1_success and test2_success and test3_success
+
+
+if __name__ == "__main__":
+    success = asyncio.run(main())
+    sys.exit(0 if success else 1)
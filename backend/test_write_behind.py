@@ -0,0 +1,124 @@
+"""
+Test the bounded write-behind queue.
+"""
+import asyncio
+import sys
+import os
+
+# Add the backend directory to the Python path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__)))
+
+from app.langgraph.utils.write_behind import WriteBehindQueue
+
+
+async def test_batching_and_drain():
+    """Test that items are written in batches and drained on stop."""
+    print("🧪 Testing batching and shutdown drain...")
+    
+    batches = []
+    
+    async def handler(batch):
+        batches.append(list(batch))
+    
+    queue = WriteBehindQueue("test", handler, max_size=100, batch_size=3, flush_interval=0.05)
+    await queue.start()
+    await queue.put_many(list(range(7)))
+    await queue.stop()
+    
+    assert [item for batch in batches for item in batch] == list(range(7)), f"Items lost or reordered: {batches}"
+    assert max(len(batch) for batch in batches) <= 3, "Batches must respect batch_size"
+    stats = queue.get_stats()
+    assert stats["written"] == 7 and stats["pending"] == 0 and not stats["running"]
+    print(f"   ✅ 7 items written in {len(batches)} batches and drained on stop")
+    
+    return True
+
+
+async def test_retries():
+    """Test that failed batches are retried, then dropped after max_retries."""
+    print("\n🧪 Testing retries...")
+    
+    attempts = []
+    
+    async def flaky_handler(batch):
+        attempts.append(len(batch))
+        if len(attempts) < 3:
+            raise RuntimeError("database unavailable")
+    
+    queue = WriteBehindQueue("flaky", flaky_handler, max_size=10, batch_size=10, flush_interval=0.01)
+    await queue.start()
+    await queue.put("row")
+    await queue.stop()
+    assert len(attempts) == 3 and queue.get_stats()["written"] == 1, f"Unexpected attempts: {attempts}"
+    print("   ✅ Failed batch retried until written")
+    
+    async def failing_handler(batch):
+        raise RuntimeError("database unavailable")
+    
+    dropped = []
+    queue = WriteBehindQueue(
+        "failing", failing_handler, max_size=10, batch_size=10, flush_interval=0.01, max_retries=2, on_drop=dropped.extend
+    )
+    await queue.start()
+    await queue.put("row")
+    await queue.stop()
+    stats = queue.get_stats()
+    assert stats["dropped"] == 1 and stats["failed_batches"] == 3, f"Unexpected stats: {stats}"
+    assert dropped == ["row"], "Dropped batch is passed to on_drop"
+    print("   ✅ Batch dropped after max_retries")
+    
+    return True
+
+
+async def test_backpressure():
+    """Test that put() waits for the worker when the queue is full."""
+    print("\n🧪 Testing backpressure...")
+    
+    release = asyncio.Event()
+    
+    async def slow_handler(batch):
+        await release.wait()
+    
+    queue = WriteBehindQueue("slow", slow_handler, max_size=2, batch_size=1, flush_interval=0.01)
+    await queue.start()
+    
+    # One item in the stuck handler, two filling the queue
+    for item in range(3):
+        await queue.put(item)
+    await asyncio.sleep(0.02)
+    
+    blocked_put = asyncio.create_task(queue.put(3))
+    await asyncio.sleep(0.05)
+    assert not blocked_put.done(), "put() should wait while the queue is full"
+    print("   ✅ Producer waits on a full queue")
+    
+    release.set()
+    await blocked_put
+    await queue.stop()
+    stats = queue.get_stats()
+    assert stats["blocked_puts"] >= 1 and stats["written"] == 4 and stats["high_watermark"] == 2, f"Unexpected stats: {stats}"
+    print(f"   ✅ Backpressure recorded ({stats['blocked_seconds']:.2f}s blocked)")
+    
+    return True
+
+
+async def main():
+    """Run write-behind queue tests."""
+    print("🚀 Starting Write-Behind Queue Tests")
+    print("=" * 80)
+    
+    test1_success = await test_batching_and_drain()
+    test2_success = await test_retries()
+    test3_success = await test_backpressure()
+    
+    print("\n" + "=" * 80)
+    print(f"Batching/Drain Test: {'✅ PASSED' if test1_success else '❌ FAILED'}")
+    print(f"Retry Test: {'✅ PASSED' if test2_success else '❌ FAILED'}")
+    print(f"Backpressure Test: {'✅ PASSED' if test3_success else '❌ FAILED'}")
+    
+    return test1_success and test2_success and test3_success
+
+
+if __name__ == "__main__":
+    success = asyncio.run(main())
+    sys.exit(0 if success else 1)